@@ -121,6 +121,13 @@ class AppSettings(BaseSettings, metaclass=AppSettingsMeta):
             "Only takes effect in development, local, or testing environments - ignored in staging/production."
         ),
     )
+    map_cluster_max_zoom: int = Field(
+        default=12,
+        description=(
+            "Map zoom level at which the main map switches from server-side pin clusters to individual pins. "
+            "Cluster aggregates are kept for every zoom level below it; set to 0 to disable clustering."
+        ),
+    )
 
     # Classes
     default_auto_field: str = Field(default="django.db.models.BigAutoField", description="The default auto field")
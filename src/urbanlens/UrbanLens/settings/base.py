@@ -90,6 +90,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    # One SiteSettings read per request, however many callers ask for it.
+    "urbanlens.dashboard.middleware.SiteSettingsMiddleware",
     # Innermost: swaps in the simulated viewer for "view profile as" previews.
     "urbanlens.dashboard.middleware.ProfilePreviewMiddleware",
 ]
@@ -319,6 +321,12 @@ CELERY_BEAT_SCHEDULE = {
         "task": "urbanlens.dashboard.tasks.upgrade_placeholder_pin_names",
         "schedule": 60 * 60,
     },
+    # The Valkey rate limiter buffers ApiCallLog rows; cost reports and the
+    # database fallback limiter lag by at most this interval.
+    "api-call-audit-flush": {
+        "task": "urbanlens.dashboard.tasks.flush_api_call_audit_log",
+        "schedule": 60,
+    },
     # Daily is plenty: retention is measured in hundreds of days
     # (services.pin_sync.TOMBSTONE_RETENTION), and the pins/deleted/ feed's 410
     # full-resync signal guards clients against any pruning-induced gap.
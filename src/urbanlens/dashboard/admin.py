@@ -25,10 +25,10 @@ class ApiRateLimitAdmin(admin.ModelAdmin):
 class ApiCallLogAdmin(admin.ModelAdmin):
     """Admin for ApiCallLog - read-only view of API call history."""
 
-    list_display = ["service", "created", "success", "response_ms", "was_rate_limited", "was_geo_filtered"]
-    list_filter = ["service", "success", "was_rate_limited", "was_geo_filtered"]
+    list_display = ["service", "created", "success", "response_ms", "was_rate_limited", "was_geo_filtered", "was_cached"]
+    list_filter = ["service", "success", "was_rate_limited", "was_geo_filtered", "was_cached"]
     search_fields = ["service", "endpoint"]
-    readonly_fields = ["service", "endpoint", "created", "updated", "success", "response_ms", "was_rate_limited", "was_geo_filtered"]
+    readonly_fields = ["service", "endpoint", "created", "updated", "success", "response_ms", "was_rate_limited", "was_geo_filtered", "was_cached"]
     ordering = ["-created"]
 
     def has_add_permission(self, request: HttpRequest) -> bool:
@@ -14,15 +14,19 @@ class DashboardConfig(AppConfig):
         import urbanlens.dashboard.models.aliases.signals
         import urbanlens.dashboard.models.cache.signals
         import urbanlens.dashboard.models.comments.signals
+        import urbanlens.dashboard.models.direct_messages.signals
+        import urbanlens.dashboard.models.group_chats.signals
         from urbanlens.dashboard.models.labels.signals import create_default_tags
         import urbanlens.dashboard.models.links.signals
         import urbanlens.dashboard.models.location.signals
         import urbanlens.dashboard.models.markup.signals
         import urbanlens.dashboard.models.notifications.signals
         import urbanlens.dashboard.models.pin.signals
+        import urbanlens.dashboard.models.pin_footprint.signals
         import urbanlens.dashboard.models.pin_list.signals
         from urbanlens.dashboard.models.profile.model import Profile
         import urbanlens.dashboard.models.profile.signals
+        import urbanlens.dashboard.models.subscriptions.signals
         import urbanlens.dashboard.models.trips.signals
         import urbanlens.dashboard.models.wiki.signals
         import urbanlens.dashboard.models.wiki_edit.signals
@@ -5,13 +5,18 @@ import re
 from typing import TYPE_CHECKING
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import DatabaseError
 
 if TYPE_CHECKING:
     from django.http import HttpRequest
 
+    from urbanlens.dashboard.models.profile.model import Profile
+
 logger = logging.getLogger(__name__)
 
+MESSAGES_ICON_CACHE_SECONDS = 24 * 60 * 60
+
 
 def add_site_settings(request: HttpRequest) -> dict[str, str]:
     """Inject site-wide settings into every template context.
@@ -176,6 +181,24 @@ def add_pending_account_deletion(request: HttpRequest) -> dict[str, object]:
     return {"pending_account_deletion": False, "account_deletion_date": None, "account_deletion_days_left": None}
 
 
+def _messages_icon_relevant(profile: Profile) -> bool:
+    """Whether the profile has ever used direct messages or had a friend.
+
+    Both conditions only ever become true, so a positive answer is cached
+    and later renders skip the three existence queries behind it.
+    """
+    from urbanlens.dashboard.models.friendship import Friendship
+    from urbanlens.dashboard.services.direct_messages import has_used_direct_messages
+
+    key = f"ul:messages-icon:{profile.pk}"
+    if cache.get(key):
+        return True
+    relevant = has_used_direct_messages(profile) or Friendship.objects.profile(profile).ever_friends().exists()
+    if relevant:
+        cache.set(key, 1, timeout=MESSAGES_ICON_CACHE_SECONDS)
+    return relevant
+
+
 def add_direct_messages(request: HttpRequest) -> dict[str, bool]:
     """Expose whether the navbar messages icon should render for this user.
 
@@ -196,11 +219,9 @@ def add_direct_messages(request: HttpRequest) -> dict[str, bool]:
     if isinstance(request.user, User):
         try:
             from urbanlens.dashboard.models.e2ee import MessagingKeyBundle
-            from urbanlens.dashboard.models.friendship import Friendship
-            from urbanlens.dashboard.services.direct_messages import has_used_direct_messages
 
             needs_oauth_enroll = not request.user.has_usable_password() and not MessagingKeyBundle.objects.filter(profile__user=request.user).exists()
-            show_messages_icon = has_used_direct_messages(request.user.profile) or Friendship.objects.profile(request.user.profile).ever_friends().exists()
+            show_messages_icon = _messages_icon_relevant(request.user.profile)
             return {
                 "show_messages_icon": show_messages_icon,
                 "e2ee_needs_oauth_enroll": needs_oauth_enroll,
@@ -213,14 +234,15 @@ def add_direct_messages(request: HttpRequest) -> dict[str, bool]:
 def add_feature_access(request: HttpRequest) -> dict[str, bool]:
     """Expose subscription-gated feature visibility to templates."""
     try:
-        from urbanlens.dashboard.models.subscriptions import SiteFeature, user_has_feature
+        from urbanlens.dashboard.models.subscriptions import SiteFeature, entitlements_for
 
+        entitlements = entitlements_for(request.user)
         return {
-            "can_use_ai_features": user_has_feature(request.user, SiteFeature.AI),
-            "show_places_layer": user_has_feature(request.user, SiteFeature.PLACES),
-            "can_use_web_search": user_has_feature(request.user, SiteFeature.SEARCH),
-            "can_upload_videos": user_has_feature(request.user, SiteFeature.VIDEO_UPLOADS),
-            "show_games_nav": user_has_feature(request.user, SiteFeature.ALPHA_FEATURES),
+            "can_use_ai_features": entitlements.has(SiteFeature.AI),
+            "show_places_layer": entitlements.has(SiteFeature.PLACES),
+            "can_use_web_search": entitlements.has(SiteFeature.SEARCH),
+            "can_upload_videos": entitlements.has(SiteFeature.VIDEO_UPLOADS),
+            "show_games_nav": entitlements.has(SiteFeature.ALPHA_FEATURES),
         }
     except (ImportError, DatabaseError):
         return {"can_use_ai_features": False, "show_places_layer": False, "can_use_web_search": False, "can_upload_videos": False, "show_games_nav": False}
@@ -1,5 +1,7 @@
 import contextlib
 from datetime import datetime
+import gzip
+import hashlib
 import json
 import logging
 import operator
@@ -12,9 +14,11 @@ from django.core.exceptions import ValidationError
 from django.db import DatabaseError
 from django.db.models import Count, Prefetch
 from django.db.models.functions import Coalesce, Lower
-from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
+from django.http import HttpResponse, HttpResponseNotModified, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
 from rest_framework.viewsets import GenericViewSet
 
 from urbanlens.dashboard.forms.search import SearchForm
@@ -31,8 +35,10 @@ from urbanlens.dashboard.models.saved_filter.model import SavedFilter
 from urbanlens.dashboard.models.site_settings.model import SiteSettings
 from urbanlens.dashboard.services.json_safety import safe_json_for_script
 from urbanlens.dashboard.services.map_pins import MapPinCache, MapPinPayloadService
+from urbanlens.dashboard.services.map_pins.tiles import encode_columnar_tile, tile_bounds
 from urbanlens.dashboard.services.pagination import get_page
 from urbanlens.dashboard.services.pin_creation import PinCreationError, PinCreationForbiddenError, create_pin_for_profile
+from urbanlens.dashboard.services.pin_overlaps import overlap_group_page
 from urbanlens.dashboard.services.redact import redact_secret
 from urbanlens.dashboard.services.saved_filter_cache import get_or_compute_matching_uuids
 from urbanlens.UrbanLens.settings.app import settings
@@ -595,31 +601,90 @@ class MapController(LoginRequiredMixin, GenericViewSet):
             bbox: "south,west,north,east" floats - restrict to this bounding box.
         """
         profile, _ = Profile.objects.get_or_create(user=request.user)
-        query = Pin.objects.filter(profile=profile).root_pins().select_related("location")
+        return _map_pins_page_response(request, profile, _parse_bbox(request.GET.get("bbox", "")))
 
-        if bbox := _parse_bbox(request.GET.get("bbox", "")):
-            query = query.within_bounds(*bbox)
+    def map_pin_clusters_json(self, request, *args, **kwargs):
+        """Return grid clusters of the profile's root pins for low zoom levels.
 
-        cursor = _safe_positive_int(request.GET.get("cursor"))
-        limit = _safe_positive_int(request.GET.get("limit"))
-        include_total = request.GET.get("include_total") == "1"
-        cached_page = MapPinCache(profile).get_or_build_page(
-            query,
-            cursor=cursor,
-            limit=limit,
-            include_total=include_total,
+        At country or state zoom the map needs one marker per screen region,
+        not every pin; clustering server-side keeps those payloads a few
+        hundred entries regardless of how many pins the profile has. At or
+        above ``settings.map_cluster_max_zoom`` the response carries the
+        viewport's individual pins instead, exactly as :meth:`map_pins_json`
+        pages them.
+
+        Query params:
+            zoom: Integer map zoom level.
+            bbox: "south,west,north,east" floats - the current viewport.
+
+        Returns:
+            JsonResponse: ``{"mode": "clusters", "clusters": [{count, latitude,
+            longitude, bbox, status, color}, ...], "cache": "hit" | "miss"}``,
+            or ``{"mode": "pins", ...}`` with :meth:`map_pins_json`'s payload;
+            400 when ``zoom`` or ``bbox`` is missing or invalid.
+        """
+        try:
+            zoom = int(request.GET.get("zoom", ""))
+        except ValueError:
+            return JsonResponse({"error": "invalid zoom"}, status=400)
+        bbox = _parse_bbox(request.GET.get("bbox", ""))
+        if zoom < 0 or bbox is None:
+            return JsonResponse({"error": "invalid zoom or bbox"}, status=400)
+
+        profile, _ = Profile.objects.get_or_create(user=request.user)
+        if zoom >= settings.map_cluster_max_zoom:
+            return _map_pins_page_response(request, profile, bbox, mode="pins")
+
+        query = Pin.objects.filter(profile=profile).root_pins().select_related("location").within_bounds(*bbox)
+        cached = MapPinCache(profile).get_or_build_clusters(query, zoom=zoom, bbox=bbox)
+        return JsonResponse(
+            {
+                "mode": "clusters",
+                "clusters": cached.clusters,
+                "cache": "hit" if cached.hit else "miss",
+            },
         )
-        for pin_dict in cached_page.page.pins:
-            pin_dict["viewLocationUrl"] = f"/dashboard/map/pin/{pin_dict['slug']}/"
 
-        payload: dict[str, Any] = {
-            "pins": cached_page.page.pins,
-            "next_cursor": cached_page.page.next_cursor,
-            "cache": "hit" if cached_page.hit else "miss",
-        }
-        if cached_page.page.total is not None:
-            payload["total"] = cached_page.page.total
-        return JsonResponse(payload)
+    def map_pin_tile(self, request, zoom: int, x: int, y: int, *args, **kwargs):
+        """Return the profile's root pins inside one slippy-map tile, columnar.
+
+        Same fields as :meth:`map_pins_json`, laid out by
+        ``services.map_pins.tiles.encode_columnar_tile`` so repeated keys and
+        label/icon strings are sent once per tile rather than once per pin.
+        ``viewLocationUrl`` is not included - it is ``/dashboard/map/pin/<slug>/``.
+
+        Tiles carry a weak ETag hashed from the encoded tile itself, so a
+        client revalidating an unchanged tile gets an empty 304 whether the
+        tile was built from the cache or from the database.
+
+        Args:
+            request: Incoming request; may carry ``If-None-Match``.
+            zoom: Tile zoom level.
+            x: Tile column.
+            y: Tile row.
+
+        Returns:
+            JSON ``{"z", "x", "y", "strings", "tags", "columns", "cache"}``,
+            304 when the client's copy is current, or 400 for an invalid tile.
+        """
+        bounds = tile_bounds(zoom, x, y)
+        if bounds is None:
+            return JsonResponse({"error": "invalid tile"}, status=400)
+        profile, _ = Profile.objects.get_or_create(user=request.user)
+        query = Pin.objects.filter(profile=profile).root_pins().select_related("location").within_tile(*bounds)
+        cached = MapPinCache(profile).get_or_build_within_bounds(query, bbox=bounds)
+        tile = {"z": zoom, "x": x, "y": y, **encode_columnar_tile(cached.page.pins)}
+        # Hashed before the "cache" marker is added: a warm and a cold build of
+        # the same pins must share an ETag, and only the marker differs.
+        etag = f"W/{quote_etag(hashlib.sha256(json.dumps(tile, separators=(',', ':')).encode()).hexdigest()[:32])}"
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            tile["cache"] = "hit" if cached.hit else "miss"
+            response = HttpResponse(json.dumps(tile, separators=(",", ":")), content_type="application/json")
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
 
     def map_child_pins_json(self, request, *args, **kwargs):
         """Return the profile's child pins (all nesting depths) for the Child pins layer.
@@ -670,6 +735,48 @@ class MapController(LoginRequiredMixin, GenericViewSet):
             pins.append(entry)
         return JsonResponse({"pins": pins})
 
+    def map_pin_overlaps_json(self, request, *args, **kwargs):
+        """Return the profile's overlapping pins as a paged report of groups.
+
+        Each group is a connected set of pins whose footprints overlap (see
+        ``services.pin_overlaps``) - usually a place pinned twice, or pins
+        left stacked on the same coordinates. Groups are keyset-paged by their
+        lowest pin PK.
+
+        Query params:
+            cursor: ``next_cursor`` from the previous page.
+            limit: Groups per page (1-200, default 50).
+
+        Returns:
+            JsonResponse: ``{"groups": [{"pins": [{id, uuid, slug, name,
+            latitude, longitude}, ...]}, ...], "next_cursor", "total"}``.
+        """
+        profile, _ = Profile.objects.get_or_create(user=request.user)
+        limit = min(_safe_positive_int(request.GET.get("limit")) or 50, 200)
+        page = overlap_group_page(
+            Pin.objects.filter(profile=profile),
+            cursor=_safe_positive_int(request.GET.get("cursor")),
+            limit=limit,
+        )
+        pins_by_id = {
+            pin.pk: {
+                "id": pin.pk,
+                "uuid": str(pin.uuid),
+                "slug": pin.slug,
+                "name": pin.effective_name,
+                "latitude": pin.effective_latitude,
+                "longitude": pin.effective_longitude,
+            }
+            for pin in Pin.objects.filter(pk__in=[pin_id for group in page.groups for pin_id in group]).select_related("location")
+        }
+        return JsonResponse(
+            {
+                "groups": [{"pins": [pins_by_id[pin_id] for pin_id in group if pin_id in pins_by_id]} for group in page.groups],
+                "next_cursor": page.next_cursor,
+                "total": page.total,
+            },
+        )
+
     def map_pins_meta(self, request, *args, **kwargs):
         """Return the latest pin update timestamp and app UUID for client-side cache invalidation.
 
@@ -1062,6 +1169,100 @@ class MapController(LoginRequiredMixin, GenericViewSet):
         return map_data
 
 
+def _map_pins_page_response(request, profile: Profile, bbox: tuple[float, float, float, float] | None, **extra: Any) -> HttpResponse:
+    """Respond with one keyset page of the profile's root map pins.
+
+    Shared by ``MapController.map_pins_json`` and the individual-pin mode of
+    ``MapController.map_pin_clusters_json``. Cache hits splice the stored
+    JSON of each pin straight into the body rather than decoding and
+    re-encoding up to ``MapPinPayloadService.MAX_LIMIT`` dicts, and for
+    clients accepting gzip the compressed body is kept per page (see
+    ``MapPinCache.store_compressed_page``) so repeat requests skip both.
+
+    Args:
+        request: Incoming request carrying ``cursor``/``limit``/``include_total``.
+        profile: The profile whose pins to page.
+        bbox: Optional ``(south, west, north, east)`` viewport.
+        **extra: Additional top-level keys for the JSON body.
+
+    Returns:
+        JSON ``{"pins", "next_cursor", "cache"}``, plus ``"total"`` when
+        requested and any ``extra`` keys.
+    """
+    query = Pin.objects.filter(profile=profile).root_pins().select_related("location")
+    if bbox:
+        query = query.within_bounds(*bbox)
+
+    cursor = _safe_positive_int(request.GET.get("cursor"))
+    limit = _safe_positive_int(request.GET.get("limit"))
+    include_total = request.GET.get("include_total") == "1"
+    cache = MapPinCache(profile)
+    accepts_gzip = _accepts_gzip(request.headers.get("Accept-Encoding", ""))
+    fingerprint = cache.cached_fingerprint() if accepts_gzip else None
+    page_token = f"{cursor}|{limit}|{include_total}|{bbox}|{sorted(extra.items())}"
+    if accepts_gzip and (compressed := cache.get_compressed_page(fingerprint, page_token)) is not None:
+        return _gzipped_json_response(compressed)
+
+    cached_page = cache.get_or_build_page(
+        query,
+        cursor=cursor,
+        limit=limit,
+        include_total=include_total,
+        bbox=bbox,
+        raw=True,
+    )
+    page = cached_page.page
+    if page.raw_pins is not None:
+        pins_json = "[" + ",".join(page.raw_pins) + "]"
+    else:
+        pins_json = json.dumps([{**pin, "viewLocationUrl": MapPinPayloadService.view_location_url(pin)} for pin in page.pins], separators=(",", ":"))
+
+    meta: dict[str, Any] = {**extra, "next_cursor": page.next_cursor, "cache": "hit" if cached_page.hit else "miss"}
+    if page.total is not None:
+        meta["total"] = page.total
+    body = ('{"pins":' + pins_json + "," + json.dumps(meta, separators=(",", ":"))[1:]).encode()
+    if accepts_gzip and cached_page.hit and fingerprint:
+        compressed = gzip.compress(body)
+        cache.store_compressed_page(fingerprint, page_token, compressed)
+        return _gzipped_json_response(compressed)
+    response = HttpResponse(body, content_type="application/json")
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def _gzipped_json_response(body: bytes) -> HttpResponse:
+    response = HttpResponse(body, content_type="application/json")
+    response["Content-Encoding"] = "gzip"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def _accepts_gzip(header: str) -> bool:
+    """Whether an ``Accept-Encoding`` header allows a gzip-encoded body.
+
+    An explicit ``gzip`` (or legacy ``x-gzip``) entry decides, otherwise a
+    ``*`` entry does; either needs a non-zero q-value, so ``gzip;q=0`` is a
+    refusal. A malformed q-value counts as zero.
+    """
+    qualities: dict[str, float] = {}
+    for entry in header.split(","):
+        coding, *params = (part.strip() for part in entry.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
 def _safe_positive_int(value: str | None) -> int | None:
     try:
         parsed = int(value) if value is not None else None
@@ -981,8 +981,8 @@ class PinController(LoginRequiredMixin, GenericViewSet):
             return render(request, template_name, {"error": "No coordinates available."})
 
         # First visit for these coordinates: warm every provider's slide cache
-        # in a Celery task and let the placeholder poll -- the provider chain
-        # is several sequential upstreams and must never run on the request path.
+        # in a Celery task and let the placeholder poll -- even fanned out, the
+        # provider chain is several upstreams and must never run on the request path.
         if not panel_sources()[service_key].is_ready(pin):
             return self._pending_panel(request, pin, service_key)
 
@@ -858,6 +858,7 @@ class SiteAdminApiLimitsView(LoginRequiredMixin, PermissionRequiredMixin, View):
                     "calls_30d": summary.get("total", 0),
                     "blocked_30d": summary.get("blocked", 0),
                     "geo_skipped_30d": summary.get("geo_skipped", 0),
+                    "cached_30d": summary.get("cached", 0),
                     "errors_30d": summary.get("errors", 0),
                     "avg_ms": round(summary.get("avg_response_ms") or 0),
                 }
@@ -906,6 +907,7 @@ class SiteAdminApiLimitsView(LoginRequiredMixin, PermissionRequiredMixin, View):
 
     def post(self, request: HttpRequest):
         from urbanlens.dashboard.models.api_rate_limit import ApiRateLimit
+        from urbanlens.dashboard.services.rate_limiter import forget_limit_config
 
         service = request.POST.get("service", "").strip()
         cfg = ApiRateLimit.objects.filter(service=service).first()
@@ -924,6 +926,7 @@ class SiteAdminApiLimitsView(LoginRequiredMixin, PermissionRequiredMixin, View):
 
         self._apply_rate_limit_config(cfg, request.POST)
         cfg.save()
+        forget_limit_config(service)
 
         if is_htmx:
             response = HttpResponse(status=204)
@@ -16,22 +16,40 @@ Because ``ExternalApiView`` extends DRF's plain ``APIView`` (not
 ``GenericAPIView``), views don't inherit ``paginate_queryset``. Use
 :class:`PaginatedListMixin` to get the same behavior without changing base
 classes.
+
+Page numbers cost a ``COUNT(*)`` and an ``OFFSET`` scan on every request, and
+both grow with the library: page 200 of a large photo library reads and
+discards 5,000 rows to return 25. Views over a large, recency-ordered table
+set :attr:`PaginatedListMixin.cursor_field` to also offer an opt-in keyset
+mode - pass ``?cursor=`` (empty for the first page) and follow
+``next_cursor`` - that seeks straight to the page on ``(stamp, pk)`` with the
+same ``services.keyset_cursor`` tokens the notification feed uses. It is still
+a browse mode, not a sync feed: it never hands back a watermark. Without the
+parameter those views page exactly as before.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import hashlib
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from urbanlens.dashboard.services.keyset_cursor import InvalidCursorError, decode_cursor, encode_cursor
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from django.db.models import QuerySet
     from rest_framework.request import Request
-    from rest_framework.response import Response
     from rest_framework.serializers import BaseSerializer
 
+#: Query values accepted as "yes" for ``?count=``.
+_TRUTHY = frozenset({"1", "true", "yes"})
+
 
 class ExternalApiPagination(PageNumberPagination):
     """The external API's standard page-number pagination.
@@ -47,6 +65,82 @@ class ExternalApiPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class ExternalApiCursorPagination(ExternalApiPagination):
+    """Forward-only keyset pagination on ``(cursor_field, pk)``, newest first.
+
+    Each page is ``WHERE (stamp, pk) < (last stamp, last pk) ORDER BY stamp
+    DESC, pk DESC LIMIT page_size + 1``, so its cost depends on the page size
+    rather than on how deep the reader is. The envelope keeps the
+    page-number keys so one response parser reads both modes: ``previous`` is
+    always null, and ``count`` is null unless the caller asks for it with
+    ``?count=true``. That count is exact but cached for
+    ``count_cache_seconds`` per distinct query, so a client walking a library
+    pays for one ``COUNT(*)`` rather than one per page.
+
+    Args:
+        cursor_field: The non-null timestamp the rows are ordered by,
+            descending, with ``pk`` breaking ties.
+    """
+
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    count_cache_seconds = 60
+
+    def __init__(self, cursor_field: str) -> None:
+        self.cursor_field = cursor_field
+        self.count: int | None = None
+        self.next_cursor: str | None = None
+        self.request: Request | None = None
+
+    def paginate_queryset(self, queryset: QuerySet[Any], request: Request, view: Any = None) -> list[Any]:
+        """Return the page after ``?cursor=``, or the first page when it is empty.
+
+        Raises:
+            InvalidCursorError: The cursor is malformed or tampered with.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        field = self.cursor_field
+        queryset = queryset.order_by(f"-{field}", "-pk")
+        if request.query_params.get(self.count_query_param, "").lower() in _TRUTHY:
+            self.count = self._cached_count(queryset)
+
+        if raw := request.query_params.get(self.cursor_query_param):
+            stamp, pk = decode_cursor(raw)
+            queryset = queryset.filter(Q(**{f"{field}__lt": stamp}) | Q(**{field: stamp, "pk__lt": pk}))
+
+        rows = list(queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_cursor = encode_cursor(getattr(rows[-1], field), rows[-1].pk) if has_more and rows else None
+        return rows
+
+    def get_next_link(self) -> str | None:
+        """The absolute URL of the next page, or None on the last one."""
+        if self.next_cursor is None or self.request is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Wrap *data* in the page-number envelope plus ``next_cursor``."""
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": None,
+                "next_cursor": self.next_cursor,
+                "results": data,
+            }
+        )
+
+    def _cached_count(self, queryset: QuerySet[Any]) -> int:
+        """``queryset.count()``, shared for a minute by every page of the same walk."""
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.sha256(repr((sql, params)).encode()).hexdigest()
+        return cache.get_or_set(f"external-api-count:{digest}", queryset.count, self.count_cache_seconds)
+
+
 class PaginatedListMixin:
     """Adds one-call paginated list responses to an ``APIView``-based external view.
 
@@ -60,6 +154,10 @@ class PaginatedListMixin:
     #: Overridable per view, e.g. for an endpoint needing a different page size.
     pagination_class: type[PageNumberPagination] = ExternalApiPagination
 
+    #: Set to the (non-null, descending) timestamp a view's rows are ordered by
+    #: to offer keyset paging on ``?cursor=``. Only applies to querysets.
+    cursor_field: ClassVar[str | None] = None
+
     def paginated_response(
         self,
         queryset: QuerySet[Any] | list[Any],
@@ -76,8 +174,9 @@ class PaginatedListMixin:
                 deterministic ordering, or pages will overlap and drop rows.
             serializer_class: The serializer to apply to the page, instantiated
                 with ``many=True``.
-            request: The request whose ``page``/``page_size`` params drive
-                pagination.
+            request: The request whose ``page``/``page_size`` params - or,
+                on a view with a ``cursor_field``, ``cursor``/``count`` -
+                drive pagination.
             context: Extra serializer context. Used to hand a serializer the
                 parent object its fields need (e.g. the pin an alias belongs
                 to), so a whole page resolves without a query per row.
@@ -95,10 +194,18 @@ class PaginatedListMixin:
 
         Returns:
             A ``{count, next, previous, results}`` response for the requested
-            page.
+            page, with ``next_cursor`` added in cursor mode, or a 400 for a
+            bad cursor.
         """
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(queryset, request, view=self)
+        if self.cursor_field and isinstance(queryset, QuerySet) and ExternalApiCursorPagination.cursor_query_param in request.query_params:
+            paginator = ExternalApiCursorPagination(self.cursor_field)
+            try:
+                page = paginator.paginate_queryset(queryset, request, view=self)
+            except InvalidCursorError as exc:
+                return Response({"error": exc.safe_message}, status=400)
+        else:
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(queryset, request, view=self)
         rows = [row_builder(item) for item in page] if row_builder is not None else page
         serializer = serializer_class(rows, many=True, context=context or {})
         return paginator.get_paginated_response(serializer.data)
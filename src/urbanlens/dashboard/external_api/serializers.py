@@ -2228,7 +2228,9 @@ class PhotoListQuerySerializer(serializers.Serializer):
     """Validates the filters on ``GET photos/``.
 
     Pagination itself is the standard ``page``/``page_size`` pair handled by
-    ``external_api.pagination.ExternalApiPagination`` and is not declared here.
+    ``external_api.pagination.ExternalApiPagination``, or the opt-in
+    ``cursor``/``count`` pair of ``ExternalApiCursorPagination``, and is not
+    declared here.
     """
 
     #: A pin slug or uuid; resolved against the caller's own pins only.
@@ -2244,9 +2246,12 @@ class PhotoListQuerySerializer(serializers.Serializer):
 class PhotoListResponseSerializer(serializers.Serializer):
     """The paginated photo list envelope (schema-only)."""
 
-    count = serializers.IntegerField(read_only=True)
+    #: Null in cursor mode unless ``?count=true`` was passed.
+    count = serializers.IntegerField(read_only=True, allow_null=True)
     next = serializers.CharField(read_only=True, allow_null=True)
     previous = serializers.CharField(read_only=True, allow_null=True)
+    #: Only present in cursor mode; null on the last page.
+    next_cursor = serializers.CharField(read_only=True, allow_null=True, required=False)
     results = PhotoSerializer(many=True, read_only=True)
 
 
@@ -0,0 +1,47 @@
+"""Serializers for the external API's batch endpoint."""
+
+from __future__ import annotations
+
+from rest_framework import serializers
+
+#: Most sub-requests one ``POST batch/`` may carry. Sized for a detail screen
+#: (a pin plus its panels, comments, visits and photos), not for bulk work -
+#: the bulk endpoints exist for that.
+MAX_BATCH_REQUESTS = 20
+
+#: Methods a sub-request may use. Bodies are JSON only, so multipart uploads
+#: still go to their own endpoints.
+BATCH_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+
+class BatchSubRequestSerializer(serializers.Serializer):
+    """One request inside a batch."""
+
+    #: Echoed back on the matching response so a client can correlate without
+    #: relying on position.
+    id = serializers.CharField(max_length=64, required=False, allow_blank=True)
+    method = serializers.ChoiceField(choices=BATCH_METHODS, default="GET")
+    #: Relative to the API root, e.g. ``pins/old-mill/`` or ``photos/?page=2``.
+    path = serializers.CharField(max_length=2048)
+    body = serializers.JSONField(required=False, allow_null=True, default=None)
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    """Validates a ``POST batch/`` envelope."""
+
+    requests = serializers.ListField(child=BatchSubRequestSerializer(), min_length=1, max_length=MAX_BATCH_REQUESTS)
+
+
+class BatchSubResponseSerializer(serializers.Serializer):
+    """One sub-request's outcome (schema-only)."""
+
+    id = serializers.CharField(read_only=True, allow_blank=True)
+    status = serializers.IntegerField(read_only=True)
+    #: The endpoint's own JSON body, or null for a non-JSON response.
+    body = serializers.JSONField(read_only=True, allow_null=True)
+
+
+class BatchResponseSerializer(serializers.Serializer):
+    """The batch envelope, one response per sub-request in request order (schema-only)."""
+
+    responses = BatchSubResponseSerializer(many=True, read_only=True)
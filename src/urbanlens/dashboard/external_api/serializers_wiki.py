@@ -382,6 +382,22 @@ class GalleryImageSerializer(serializers.Serializer):
     created = serializers.DateTimeField(read_only=True)
 
 
+class GalleryImageListResponseSerializer(serializers.Serializer):
+    """The paginated wiki gallery envelope (schema-only).
+
+    Same shape as ``PhotoListResponseSerializer``: the gallery also offers
+    keyset paging on ``?cursor=``.
+    """
+
+    #: Null in cursor mode unless ``?count=true`` was passed.
+    count = serializers.IntegerField(read_only=True, allow_null=True)
+    next = serializers.CharField(read_only=True, allow_null=True)
+    previous = serializers.CharField(read_only=True, allow_null=True)
+    #: Only present in cursor mode; null on the last page.
+    next_cursor = serializers.CharField(read_only=True, allow_null=True, required=False)
+    results = GalleryImageSerializer(many=True, read_only=True)
+
+
 class WikiBoundaryEntrySerializer(serializers.Serializer):
     """One typed boundary's resolved geometry and where it came from (schema-only)."""
 
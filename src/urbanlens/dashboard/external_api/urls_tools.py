@@ -30,7 +30,7 @@ from typing import TYPE_CHECKING
 
 from django.urls import path
 
-from urbanlens.dashboard.external_api import views_undo
+from urbanlens.dashboard.external_api import views_batch, views_undo
 
 if TYPE_CHECKING:
     from django.urls.resolvers import URLPattern
@@ -40,8 +40,10 @@ if TYPE_CHECKING:
 #:
 #: Undo lives here rather than in its own module: it is a utility belonging to
 #: no single resource, aggregating across every model the undo framework can
-#: restore - exactly the shape this domain's docstring describes.
+#: restore - exactly the shape this domain's docstring describes. So does
+#: batch, which dispatches to other endpoints rather than owning a resource.
 urlpatterns: list[URLPattern] = [
+    path("batch/", views_batch.BatchView.as_view(), name=views_batch.BATCH_URL_NAME),
     path("undo/", views_undo.UndoListView.as_view(), name="undo"),
     path("undo/<uuid:undo_uuid>/restore/", views_undo.UndoRestoreView.as_view(), name="undo.restore"),
 ]
@@ -1137,7 +1137,8 @@ def _resolve_own_pin(request: Request, value: str) -> Pin | None:
 class PhotosView(PaginatedListMixin, ExternalApiView):
     """The key owner's photo library: GET browses it, POST uploads to it.
 
-    GET is a browse endpoint (page-number paginated), not a delta sync: unlike
+    GET is a browse endpoint (page-number paginated, or keyset paginated on
+    ``?cursor=`` - see ``external_api.pagination``), not a delta sync: unlike
     ``pins/`` there is no tombstone feed for photos, so a client that needs to
     detect deletions re-walks the list.
 
@@ -1152,6 +1153,7 @@ class PhotosView(PaginatedListMixin, ExternalApiView):
         "POST": frozenset({ApiKeyScope.PHOTOS_WRITE}),
     }
     parser_classes = [MultiPartParser]
+    cursor_field = "created"
 
     @extend_schema(parameters=[PhotoListQuerySerializer], responses={200: PhotoListResponseSerializer, 400: ErrorSerializer})
     def get(self, request: Request) -> Response:
@@ -1193,10 +1195,7 @@ class PhotosView(PaginatedListMixin, ExternalApiView):
         # created timestamp (a bulk import writes dozens in the same instant).
         queryset = queryset.order_by("-created", "-pk")
 
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(queryset, request, view=self)
-        payload = [build_photo_payload(image, profile) for image in page or []]
-        return paginator.get_paginated_response(PhotoSerializer(payload, many=True).data)
+        return self.paginated_response(queryset, PhotoSerializer, request, row_builder=lambda image: build_photo_payload(image, profile))
 
     @extend_schema(request=PhotoUploadSerializer, responses={201: PhotoSerializer, 400: ErrorSerializer, 403: ErrorSerializer, 409: ErrorSerializer, 413: ErrorSerializer})
     def post(self, request: Request) -> Response:
@@ -2113,6 +2112,12 @@ class LabelsView(PaginatedListMixin, ExternalApiView):
     Filters: ``kind``, ``is_global``, ``q`` (name contains), ``parent_uuid``.
     ``?with_counts=true`` adds ``pin_count``/``location_count``, opt-in because
     each is a correlated subquery per row.
+
+    Page-number only - no ``cursor_field``. Labels are listed in their
+    user-chosen ``order`` then by name, not by recency, and keyset mode pages
+    on a descending ``(stamp, pk)`` order, which would re-sort the listing.
+    A profile's labels are also a short, bounded list, so deep ``OFFSET``
+    scans - the cost keyset mode exists to avoid - don't arise.
     """
 
     required_scopes_by_method: ClassVar[dict[str, frozenset[ApiKeyScope]]] = {
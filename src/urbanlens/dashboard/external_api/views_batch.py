@@ -0,0 +1,158 @@
+"""External ``POST batch/``: several API calls in one HTTP round trip.
+
+A mobile client opening a pin detail calls ``pins/<slug>/`` and then its
+panels, comments, visits and photos - five round trips, each paying TLS
+latency, a credential lookup and throttle bookkeeping. A batch carries those
+calls in one request and runs them in-process, in order, against the real
+views:
+
+- **Authentication happens once.** The envelope's resolved user and
+  credential are forced onto every sub-request, so the key is looked up once
+  per batch rather than once per call. Each sub-request an API key
+  dispatches still gets its own usage-log entry under its own path, so the
+  key's activity reads the same as if the calls had arrived separately.
+- **Authorization and throttling happen per call.** Each sub-request goes
+  through its own view's ``HasApiKeyScope`` check and the per-credential
+  throttles exactly as if it had arrived alone, so a batch can't reach an
+  endpoint its credential couldn't. The envelope itself needs no scope - it
+  touches no data - but still counts against the burst cap, so batching
+  can't be used to slip a stampede past it.
+- **One connection, one user.** Sub-requests run sequentially on this
+  thread, sharing its database connection and the same ``User`` instance,
+  so ``request.user.profile`` and anything else cached on it loads once.
+
+Sub-requests are independent: no transaction spans the batch, a failing one
+does not stop the rest, and each status (403, 404 and 429 included) comes
+back in its own slot. Only ``external_api`` routes are reachable, and a batch
+can't contain another batch. Routed under ``urls_tools.py``.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote_to_bytes
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.urls import Resolver404, get_urlconf, resolve
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from urbanlens.dashboard.external_api.errors import NOT_FOUND_BODY
+from urbanlens.dashboard.external_api.serializers import ErrorSerializer
+from urbanlens.dashboard.external_api.serializers_batch import BatchRequestSerializer, BatchResponseSerializer
+from urbanlens.dashboard.external_api.throttling import ExternalApiBurstThrottle
+from urbanlens.dashboard.external_api.views import ExternalApiView
+from urbanlens.dashboard.models.account.model import ApiKey
+from urbanlens.dashboard.services.api_keys import record_api_key_usage
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+#: The envelope's own route name; a sub-request resolving to it is refused.
+BATCH_URL_NAME = "batch"
+
+#: Outer ``META`` keys that describe the envelope's own method, target or body
+#: and so must not carry over to a sub-request.
+_ENVELOPE_ONLY_META = frozenset({"CONTENT_LENGTH", "CONTENT_TYPE", "PATH_INFO", "QUERY_STRING", "REQUEST_METHOD", "wsgi.input"})
+
+
+def _sub_request(request: Request, method: str, path_info: str, query: str, body: Any) -> WSGIRequest:
+    """Build the Django request for one sub-call, pre-authenticated as the envelope.
+
+    Args:
+        request: The envelope request, whose headers, host and credential the
+            sub-request inherits.
+        method: The sub-request's HTTP method.
+        path_info: Its full path below the script prefix.
+        query: Its raw query string.
+        body: Its JSON body, or None for none.
+
+    Returns:
+        A request ready to hand to the resolved view.
+    """
+    payload = b"" if body is None else json.dumps(body).encode()
+    environ = {key: value for key, value in request.META.items() if key not in _ENVELOPE_ONLY_META}
+    environ.update(
+        {
+            "REQUEST_METHOD": method,
+            # WSGI carries the path as percent-decoded bytes in a latin-1 str.
+            "PATH_INFO": unquote_to_bytes(path_info).decode("iso-8859-1"),
+            "QUERY_STRING": query,
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(payload)),
+            "wsgi.input": io.BytesIO(payload),
+            "wsgi.url_scheme": request.scheme,
+        }
+    )
+    sub = WSGIRequest(environ)
+    # DRF's Request swaps its authenticators for these when present (the hook
+    # its test client uses), so the view sees the envelope's user and
+    # credential without a second key lookup. Scope checks and throttles
+    # still run against that credential as normal; _dispatch writes the
+    # usage-log entry the skipped authenticator would have.
+    sub._force_auth_user = request.user  # noqa: SLF001 - DRF's forced-auth hook
+    sub._force_auth_token = request.auth  # noqa: SLF001 - DRF's forced-auth hook
+    return sub
+
+
+def _dispatch(request: Request, api_root: str, item: dict[str, Any]) -> dict[str, Any]:
+    """Run one sub-request through its view and return its ``status``/``body``."""
+    path, _, query = item["path"].lstrip("/").partition("?")
+    path_info = api_root + path
+    try:
+        match = resolve(path_info, get_urlconf())
+    except Resolver404:
+        return {"status": 404, "body": NOT_FOUND_BODY}
+    if "external_api" not in match.namespaces:
+        return {"status": 404, "body": NOT_FOUND_BODY}
+    if match.url_name == BATCH_URL_NAME:
+        return {"status": 400, "body": {"error": "A batch can't contain another batch."}}
+
+    sub = _sub_request(request, item["method"], path_info, query, item["body"])
+    sub.resolver_match = match
+    if isinstance(request.auth, ApiKey):
+        # Mirrors ApiKeyAuthentication, which logs every request it resolves.
+        record_api_key_usage(request.auth, sub.path)
+    try:
+        response = match.func(sub, *match.args, **match.kwargs)
+    except Exception:
+        # DRF re-raises anything that isn't an APIException; contain it to
+        # this slot so one broken endpoint can't fail the calls beside it.
+        logger.exception("Batch sub-request %s %s failed", item["method"], path_info)
+        return {"status": 500, "body": {"error": "Internal server error."}}
+    # Not response.close(): that fires request_finished, which may close the
+    # database connection the remaining sub-requests are sharing.
+    return {"status": response.status_code, "body": response.data if isinstance(response, Response) else None}
+
+
+class BatchView(ExternalApiView):
+    """POST: run up to ``MAX_BATCH_REQUESTS`` external API calls in one round trip.
+
+    Responses come back in request order, each ``{id, status, body}`` with
+    ``body`` the endpoint's own JSON (null for file downloads and other
+    non-JSON responses). See the module docstring for what is shared across
+    the batch and what isn't.
+    """
+
+    #: Authentication only. Not ``UnscopedExternalApiView``, which is kept for
+    #: endpoints describing the credential itself: the envelope reads no data
+    #: of its own, and every sub-request is scope-checked by its own view.
+    permission_classes = [IsAuthenticated]
+    #: Each sub-request is charged to the read/write caps by its own view; the
+    #: envelope only takes a slot of the burst cap.
+    throttle_classes = [ExternalApiBurstThrottle]
+
+    @extend_schema(request=BatchRequestSerializer, responses={200: BatchResponseSerializer, 400: ErrorSerializer})
+    def post(self, request: Request) -> Response:
+        """Dispatch each sub-request in order and collect their responses."""
+        serializer = BatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        api_root = request.path_info.removesuffix(f"{BATCH_URL_NAME}/")
+        responses = [{"id": item.get("id", ""), **_dispatch(request, api_root, item)} for item in serializer.validated_data["requests"]]
+        return Response({"responses": responses})
@@ -54,6 +54,7 @@ from urbanlens.dashboard.external_api.serializers_wiki import (
     ArticleSaveSerializer,
     CommentCreateSerializer,
     CommentSerializer,
+    GalleryImageListResponseSerializer,
     GalleryImageSerializer,
     ReviewSerializer,
     WikiAliasCreateSerializer,
@@ -762,8 +763,9 @@ class WikiGalleryView(PaginatedListMixin, WikiApiView):
     required_scopes_by_method: ClassVar[dict[str, frozenset[ApiKeyScope]]] = {
         "GET": frozenset({ApiKeyScope.WIKI_READ}),
     }
+    cursor_field = "created"
 
-    @extend_schema(responses={200: GalleryImageSerializer(many=True), 404: ErrorSerializer})
+    @extend_schema(responses={200: GalleryImageListResponseSerializer, 400: ErrorSerializer, 404: ErrorSerializer})
     def get(self, request: Request, location_slug: str) -> Response:
         """Return one page of gallery images the caller may see."""
         _location, wiki, profile = self.resolve(request, location_slug)
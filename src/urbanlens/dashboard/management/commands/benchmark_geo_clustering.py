@@ -0,0 +1,122 @@
+"""Benchmark ``services.geo_clustering`` against the all-pairs loops it replaced.
+
+Generates a synthetic library - points scattered around a set of "places",
+the way geotagged photos bunch up - and times both clustering entry points
+next to a straight copy of the greedy loop each one used to be, checking
+that every pair produces the same groups. Needs no database.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from urbanlens.dashboard.services.geo_clustering import EARTH_RADIUS_METERS, running_centroid_clusters, seeded_clusters
+
+
+def _haversine_m(a: tuple[float, float], b: tuple[float, float]) -> float:
+    lat1, lng1 = math.radians(a[0]), math.radians(a[1])
+    lat2, lng2 = math.radians(b[0]), math.radians(b[1])
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return EARTH_RADIUS_METERS * 2 * math.asin(math.sqrt(min(h, 1.0)))
+
+
+def legacy_running_centroid_clusters(points: list[tuple[float, float]], weights: list[float], radius_m: float) -> list[list[int]]:
+    """The pre-index ``pin_suggestions._cluster_hits`` loop, over indices."""
+    clusters: list[list[int]] = []
+    centroids: list[tuple[float, float]] = []
+    totals: list[float] = []
+    for index, (lat, lng) in enumerate(points):
+        weight = weights[index]
+        for cluster, (clat, clng) in enumerate(centroids):
+            if _haversine_m((clat, clng), (lat, lng)) <= radius_m:
+                clusters[cluster].append(index)
+                total = totals[cluster] + weight
+                centroids[cluster] = (clat + (lat - clat) * weight / total, clng + (lng - clng) * weight / total)
+                totals[cluster] = total
+                break
+        else:
+            clusters.append([index])
+            centroids.append((lat, lng))
+            totals.append(weight)
+    return clusters
+
+
+def legacy_seeded_clusters(points: list[tuple[float, float]], weights: list[float], radius_m: float) -> list[list[int]]:
+    """The pre-index ``device_scan.clustering._cluster_entries`` loop, over indices."""
+    remaining = sorted(range(len(points)), key=lambda index: weights[index], reverse=True)
+    clusters: list[list[int]] = []
+    while remaining:
+        seed = remaining.pop(0)
+        cluster = [seed]
+        centroid = points[seed]
+        changed = True
+        while changed:
+            changed = False
+            still_remaining = []
+            for candidate in remaining:
+                if _haversine_m(points[candidate], centroid) <= radius_m:
+                    cluster.append(candidate)
+                    changed = True
+                else:
+                    still_remaining.append(candidate)
+            remaining = still_remaining
+            if changed:
+                total = sum(weights[index] for index in cluster)
+                centroid = (sum(points[index][0] * weights[index] for index in cluster) / total, sum(points[index][1] * weights[index] for index in cluster) / total)
+        clusters.append(cluster)
+    return clusters
+
+
+def synthetic_points(count: int, places: int, spread_m: float, seed: int) -> tuple[list[tuple[float, float]], list[float]]:
+    """``count`` weighted points jittered around ``places`` random centres in one region."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data, not security-sensitive
+    centres = [(rng.uniform(40.0, 41.0), rng.uniform(-75.0, -73.5)) for _ in range(places)]
+    metres_per_degree = EARTH_RADIUS_METERS * math.pi / 180
+    points = []
+    for _ in range(count):
+        lat, lng = rng.choice(centres)
+        points.append((lat + rng.gauss(0, spread_m) / metres_per_degree, lng + rng.gauss(0, spread_m) / (metres_per_degree * math.cos(math.radians(lat)))))
+    weights = [float(rng.randint(1, 20)) for _ in range(count)]
+    return points, weights
+
+
+class Command(BaseCommand):
+    """Time the indexed clustering engine against the legacy greedy loops."""
+
+    help = "Benchmark services.geo_clustering against the O(n x clusters) loops it replaced."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--points", type=int, default=20_000, help="Synthetic points to cluster (default: 20000).")
+        parser.add_argument("--places", type=int, default=2_000, help="Distinct places the points bunch around (default: 2000).")
+        parser.add_argument("--spread", type=float, default=60.0, help="Jitter around each place, in metres (default: 60).")
+        parser.add_argument("--radius", type=float, default=150.0, help="Merge radius in metres (default: 150).")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+        parser.add_argument("--skip-legacy", action="store_true", help="Only time the indexed engine, e.g. for point counts the legacy loops can't finish.")
+
+    def handle(self, *args, **options):
+        points, weights = synthetic_points(options["points"], options["places"], options["spread"], options["seed"])
+        latitudes = [lat for lat, _lng in points]
+        longitudes = [lng for _lat, lng in points]
+        radius = options["radius"]
+        self.stdout.write(f"{len(points)} points around {options['places']} places, {radius:g} m radius.")
+
+        for name, engine, legacy in (
+            ("running centroid (pin suggestions)", lambda: running_centroid_clusters(latitudes, longitudes, weights, radius), lambda: legacy_running_centroid_clusters(points, weights, radius)),
+            ("seeded (device scans)", lambda: seeded_clusters(latitudes, longitudes, weights, radius), lambda: legacy_seeded_clusters(points, weights, radius)),
+        ):
+            started = time.perf_counter()
+            groups = engine()
+            engine_seconds = time.perf_counter() - started
+            line = f"  {name}: {len(groups)} clusters, indexed {engine_seconds:.3f}s"
+            if not options["skip_legacy"]:
+                started = time.perf_counter()
+                expected = legacy()
+                legacy_seconds = time.perf_counter() - started
+                if groups != expected:
+                    raise CommandError(f"{name}: indexed clustering disagrees with the legacy loop.")
+                line += f", legacy {legacy_seconds:.3f}s ({legacy_seconds / max(engine_seconds, 1e-9):.1f}x)"
+            self.stdout.write(line)
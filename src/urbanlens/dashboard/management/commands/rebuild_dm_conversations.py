@@ -0,0 +1,44 @@
+"""Recompute the messages inbox summaries from message history.
+
+``DirectMessageConversation`` rows and the inbox columns on
+``GroupChatMembership`` are maintained as messages are sent, read and
+deleted. Bulk writes that bypass those paths (raw SQL, ``QuerySet.update()``
+on ``read_at``) can leave them behind; this rebuilds them from scratch.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+from django.core.management.base import BaseCommand
+
+from urbanlens.dashboard.models.direct_messages.conversation import DirectMessageConversation
+from urbanlens.dashboard.models.group_chats.model import GroupChatMembership
+from urbanlens.dashboard.models.profile.model import Profile
+
+
+class Command(BaseCommand):
+    """Rebuild one-to-one conversation rows and group membership summaries, in batches."""
+
+    help = "Rebuild the denormalized direct message and group chat inbox summaries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profile", type=int, action="append", dest="profile_ids", help="Only rebuild this profile's inbox (repeatable).")
+        parser.add_argument("--batch-size", type=int, default=500, help="Profiles rebuilt per batch (default: 500).")
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.order_by("pk")
+        if options["profile_ids"]:
+            profiles = profiles.filter(pk__in=options["profile_ids"])
+        profile_ids = profiles.values_list("pk", flat=True)
+        total = profile_ids.count()
+        self.stdout.write(f"Rebuilding inbox summaries for {total} profile(s).")
+
+        done = 0
+        for batch in itertools.batched(profile_ids.iterator(), options["batch_size"]):
+            DirectMessageConversation.objects.rebuild(batch)
+            GroupChatMembership.objects.active().filter(profile_id__in=batch).rebuild_summaries()
+            done += len(batch)
+            self.stdout.write(f"  {done}/{total}")
+
+        self.stdout.write("Done.")
@@ -0,0 +1,42 @@
+"""Materialize PinFootprint rows for existing root pins.
+
+Footprints are kept current by signals once they exist, but pins created
+before the table existed (or by a write path that skips signals) have none,
+and every point-in-pin check falls back to resolving their boundary chain on
+the fly. Run this once after migrating, and again with ``--all`` if
+footprints are ever suspected to have drifted.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+from django.core.management.base import BaseCommand
+
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
+
+
+class Command(BaseCommand):
+    """Resolve and store the effective boundaries of root pins, in batches."""
+
+    help = "Backfill materialized pin footprints (effective property/building boundaries)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Refresh every root pin, not just those missing a footprint.")
+        parser.add_argument("--batch-size", type=int, default=500, help="Pins resolved per batch (default: 500).")
+
+    def handle(self, *args, **options):
+        pins = Pin.objects.root_pins()
+        if not options["all"]:
+            pins = pins.without_footprint()
+        pin_ids = pins.order_by("pk").values_list("pk", flat=True)
+        total = pin_ids.count()
+        self.stdout.write(f"Refreshing footprints for {total} pin(s).")
+
+        refreshed = 0
+        for batch in itertools.batched(pin_ids.iterator(), options["batch_size"]):
+            refreshed += PinFootprint.objects.refresh(Pin.objects.filter(pk__in=batch))
+            self.stdout.write(f"  {refreshed}/{total}")
+
+        self.stdout.write(f"Done. Refreshed: {refreshed}.")
@@ -11,6 +11,7 @@ from django.db import transaction
 from django.http import HttpResponse
 from django.utils.html import escape
 
+from urbanlens.dashboard.models.site_settings.queryset import SiteSettingsManager
 from urbanlens.dashboard.services.profile_preview import SESSION_KEY, create_ghost_viewer, mode_label
 
 if TYPE_CHECKING:
@@ -21,6 +22,40 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class SiteSettingsMiddleware:
+    """Memoize ``SiteSettings.get_current()`` for the duration of each request.
+
+    The context processor, feature checks and services each ask for the
+    singleton; inside this scope only the first of them reaches the process
+    cache (or the database), and the rest share that record.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Store the downstream handler.
+
+        Args:
+            get_response: The next middleware/view callable in the chain.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Dispatch the request inside a site settings memo scope.
+
+        Args:
+            request: The incoming HTTP request.
+
+        Returns:
+            The downstream response.
+        """
+        with SiteSettingsManager.request_scope():
+            response = self.get_response(request)
+            # Template responses render (and run context processors) after
+            # the view returns; do it while the memo is still in scope.
+            if hasattr(response, "render") and not getattr(response, "is_rendered", True):
+                response.render()
+            return response
+
+
 class ProfilePreviewMiddleware:
     """Render the owner's profile page as a simulated other user during a preview.
 
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.6 on 2026-10-18 12:00
+
+import django.contrib.gis.db.models.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0010_v0_6_0'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PinFootprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('boundary_type', models.CharField(choices=[('property', 'Property'), ('building', 'Building')], max_length=20)),
+                ('polygon', django.contrib.gis.db.models.fields.MultiPolygonField(blank=True, null=True, srid=4326)),
+                ('pin', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='footprints', to='dashboard.pin')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pin_footprints', to='dashboard.profile')),
+            ],
+            options={
+                'db_table': 'dashboard_pin_footprints',
+                'abstract': False,
+                'indexes': [models.Index(fields=['profile', 'boundary_type'], name='idxdb_pinfoot_prof_type')],
+                'constraints': [models.UniqueConstraint(fields=('pin', 'boundary_type'), name='pin_footprint_unique_pin_type')],
+            },
+        ),
+    ]
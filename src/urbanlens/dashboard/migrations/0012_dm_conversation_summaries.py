@@ -0,0 +1,48 @@
+# Generated by Django 6.0.6 on 2026-10-18 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0011_pinfootprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirectMessageConversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('last_activity', models.DateTimeField()),
+                ('unread_count', models.PositiveIntegerField(default=0)),
+                ('last_message', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='dashboard.directmessage')),
+                ('partner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='dashboard.profile')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dm_conversations', to='dashboard.profile')),
+            ],
+            options={
+                'db_table': 'dashboard_dm_conversations',
+                'abstract': False,
+                'indexes': [models.Index(fields=['profile', '-last_message'], name='idxdb_dmconv_profile_last')],
+                'constraints': [models.UniqueConstraint(fields=('profile', 'partner'), name='db_dm_conversation_unique')],
+            },
+        ),
+        migrations.AddField(
+            model_name='groupchatmembership',
+            name='last_activity',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='groupchatmembership',
+            name='last_message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='dashboard.groupmessage'),
+        ),
+        migrations.AddField(
+            model_name='groupchatmembership',
+            name='unread_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Backfill the inbox summaries added in 0012 from the existing message
+# history. Kept apart from the DDL (see 0002's header). The same SQL is
+# available afterwards as `manage.py rebuild_dm_conversations`.
+
+from django.db import migrations
+
+BACKFILL_DM_CONVERSATIONS = """
+INSERT INTO dashboard_dm_conversations (created, updated, profile_id, partner_id, last_message_id, last_activity, unread_count)
+SELECT now(), now(), v.profile_id, v.partner_id, MAX(v.id),
+    (array_agg(v.created ORDER BY v.id DESC))[1],
+    COUNT(*) FILTER (WHERE v.recipient_id = v.profile_id AND v.read_at IS NULL)
+FROM (
+    SELECT m.sender_id AS profile_id, m.recipient_id AS partner_id, m.id, m.created, m.recipient_id, m.read_at
+    FROM dashboard_direct_messages AS m
+    UNION ALL
+    SELECT m.recipient_id, m.sender_id, m.id, m.created, m.recipient_id, m.read_at
+    FROM dashboard_direct_messages AS m
+    WHERE m.deleted_by_recipient_at IS NULL AND m.sender_id <> m.recipient_id
+) AS v
+GROUP BY v.profile_id, v.partner_id
+ON CONFLICT (profile_id, partner_id) DO NOTHING;
+"""
+
+BACKFILL_GROUP_MEMBERSHIPS = """
+UPDATE dashboard_group_chat_memberships AS gm SET
+    last_message_id = (
+        SELECT m.id FROM dashboard_group_messages AS m
+        WHERE m.group_id = gm.group_id AND m.created >= gm.created
+        ORDER BY m.id DESC LIMIT 1
+    ),
+    last_activity = (
+        SELECT m.created FROM dashboard_group_messages AS m
+        WHERE m.group_id = gm.group_id AND m.created >= gm.created
+        ORDER BY m.id DESC LIMIT 1
+    ),
+    unread_count = (
+        SELECT COUNT(*) FROM dashboard_group_messages AS m
+        WHERE m.group_id = gm.group_id AND m.created >= gm.created AND m.sender_id <> gm.profile_id
+            AND (gm.last_read_at IS NULL OR m.created > gm.last_read_at)
+    )
+WHERE gm.left_at IS NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0012_dm_conversation_summaries'),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_DM_CONVERSATIONS, migrations.RunSQL.noop),
+        migrations.RunSQL(BACKFILL_GROUP_MEMBERSHIPS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.6 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0013_dm_conversation_summaries_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apicalllog',
+            name='was_cached',
+            field=models.BooleanField(default=False, help_text='True if this entry records a call answered from a local response cache without reaching the provider.'),
+        ),
+    ]
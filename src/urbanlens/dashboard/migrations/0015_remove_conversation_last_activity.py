@@ -0,0 +1,21 @@
+# Generated by Django 6.0.6 on 2026-10-18 12:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0014_apicalllog_was_cached'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='directmessageconversation',
+            name='last_activity',
+        ),
+        migrations.RemoveField(
+            model_name='groupchatmembership',
+            name='last_activity',
+        ),
+    ]
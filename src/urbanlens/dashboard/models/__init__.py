@@ -43,6 +43,7 @@ from urbanlens.dashboard.models.device_scan import (
 )
 from urbanlens.dashboard.models.direct_messages import (
     DirectMessage,
+    DirectMessageConversation,
     DirectMessageImagePermission,
     DirectMessageLocationMention,
     DirectMessageShare,
@@ -72,6 +73,7 @@ from urbanlens.dashboard.models.location import Location
 from urbanlens.dashboard.models.markup import MapLayerMode, MarkupMap, MarkupMapShare, MarkupType, PinMarkup
 from urbanlens.dashboard.models.notifications import NotificationLog, NotificationPreference
 from urbanlens.dashboard.models.pin import Pin, PinNote
+from urbanlens.dashboard.models.pin_footprint import PinFootprint
 from urbanlens.dashboard.models.pin_list import PinList, PinListItem
 from urbanlens.dashboard.models.pin_merge_suggestions import PinMergeSuggestion, PinMergeSuggestionOrigin, PinMergeSuggestionStatus
 from urbanlens.dashboard.models.pin_share import ExposureSource, LocationExposure, PinShare, PinShareOrigin, PinShareStatus
@@ -46,6 +46,10 @@ class ApiCallLog(abstract.DashboardModel):
         default=False,
         help_text="True if this entry records a call that was skipped due to service being disabled.",
     )
+    was_cached = BooleanField(
+        default=False,
+        help_text="True if this entry records a call answered from a local response cache without reaching the provider.",
+    )
     cost_estimate = DecimalField(
         max_digits=10,
         decimal_places=6,
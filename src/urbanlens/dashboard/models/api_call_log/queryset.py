@@ -50,6 +50,10 @@ class ApiCallLogQuerySet(abstract.DashboardQuerySet):
         """Filter to calls that were skipped due to service being disabled."""
         return self.filter(was_service_disabled=True)
 
+    def cached(self) -> Self:
+        """Filter to calls answered from a local response cache."""
+        return self.filter(was_cached=True)
+
     def summary_by_service(self) -> list[dict]:
         """Return per-service usage summary for the last 30 days."""
         return list(
@@ -59,6 +63,7 @@ class ApiCallLogQuerySet(abstract.DashboardQuerySet):
                 total=Count("id"),
                 blocked=Count("id", filter=Q(was_rate_limited=True)),
                 geo_skipped=Count("id", filter=Q(was_geo_filtered=True)),
+                cached=Count("id", filter=Q(was_cached=True)),
                 errors=Count("id", filter=Q(success=False, was_rate_limited=False, was_geo_filtered=False)),
                 avg_response_ms=Avg("response_ms"),
                 total_cost=Sum("cost_estimate"),
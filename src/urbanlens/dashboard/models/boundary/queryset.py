@@ -346,6 +346,100 @@ class BoundaryManager(abstract.DashboardManager.from_queryset(BoundaryQuerySet))
         """The polygon that applies to a pin (see ``resolve_for_pin``)."""
         return self.resolve_for_pin(pin, boundary_type)[0]
 
+    def effective_polygons_by_pin_id(self, pins: Iterable[Pin], boundary_type: str) -> dict[int, GEOSGeometry]:
+        """Batch-resolve many pins' effective polygons, keyed by pin id.
+
+        The batched counterpart to :meth:`effective_polygon_for_pin`. Root
+        pins are read from their materialized ``PinFootprint`` rows in one
+        query; root pins without rows yet go through
+        :meth:`resolve_root_polygons_by_pin_id`. Detail pins need the
+        parent-inheritance branch, so they go through :meth:`resolve_for_pin`
+        one by one.
+
+        Args:
+            pins: Pins to resolve, ideally ``select_related`` for
+                ``location``, ``location__wiki`` and ``wiki``.
+            boundary_type: A :class:`BoundaryType` value.
+
+        Returns:
+            Dict mapping pin id to its effective polygon; pins with no
+            applicable boundary (including no fallback circle) are omitted.
+        """
+        from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
+
+        result: dict[int, GEOSGeometry] = {}
+        root_pins = []
+        for pin in pins:
+            if pin.parent_pin_id:
+                if (polygon := self.effective_polygon_for_pin(pin, boundary_type)) is not None:
+                    result[pin.pk] = polygon
+            else:
+                root_pins.append(pin)
+
+        materialized = PinFootprint.objects.polygons_by_pin_id((pin.pk for pin in root_pins), boundary_type)
+        result.update((pin_id, polygon) for pin_id, polygon in materialized.items() if polygon is not None)
+        unresolved = [pin for pin in root_pins if pin.pk not in materialized]
+        result.update(self.resolve_root_polygons_by_pin_id(unresolved, boundary_type))
+        return result
+
+    def resolve_root_polygons_by_pin_id(self, pins: Iterable[Pin], boundary_type: str) -> dict[int, GEOSGeometry]:
+        """Resolve root pins' effective polygons from the boundary rows, keyed by pin id.
+
+        The pins' own rows, their wikis' rows and their locations' default
+        rows are each fetched in one query (see ``rows_by_pin_id`` and
+        friends) instead of three per pin, then every pin is resolved in
+        ``resolve_for_pin``'s order (own row -> wiki row -> location-default
+        row -> circle fallback). This is what ``PinFootprint`` rows are
+        built from; readers should go through
+        :meth:`effective_polygons_by_pin_id` instead.
+
+        Args:
+            pins: Root pins to resolve, ideally ``select_related`` for
+                ``location``, ``location__wiki`` and ``wiki``.
+            boundary_type: A :class:`BoundaryType` value.
+
+        Returns:
+            Dict mapping pin id to its effective polygon; pins with no
+            applicable boundary (including no fallback circle) are omitted.
+        """
+        from urbanlens.dashboard.models.boundary.model import BoundaryType
+        from urbanlens.dashboard.models.wiki.model import Wiki
+
+        root_pins = list(pins)
+        result: dict[int, GEOSGeometry] = {}
+        if not root_pins:
+            return result
+
+        own_by_pin_id = self.rows_by_pin_id((pin.pk for pin in root_pins), boundary_type)
+        wiki_by_pin_id: dict[int, Wiki] = {}
+        for pin in root_pins:
+            own_row = own_by_pin_id.get(pin.pk)
+            if own_row is not None and (own_row.polygon or own_row.generated_polygon):
+                continue
+            wiki = pin.wiki if pin.wiki_id else (Wiki.objects.get_for_location(pin.location) if pin.location_id else None)
+            if wiki is not None:
+                wiki_by_pin_id[pin.pk] = wiki
+        wiki_rows = self.rows_by_wiki_id((wiki.pk for wiki in wiki_by_pin_id.values()), boundary_type)
+        location_rows = self.rows_by_location_id((pin.location_id for pin in root_pins if pin.location_id), boundary_type)
+
+        for pin in root_pins:
+            if (own_row := own_by_pin_id.get(pin.pk)) is not None and (own_row.polygon or own_row.generated_polygon):
+                result[pin.pk] = own_row.polygon or own_row.generated_polygon
+                continue
+            wiki = wiki_by_pin_id.get(pin.pk)
+            if wiki is not None and (wiki_row := wiki_rows.get(wiki.pk)) is not None and wiki_row.drawn_or_generated_polygon:
+                result[pin.pk] = wiki_row.drawn_or_generated_polygon
+                continue
+            if not pin.location_id:
+                continue
+            if (location_row := location_rows.get(pin.location_id)) is not None and location_row.generated_polygon:
+                result[pin.pk] = location_row.generated_polygon
+            elif boundary_type == BoundaryType.PROPERTY:
+                circle = circle_for_coordinates(pin.location.latitude, pin.location.longitude)
+                if circle is not None:
+                    result[pin.pk] = circle
+        return result
+
     @staticmethod
     def _pin_point(pin: Pin) -> Point | None:
         """The pin's marker coordinates as a GEOS point, or None."""
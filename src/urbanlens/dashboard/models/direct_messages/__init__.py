@@ -1,14 +1,18 @@
+from urbanlens.dashboard.models.direct_messages.conversation import DirectMessageConversation
 from urbanlens.dashboard.models.direct_messages.image_permission import DirectMessageImagePermission
 from urbanlens.dashboard.models.direct_messages.location_mention import DirectMessageLocationMention, LocationMentionKind
 from urbanlens.dashboard.models.direct_messages.meta import DirectMessageShareKind, ImagePermissionStatus, MessageRetentionChoice
 from urbanlens.dashboard.models.direct_messages.model import DirectMessage
 from urbanlens.dashboard.models.direct_messages.mute import DirectMessageMute
-from urbanlens.dashboard.models.direct_messages.queryset import DirectMessageManager, DirectMessageQuerySet
+from urbanlens.dashboard.models.direct_messages.queryset import DirectMessageConversationManager, DirectMessageConversationQuerySet, DirectMessageManager, DirectMessageQuerySet
 from urbanlens.dashboard.models.direct_messages.share import DirectMessageShare
 from urbanlens.dashboard.models.direct_messages.temporary_access import DirectMessageTemporaryAccess
 
 __all__ = [
     "DirectMessage",
+    "DirectMessageConversation",
+    "DirectMessageConversationManager",
+    "DirectMessageConversationQuerySet",
     "DirectMessageImagePermission",
     "DirectMessageLocationMention",
     "DirectMessageManager",
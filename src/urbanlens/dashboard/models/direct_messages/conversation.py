@@ -0,0 +1,61 @@
+"""Denormalized per-conversation inbox rows for direct messages."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import CASCADE, SET_NULL, ForeignKey, Index, PositiveIntegerField, UniqueConstraint
+
+from urbanlens.dashboard.models import abstract
+from urbanlens.dashboard.models.direct_messages.queryset import DirectMessageConversationManager
+
+
+class DirectMessageConversation(abstract.DashboardModel):
+    """One profile's view of one one-to-one conversation, as the inbox lists it.
+
+    Summarizes what the inbox used to aggregate from the whole message
+    history on every render: the newest message ``profile`` can see in the
+    conversation with ``partner``
+    and how many of the partner's messages ``profile`` hasn't read. Each
+    conversation has two rows, one per participant, since self-deleted
+    messages and read state differ between them.
+
+    Rows are kept current inside the writing transaction by the signal
+    receivers in ``direct_messages.signals`` and by ``DirectMessageQuerySet.
+    mark_read``; ``rebuild_dm_conversations`` recomputes them from scratch.
+    """
+
+    profile = ForeignKey(
+        "dashboard.Profile",
+        on_delete=CASCADE,
+        related_name="dm_conversations",
+    )
+    partner = ForeignKey(
+        "dashboard.Profile",
+        on_delete=CASCADE,
+        related_name="+",
+    )
+    last_message = ForeignKey(
+        "dashboard.DirectMessage",
+        on_delete=SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+    unread_count = PositiveIntegerField(default=0)
+
+    objects = DirectMessageConversationManager()
+
+    if TYPE_CHECKING:
+        profile_id: int
+        partner_id: int
+        last_message_id: int | None
+
+    class Meta(abstract.DashboardModel.Meta):
+        db_table = "dashboard_dm_conversations"
+        constraints = [
+            UniqueConstraint(fields=["profile", "partner"], name="db_dm_conversation_unique"),
+        ]
+        indexes = [
+            Index(fields=["profile", "-last_message"], name="idxdb_dmconv_profile_last"),
+        ]
@@ -19,9 +19,9 @@ if TYPE_CHECKING:
 class DirectMessage(abstract.DashboardModel):
     """One private message from one profile to another.
 
-    A "conversation" is not its own model - it is simply the set of messages
-    between two profiles in either direction (see
-    ``DirectMessageQuerySet.between`` / ``conversation_rows``). ``read_at``
+    A conversation is the set of messages between two profiles in either
+    direction (see ``DirectMessageQuerySet.between``); the inbox reads its
+    per-participant summary from ``DirectMessageConversation``. ``read_at``
     doubles as the unread flag: null means the recipient hasn't opened the
     conversation since this message arrived.
 
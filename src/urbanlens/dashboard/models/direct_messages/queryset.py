@@ -4,14 +4,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Self
 
-from django.db.models import Case, Count, F, IntegerField, Max, Q, When
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from urbanlens.dashboard.models import abstract
 from urbanlens.dashboard.models.direct_messages.meta import RETENTION_DELTAS, MessageRetentionChoice
 
 if TYPE_CHECKING:
-    from django.db.models import QuerySet
+    from collections.abc import Iterable
 
     from urbanlens.dashboard.models.direct_messages.model import DirectMessage
     from urbanlens.dashboard.models.profile.model import Profile
@@ -116,44 +117,177 @@ class DirectMessageQuerySet(abstract.DashboardQuerySet):
     def mark_read(self) -> int:
         """Mark every unread message in this queryset as read now.
 
+        Also refreshes the recipients' ``DirectMessageConversation`` unread
+        counts, in the same transaction.
+
         Returns:
             The number of rows updated.
         """
-        return self.filter(read_at__isnull=True).update(read_at=timezone.now())
+        from urbanlens.dashboard.models.direct_messages.conversation import DirectMessageConversation
 
-    def conversation_rows(self, profile: Profile) -> QuerySet[DirectMessage, dict[str, Any]]:
-        """Aggregate the profile's messages into one row per conversation partner.
+        unread = self.filter(read_at__isnull=True)
+        with transaction.atomic():
+            pairs = set(unread.values_list("recipient_id", "sender_id").distinct().order_by())
+            updated = unread.update(read_at=timezone.now())
+            DirectMessageConversation.objects.refresh_pairs(pairs)
+        return updated
 
-        Args:
-            profile: The profile whose conversations to summarize.
+    def conversation_pairs(self) -> set[tuple[int, int]]:
+        """Every ``(profile_id, partner_id)`` inbox row these messages can appear in.
 
         Returns:
-            A values queryset with ``partner_id`` (the other profile's pk),
-            ``last_message_id`` (pk of the newest message either way), and
-            ``unread_count`` (messages from the partner not yet read), ordered
-            most-recently-active first.
+            Both participants' view of each conversation in this queryset.
         """
-        partner = Case(
-            When(sender=profile, then=F("recipient_id")),
-            default=F("sender_id"),
-            output_field=IntegerField(),
-        )
-        return (
-            self.involving(profile)
-            .annotate(partner_id=partner)
-            .values("partner_id")
-            .annotate(
-                last_message_id=Max("id"),
-                unread_count=Count("id", filter=Q(recipient=profile, read_at__isnull=True)),
-            )
-            .order_by("-last_message_id")
-        )
+        pairs = set(self.values_list("sender_id", "recipient_id").distinct().order_by())
+        return pairs | {(recipient_id, sender_id) for sender_id, recipient_id in pairs}
 
 
 class DirectMessageManager(abstract.DashboardManager.from_queryset(DirectMessageQuerySet)):
     """Manager for DirectMessage."""
 
 
+class DirectMessageConversationQuerySet(abstract.DashboardQuerySet):
+    """QuerySet for DirectMessageConversation inbox rows."""
+
+    def inbox(self, profile: Profile) -> Self:
+        """The profile's conversations that still show a message, most recently active first.
+
+        Ordered by ``last_message`` - message ids grow with send time - so
+        the ``(profile, -last_message)`` index serves the whole listing.
+
+        Args:
+            profile: The profile whose inbox to list.
+
+        Returns:
+            The profile's rows with a visible last message, newest first.
+        """
+        return self.filter(profile=profile, last_message__isnull=False).order_by("-last_message_id")
+
+
+class DirectMessageConversationManager(abstract.DashboardManager.from_queryset(DirectMessageConversationQuerySet)):
+    """Manager for DirectMessageConversation - keeps the rows in step with the messages."""
+
+    def record_message(self, message: DirectMessage) -> None:
+        """Fold one new message into both participants' rows, in one upsert.
+
+        The sender's row only moves its last message forward; the
+        recipient's row also counts the message as unread, unless it was
+        already read or self-deleted on arrival. Upserting with
+        ``GREATEST`` keeps concurrent sends to the same conversation from
+        moving the last message backwards.
+
+        Args:
+            message: The message just created.
+        """
+        table = self.model._meta.db_table  # noqa: SLF001 - _meta is public API despite the underscore
+        rows = [(message.sender_id, message.recipient_id, 0)]
+        recipient_unread = int(message.read_at is None)
+        if message.sender_id == message.recipient_id:
+            rows = [(message.sender_id, message.recipient_id, recipient_unread)]
+        elif message.deleted_by_recipient_at is None:
+            rows.append((message.recipient_id, message.sender_id, recipient_unread))
+
+        now = timezone.now()
+        values = ", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(rows))
+        params: list[Any] = []
+        for profile_id, partner_id, unread in rows:
+            params.extend([now, now, profile_id, partner_id, message.pk, unread])
+        sql = f"""
+            INSERT INTO {table} (created, updated, profile_id, partner_id, last_message_id, unread_count)
+            VALUES {values}
+            ON CONFLICT (profile_id, partner_id) DO UPDATE SET
+                last_message_id = GREATEST({table}.last_message_id, EXCLUDED.last_message_id),
+                unread_count = {table}.unread_count + EXCLUDED.unread_count,
+                updated = EXCLUDED.updated
+        """  # noqa: S608 - identifiers from Django _meta, not user input
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def refresh_pairs(self, pairs: Iterable[tuple[int, int]]) -> None:
+        """Recompute the rows for specific ``(profile_id, partner_id)`` pairs.
+
+        For writes that can move a row's last message backwards or lower its
+        unread count - read receipts, self-deletes, hard deletes. Only the
+        named conversations' messages are scanned. A pair with no message
+        left visible to its profile loses its row.
+
+        Args:
+            pairs: ``(profile_id, partner_id)`` tuples to recompute.
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+        profile_ids = [profile_id for profile_id, _ in pairs]
+        partner_ids = [partner_id for _, partner_id in pairs]
+        wanted = "SELECT * FROM unnest(%s::bigint[], %s::bigint[])"
+        with transaction.atomic():
+            self.filter(self._pairs_q(pairs)).delete()
+            self._insert_summaries(
+                f"(m.sender_id, m.recipient_id) IN ({wanted})",
+                f"(m.recipient_id, m.sender_id) IN ({wanted})",
+                [profile_ids, partner_ids, profile_ids, partner_ids],
+            )
+
+    def rebuild(self, profile_ids: Iterable[int]) -> None:
+        """Recompute every row of the given profiles from their message history.
+
+        Args:
+            profile_ids: Profiles whose inbox rows to rebuild.
+        """
+        profile_ids = list(profile_ids)
+        if not profile_ids:
+            return
+        with transaction.atomic():
+            self.filter(profile_id__in=profile_ids).delete()
+            self._insert_summaries("m.sender_id = ANY(%s::bigint[])", "m.recipient_id = ANY(%s::bigint[])", [profile_ids, profile_ids])
+
+    @staticmethod
+    def _pairs_q(pairs: list[tuple[int, int]]) -> Q:
+        q = Q(pk__in=[])
+        for profile_id, partner_id in pairs:
+            q |= Q(profile_id=profile_id, partner_id=partner_id)
+        return q
+
+    def _insert_summaries(self, sent_filter: str, received_filter: str, params: list[Any]) -> None:
+        """Insert one aggregated row per conversation matched by the two message filters.
+
+        Mirrors ``DirectMessageQuerySet.visible_to``: a profile sees everything
+        it sent, and everything it received that it hasn't deleted for itself.
+
+        Args:
+            sent_filter: SQL condition on message ``m`` selecting messages
+                counted on their sender's row.
+            received_filter: The same for messages counted on their
+                recipient's row.
+            params: Query parameters for both filters, in order.
+        """
+        from urbanlens.dashboard.models.direct_messages.model import DirectMessage
+
+        table = self.model._meta.db_table  # noqa: SLF001 - _meta is public API despite the underscore
+        message_table = DirectMessage._meta.db_table  # noqa: SLF001
+        sql = f"""
+            INSERT INTO {table} (created, updated, profile_id, partner_id, last_message_id, unread_count)
+            SELECT now(), now(), v.profile_id, v.partner_id, MAX(v.id),
+                COUNT(*) FILTER (WHERE v.recipient_id = v.profile_id AND v.read_at IS NULL)
+            FROM (
+                SELECT m.sender_id AS profile_id, m.recipient_id AS partner_id, m.id, m.recipient_id, m.read_at
+                FROM {message_table} AS m
+                WHERE {sent_filter}
+                UNION ALL
+                SELECT m.recipient_id, m.sender_id, m.id, m.recipient_id, m.read_at
+                FROM {message_table} AS m
+                WHERE {received_filter} AND m.deleted_by_recipient_at IS NULL AND m.sender_id <> m.recipient_id
+            ) AS v
+            GROUP BY v.profile_id, v.partner_id
+            ON CONFLICT (profile_id, partner_id) DO UPDATE SET
+                last_message_id = EXCLUDED.last_message_id,
+                unread_count = EXCLUDED.unread_count,
+                updated = EXCLUDED.updated
+        """  # noqa: S608 - identifiers from Django _meta, filters are fixed SQL fragments
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+
 class DirectMessageMuteQuerySet(abstract.DashboardQuerySet):
     """Custom queryset for DirectMessageMute models."""
 
@@ -0,0 +1,66 @@
+"""Keep DirectMessageConversation inbox rows in step with the messages.
+
+Receivers run inside the writing transaction, so an inbox never shows a
+message that was rolled back. ``QuerySet.update()`` writes bypass them:
+``DirectMessageQuerySet.mark_read`` refreshes the rows itself, and any other
+bulk update that touches ``read_at`` or ``deleted_by_recipient_at`` must call
+``DirectMessageConversation.objects.refresh_pairs``. A bulk delete can wrap
+itself in :func:`deferred_conversation_refresh` and refresh each pair once
+afterwards instead of once per deleted row.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from urbanlens.dashboard.models.direct_messages.conversation import DirectMessageConversation
+from urbanlens.dashboard.models.direct_messages.model import DirectMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Fields whose change can move a conversation's last message or unread count.
+_SUMMARY_FIELDS = frozenset({"read_at", "deleted_by_recipient_at"})
+
+# True while a bulk delete has taken over refreshing the inbox rows.
+_refresh_deferred: ContextVar[bool] = ContextVar("direct_message_refresh_deferred", default=False)
+
+
+@contextmanager
+def deferred_conversation_refresh() -> Iterator[None]:
+    """Skip the per-message inbox refresh for deletes made inside the block.
+
+    The caller owns the refresh: collect the pairs first (see
+    ``DirectMessageQuerySet.conversation_pairs``) and pass them to
+    ``DirectMessageConversation.objects.refresh_pairs`` once the rows are gone,
+    in the same transaction.
+    """
+    token = _refresh_deferred.set(True)
+    try:
+        yield
+    finally:
+        _refresh_deferred.reset(token)
+
+
+def _pairs(message: DirectMessage) -> set[tuple[int, int]]:
+    return {(message.sender_id, message.recipient_id), (message.recipient_id, message.sender_id)}
+
+
+@receiver(post_save, sender=DirectMessage, dispatch_uid="direct_message_update_conversations")
+def update_conversations_for_message(sender: type[DirectMessage], instance: DirectMessage, created: bool, update_fields: frozenset[str] | None, **kwargs) -> None:
+    if created:
+        DirectMessageConversation.objects.record_message(instance)
+    elif update_fields is None or update_fields & _SUMMARY_FIELDS:
+        DirectMessageConversation.objects.refresh_pairs(_pairs(instance))
+
+
+@receiver(post_delete, sender=DirectMessage, dispatch_uid="direct_message_delete_update_conversations")
+def update_conversations_for_deleted_message(sender: type[DirectMessage], instance: DirectMessage, **kwargs) -> None:
+    if _refresh_deferred.get():
+        return
+    DirectMessageConversation.objects.refresh_pairs(_pairs(instance))
@@ -1,16 +1,17 @@
 """Group chat models - multi-member conversations built on the direct message system.
 
 A ``GroupChat`` is a named, multi-member conversation. Unlike one-to-one
-direct messages (which have no conversation row at all - see
-``DirectMessage``), group membership, history visibility, and read state all
-hang off explicit rows here:
+direct messages (where a conversation is just the messages between two
+profiles - see ``DirectMessage``), group membership, history visibility, and
+read state all hang off explicit rows here:
 
 - ``GroupChatMembership`` - one row per member *stint*. Leaving or being
   removed sets ``left_at`` (the row is kept for history); being re-added
   creates a brand-new row. A member only ever sees messages sent during
   their current stint (``GroupMessageQuerySet.visible_window``), which is
   what guarantees that someone added to a conversation cannot read anything
-  sent before they joined.
+  sent before they joined. The row also carries the stint's inbox summary
+  (last message, unread count).
 - ``GroupMessage`` - one message in one group, plaintext or end-to-end
   encrypted (same body-xor-ciphertext contract as ``DirectMessage``; group
   keys live in ``models.e2ee.group_key``).
@@ -148,10 +149,24 @@ class GroupChatMembership(abstract.DashboardModel):
     # Per-member notification muting for this group (mirrors DirectMessageMute).
     muted = BooleanField(default=False)
 
+    # Inbox summary for this stint, kept current by GroupChatMembershipManager.
+    # record_message (on every send) and GroupMessageQuerySet.mark_read, so
+    # the sidebar never scans message history: the newest message visible to
+    # this stint, and how many messages from others arrived since last_read_at.
+    last_message = ForeignKey(
+        "dashboard.GroupMessage",
+        on_delete=SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+    unread_count = PositiveIntegerField(default=0)
+
     if TYPE_CHECKING:
         group_id: int
         profile_id: int
         removed_by_id: int | None
+        last_message_id: int | None
 
     objects = GroupChatMembershipManager()
 
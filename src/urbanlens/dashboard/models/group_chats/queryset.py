@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Self
 
-from django.db.models import Q
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from urbanlens.dashboard.models import abstract
 
 if TYPE_CHECKING:
-    from urbanlens.dashboard.models.group_chats.model import GroupChatMembership
+    from urbanlens.dashboard.models.group_chats.model import GroupChatMembership, GroupMessage
     from urbanlens.dashboard.models.profile.model import Profile
 
 
@@ -44,10 +45,54 @@ class GroupChatMembershipQuerySet(abstract.DashboardQuerySet):
         """
         return self.filter(left_at__isnull=True)
 
+    def rebuild_summaries(self) -> int:
+        """Recompute these memberships' inbox summaries from their messages.
+
+        The set-based equivalent of what ``record_message`` and
+        ``GroupMessageQuerySet.mark_read`` maintain incrementally, for the
+        ``rebuild_dm_conversations`` command.
+
+        Returns:
+            Number of memberships updated.
+        """
+        from urbanlens.dashboard.models.group_chats.model import GroupMessage
+
+        visible = GroupMessage.objects.filter(group_id=OuterRef("group_id"), created__gte=OuterRef("created")).order_by()
+        last = visible.order_by("-id")[:1]
+        unread = visible.exclude(sender_id=OuterRef("profile_id")).annotate(read_mark=OuterRef("last_read_at")).filter(Q(read_mark__isnull=True) | Q(created__gt=F("read_mark"))).values("group_id").annotate(count=Count("id")).values("count")
+        return self.update(
+            last_message_id=Subquery(last.values("id")),
+            unread_count=Coalesce(Subquery(unread), 0),
+        )
+
 
 class GroupChatMembershipManager(abstract.DashboardManager.from_queryset(GroupChatMembershipQuerySet)):
     """Manager for GroupChatMembership."""
 
+    def record_message(self, message: GroupMessage) -> int:
+        """Fold one new message into the inbox summary of every member who can see it.
+
+        One UPDATE across the group's active memberships whose stint had
+        started when the message was sent: each moves its last message
+        forward (never backwards, should sends commit out of order), and
+        every member but the sender counts it as unread.
+
+        Args:
+            message: The message just created.
+
+        Returns:
+            Number of memberships updated.
+        """
+        newer = Q(last_message_id__isnull=True) | Q(last_message_id__lt=message.pk)
+        return (
+            self.active()
+            .filter(group_id=message.group_id, created__lte=message.created)
+            .update(
+                last_message_id=Case(When(newer, then=Value(message.pk)), default=F("last_message_id")),
+                unread_count=F("unread_count") + Case(When(profile_id=message.sender_id, then=Value(0)), default=Value(1)),
+            )
+        )
+
 
 class GroupMessageQuerySet(abstract.DashboardQuerySet):
     """QuerySet for GroupMessage with membership-scoped visibility helpers."""
@@ -85,14 +130,15 @@ class GroupMessageQuerySet(abstract.DashboardQuerySet):
         return queryset
 
     def mark_read(self, membership: GroupChatMembership) -> None:
-        """Advance the membership's read high-water mark to now.
+        """Advance the membership's read high-water mark to now and clear its unread count.
 
         Args:
             membership: The viewer's active membership row (updated in place).
         """
         now = timezone.now()
-        type(membership).objects.filter(pk=membership.pk).update(last_read_at=now)
+        type(membership).objects.filter(pk=membership.pk).update(last_read_at=now, unread_count=0)
         membership.last_read_at = now
+        membership.unread_count = 0
 
     def search_visible_to(self, profile: Profile) -> Self:
         """Return every plaintext message `profile` may see across all their groups.
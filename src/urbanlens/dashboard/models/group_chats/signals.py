@@ -0,0 +1,19 @@
+"""Keep group chat membership inbox summaries in step with new messages."""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from urbanlens.dashboard.models.group_chats.model import GroupChatMembership, GroupMessage
+
+
+@receiver(post_save, sender=GroupMessage, dispatch_uid="group_message_update_membership_summaries")
+def update_membership_summaries(sender: type[GroupMessage], instance: GroupMessage, created: bool, **kwargs) -> None:
+    """Count a new message on every member's summary, inside the sending transaction.
+
+    Tombstoning a message (``deleted_at``) leaves it in the timeline, so
+    later saves don't change any summary.
+    """
+    if created:
+        GroupChatMembership.objects.record_message(instance)
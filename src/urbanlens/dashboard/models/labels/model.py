@@ -157,21 +157,15 @@ class Label(abstract.FrontendDashboardModel):
 
     @classmethod
     def get_label_and_descendants(cls, label_id: int) -> set[int]:
-        """Return label_id plus all descendant label IDs (BFS, cycle-safe).
+        """Return label_id plus all descendant label IDs (one recursive query, cycle-safe).
 
         Used so that filtering pins by a parent label also surfaces pins carrying
-        any of its descendant labels.
+        any of its descendant labels. Expanding several labels at once should go
+        through ``services.labels.hierarchy.descendant_map`` instead.
         """
-        visited: set[int] = set()
-        queue: list[int] = [label_id]
-        while queue:
-            current = queue.pop(0)
-            if current in visited:
-                continue
-            visited.add(current)
-            children_ids = list(cls.objects.filter(parents__id=current).values_list("id", flat=True))
-            queue.extend(children_ids)
-        return visited
+        from urbanlens.dashboard.services.labels.hierarchy import descendant_map
+
+        return descendant_map([label_id])[int(label_id)]
 
     def __str__(self) -> str:
         if self.profile_id:
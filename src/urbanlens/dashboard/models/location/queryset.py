@@ -9,13 +9,15 @@ from django.contrib.gis.geos import Point
 from django.contrib.gis.measure import D
 
 # Django Imports
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 from django.db.models import DecimalField, Q
 
 # App Imports
 from urbanlens.dashboard.models import abstract
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from urbanlens.dashboard.models.location.model import Location
 
 logger = logging.getLogger(__name__)
@@ -250,3 +252,78 @@ class LocationManager(abstract.PublicDashboardManager.from_queryset(LocationQuer
 
         # Return the new location and True for 'created'
         return location, True
+
+    def nearby_ids(self, coordinates: Sequence[tuple[float, float]], threshold_meters: float = 50) -> list[int | None]:
+        """The Location :meth:`get_nearby_or_create` would reuse for each coordinate, in one query.
+
+        A lateral join probes the ``point`` geography index around every
+        coordinate at once and, like ``get_nearby_or_create``, takes the
+        lowest-pk Location within the threshold.
+
+        Args:
+            coordinates: ``(latitude, longitude)`` pairs.
+            threshold_meters: Distance within which a Location counts as the same place.
+
+        Returns:
+            One Location pk per coordinate, in input order; None where no
+            Location lies within the threshold.
+        """
+        matches: list[int | None] = [None] * len(coordinates)
+        if not coordinates:
+            return matches
+
+        table = self.model._meta.db_table  # noqa: SLF001 - _meta is public API despite the underscore
+        point_column = self.model._meta.get_field("point").column  # noqa: SLF001
+        sql = f"""
+            SELECT probe.idx, nearest.id
+            FROM unnest(%s::int[], %s::float8[], %s::float8[]) AS probe(idx, latitude, longitude)
+            CROSS JOIN LATERAL (
+                SELECT location.id FROM {table} AS location
+                WHERE ST_DWithin(location.{point_column}, ST_SetSRID(ST_MakePoint(probe.longitude, probe.latitude), 4326)::geography, %s)
+                ORDER BY location.id
+                LIMIT 1
+            ) AS nearest
+        """  # noqa: S608 - identifiers from Django _meta, not user input
+        params = [list(range(len(coordinates))), [float(lat) for lat, _ in coordinates], [float(lon) for _, lon in coordinates], threshold_meters]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for index, location_id in cursor.fetchall():
+                matches[index] = location_id
+        return matches
+
+    def neighbor_counts(self, location_ids: Sequence[int], radius_meters: float, cap: int) -> dict[int, int]:
+        """How many other Locations lie within ``radius_meters`` of each given Location, in one query.
+
+        A lateral join probes the ``point`` geography index around every
+        target at once; each probe stops after ``cap`` neighbors, so a dense
+        city block costs no more than a sparse one.
+
+        Args:
+            location_ids: The Locations to score.
+            radius_meters: Neighborhood radius.
+            cap: Highest count worth distinguishing.
+
+        Returns:
+            ``{location pk: neighbor count (at most cap)}`` for every given
+            Location that exists.
+        """
+        if not location_ids:
+            return {}
+
+        table = self.model._meta.db_table  # noqa: SLF001 - _meta is public API despite the underscore
+        point_column = self.model._meta.get_field("point").column  # noqa: SLF001
+        sql = f"""
+            SELECT target.id, nearby.count
+            FROM {table} AS target
+            CROSS JOIN LATERAL (
+                SELECT COUNT(*) AS count FROM (
+                    SELECT 1 FROM {table} AS other
+                    WHERE other.id <> target.id AND ST_DWithin(other.{point_column}, target.{point_column}, %s)
+                    LIMIT %s
+                ) AS capped
+            ) AS nearby
+            WHERE target.id = ANY(%s)
+        """  # noqa: S608 - identifiers from Django _meta, not user input
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [radius_meters, cap, list(location_ids)])
+            return dict(cursor.fetchall())
@@ -248,6 +248,10 @@ class Pin(abstract.PublicDashboardModel, abstract.SecurityModel, abstract.Addres
     def from_db(cls, db, field_names, values) -> Pin:
         """Track the persisted name and location so ``save()`` can detect renames and moves.
 
+        The footprint inputs (location, parent pin, wiki) are recorded too, so
+        ``models.pin_footprint.signals`` only re-resolves a pin's materialized
+        footprint when one of them changed.
+
         Args:
             db: Database alias the row was loaded from.
             field_names: Names of the loaded fields.
@@ -261,6 +265,8 @@ class Pin(abstract.PublicDashboardModel, abstract.SecurityModel, abstract.Addres
             instance._loaded_name = instance.name  # noqa: SLF001
         if "location" in field_names:
             instance._loaded_location_id = instance.location_id  # noqa: SLF001
+        if {"location_id", "parent_pin_id", "wiki_id"}.issubset(field_names):
+            instance._loaded_footprint_inputs = (instance.location_id, instance.parent_pin_id, instance.wiki_id)  # noqa: SLF001
         return instance
 
     def save(self, *args, **kwargs) -> None:
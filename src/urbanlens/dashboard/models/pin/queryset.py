@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import contextlib
+from decimal import Decimal
 import logging
 import math
 from typing import TYPE_CHECKING, Self
@@ -14,6 +15,7 @@ from django.utils import timezone
 
 # App Imports
 from urbanlens.dashboard.models import abstract
+from urbanlens.dashboard.models.boundary.model import BoundaryType
 from urbanlens.dashboard.services.redact import redact_coordinate
 
 if TYPE_CHECKING:
@@ -190,6 +192,51 @@ class PinQuerySet(abstract.PublicDashboardQuerySet):
         """
         return self.root_pins().filter(location__point__distance_lte=(point, D(km=radius_km))).annotate(distance=Distance("location__point", point)).order_by("distance")
 
+    def containing_point(self, point: Point, boundary_type: str = BoundaryType.PROPERTY) -> Self:
+        """Pins whose materialized footprint contains ``point``.
+
+        One GiST-indexed ``ST_Contains`` over ``PinFootprint`` instead of
+        resolving every candidate's boundary chain. Only root pins have
+        footprints, and only once they've been materialized - pair with
+        :meth:`without_footprint_polygon` for the stragglers.
+
+        Args:
+            point: WGS-84 point to test.
+            boundary_type: A ``BoundaryType`` value.
+
+        Returns:
+            The pins whose footprint of that type contains the point.
+        """
+        return self.filter(footprints__boundary_type=boundary_type, footprints__polygon__contains=point)
+
+    def without_footprint(self, boundary_type: str = BoundaryType.PROPERTY) -> Self:
+        """Pins with no materialized footprint of ``boundary_type`` yet.
+
+        Args:
+            boundary_type: A ``BoundaryType`` value.
+
+        Returns:
+            The pins whose footprint must still be resolved on the fly.
+        """
+        return self.exclude(footprints__boundary_type=boundary_type)
+
+    def without_footprint_polygon(self, boundary_type: str = BoundaryType.PROPERTY) -> Self:
+        """Pins that :meth:`containing_point` can never match.
+
+        Those with no footprint row yet, plus those whose row has a null
+        polygon (nothing in the boundary chain applied). Point-in-pin callers
+        still owe both the per-pin check and its 50 m fallback.
+
+        Args:
+            boundary_type: A ``BoundaryType`` value.
+
+        Returns:
+            The pins whose containment must still be checked on the fly.
+        """
+        from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
+
+        return self.exclude(Exists(PinFootprint.objects.filter(pin=OuterRef("pk"), boundary_type=boundary_type, polygon__isnull=False)))
+
     def within_bounds(self, south: float, west: float, north: float, east: float) -> Self:
         """Return pins whose location falls within a lat/lng bounding box.
 
@@ -213,6 +260,36 @@ class PinQuerySet(abstract.PublicDashboardQuerySet):
         bbox.srid = 4326
         return self.filter(location__point__within=bbox)
 
+    def within_tile(self, south: float, west: float, north: float, east: float) -> Self:
+        """Return pins inside a map tile's half-open lat/lng box.
+
+        Unlike ``within_bounds``, the south and west edges are inclusive and
+        the north and east edges exclusive (closed only on the world's own
+        edge), so adjacent tiles never share a pin - the rule
+        ``tiles.tile_contains`` applies to cached pins. The edges are compared
+        as exact ``Decimal`` values against the stored coordinates, so the
+        database and the cache agree on which side of an edge a pin falls.
+
+        Args:
+            south: Southern (minimum) latitude.
+            west: Western (minimum) longitude.
+            north: Northern (maximum) latitude.
+            east: Eastern (maximum) longitude.
+
+        Returns:
+            This queryset filtered to pins within the tile.
+        """
+        north_lookup = "location__latitude__lte" if north >= 90.0 else "location__latitude__lt"
+        east_lookup = "location__longitude__lte" if east >= 180.0 else "location__longitude__lt"
+        return self.filter(
+            **{
+                "location__latitude__gte": Decimal(south),
+                "location__longitude__gte": Decimal(west),
+                north_lookup: Decimal(north),
+                east_lookup: Decimal(east),
+            }
+        )
+
     def by_tag(self, tag_id: int) -> Self:
         """Filter pins that have this tag or any of its descendant tags."""
         from urbanlens.dashboard.models.labels.model import Label
@@ -225,12 +302,15 @@ class PinQuerySet(abstract.PublicDashboardQuerySet):
 
         Args:
             groups: List of ``{"op": "and"|"or"|"not", "ids": [int, ...]}``.
+                Ids stored as strings by saved filters are accepted too.
 
         Returns:
             Filtered QuerySet (not yet distinct - caller must call ``.distinct()``).
         """
-        from urbanlens.dashboard.models.labels.model import Label as _Label
+        from urbanlens.dashboard.services.labels.hierarchy import descendant_map
 
+        # Every label in every group is expanded up front in one query.
+        expanded = descendant_map(bid for group in groups for bid in group.get("ids", []))
         qs = self
         for group in groups:
             op = group.get("op")
@@ -239,18 +319,15 @@ class PinQuerySet(abstract.PublicDashboardQuerySet):
                 continue
             if op == "and":
                 for bid in ids:
-                    expanded = _Label.get_label_and_descendants(bid)
-                    qs = qs.filter(labels__id__in=expanded)
+                    qs = qs.filter(labels__id__in=expanded[int(bid)])
             elif op == "or":
                 or_q = Q()
                 for bid in ids:
-                    expanded = _Label.get_label_and_descendants(bid)
-                    or_q |= Q(labels__id__in=expanded)
+                    or_q |= Q(labels__id__in=expanded[int(bid)])
                 qs = qs.filter(or_q)
             elif op == "not":
                 for bid in ids:
-                    expanded = _Label.get_label_and_descendants(bid)
-                    qs = qs.exclude(labels__id__in=expanded)
+                    qs = qs.exclude(labels__id__in=expanded[int(bid)])
         return qs
 
     def filter_by_criteria(self, criteria) -> Self:
@@ -286,18 +363,16 @@ class PinQuerySet(abstract.PublicDashboardQuerySet):
         if label_groups := criteria.get("label_groups"):
             qs = qs.apply_label_groups(label_groups)
         else:
-            if tags := criteria.get("tags"):
-                from urbanlens.dashboard.models.labels.model import Label as _Label
+            tags = list(criteria.get("tags") or [])
+            exclude_tags = list(criteria.get("exclude_tags") or [])
+            if tags or exclude_tags:
+                from urbanlens.dashboard.services.labels.hierarchy import descendant_map
 
+                expanded = descendant_map(label.id for label in [*tags, *exclude_tags])
                 for label in tags:
-                    label_ids = _Label.get_label_and_descendants(label.id)
-                    qs = qs.filter(labels__id__in=label_ids)
-            if exclude_tags := criteria.get("exclude_tags"):
-                from urbanlens.dashboard.models.labels.model import Label as _Label
-
+                    qs = qs.filter(labels__id__in=expanded[label.id])
                 for label in exclude_tags:
-                    label_ids = _Label.get_label_and_descendants(label.id)
-                    qs = qs.exclude(labels__id__in=label_ids)
+                    qs = qs.exclude(labels__id__in=expanded[label.id])
         if (min_rating := criteria.get("min_rating")) is not None:
             with contextlib.suppress(ValueError, TypeError):
                 min_rating = int(min_rating)
@@ -458,29 +533,18 @@ class PinQuerySet(abstract.PublicDashboardQuerySet):
         coordinates by a bug get identical, fully-overlapping circles) as well
         as a real drawn-boundary overlap check.
 
-        Both pins in every overlapping pair are included in the result.
+        Both pins in every overlapping pair are included in the result. The
+        pairs come from a bulk footprint fetch and an STRtree self-join (see
+        ``services.pin_overlaps``); to review them as groups rather than a
+        flat set, use ``services.pin_overlaps.overlap_group_page``.
 
         Returns:
             Pins (from this queryset) that overlap at least one other pin also
             in this queryset.
         """
-        from urbanlens.dashboard.models.boundary.model import Boundary, BoundaryType
-        from urbanlens.dashboard.models.pin.model import Pin
-
-        # Re-queried via the concrete Pin manager (rather than iterating `self`
-        # directly) so effective_polygon_for_pin, which takes a concrete Pin,
-        # type-checks - `self` here is still the generic PinQuerySet[_ModelT].
-        pins = Pin.objects.filter(pk__in=self.values_list("pk", flat=True)).select_related("location")
-        footprints = [(pin.pk, polygon) for pin in pins if (polygon := Boundary.objects.effective_polygon_for_pin(pin, BoundaryType.PROPERTY)) is not None]
-
-        overlapping_ids: set[int] = set()
-        for i, (pk_a, polygon_a) in enumerate(footprints):
-            for pk_b, polygon_b in footprints[i + 1 :]:
-                if polygon_a.intersects(polygon_b):
-                    overlapping_ids.add(pk_a)
-                    overlapping_ids.add(pk_b)
+        from urbanlens.dashboard.services.pin_overlaps import overlap_groups
 
-        return self.filter(pk__in=overlapping_ids)
+        return self.filter(pk__in=[pin_id for group in overlap_groups(self) for pin_id in group])
 
     def rated(self, rating) -> Self:
         """
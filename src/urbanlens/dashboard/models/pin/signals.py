@@ -1,13 +1,21 @@
+from __future__ import annotations
+
+from collections import defaultdict
 import logging
+from typing import TYPE_CHECKING
 
 from django.db import transaction
-from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from urbanlens.dashboard.models.labels.customization.model import LabelCustomization
 from urbanlens.dashboard.models.labels.model import Label
 from urbanlens.dashboard.models.pin import Pin
 from urbanlens.dashboard.models.reviews.model import Review
+from urbanlens.dashboard.services.map_pins.refresh import refresh_labels_on_commit, refresh_pins_on_commit
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
 
 logger = logging.getLogger(__name__)
 
@@ -27,26 +35,21 @@ def invalidate_profile_map_center(sender: type[Pin], instance: Pin, created: boo
 
 def _refresh_cached_pin(pin_id: int, profile_id: int) -> None:
     """Update one cached map pin if that profile is currently cached in Valkey."""
+    refresh_pins_on_commit(profile_id, [pin_id])
 
-    def _run() -> None:
-        from urbanlens.dashboard.models.profile.model import Profile
-        from urbanlens.dashboard.services.map_pins import MapPinCache
 
-        try:
-            profile = Profile.objects.get(pk=profile_id)
-            pin = Pin.objects.get(pk=pin_id)
-        except (Profile.DoesNotExist, Pin.DoesNotExist):
-            try:
-                MapPinCache(Profile(pk=profile_id)).delete_pin(pin_id)
-            except (ConnectionError, OSError, RuntimeError):
-                logger.debug("Unable to delete missing pin %s from map cache", pin_id, exc_info=True)
-            return
-        try:
-            MapPinCache(profile).upsert_pin(pin)
-        except (ConnectionError, OSError, RuntimeError):
-            logger.warning("Unable to refresh cached map pin %s", pin_id, exc_info=True)
+def _refresh_cached_pins_by_profile(pins: QuerySet[Pin]) -> None:
+    """Re-render cached map pins in one batch per owning profile."""
+    pin_ids_by_profile: defaultdict[int, set[int]] = defaultdict(set)
+    for pin_id, profile_id in pins.values_list("pk", "profile_id"):
+        pin_ids_by_profile[profile_id].add(pin_id)
+    for profile_id, pin_ids in pin_ids_by_profile.items():
+        refresh_pins_on_commit(profile_id, pin_ids)
 
-    transaction.on_commit(_run)
+
+def _label_profile_ids(label: Label) -> list[int]:
+    """Profiles owning at least one pin that carries *label*."""
+    return list(Pin.objects.filter(labels=label).order_by().values_list("profile_id", flat=True).distinct())
 
 
 def _delete_cached_pin(pin_id: int, profile_id: int) -> None:
@@ -99,9 +102,21 @@ def record_pin_tombstone(sender: type[Pin], instance: Pin, **kwargs) -> None:
 
 
 @receiver(m2m_changed, sender=Pin.labels.through, dispatch_uid="pin_labels_refresh_map_pin_cache")
-def refresh_map_pin_cache_for_labels(sender, instance: Pin, action: str, **kwargs) -> None:
-    if action in {"post_add", "post_remove", "post_clear"} and instance.profile_id:
-        _refresh_cached_pin(instance.pk, instance.profile_id)
+def refresh_map_pin_cache_for_labels(sender, instance: Pin | Label, action: str, pk_set=None, reverse: bool = False, **kwargs) -> None:
+    """Re-render pins whose labels changed, from either side of the relation.
+
+    ``pin.labels.add(...)`` passes the pin as *instance*; ``label.pins.add(...)``
+    (as label merges do) passes the label, with the affected pins in *pk_set*.
+    A reverse clear has no *pk_set*, so its pins are collected on
+    ``pre_clear`` - the refresh itself still waits for the commit.
+    """
+    if not reverse:
+        if action in {"post_add", "post_remove", "post_clear"} and instance.profile_id:
+            _refresh_cached_pin(instance.pk, instance.profile_id)
+    elif action in {"post_add", "post_remove"} and pk_set:
+        _refresh_cached_pins_by_profile(Pin.objects.filter(pk__in=pk_set))
+    elif action == "pre_clear":
+        _refresh_cached_pins_by_profile(Pin.objects.filter(labels=instance))
 
 
 @receiver(post_save, sender=Label, dispatch_uid="label_refresh_map_pin_cache")
@@ -113,18 +128,32 @@ def refresh_map_pin_cache_for_label(sender: type[Label], instance: Label, create
     server-side Redis pin cache for pins that already carry this label - they'd
     keep serving the old baked-in icon/color until something else happened to
     touch that specific pin, or the cache TTL lapsed.
+
+    Each cache finds the pins through its own label index
+    (``MapPinCache.refresh_labels``) and re-renders them in one batch.
     """
     if created:
         return  # not attached to any pin yet
-    for pin_id, profile_id in Pin.objects.filter(labels=instance).values_list("pk", "profile_id"):
-        _refresh_cached_pin(pin_id, profile_id)
+    refresh_labels_on_commit(_label_profile_ids(instance), [instance.pk])
+
+
+@receiver(pre_delete, sender=Label, dispatch_uid="label_delete_refresh_map_pin_cache")
+def refresh_map_pin_cache_for_deleted_label(sender: type[Label], instance: Label, **kwargs) -> None:
+    """Drop a deleted (or merged-away) label's chip and icon from cached pins.
+
+    Deleting a label removes its ``Pin.labels.through`` rows without any
+    m2m signal, so the owning profiles are read here, before the rows go;
+    the caches' label indexes still list the pins when the refresh runs
+    after commit.
+    """
+    refresh_labels_on_commit(_label_profile_ids(instance), [instance.pk])
 
 
 @receiver(post_save, sender=LabelCustomization, dispatch_uid="label_customization_refresh_map_pin_cache")
+@receiver(post_delete, sender=LabelCustomization, dispatch_uid="label_customization_delete_refresh_map_pin_cache")
 def refresh_map_pin_cache_for_label_customization(sender: type[LabelCustomization], instance: LabelCustomization, **kwargs) -> None:
     """Per-profile icon/color overrides need the same cache refresh as editing the label itself."""
-    for pin_id in Pin.objects.filter(profile_id=instance.profile_id, labels=instance.label_id).values_list("pk", flat=True):
-        _refresh_cached_pin(pin_id, instance.profile_id)
+    refresh_labels_on_commit([instance.profile_id], [instance.label_id])
 
 
 @receiver(m2m_changed, sender=Pin.labels.through, dispatch_uid="pin_labels_propagate_visited")
@@ -149,15 +178,27 @@ def propagate_visited_label_to_ancestors(sender, instance: Pin, action: str, pk_
         ancestor.labels.add(visited_label)
 
 
+def _changes_map_rating(review: Review) -> bool:
+    """Whether saving or deleting *review* can change its pin's ``map_rating``.
+
+    The map shows each pin's newest review rating (see
+    ``MapPinPayloadService.prepare_queryset``), so edits to older reviews
+    leave the cached pin as it is.
+    """
+    if not review.pin_id:
+        return False
+    return review.created is None or not Review.objects.filter(pin_id=review.pin_id, created__gt=review.created).exists()
+
+
 @receiver(post_save, sender=Review, dispatch_uid="review_refresh_map_pin_cache")
 def refresh_map_pin_cache_for_review(sender, instance: Review, **kwargs) -> None:
-    if instance.pin_id:
+    if _changes_map_rating(instance):
         _refresh_cached_pin(instance.pin_id, instance.pin.profile_id)
 
 
 @receiver(post_delete, sender=Review, dispatch_uid="review_delete_refresh_map_pin_cache")
 def refresh_map_pin_cache_for_deleted_review(sender, instance: Review, **kwargs) -> None:
-    if instance.pin_id:
+    if _changes_map_rating(instance):
         _refresh_cached_pin(instance.pin_id, instance.pin.profile_id)
 
 
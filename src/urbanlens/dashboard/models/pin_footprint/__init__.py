@@ -0,0 +1 @@
+from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
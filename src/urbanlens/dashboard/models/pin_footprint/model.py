@@ -0,0 +1,66 @@
+"""Materialized effective footprint of a root pin.
+
+A pin's effective property (or building) boundary is not a stored column: it
+is resolved through ``BoundaryManager.resolve_for_pin``'s chain - the pin's
+own drawing, its wiki's drawing, the location's generated default, else a
+circle around the coordinates. That chain costs several queries per pin, and
+"which of my pins contain this point" ran it for every candidate pin.
+
+``PinFootprint`` stores the chain's answer for every root pin, one row per
+boundary type, in a GiST-indexed geometry column, so point-in-pin matching
+becomes one ``ST_Contains`` query (see ``PinQuerySet.containing_point`` and
+``PinFootprintManager.pins_containing``). A row whose ``polygon`` is null
+records that nothing applies (e.g. no known building). Root pins without any
+row yet - created before this table existed, or by a write path that skipped
+signals - and rows with a null polygon are still resolved the old way by
+every point-in-pin caller (``PinQuerySet.without_footprint_polygon``).
+
+Rows are rebuilt after commit by ``models.pin_footprint.signals`` whenever an
+input to the chain changes: a pin's location/wiki/parent, a boundary row, a
+wiki moving to another location, or a vote changing a location's official
+boundary (``services.boundary_voting.apply_winning_boundary``). The
+``refresh_pin_footprints`` management command backfills existing pins.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.contrib.gis.db.models import MultiPolygonField
+from django.db.models import CASCADE, CharField, ForeignKey, Index
+from django.db.models.constraints import UniqueConstraint
+
+from urbanlens.dashboard.models import abstract
+from urbanlens.dashboard.models.boundary.model import BoundaryType
+from urbanlens.dashboard.models.pin_footprint.queryset import PinFootprintManager
+
+
+class PinFootprint(abstract.DashboardModel):
+    """One root pin's effective boundary of one type."""
+
+    pin = ForeignKey("dashboard.Pin", on_delete=CASCADE, related_name="footprints")
+    # Mirrors pin.profile so per-profile containment queries stay on this table.
+    profile = ForeignKey("dashboard.Profile", on_delete=CASCADE, related_name="pin_footprints")
+    boundary_type = CharField(max_length=20, choices=BoundaryType.choices)
+    # Planar geometry rather than geography: ST_Contains has no geography
+    # form, and planar containment in lon/lat is what the in-Python
+    # ``polygon.contains(point)`` checks it replaces computed too.
+    polygon = MultiPolygonField(srid=4326, null=True, blank=True)
+
+    if TYPE_CHECKING:
+        pin_id: int
+        profile_id: int
+
+    objects = PinFootprintManager()
+
+    class Meta(abstract.DashboardModel.Meta):
+        db_table = "dashboard_pin_footprints"
+        constraints = [
+            UniqueConstraint(fields=["pin", "boundary_type"], name="pin_footprint_unique_pin_type"),
+        ]
+        indexes = [
+            Index(fields=["profile", "boundary_type"], name="idxdb_pinfoot_prof_type"),
+        ]
+
+    def __str__(self) -> str:
+        return f"PinFootprint({self.boundary_type}, pin={self.pin_id})"
@@ -0,0 +1,167 @@
+"""QuerySet/Manager for materialized pin footprints."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Self
+
+from django.contrib.gis.geos import MultiPolygon, Polygon
+from django.db import DatabaseError, connection, transaction
+
+from urbanlens.dashboard.models import abstract
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from django.contrib.gis.geos import GEOSGeometry, Point
+    from django.db.models import QuerySet
+
+    from urbanlens.dashboard.models.pin.model import Pin
+
+logger = logging.getLogger(__name__)
+
+
+def _as_multipolygon(polygon: GEOSGeometry | None) -> MultiPolygon | None:
+    """The resolved polygon in the column's shape (circle fallbacks are plain Polygons)."""
+    if isinstance(polygon, Polygon):
+        return MultiPolygon(polygon, srid=polygon.srid or 4326)
+    return polygon
+
+
+class PinFootprintQuerySet(abstract.DashboardQuerySet):
+    """QuerySet for :class:`~urbanlens.dashboard.models.pin_footprint.model.PinFootprint`."""
+
+    def of_type(self, boundary_type: str) -> Self:
+        """Footprints of one boundary type."""
+        return self.filter(boundary_type=boundary_type)
+
+    def containing(self, point: Point) -> Self:
+        """Footprints whose polygon contains ``point`` (GiST-indexed ``ST_Contains``)."""
+        return self.filter(polygon__contains=point)
+
+
+class PinFootprintManager(abstract.DashboardManager.from_queryset(PinFootprintQuerySet)):
+    """Manager for :class:`~urbanlens.dashboard.models.pin_footprint.model.PinFootprint`."""
+
+    def polygons_by_pin_id(self, pin_ids: Iterable[int], boundary_type: str) -> dict[int, GEOSGeometry | None]:
+        """Materialized footprints for a batch of pins, keyed by pin id.
+
+        Args:
+            pin_ids: Primary keys of the pins to look up.
+            boundary_type: A ``BoundaryType`` value.
+
+        Returns:
+            Dict mapping pin id to its polygon - None when the row records
+            that no boundary applies. Pins without a row are omitted.
+        """
+        pin_ids = list(pin_ids)
+        if not pin_ids:
+            return {}
+        return dict(self.of_type(boundary_type).filter(pin_id__in=pin_ids).values_list("pin_id", "polygon"))
+
+    def pins_containing(self, profile_id: int, coordinates: Sequence[tuple[float, float]], boundary_type: str) -> list[int | None]:
+        """The profile's root pin whose footprint contains each coordinate, in one query.
+
+        Where several footprints contain a coordinate, the pin whose location
+        is nearest wins - the order ``PinQuerySet.near_point`` candidates were
+        checked in before footprints were materialized.
+
+        Args:
+            profile_id: The profile whose pins to match.
+            coordinates: ``(latitude, longitude)`` pairs.
+            boundary_type: A ``BoundaryType`` value.
+
+        Returns:
+            One pin pk per coordinate, in input order; None where no
+            materialized footprint contains it.
+        """
+        from urbanlens.dashboard.models.location.model import Location
+        from urbanlens.dashboard.models.pin.model import Pin
+
+        matches: list[int | None] = [None] * len(coordinates)
+        if not coordinates:
+            return matches
+
+        footprint_table = self.model._meta.db_table  # noqa: SLF001 - _meta is public API despite the underscore
+        pin_table = Pin._meta.db_table  # noqa: SLF001
+        pin_location_column = Pin._meta.get_field("location").column  # noqa: SLF001
+        location_table = Location._meta.db_table  # noqa: SLF001
+        point_column = Location._meta.get_field("point").column  # noqa: SLF001
+        sql = f"""
+            SELECT DISTINCT ON (probe.idx) probe.idx, footprint.pin_id
+            FROM unnest(%s::int[], %s::float8[], %s::float8[]) AS probe(idx, latitude, longitude)
+            JOIN {footprint_table} AS footprint
+                ON footprint.profile_id = %s
+                AND footprint.boundary_type = %s
+                AND ST_Contains(footprint.polygon, ST_SetSRID(ST_MakePoint(probe.longitude, probe.latitude), 4326))
+            JOIN {pin_table} AS pin ON pin.id = footprint.pin_id
+            LEFT JOIN {location_table} AS location ON location.id = pin.{pin_location_column}
+            ORDER BY probe.idx, ST_Distance(location.{point_column}, ST_SetSRID(ST_MakePoint(probe.longitude, probe.latitude), 4326)::geography), footprint.pin_id
+        """  # noqa: S608 - identifiers from Django _meta, not user input
+        params = [list(range(len(coordinates))), [float(lat) for lat, _ in coordinates], [float(lon) for _, lon in coordinates], profile_id, boundary_type]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for index, pin_id in cursor.fetchall():
+                matches[index] = pin_id
+        return matches
+
+    def refresh(self, pins: QuerySet[Pin]) -> int:
+        """Re-resolve and store the footprints of a batch of pins.
+
+        Root pins get one row per boundary type; rows left on pins that have
+        since become detail pins are deleted.
+
+        Args:
+            pins: The pins to refresh.
+
+        Returns:
+            Number of root pins whose footprints were written.
+        """
+        from urbanlens.dashboard.models.boundary.model import Boundary, BoundaryType
+
+        pin_list = list(pins.select_related("location", "location__wiki", "wiki"))
+        if not pin_list:
+            return 0
+        root_pins = [pin for pin in pin_list if not pin.parent_pin_id]
+        rows = []
+        for boundary_type in BoundaryType.values:
+            polygons = Boundary.objects.resolve_root_polygons_by_pin_id(root_pins, boundary_type)
+            rows.extend(self.model(pin=pin, profile_id=pin.profile_id, boundary_type=boundary_type, polygon=_as_multipolygon(polygons.get(pin.pk))) for pin in root_pins)
+
+        with transaction.atomic():
+            self.filter(pin_id__in=[pin.pk for pin in pin_list if pin.parent_pin_id]).delete()
+            # An upsert rather than delete-and-insert, so two refreshes of
+            # the same pin racing each other can't trip the unique constraint.
+            self.bulk_create(rows, update_conflicts=True, unique_fields=["pin", "boundary_type"], update_fields=["profile", "polygon", "updated"])
+        return len(root_pins)
+
+    def refresh_on_commit(self, pins: QuerySet[Pin]) -> None:
+        """Refresh the footprints of ``pins`` once the current transaction commits.
+
+        The queryset is evaluated at commit time, so pins created later in
+        the same transaction are picked up too.
+
+        Args:
+            pins: The pins whose footprint inputs changed.
+        """
+
+        def _run() -> None:
+            try:
+                self.refresh(pins)
+            except DatabaseError:
+                logger.warning("Unable to refresh pin footprints", exc_info=True)
+
+        transaction.on_commit(_run)
+
+    def refresh_location_on_commit(self, location_id: int) -> None:
+        """Refresh every root pin at a location once the current transaction commits.
+
+        For writes that change a location's default boundary with
+        ``QuerySet.update()``, which the post_save receivers never see.
+
+        Args:
+            location_id: The location whose default boundary changed.
+        """
+        from urbanlens.dashboard.models.pin.model import Pin
+
+        self.refresh_on_commit(Pin.objects.root_pins().filter(location_id=location_id))
@@ -0,0 +1,71 @@
+"""Keep materialized pin footprints current.
+
+Every receiver here only works out *which* pins an edit can affect and hands
+them to ``PinFootprint.objects.refresh_on_commit``; the footprints are
+re-resolved once the edit commits. ``QuerySet.update()`` writes bypass these
+receivers, so the services that update boundary geometry that way
+(``generate_location_boundaries``, ``apply_winning_boundary``) schedule the
+refresh themselves via ``PinFootprint.objects.refresh_location_on_commit``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from urbanlens.dashboard.models.boundary.model import Boundary
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
+from urbanlens.dashboard.models.wiki.model import Wiki
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+
+def _pins_affected_by(boundary: Boundary) -> QuerySet[Pin] | None:
+    """Root pins whose effective boundary can resolve through ``boundary``."""
+    if boundary.pin_id:
+        return Pin.objects.filter(pk=boundary.pin_id)
+    if boundary.wiki_id:
+        # Pins linked to the wiki, plus unlinked pins that fall back to their
+        # location's wiki (see BoundaryManager.resolve_for_pin).
+        return Pin.objects.root_pins().filter(Q(wiki_id=boundary.wiki_id) | Q(wiki__isnull=True, location__wiki=boundary.wiki_id))
+    if boundary.source or not boundary.location_id:
+        # Vote candidates only reach pins once apply_winning_boundary copies
+        # the winner onto the location default.
+        return None
+    return Pin.objects.root_pins().filter(location_id=boundary.location_id)
+
+
+@receiver(post_save, sender=Boundary, dispatch_uid="boundary_refresh_pin_footprints")
+@receiver(post_delete, sender=Boundary, dispatch_uid="boundary_delete_refresh_pin_footprints")
+def refresh_footprints_for_boundary(sender: type[Boundary], instance: Boundary, **kwargs) -> None:
+    if (pins := _pins_affected_by(instance)) is not None:
+        PinFootprint.objects.refresh_on_commit(pins)
+
+
+@receiver(post_save, sender=Pin, dispatch_uid="pin_refresh_footprint")
+def refresh_footprint_for_pin(sender: type[Pin], instance: Pin, created: bool, **kwargs) -> None:
+    """Re-resolve a pin that is new, or whose location, wiki or parent changed.
+
+    Saves that touch none of those (renames, notes, visits) leave the
+    footprint alone; ``Pin.from_db`` records the loaded values to compare.
+    """
+    inputs = (instance.location_id, instance.parent_pin_id, instance.wiki_id)
+    if created or getattr(instance, "_loaded_footprint_inputs", None) != inputs:
+        PinFootprint.objects.refresh_on_commit(Pin.objects.filter(pk=instance.pk))
+        instance._loaded_footprint_inputs = inputs  # noqa: SLF001 - the pin's own from_db snapshot
+
+
+@receiver(post_save, sender=Wiki, dispatch_uid="wiki_refresh_pin_footprints")
+def refresh_footprints_for_wiki(sender: type[Wiki], instance: Wiki, created: bool, **kwargs) -> None:
+    """A wiki repointed to another Location changes which unlinked pins fall back to it."""
+    loaded_location_id = getattr(instance, "_loaded_location_id", None)
+    if created or loaded_location_id == instance.location_id:
+        return
+    location_ids = [location_id for location_id in (loaded_location_id, instance.location_id) if location_id]
+    PinFootprint.objects.refresh_on_commit(Pin.objects.root_pins().filter(wiki__isnull=True, location_id__in=location_ids))
+    instance._loaded_location_id = instance.location_id  # noqa: SLF001 - the wiki's own from_db snapshot
@@ -522,6 +522,15 @@ class SiteSettings(abstract.FrontendDashboardModel):
     def __str__(self) -> str:
         return "Site Settings"
 
+    def save(self, *args, **kwargs) -> None:
+        super().save(*args, **kwargs)
+        SiteSettingsManager.invalidate()
+
+    def delete(self, *args, **kwargs) -> tuple[int, dict[str, int]]:
+        result = super().delete(*args, **kwargs)
+        SiteSettingsManager.invalidate()
+        return result
+
     @classmethod
     def get_current(cls) -> SiteSettings:
         """Return (and create if missing) the singleton settings record."""
@@ -1,18 +1,106 @@
-"""SiteSettings queryset and manager."""
+"""SiteSettings queryset and manager.
+
+The singleton is read on every page (``add_site_settings``) and again by
+feature checks, cache staleness, enrichment and rate limiting, so
+``get_current()`` avoids the database where it can:
+
+* Inside a request wrapped by ``SiteSettingsMiddleware`` the record is
+  memoized, so one request never reads the row twice.
+* Across requests each process keeps the last record it read, tagged with a
+  version counter stored in Valkey. Every write bumps the counter once its
+  transaction commits, and a process only re-reads the row when the counter
+  moved. Without Valkey the process copy expires after a few seconds instead.
+"""
 
 from __future__ import annotations
 
+import contextlib
+from contextvars import ContextVar
+import copy
+from dataclasses import dataclass
+import logging
+import os
+import time
 from typing import TYPE_CHECKING
 
+from django.db import connection, transaction
+import redis
+
 from urbanlens.dashboard.models import abstract
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from urbanlens.dashboard.models.site_settings.model import SiteSettings
 
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "ul:site-settings:version"
+# How long a process trusts its copy when there's no Valkey to ask.
+LOCAL_TTL_SECONDS = 5.0
+
+
+@dataclass
+class _Cached:
+    settings: SiteSettings
+    version: str | None
+    loaded_at: float
+
+
+_cached: _Cached | None = None
+_client: redis.Redis | None = None
+# The current request's memo: unset outside ``request_scope()``, an empty
+# list until the first read, then the record that request sees.
+_request_memo: ContextVar[list[SiteSettings] | None] = ContextVar("site_settings_request_memo", default=None)
+
+
+def _valkey() -> redis.Redis | None:
+    """The shared Valkey client for this process, or None when not configured."""
+    global _client  # noqa: PLW0603 - one connection pool per process
+    url = os.getenv("UL_VALKEY_URL") or os.getenv("UL_REDIS_URL")
+    if not url:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(url, decode_responses=True, socket_connect_timeout=1, socket_timeout=2)
+    return _client
+
+
+def _current_version() -> str | None:
+    """The shared settings version, or None when Valkey is unset or unreachable."""
+    client = _valkey()
+    if client is None:
+        return None
+    try:
+        return client.get(VERSION_KEY) or "0"
+    except redis.RedisError:
+        logger.warning("Unable to read the site settings version from Valkey", exc_info=True)
+        return None
+
+
+def _publish_change() -> None:
+    """Forget this process's copy and bump the shared version, once a write has committed."""
+    global _cached  # noqa: PLW0603 - the per-process singleton cache
+    _cached = None
+    client = _valkey()
+    if client is None:
+        return
+    try:
+        client.incr(VERSION_KEY)
+    except redis.RedisError:
+        logger.warning("Unable to bump the site settings version in Valkey", exc_info=True)
+
 
 class SiteSettingsQuerySet(abstract.FrontendDashboardQuerySet):
     """QuerySet for the site settings singleton."""
 
+    def update(self, **kwargs) -> int:
+        """Update the rows and invalidate every cached copy of the singleton."""
+        rows = super().update(**kwargs)
+        SiteSettingsManager.invalidate()
+        return rows
+
+    update.alters_data = True
+
 
 class SiteSettingsManager(abstract.FrontendDashboardManager.from_queryset(SiteSettingsQuerySet)):
     """Manager for SiteSettings. Use get_current() for the singleton record."""
@@ -20,8 +108,55 @@ class SiteSettingsManager(abstract.FrontendDashboardManager.from_queryset(SiteSe
     def get_current(self) -> SiteSettings:
         """Return (and create if missing) the singleton settings record.
 
+        Served from the request memo, then the process cache, and only then
+        the database (see the module docstring).
+
         Returns:
             The single SiteSettings row (pk=1).
         """
+        memo = _request_memo.get()
+        if memo:
+            return memo[0]
+        settings = self._load()
+        if memo is not None:
+            memo.append(settings)
+        return settings
+
+    def _load(self) -> SiteSettings:
+        """The process copy when it is still current, else a fresh read."""
+        global _cached  # noqa: PLW0603 - the per-process singleton cache
+        version = _current_version()
+        cached = _cached
+        if cached is not None:
+            fresh = version == cached.version if version is not None else time.monotonic() - cached.loaded_at < LOCAL_TTL_SECONDS
+            if fresh:
+                # Each caller gets its own copy, so a form that edits the
+                # record and fails validation can't leak into other requests.
+                return copy.copy(cached.settings)
+
         obj, _ = self.get_or_create(pk=1)
+        # A row read inside a transaction may be this transaction's own,
+        # uncommitted edit; only share rows read in autocommit mode.
+        if not connection.in_atomic_block:
+            _cached = _Cached(settings=copy.copy(obj), version=version, loaded_at=time.monotonic())
         return obj
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop this process's and this request's copies, and tell other processes on commit."""
+        global _cached  # noqa: PLW0603 - the per-process singleton cache
+        _cached = None
+        if memo := _request_memo.get():
+            memo.clear()
+        # Again after commit: another thread may have re-read the old row meanwhile.
+        transaction.on_commit(_publish_change)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def request_scope() -> Iterator[None]:
+        """Memoize ``get_current()`` for the duration of the block (one request)."""
+        token = _request_memo.set([])
+        try:
+            yield
+        finally:
+            _request_memo.reset(token)
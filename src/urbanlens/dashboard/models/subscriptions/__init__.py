@@ -1,11 +1,14 @@
 """Subscription role models."""
 
 from urbanlens.dashboard.models.subscriptions.model import (
+    FeatureEntitlements,
     PendingSubscriptionGrant,
     SiteFeature,
     SubscriptionRole,
     UserSubscription,
     active_subscription_roles,
+    entitlements_for,
+    forget_entitlements,
     grant_subscription,
     user_has_feature,
 )
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import contextlib
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from django.contrib.auth.models import AnonymousUser, User
 from django.db.models import CASCADE, CharField, DateTimeField, ForeignKey, IntegerField, Q, TextChoices, UniqueConstraint
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 from urbanlens.dashboard.models import abstract
 from urbanlens.dashboard.models.subscriptions.queryset import PendingSubscriptionGrantManager, SubscriptionRoleManager, UserSubscriptionManager
@@ -205,6 +207,70 @@ class PendingSubscriptionGrant(abstract.DashboardModel):
         return int(self.duration_months)
 
 
+class FeatureEntitlements:
+    """What one user is entitled to, resolved once and shared for a request.
+
+    ``user_has_feature`` used to re-run the admin check, the site defaults
+    and an active-subscriptions query for every feature it was asked about;
+    the navbar alone asks about five. A snapshot is memoized on the user
+    instance it was resolved for - ``request.user`` for the life of a
+    request - so context processors, controllers and DRF permissions share
+    one subscriptions query. Site-wide defaults are not copied into the
+    snapshot: they come from ``SiteSettings.get_current()``, which has its
+    own request memo and invalidation.
+    """
+
+    def __init__(self, user: AbstractBaseUser | AnonymousUser) -> None:
+        self.user = user if isinstance(user, User) and user.is_authenticated else None
+        self.is_site_admin = self.user is not None and self.user.has_perm("dashboard.view_site_admin")
+
+    @cached_property
+    def roles(self) -> list[SubscriptionRole]:
+        """The roles of the user's active (unrevoked, unexpired) subscriptions."""
+        if self.user is None:
+            return []
+        return [subscription.role for subscription in UserSubscription.objects.active_for(self.user).select_related("role")]
+
+    @cached_property
+    def role_features(self) -> frozenset[str]:
+        """Every ``SiteFeature`` value granted by at least one of the user's roles."""
+        return frozenset().union(*(role.feature_set for role in self.roles))
+
+    def has(self, feature: SiteFeature | str) -> bool:
+        """Return whether the user has ``feature`` (see :func:`user_has_feature`)."""
+        if self.user is None:
+            return False
+        if self.is_site_admin:
+            return True
+        from urbanlens.dashboard.models.site_settings import SiteSettings
+
+        if SiteSettings.get_current().grants(feature):
+            return True
+        return str(feature) in self.role_features
+
+
+def entitlements_for(user: AbstractBaseUser | AnonymousUser) -> FeatureEntitlements:
+    """The user's entitlement snapshot, resolved on first use and memoized on ``user``.
+
+    Args:
+        user: The user to resolve, usually ``request.user``.
+
+    Returns:
+        The snapshot cached on this user instance.
+    """
+    cached = getattr(user, "_feature_entitlements", None)
+    if cached is None:
+        cached = FeatureEntitlements(user)
+        user._feature_entitlements = cached  # noqa: SLF001 - memoizing on the instance we were handed
+    return cached
+
+
+def forget_entitlements(user: AbstractBaseUser | AnonymousUser) -> None:
+    """Drop the snapshot memoized on ``user`` so the next check re-resolves it."""
+    with contextlib.suppress(AttributeError):
+        del user._feature_entitlements  # noqa: SLF001 - the memo entitlements_for() set
+
+
 def user_has_feature(user: AbstractBaseUser | AnonymousUser, feature: SiteFeature | str) -> bool:
     """Return whether the user has the feature, via the site default or an active role.
 
@@ -215,16 +281,7 @@ def user_has_feature(user: AbstractBaseUser | AnonymousUser, feature: SiteFeatur
     use ``request.user`` directly without duplicating authentication/type checks
     throughout controllers and context processors.
     """
-    if not isinstance(user, User) or not user.is_authenticated:
-        return False
-    if user.has_perm("dashboard.view_site_admin"):
-        return True
-    from urbanlens.dashboard.models.site_settings import SiteSettings
-
-    if SiteSettings.get_current().grants(feature):
-        return True
-    subscriptions = UserSubscription.objects.active_for(user).select_related("role")
-    return any(subscription.role.grants(feature) for subscription in subscriptions)
+    return entitlements_for(user).has(feature)
 
 
 def active_subscription_roles(user: AbstractBaseUser | AnonymousUser) -> list[SubscriptionRole]:
@@ -236,10 +293,7 @@ def active_subscription_roles(user: AbstractBaseUser | AnonymousUser) -> list[Su
     Returns:
         The roles of the user's active (unrevoked, unexpired) subscriptions.
     """
-    if not isinstance(user, User) or not user.is_authenticated:
-        return []
-    subscriptions = UserSubscription.objects.active_for(user).select_related("role")
-    return [subscription.role for subscription in subscriptions]
+    return list(entitlements_for(user).roles)
 
 
 def grant_subscription(user: User, role: SubscriptionRole, granted_by: User, months: int | None) -> UserSubscription:
@@ -251,4 +305,5 @@ def grant_subscription(user: User, role: SubscriptionRole, granted_by: User, mon
     subscription.granted_by = granted_by
     subscription.revoked_at = None
     subscription.save()
+    forget_entitlements(user)
     return subscription
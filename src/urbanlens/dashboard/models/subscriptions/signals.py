@@ -0,0 +1,21 @@
+"""Drop memoized entitlement snapshots when a user's subscriptions change."""
+
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from urbanlens.dashboard.models.subscriptions.model import UserSubscription, forget_entitlements
+
+
+@receiver(post_save, sender=UserSubscription, dispatch_uid="user_subscription_forget_entitlements")
+@receiver(post_delete, sender=UserSubscription, dispatch_uid="user_subscription_delete_forget_entitlements")
+def forget_entitlements_for_subscription(sender: type[UserSubscription], instance: UserSubscription, **kwargs) -> None:
+    """Re-resolve the subscriber's snapshot, when it is the user instance this write was handed.
+
+    Snapshots live on a single user instance (normally ``request.user``), so
+    only a snapshot reachable from the subscription can be stale here; any
+    other instance of the same user belongs to a different request.
+    """
+    if UserSubscription.user.is_cached(instance):
+        forget_entitlements(instance.user)
@@ -174,7 +174,10 @@ class Wiki(abstract.PublicDashboardModel, abstract.SecurityModel, abstract.Addre
 
     @classmethod
     def from_db(cls, db, field_names, values) -> Wiki:
-        """Track the persisted name so ``save()`` can detect renames.
+        """Track the persisted name and location.
+
+        ``save()`` uses the name to detect renames; the location lets
+        ``models.pin_footprint.signals`` notice the wiki being repointed.
 
         Args:
             db: Database alias the row was loaded from.
@@ -187,6 +190,8 @@ class Wiki(abstract.PublicDashboardModel, abstract.SecurityModel, abstract.Addre
         instance = super().from_db(db, field_names, values)
         if "name" in field_names:
             instance._loaded_name = instance.name  # noqa: SLF001
+        if "location_id" in field_names:
+            instance._loaded_location_id = instance.location_id  # noqa: SLF001
         return instance
 
     def save(self, *args, **kwargs) -> None:
@@ -295,6 +295,7 @@ def _draft_new_paragraphs(
         response_ms=elapsed_ms,
         endpoint=gateway.model,
         cost_estimate=gateway.cost,
+        was_cached=gateway.served_from_cache,
     )
     return answer
 
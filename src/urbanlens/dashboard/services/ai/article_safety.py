@@ -105,6 +105,7 @@ def classify_article_text(text: str, *, place_name: str, profile: Profile | None
         response_ms=elapsed_ms,
         endpoint=gateway.model,
         cost_estimate=gateway.cost,
+        was_cached=gateway.served_from_cache,
     )
 
     if raw is None:
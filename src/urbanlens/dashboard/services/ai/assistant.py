@@ -343,4 +343,4 @@ def run_assistant_turn(profile: Profile, history: list[dict[str, Any]], user_mes
         # this instance, so gateway.cost here already reflects every round
         # trip the loop made, however many tool calls that took.
         elapsed_ms = int((time.monotonic() - started) * 1000)
-        log_api_call("assistant", success=succeeded, response_ms=elapsed_ms, endpoint=gateway.model, cost_estimate=gateway.cost)
+        log_api_call("assistant", success=succeeded, response_ms=elapsed_ms, endpoint=gateway.model, cost_estimate=gateway.cost, was_cached=gateway.served_from_cache)
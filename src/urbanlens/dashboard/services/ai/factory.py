@@ -47,7 +47,9 @@ def get_gateway(feature: str | None = None, profile: Profile | None = None, prov
             specific provider's capabilities (e.g. the chat assistant's
             tool-calling protocol) regardless of the site default.
         **kwargs: Extra keyword arguments forwarded to the gateway constructor
-            (e.g. ``instructions``, ``formatting``).
+            (e.g. ``instructions``, ``formatting``). The feature's response
+            cache policy (``response_cache.CACHE_POLICIES``) is attached
+            unless ``cache_policy`` is passed explicitly.
 
     Returns:
         A configured ``LLMGateway`` subclass instance, or ``None`` if AI is
@@ -55,6 +57,7 @@ def get_gateway(feature: str | None = None, profile: Profile | None = None, prov
         feature is turned off.
     """
     from urbanlens.dashboard.models.site_settings import SiteSettings
+    from urbanlens.dashboard.services.ai.response_cache import policy_for
 
     site = SiteSettings.get_current()
 
@@ -72,6 +75,7 @@ def get_gateway(feature: str | None = None, profile: Profile | None = None, prov
             logger.debug("AI feature '%s' is disabled; skipping AI call", feature)
             return None
 
+    kwargs.setdefault("cache_policy", policy_for(feature))
     provider = provider or site.ai_provider
 
     if provider == "openai":
@@ -9,6 +9,7 @@ from typing import Any, ClassVar, Generic, TypeVar
 
 import tiktoken
 
+from urbanlens.dashboard.services.ai import response_cache
 from urbanlens.dashboard.services.ai.message import MessageQueue
 from urbanlens.dashboard.services.ai.meta import (
     FORMATTING,
@@ -29,6 +30,10 @@ class LLMGateway[Response](ABC):
     _api_key: str | None
     extend: bool
     _token_count: dict[str, int]
+    _cache_count: dict[str, int]
+    #: Opt-in response cache (see ``services.ai.response_cache``); None
+    #: always calls the provider.
+    cache_policy: response_cache.LLMCachePolicy | None
     formatting: str
     instructions: str
     project_description: str
@@ -52,9 +57,13 @@ class LLMGateway[Response](ABC):
         formatting: str = FORMATTING,
         instructions: str = INSTRUCTIONS,
         project_description: str = PROJECT_DESCRIPTION,
+        *,
+        cache_policy: response_cache.LLMCachePolicy | None = None,
         **kwargs,
     ):
         self._token_count = {"sent": 0, "received": 0}
+        self._cache_count = {"hits": 0, "misses": 0}
+        self.cache_policy = cache_policy
         self.formatting = formatting
         self.instructions = instructions
         self.project_description = project_description
@@ -128,12 +137,33 @@ class LLMGateway[Response](ABC):
         """
         return self._token_count["sent"] + self._token_count["received"]
 
+    @property
+    def cache_hits(self) -> int:
+        """Prompts answered from the response cache, without calling the provider."""
+        return self._cache_count["hits"]
+
+    @property
+    def cache_misses(self) -> int:
+        """Cacheable prompts that had to be sent to the provider."""
+        return self._cache_count["misses"]
+
+    @property
+    def served_from_cache(self) -> bool:
+        """Whether every prompt so far was answered from the response cache.
+
+        Call sites pass this to ``log_api_call(was_cached=...)`` so a cached
+        answer isn't reported (or rate-limited) as a provider call.
+        """
+        return self.cache_hits > 0 and self.cache_misses == 0
+
     @property
     def cost(self) -> Decimal:
         """
         Calculates the total cost for the tokens sent and received based on the model's costs per thousand tokens.
 
         Returns the total cost for the tokens calculated based on the model's costs.
+        Answers served from the response cache send and receive no tokens, so
+        they add nothing here; ``cache_hits`` counts them instead.
 
         Returns:
             Decimal:
@@ -380,18 +410,58 @@ class LLMGateway[Response](ABC):
         except ValueError:
             logger.warning("Prompt exceeds token limit for model '%s'; skipping AI call", self.model)
             return None
-        self.send_tokens(queue)
 
-        if response := self._get_response(queue):
-            if message := self._parse_response(response):
-                self.receive_tokens(message)
-                answer = self._parse_answer(message)
-                if not answer:
-                    logger.error("No answer from message queue: %s", queue)
-                return answer
+        if message := self._complete(queue):
+            answer = self._parse_answer(message)
+            if not answer:
+                logger.error("No answer from message queue: %s", queue)
+            return answer
 
         return None
 
+    def _cache_parameters(self) -> dict[str, Any]:
+        """Request parameters, besides the model and messages, that shape the answer.
+
+        Part of the response cache key. Subclasses that send further
+        parameters (temperature, tools, ...) should extend this.
+        """
+        return {"max_tokens": self.max_tokens}
+
+    def _complete(self, queue: MessageQueue) -> str | None:
+        """Send ``queue`` (or find its answer in the response cache) and return the message body.
+
+        Token counts only grow when the provider is actually called. Only
+        responses containing at least one ANSWER tag are cached, so a
+        malformed reply is retried on the next call instead of replayed.
+
+        Args:
+            queue: The messages to send.
+
+        Returns:
+            The response message body, or None if the provider returned nothing usable.
+        """
+        policy = self.cache_policy
+        key = None
+        if policy is not None:
+            key = response_cache.cache_key(type(self).__name__, self.model, queue, self._cache_parameters())
+            if (cached := response_cache.get_response(key)) is not None:
+                self._cache_count["hits"] += 1
+                logger.debug("LLM response cache hit for model '%s'", self.model)
+                return cached
+            self._cache_count["misses"] += 1
+
+        self.send_tokens(queue)
+        response = self._get_response(queue)
+        if not response:
+            return None
+        message = self._parse_response(response)
+        if not message:
+            return None
+        self.receive_tokens(message)
+        if key is not None and policy is not None and self._parse_answers(message):
+            response_cache.store_response(key, message, policy)
+        return message
+
     @abstractmethod
     def _get_response(self, message_queue: MessageQueue) -> Response | None:
         """
@@ -496,14 +566,10 @@ class LLMGateway[Response](ABC):
             logger.warning("Prompt exceeds token limit for model '%s'; skipping AI call", self.model)
             return []
 
-        self.send_tokens(queue)
-
-        if response := self._get_response(queue):
-            if message := self._parse_response(response):
-                self.receive_tokens(message)
-                answers = self._parse_answers(message)
-                if max_results is not None:
-                    answers = answers[:max_results]
-                return answers
+        if message := self._complete(queue):
+            answers = self._parse_answers(message)
+            if max_results is not None:
+                answers = answers[:max_results]
+            return answers
 
         return []
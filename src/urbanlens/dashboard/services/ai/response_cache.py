@@ -0,0 +1,119 @@
+"""Content-addressed cache of LLM responses.
+
+Retried Celery tasks and repeated runs over unchanged data (re-suggesting a
+pin's categories, re-expanding an article from the same page) send the exact
+same conversation to the same model again, paying for the tokens and the
+latency twice. ``LLMGateway`` looks a response up here first when it has a
+``cache_policy``; the key is a hash of everything that determines the answer
+- provider, model, every message in the queue (system prompt included) and
+the request parameters - so any change to the prompt, the instructions, the
+model or its settings is a different entry and nothing needs invalidating.
+
+Caching is opt-in per call site: ``get_gateway`` attaches the policy listed
+for its ``feature`` in ``CACHE_POLICIES``, and features without one (the
+assistant chat, moderation and answer checks, trip suggestions) always call
+the provider. Entries live in the default ``django.core.cache`` backend -
+Valkey when ``UL_VALKEY_URL`` is configured - and a cache outage only costs
+the lookup, never the call.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+
+if TYPE_CHECKING:
+    from urbanlens.dashboard.services.ai.message import MessageQueue
+
+logger = logging.getLogger(__name__)
+
+# Bump to orphan every stored entry, e.g. after a change to how responses are parsed.
+_KEY_VERSION = 1
+_KEY_PREFIX = "llm-response"
+
+_HOUR = 60 * 60
+_DAY = 24 * _HOUR
+
+
+@dataclass(frozen=True, slots=True)
+class LLMCachePolicy:
+    """How long, and how large, a call site's responses may be cached.
+
+    Attributes:
+        ttl_seconds: Lifetime of a stored response.
+        max_response_chars: Responses longer than this are returned but not
+            stored, so one runaway answer can't crowd the shared cache.
+    """
+
+    ttl_seconds: int
+    max_response_chars: int = 16_000
+
+
+#: Cache policy per ``get_gateway`` feature key. A feature missing here is
+#: never cached. Trivia generation only gets a short window - long enough to
+#: absorb a retried task, short enough that asking again still draws fresh
+#: questions.
+CACHE_POLICIES: dict[str, LLMCachePolicy] = {
+    "category_suggestions": LLMCachePolicy(ttl_seconds=7 * _DAY, max_response_chars=4_000),
+    "label_style_suggestions": LLMCachePolicy(ttl_seconds=7 * _DAY, max_response_chars=4_000),
+    "link_extraction": LLMCachePolicy(ttl_seconds=_DAY, max_response_chars=64_000),
+    "article_expansion": LLMCachePolicy(ttl_seconds=_DAY, max_response_chars=32_000),
+    "document_pin_import": LLMCachePolicy(ttl_seconds=_DAY, max_response_chars=64_000),
+    "trivia_generation": LLMCachePolicy(ttl_seconds=_HOUR),
+}
+
+
+def policy_for(feature: str | None) -> LLMCachePolicy | None:
+    """The cache policy for a ``get_gateway`` feature key, or None if it isn't cached."""
+    return CACHE_POLICIES.get(feature) if feature else None
+
+
+def cache_key(provider: str, model: str, message_queue: MessageQueue, parameters: dict[str, Any]) -> str:
+    """Key for the response to ``message_queue`` from ``provider``'s ``model``.
+
+    Args:
+        provider: The gateway class name, so two providers serving a model of
+            the same name never share answers.
+        model: The provider's model identifier.
+        message_queue: The full conversation, system prompt included.
+        parameters: Request parameters that change the answer (e.g. ``max_tokens``).
+
+    Returns:
+        A fixed-length cache key.
+    """
+    payload = json.dumps(
+        {"provider": provider, "model": model, "messages": list(message_queue), "parameters": parameters},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{_KEY_PREFIX}:v{_KEY_VERSION}:{digest}"
+
+
+def get_response(key: str) -> str | None:
+    """The stored response text for ``key``, or None on a miss or cache error."""
+    try:
+        return cache.get(key)
+    except Exception:
+        logger.warning("LLM response cache lookup failed; calling the provider", exc_info=True)
+        return None
+
+
+def store_response(key: str, message: str, policy: LLMCachePolicy) -> bool:
+    """Store ``message`` under ``key`` if it fits ``policy``; return whether it was stored."""
+    if len(message) > policy.max_response_chars:
+        logger.debug("LLM response of %d chars exceeds the %d-char cache cap; not caching", len(message), policy.max_response_chars)
+        return False
+    try:
+        cache.set(key, message, policy.ttl_seconds)
+    except Exception:
+        logger.warning("LLM response cache write failed", exc_info=True)
+        return False
+    return True
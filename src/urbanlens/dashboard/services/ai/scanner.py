@@ -10,6 +10,11 @@ Integrate at two levels:
   - Gateway level: call scan() on every user prompt before it reaches the model.
   - Construction level: call wrap_user_data() on each user-supplied field before
     embedding it in the prompt, so the model knows to treat it as inert data.
+
+scan() sees whole wiki articles, imported documents and chat transcripts, so
+it doesn't run every pattern over every prompt: each pattern lists keywords
+it can't match without, and only patterns whose keywords all occur in the
+text are run. Clean prose usually exits after the keyword check alone.
 """
 
 from __future__ import annotations
@@ -23,37 +28,41 @@ logger = logging.getLogger(__name__)
 _HIGH = "high"
 _MED = "medium"
 
-# Each entry: (compiled regex, human label, confidence tier)
+# Each entry: (compiled regex, human label, confidence tier, required keywords)
 # High-confidence = almost certainly an attack; medium = suspicious but can be legitimate.
-_PATTERNS: list[tuple[re.Pattern, str, str]] = [
+# Required keywords drive the prefilter (see _candidates): every keyword must
+# occur in the case-folded text for the regex to be able to match at all, and
+# "a|b" means either will do. They must stay true necessary conditions - a
+# keyword the regex can match without would silently hide an injection.
+_PATTERNS: list[tuple[re.Pattern, str, str, tuple[str, ...]]] = [
     # -- Instruction override family -------------------------------------------
-    (re.compile(r"(?i)ignore\s+(?:all\s+)?(?:previous|prior|above|your)\s+instructions?"), "instruction override", _HIGH),
-    (re.compile(r"(?i)(?:disregard|forget|bypass|override)\s+(?:all\s+)?(?:previous|prior|above|your)?\s*instructions?"), "instruction override", _HIGH),
+    (re.compile(r"(?i)ignore\s+(?:all\s+)?(?:previous|prior|above|your)\s+instructions?"), "instruction override", _HIGH, ("instruction", "ignore")),
+    (re.compile(r"(?i)(?:disregard|forget|bypass|override)\s+(?:all\s+)?(?:previous|prior|above|your)?\s*instructions?"), "instruction override", _HIGH, ("instruction", "disregard|forget|bypass|override")),
     # -- New-instructions injection --------------------------------------------
-    (re.compile(r"(?im)(?:^|(?<=\.\s)|(?<=\n))new\s+instructions?\s*:"), "instruction injection", _HIGH),
-    (re.compile(r"(?i)(?:here\s+are|these\s+are)\s+(?:your\s+)?new\s+instructions?"), "instruction injection", _HIGH),
-    (re.compile(r"(?i)\byour\s+new\s+(?:task|goal|role|purpose|instructions?)\s+(?:is|are)\b"), "role override", _HIGH),
+    (re.compile(r"(?im)(?:^|(?<=\.\s)|(?<=\n))new\s+instructions?\s*:"), "instruction injection", _HIGH, ("instruction", "new")),
+    (re.compile(r"(?i)(?:here\s+are|these\s+are)\s+(?:your\s+)?new\s+instructions?"), "instruction injection", _HIGH, ("instruction", "here|these", "new")),
+    (re.compile(r"(?i)\byour\s+new\s+(?:task|goal|role|purpose|instructions?)\s+(?:is|are)\b"), "role override", _HIGH, ("your", "task|goal|role|purpose|instruction", "new")),
     # -- Jailbreak keywords ----------------------------------------------------
-    (re.compile(r"(?i)\b(?:jailbreak|dan\s+mode|developer\s+mode|god\s+mode|unrestricted\s+mode|uncensored\s+mode)\b"), "jailbreak attempt", _HIGH),
+    (re.compile(r"(?i)\b(?:jailbreak|dan\s+mode|developer\s+mode|god\s+mode|unrestricted\s+mode|uncensored\s+mode)\b"), "jailbreak attempt", _HIGH, ("jailbreak|mode",)),
     # -- System-prompt probing -------------------------------------------------
-    (re.compile(r"(?i)\b(?:reveal|repeat|print|output|show|display)\s+(?:your\s+)?(?:system\s+)?(?:prompt|instructions?)"), "system prompt probe", _HIGH),
-    (re.compile(r"(?i)what\s+(?:are|is)\s+your\s+(?:system\s+)?(?:prompt|instructions?)"), "system prompt probe", _HIGH),
+    (re.compile(r"(?i)\b(?:reveal|repeat|print|output|show|display)\s+(?:your\s+)?(?:system\s+)?(?:prompt|instructions?)"), "system prompt probe", _HIGH, ("prompt|instruction", "reveal|repeat|print|output|show|display")),
+    (re.compile(r"(?i)what\s+(?:are|is)\s+your\s+(?:system\s+)?(?:prompt|instructions?)"), "system prompt probe", _HIGH, ("prompt|instruction", "your", "what")),
     # -- Delimiter injection ---------------------------------------------------
-    (re.compile(r"(?i)</?system>"), "delimiter injection", _HIGH),
-    (re.compile(r"(?i)</?instructions?>"), "delimiter injection", _HIGH),
-    (re.compile(r"(?i)</?prompt>"), "delimiter injection", _HIGH),
-    (re.compile(r"(?im)^###\s*(?:system|instructions?|prompt)\b"), "delimiter injection", _HIGH),
-    (re.compile(r"(?i)\[system\]"), "delimiter injection", _HIGH),
-    (re.compile(r"(?i)<</?SYS>>"), "delimiter injection", _HIGH),
+    (re.compile(r"(?i)</?system>"), "delimiter injection", _HIGH, ("system>",)),
+    (re.compile(r"(?i)</?instructions?>"), "delimiter injection", _HIGH, ("<instruction|</instruction",)),
+    (re.compile(r"(?i)</?prompt>"), "delimiter injection", _HIGH, ("<prompt>|</prompt>",)),
+    (re.compile(r"(?im)^###\s*(?:system|instructions?|prompt)\b"), "delimiter injection", _HIGH, ("###",)),
+    (re.compile(r"(?i)\[system\]"), "delimiter injection", _HIGH, ("[system]",)),
+    (re.compile(r"(?i)<</?SYS>>"), "delimiter injection", _HIGH, ("<<sys>>|<</sys>>",)),
     # -- Role override ---------------------------------------------------------
-    (re.compile(r"(?i)\bpretend\s+(?:you\s+are|to\s+be)\b"), "role override", _HIGH),
-    (re.compile(r"(?i)\byou\s+(?:are|must)\s+now\s+(?:act|be|behave|ignore)\b"), "role override", _HIGH),
-    (re.compile(r"(?i)\bact\s+as\s+(?:an?\s+)?(?:ai|gpt|claude|llm|chatbot|uncensored\s+ai)\b"), "role override", _HIGH),
+    (re.compile(r"(?i)\bpretend\s+(?:you\s+are|to\s+be)\b"), "role override", _HIGH, ("pretend",)),
+    (re.compile(r"(?i)\byou\s+(?:are|must)\s+now\s+(?:act|be|behave|ignore)\b"), "role override", _HIGH, ("you", "now", "act|be|behave|ignore")),
+    (re.compile(r"(?i)\bact\s+as\s+(?:an?\s+)?(?:ai|gpt|claude|llm|chatbot|uncensored\s+ai)\b"), "role override", _HIGH, ("act", "ai|gpt|claude|llm|chatbot")),
     # -- Medium confidence -----------------------------------------------------
-    (re.compile(r"(?i)\bdo\s+not\s+(?:follow|obey|adhere\s+to|comply\s+with)\s+(?:your|these|any)\s+(?:instruction|rule|guideline|constraint)"), "constraint bypass", _MED),
-    (re.compile(r"(?i)\bsystem\s+prompt\b"), "system prompt mention", _MED),
-    (re.compile(r"(?i)\bprompt\s+injection\b"), "self-referential", _MED),
-    (re.compile(r"(?im)^\s*role\s*:\s*(?:system|developer|admin)\b"), "role injection", _MED),
+    (re.compile(r"(?i)\bdo\s+not\s+(?:follow|obey|adhere\s+to|comply\s+with)\s+(?:your|these|any)\s+(?:instruction|rule|guideline|constraint)"), "constraint bypass", _MED, ("follow|obey|adhere|comply", "not")),
+    (re.compile(r"(?i)\bsystem\s+prompt\b"), "system prompt mention", _MED, ("prompt", "system")),
+    (re.compile(r"(?i)\bprompt\s+injection\b"), "self-referential", _MED, ("injection", "prompt")),
+    (re.compile(r"(?im)^\s*role\s*:\s*(?:system|developer|admin)\b"), "role injection", _MED, ("role", "system|developer|admin")),
 ]
 
 # A single high-confidence match scores 0.4 → above this threshold we sanitize.
@@ -102,8 +111,12 @@ def scan(text: str, source: str = "unknown") -> ScanResult:
     if not text or not text.strip():
         return ScanResult(original=text, sanitized=text, is_suspicious=False, risk_score=0.0, source=source)
 
+    candidates = _candidates(text)
+    if not candidates:
+        return ScanResult(original=text, sanitized=text, is_suspicious=False, risk_score=0.0, source=source)
+
     matches: list[InjectionMatch] = []
-    for pattern, description, confidence in _PATTERNS:
+    for pattern, description, confidence, _keywords in candidates:
         for m in pattern.finditer(text):
             matches.append(InjectionMatch(description=description, matched_text=m.group(), confidence=confidence))
 
@@ -121,7 +134,7 @@ def scan(text: str, source: str = "unknown") -> ScanResult:
             summary,
         )
 
-    sanitized = _apply_sanitization(text) if risk_score >= _SANITIZE_THRESHOLD else text
+    sanitized = _apply_sanitization(text, candidates) if risk_score >= _SANITIZE_THRESHOLD else text
 
     return ScanResult(
         original=text,
@@ -167,10 +180,45 @@ def wrap_user_data(text: str) -> str:
     return f"<USER_DATA>\n{neutralized}\n</USER_DATA>"
 
 
-def _apply_sanitization(text: str) -> str:
-    """Replace all high-confidence injection patterns with the placeholder string."""
+def _apply_sanitization(text: str, candidates: list[tuple[re.Pattern, str, str, tuple[str, ...]]]) -> str:
+    """Replace all high-confidence injection patterns with the placeholder string.
+
+    Only ``candidates`` - the patterns ``_candidates`` kept for the original
+    text - can match: a replacement never adds a keyword, since
+    ``[CONTENT FILTERED]`` contains none and its brackets keep the text on
+    either side from joining into one.
+    """
     result = text
-    for pattern, _, confidence in _PATTERNS:
+    for pattern, _, confidence, _keywords in candidates:
         if confidence == _HIGH:
             result = pattern.sub(_REPLACEMENT, result)
     return result
+
+
+# Characters IGNORECASE matches to an ASCII letter that str.lower() doesn't
+# map onto it (dotted/dotless i, long s), folded by hand for the prefilter.
+_KEYWORD_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+# Keyword alternatives per pattern. Keep each pattern's rarest keyword first:
+# the prefilter stops checking a pattern at its first missing keyword.
+_KEYWORD_GROUPS = [tuple(tuple(group.split("|")) for group in keywords) for _, _, _, keywords in _PATTERNS]
+
+
+def _candidates(text: str) -> list[tuple[re.Pattern, str, str, tuple[str, ...]]]:
+    """The patterns that could match ``text``, in ``_PATTERNS`` order.
+
+    One case-folded copy of the text is searched for keywords with plain
+    substring search - far cheaper than a regex pass - remembering each
+    answer, since patterns share keywords. Only patterns with every keyword
+    group present are returned, so ordinary prose runs few regexes or none.
+    """
+    folded = text.lower() if text.isascii() else text.translate(_KEYWORD_FOLD).lower()
+    seen: dict[str, bool] = {}
+
+    def present(keyword: str) -> bool:
+        found = seen.get(keyword)
+        if found is None:
+            found = seen[keyword] = keyword in folded
+        return found
+
+    return [entry for entry, groups in zip(_PATTERNS, _KEYWORD_GROUPS, strict=True) if all(any(present(keyword) for keyword in group) for group in groups)]
@@ -34,6 +34,7 @@ from django.utils import timezone
 
 from urbanlens.dashboard.models.boundary.model import Boundary, BoundarySource, BoundaryType
 from urbanlens.dashboard.models.boundary_vote.model import BoundaryVote
+from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -200,6 +201,8 @@ def apply_winning_boundary(location: Location) -> Boundary | None:
     if canonical.generated_polygon is not None and canonical.generated_polygon.wkb == winner.generated_polygon.wkb:
         return winner
     Boundary.objects.filter(pk=canonical.pk).update(generated_polygon=winner.generated_polygon, updated=timezone.now())
+    # update() skips post_save, so re-resolve the location's pins here.
+    PinFootprint.objects.refresh_location_on_commit(location.pk)
     logger.info("Boundary vote applied for location %s: %s is now the official boundary", location.pk, winner.source)
     return winner
 
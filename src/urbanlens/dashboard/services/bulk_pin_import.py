@@ -0,0 +1,362 @@
+"""Set-based import of ``pins.json`` rows.
+
+Importing one pin at a time costs a uuid lookup or two, a PostGIS proximity
+query plus an insert for the Location, the Pin insert, one ``labels.add`` per
+label and a Review insert - tens of thousands of round trips for a large
+backup. :class:`BulkPinImporter` resolves a whole chunk of rows with a
+handful of queries instead: one uuid lookup, one lateral spatial join to
+snap coordinates onto existing Locations, and ``bulk_create`` for the new
+Locations, Pins, aliases, label links and Reviews.
+
+The outcome matches ``services.import_data._import_pin_row`` row for row -
+same ``ImportResult`` counts, same per-profile uuid scoping, same dedupe of
+rows that land on one Location. ``bulk_create`` skips ``save()`` and the
+post_save receivers, so the few side effects that matter for a new root pin
+(sanitized name, slug, alias, map center, map pin cache, smart lists) are
+applied here in bulk - the rest only act on pins that already have a wiki,
+which imported pins never do.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+import random
+from typing import TYPE_CHECKING, Any
+
+from django.contrib.gis.geos import Point
+from django.db import transaction
+from django.db.models import F
+from django.utils.text import slugify
+
+if TYPE_CHECKING:
+    from urbanlens.dashboard.models.location.model import Location
+    from urbanlens.dashboard.models.pin.model import Pin
+    from urbanlens.dashboard.services.import_data import ImportResult
+
+#: Rows resolved per chunk; each chunk is one transaction.
+CHUNK_SIZE = 500
+
+#: Same radius ``Pin.objects.get_nearby_or_create`` dedupes Locations within.
+_THRESHOLD_METERS = 50
+
+_METERS_PER_DEGREE = 111_320
+
+
+@dataclass
+class _PendingPin:
+    """One row that passed validation and still needs a Location and a Pin."""
+
+    row: dict[str, Any]
+    uuid_str: str
+    latitude: float
+    longitude: float
+    defaults: dict[str, Any]
+    location: Location | None = None
+
+
+@dataclass
+class _ChunkOutcome:
+    """Everything a chunk changes, applied only once its transaction commits."""
+
+    mapped: dict[str, int] = field(default_factory=dict)
+    created_pins: list[Pin] = field(default_factory=list)
+    skipped: int = 0
+    warnings: list[str] = field(default_factory=list)
+    claimed_uuids: set[str] = field(default_factory=set)
+    slugs: set[str] = field(default_factory=set)
+
+
+def coerce_coordinates(latitude: Any, longitude: Any) -> tuple[float, float] | None:
+    """Coordinates as floats, or None when ``get_nearby_or_create`` would reject them."""
+    try:
+        lat, lon = float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        return None
+    if not (math.isfinite(lat) and math.isfinite(lon)):
+        return None
+    return lat, lon
+
+
+def _distance_meters(a: tuple[float, float], b: tuple[float, float]) -> float:
+    """Haversine distance between two ``(latitude, longitude)`` pairs."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6_371_008.8 * math.asin(min(1.0, math.sqrt(h)))
+
+
+class _NewLocationGrid:
+    """Locations created earlier in the same chunk, bucketed for a radius lookup.
+
+    Rows are resolved in order, so a row within the threshold of a Location
+    an earlier row just created reuses it - exactly what sequential
+    ``get_nearby_or_create`` calls would do, without a query per row.
+    """
+
+    _CELL_DEGREES = _THRESHOLD_METERS / _METERS_PER_DEGREE
+
+    def __init__(self) -> None:
+        self._cells: dict[tuple[int, int], list[tuple[tuple[float, float], Location]]] = {}
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self._CELL_DEGREES), math.floor(lon / self._CELL_DEGREES)
+
+    def nearest(self, lat: float, lon: float) -> Location | None:
+        row, col = self._cell(lat, lon)
+        # A degree of longitude shrinks towards the poles, so the threshold
+        # spans more longitude cells there.
+        col_reach = math.ceil(1 / max(math.cos(math.radians(lat)), 0.01))
+        for d_row in (-1, 0, 1):
+            for d_col in range(-col_reach, col_reach + 1):
+                for point, location in self._cells.get((row + d_row, col + d_col), ()):
+                    if _distance_meters(point, (lat, lon)) <= _THRESHOLD_METERS:
+                        return location
+        return None
+
+    def add(self, lat: float, lon: float, location: Location) -> None:
+        self._cells.setdefault(self._cell(lat, lon), []).append(((lat, lon), location))
+
+
+class BulkPinImporter:
+    """Imports ``pins.json`` rows for one profile a chunk at a time.
+
+    Args:
+        profile: The importing profile.
+        result: Collects created/skipped counts and warnings.
+        pin_uuid_map: Archive pin uuid -> local pk, filled as rows resolve.
+        label_uuid_map: Archive label uuid -> local pk from the labels step.
+    """
+
+    def __init__(self, profile: Any, result: ImportResult, *, pin_uuid_map: dict[str, int], label_uuid_map: dict[str, int]) -> None:
+        from urbanlens.dashboard.models.pin.model import Pin
+
+        self.profile = profile
+        self.result = result
+        self.pin_uuid_map = pin_uuid_map
+        self.label_uuid_map = label_uuid_map
+        self.created_pin_ids: list[int] = []
+        # Pin slugs are unique per profile; loading them once lets every
+        # chunk mint slugs without an existence query per pin.
+        self._slugs: set[str] = set(Pin.objects.filter(profile=profile, slug__isnull=False).values_list("slug", flat=True))
+        self._claimed_uuids: set[str] = set()
+
+    def import_chunk(self, rows: list[dict[str, Any]]) -> None:
+        """Import one chunk of rows in a single transaction.
+
+        Args:
+            rows: ``pins.json`` rows, in archive order.
+        """
+        with transaction.atomic():
+            outcome = self._import_chunk(rows)
+
+        self.pin_uuid_map.update(outcome.mapped)
+        self.created_pin_ids.extend(pin.pk for pin in outcome.created_pins)
+        self._claimed_uuids |= outcome.claimed_uuids
+        self._slugs |= outcome.slugs
+        self.result.warnings.extend(outcome.warnings)
+        if outcome.created_pins:
+            self.result.inc_created("pins", len(outcome.created_pins))
+        if outcome.skipped:
+            self.result.inc_skipped("pins", outcome.skipped)
+
+    def claim_pin(self, pin: Any) -> None:
+        """Reserve the slug and uuid of a pin created outside a chunk.
+
+        Pins from ``import_data``'s row-by-row fallback were saved through
+        ``Pin.save()``, so later chunks would otherwise mint the same slug
+        and hit IntegrityError again.
+        """
+        if pin.slug:
+            self._slugs.add(pin.slug)
+        self._claimed_uuids.add(str(pin.uuid))
+
+    def finish(self) -> None:
+        """Apply the per-profile side effects ``Pin.save()`` would have triggered, once."""
+        if not self.created_pin_ids:
+            return
+        from urbanlens.dashboard.models.pin.model import Pin
+        from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
+        from urbanlens.dashboard.models.profile.model import Profile
+        from urbanlens.dashboard.services.map_pins.refresh import refresh_pins_on_commit
+
+        Profile.objects.filter(pk=self.profile.pk).update(map_center_latitude=None, map_center_longitude=None)
+        refresh_pins_on_commit(self.profile.pk, self.created_pin_ids)
+        PinFootprint.objects.refresh_on_commit(Pin.objects.filter(pk__in=self.created_pin_ids))
+
+        profile_id = self.profile.pk
+
+        def _resync_smart_lists() -> None:
+            from urbanlens.dashboard.models.pin_list.model import PinList
+            from urbanlens.dashboard.services.pin_list_membership import resync_smart_list
+
+            for pin_list in PinList.objects.active_smart_lists(profile_id):
+                resync_smart_list(pin_list)
+
+        transaction.on_commit(_resync_smart_lists)
+
+    # -- Chunk resolution -------------------------------------------------------
+
+    def _import_chunk(self, rows: list[dict[str, Any]]) -> _ChunkOutcome:
+        from urbanlens.dashboard.models.pin.model import Pin
+        from urbanlens.dashboard.services.import_data import _pin_defaults, _safe_uuid
+
+        outcome = _ChunkOutcome()
+        normalized = {row.get("uuid", ""): _safe_uuid(row.get("uuid", "")) for row in rows if row.get("uuid")}
+        own: dict[str, int] = {}
+        taken: set[str] = set(self._claimed_uuids)
+        for uuid_value, profile_id, pk in Pin.objects.filter(uuid__in={u for u in normalized.values() if u}).values_list("uuid", "profile_id", "pk"):
+            taken.add(str(uuid_value))
+            if profile_id == self.profile.pk:
+                own[str(uuid_value)] = pk
+
+        pending: list[_PendingPin] = []
+        for row in rows:
+            uuid_str = row.get("uuid", "")
+            uuid_key = normalized.get(uuid_str) if uuid_str else None
+            # Idempotency, scoped to this profile: a uuid belonging to another
+            # user's pin must never enter pin_uuid_map.
+            if uuid_key and uuid_key in own:
+                outcome.mapped[uuid_str] = own[uuid_key]
+                outcome.skipped += 1
+                continue
+
+            lat = row.get("latitude")
+            lng = row.get("longitude")
+            if lat is None or lng is None:
+                outcome.warnings.append(f"Could not import pin '{row.get('name', uuid_str)}': missing coordinates.")
+                outcome.skipped += 1
+                continue
+
+            defaults = _pin_defaults(row)
+            coordinates = coerce_coordinates(lat, lng)
+            if coordinates is None:
+                outcome.skipped += 1
+                continue
+            if uuid_key and uuid_key not in taken:
+                defaults["uuid"] = uuid_key
+                taken.add(uuid_key)
+            pending.append(_PendingPin(row=row, uuid_str=uuid_str, latitude=coordinates[0], longitude=coordinates[1], defaults=defaults))
+
+        if pending:
+            self._resolve_locations(pending)
+            self._create_pins(pending, outcome)
+        return outcome
+
+    def _resolve_locations(self, pending: list[_PendingPin]) -> None:
+        """Attach a Location to every pending row, creating the missing ones in one insert."""
+        from urbanlens.dashboard.models.location.model import Location
+
+        nearby = Location.objects.nearby_ids([(item.latitude, item.longitude) for item in pending], threshold_meters=_THRESHOLD_METERS)
+        existing = Location.objects.select_related("wiki").in_bulk({pk for pk in nearby if pk is not None})
+
+        grid = _NewLocationGrid()
+        new_locations: list[Location] = []
+        for item, location_id in zip(pending, nearby, strict=True):
+            if location_id is not None:
+                item.location = existing[location_id]
+                continue
+            item.location = grid.nearest(item.latitude, item.longitude)
+            if item.location is None:
+                location = Location(latitude=item.latitude, longitude=item.longitude, point=Point(item.longitude, item.latitude, srid=4326))
+                # Location._slugify_base() without an official name is the
+                # uuid, which is already unique - no collision check needed.
+                location.slug = str(location.uuid)
+                grid.add(item.latitude, item.longitude, location)
+                new_locations.append(location)
+                item.location = location
+        if new_locations:
+            Location.objects.bulk_create(new_locations)
+
+    def _create_pins(self, pending: list[_PendingPin], outcome: _ChunkOutcome) -> None:
+        from urbanlens.dashboard.models.aliases.model import PinAlias
+        from urbanlens.dashboard.models.pin.model import Pin
+        from urbanlens.dashboard.models.reviews.model import Review
+        from urbanlens.dashboard.services.locations.naming import is_meaningful_name, sanitize_name
+
+        location_ids = {item.location.pk for item in pending if item.location is not None}
+        # Root pins first, like get_nearby_or_create's own existence check.
+        pin_at_location: dict[int, int] = {}
+        for location_id, pk in Pin.objects.filter(profile=self.profile, location_id__in=location_ids).order_by("location_id", F("parent_pin_id").asc(nulls_first=True), "pk").values_list("location_id", "pk"):
+            pin_at_location.setdefault(location_id, pk)
+
+        # Each row resolves to an existing pin's pk or to a Pin created in
+        # this chunk - shared by later rows that land on the same Location.
+        targets: list[tuple[_PendingPin, int | Pin]] = []
+        created: dict[int, tuple[_PendingPin, Pin]] = {}
+        for item in pending:
+            location = item.location
+            if location is None:
+                continue
+            if location.pk in pin_at_location:
+                targets.append((item, pin_at_location[location.pk]))
+            elif location.pk in created:
+                targets.append((item, created[location.pk][1]))
+            else:
+                pin = Pin(location=location, profile=self.profile, **item.defaults)
+                pin.name = sanitize_name(pin.name)
+                pin.slug = self._mint_slug(pin, outcome.slugs)
+                created[location.pk] = (item, pin)
+                targets.append((item, pin))
+                if "uuid" in item.defaults:
+                    outcome.claimed_uuids.add(item.defaults["uuid"])
+
+        new_pins = [pin for _item, pin in created.values()]
+        if new_pins:
+            Pin.objects.bulk_create(new_pins)
+        for item, target in targets:
+            if item.uuid_str:
+                outcome.mapped[item.uuid_str] = target if isinstance(target, int) else target.pk
+        outcome.created_pins.extend(new_pins)
+        outcome.skipped += len(targets) - len(new_pins)
+        if not new_pins:
+            return
+
+        aliases: list[PinAlias] = []
+        label_links = []
+        reviews = []
+        articles: list[tuple[Pin, str]] = []
+        for item, pin in created.values():
+            if is_meaningful_name(pin.name):
+                aliases.append(PinAlias(pin=pin, name=(pin.name or "").strip()))
+            # "badge_uuids" is the pre-rename key, kept for old backup archives.
+            for label_uuid in item.row.get("label_uuids") or item.row.get("badge_uuids", []):
+                if label_uuid in self.label_uuid_map:
+                    label_links.append(Pin.labels.through(pin_id=pin.pk, label_id=self.label_uuid_map[label_uuid]))
+            rating = item.row.get("rating")
+            if isinstance(rating, int) and 0 <= rating <= 5:
+                reviews.append(Review(profile=self.profile, pin=pin, rating=rating))
+            if content := (item.row.get("article") or {}).get("content"):
+                articles.append((pin, content))
+
+        self._create_related(new_pins, aliases, label_links, reviews, articles)
+
+    def _create_related(self, pins: list[Pin], aliases: list, label_links: list, reviews: list, articles: list[tuple[Pin, str]]) -> None:
+        from urbanlens.dashboard.models.aliases.model import PinAlias
+        from urbanlens.dashboard.models.aliases.signals import _ALIAS_SENSITIVE_CACHE_SOURCES
+        from urbanlens.dashboard.models.cache.location_cache import LocationCache
+        from urbanlens.dashboard.models.pin.model import Pin
+        from urbanlens.dashboard.models.reviews.model import Review
+        from urbanlens.dashboard.services.articles import save_article
+
+        if aliases:
+            PinAlias.objects.bulk_create(aliases, ignore_conflicts=True)
+            # A new alias may match a Wikipedia article the location's cached
+            # lookups missed - see invalidate_name_sensitive_cache_for_new_pin_alias.
+            LocationCache.objects.filter(location_id__in={pin.location_id for pin in pins}, source__in=_ALIAS_SENSITIVE_CACHE_SOURCES).delete()
+        if label_links:
+            Pin.labels.through.objects.bulk_create(label_links, ignore_conflicts=True)
+        if reviews:
+            Review.objects.bulk_create(reviews)
+        for pin, content in articles:
+            save_article(editor=self.profile, content=content, edit_summary="Imported", pin=pin)
+
+    def _mint_slug(self, pin: Pin, chunk_slugs: set[str]) -> str:
+        """A slug unique among the profile's pins, mirroring ``PublicDashboardModel._generate_slug``."""
+        max_len = pin._slug_max_length()  # noqa: SLF001 - same model family, same rules
+        raw_base = slugify(pin._slugify_base()) or "item"  # noqa: SLF001
+        candidate = raw_base[:max_len]
+        while candidate in self._slugs or candidate in chunk_slugs:
+            suffix = f"-{random.randint(2, 90_000)}"  # noqa: S311 # nosec: B311 - Used for slug generation
+            candidate = raw_base[: max_len - len(suffix)] + suffix
+        chunk_slugs.add(candidate)
+        return candidate
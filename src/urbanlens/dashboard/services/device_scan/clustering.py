@@ -35,6 +35,8 @@ from typing import TYPE_CHECKING
 
 from django.utils import timezone
 
+from urbanlens.dashboard.services.geo_clustering import seeded_clusters
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
     import datetime
@@ -191,10 +193,9 @@ def _cluster_entries(entries: Sequence[_WeightedEntry]) -> list[list[_WeightedEn
     """Greedily group entries within ``MERGE_DISTANCE_METERS`` of a growing cluster centroid.
 
     Heaviest (most recent/most corroborated) entries seed clusters first, so
-    a cluster's running centroid stabilizes quickly. This is a simple
-    approximation appropriate for the modest per-(device, wiki) point counts
-    this ever runs against - not a general-purpose spatial clustering
-    algorithm.
+    a cluster's running centroid stabilizes quickly. Each pass only looks at
+    entries near the centroid (see ``services.geo_clustering``), so a busy
+    device's long history no longer makes every pass rescan all of it.
 
     Args:
         entries: Weighted entries to group.
@@ -202,27 +203,8 @@ def _cluster_entries(entries: Sequence[_WeightedEntry]) -> list[list[_WeightedEn
     Returns:
         Clusters (each a non-empty list of entries), in no particular order.
     """
-    remaining = sorted(entries, key=lambda e: e.weight, reverse=True)
-    clusters: list[list[_WeightedEntry]] = []
-    while remaining:
-        seed = remaining.pop(0)
-        cluster = [seed]
-        centroid = seed.point
-        changed = True
-        while changed:
-            changed = False
-            still_remaining = []
-            for candidate in remaining:
-                if _haversine_meters(candidate.point, centroid) <= MERGE_DISTANCE_METERS:
-                    cluster.append(candidate)
-                    changed = True
-                else:
-                    still_remaining.append(candidate)
-            remaining = still_remaining
-            if changed:
-                centroid = weighted_centroid([(e.point, e.weight) for e in cluster])
-        clusters.append(cluster)
-    return clusters
+    groups = seeded_clusters([entry.point.y for entry in entries], [entry.point.x for entry in entries], [entry.weight for entry in entries], MERGE_DISTANCE_METERS)
+    return [[entries[index] for index in group] for group in groups]
 
 
 def _match_existing_marker(candidates: Sequence[WikiDeviceMarker], centroid: Point, already_matched: set[int]) -> WikiDeviceMarker | None:
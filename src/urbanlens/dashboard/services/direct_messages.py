@@ -871,7 +871,7 @@ def create_direct_message(
         # immediately and skip the notification/email entirely (see the
         # "open thread" tracking above, updated by the client on each WS
         # connect/thread-switch).
-        DirectMessage.objects.filter(pk=message.pk).update(read_at=timezone.now())
+        DirectMessage.objects.filter(pk=message.pk).mark_read()
         message.read_at = timezone.now()
     else:
         _notify_recipient(message)
@@ -1152,41 +1152,34 @@ def conversations_for(profile: Profile) -> list[dict[str, Any]]:
         (DirectMessage), ``unread_count`` (int), and the
         ``display_identity_for`` keys for rendering the partner's identity.
     """
+    from urbanlens.dashboard.models.direct_messages.conversation import DirectMessageConversation
     from urbanlens.dashboard.models.direct_messages.mute import DirectMessageMute
-    from urbanlens.dashboard.models.profile.model import Profile as ProfileModel
 
-    # visible_to: a message this profile deleted from their own view must not
-    # surface as the sidebar's last-message preview or count as unread there.
-    rows = list(DirectMessage.objects.visible_to(profile).conversation_rows(profile))
-    if not rows:
+    # The summary rows already exclude messages this profile deleted from its
+    # own view, so those never surface as the last-message preview or unread.
+    # prefetch_related("last_message__images"): without it, a last message
+    # with no body (image-only or map-only send) makes the `message_preview`
+    # template tag's `images.exists()` fallback issue its own query per such
+    # row - an N+1 across the sidebar's conversation list.
+    summaries = list(
+        DirectMessageConversation.objects.inbox(profile).select_related("partner__user", "last_message").prefetch_related("last_message__images"),
+    )
+    if not summaries:
         return []
-
-    partners = ProfileModel.objects.select_related("user").in_bulk([row["partner_id"] for row in rows])
-    # prefetch_related("images"): without it, a last message with no body
-    # (image-only or map-only send) makes the `message_preview` template tag's
-    # `images.exists()` fallback issue its own query per such row - an N+1
-    # across the sidebar's conversation list.
-    last_messages = DirectMessage.objects.filter(pk__in=[row["last_message_id"] for row in rows]).prefetch_related("images").in_bulk()
     muted_sender_ids = set(DirectMessageMute.objects.filter(viewer=profile).values_list("sender_id", flat=True))
 
-    conversations = []
-    for row in rows:
-        partner = partners.get(row["partner_id"])
-        last_message = last_messages.get(row["last_message_id"])
-        if partner is None or last_message is None:
-            continue
-        conversations.append(
-            {
-                "kind": "dm",
-                "partner": partner,
-                "last_message": last_message,
-                "unread_count": row["unread_count"],
-                "is_muted": partner.pk in muted_sender_ids,
-                "last_activity": last_message.created,
-                **display_identity_for(profile, partner),
-            },
-        )
-    return conversations
+    return [
+        {
+            "kind": "dm",
+            "partner": summary.partner,
+            "last_message": summary.last_message,
+            "unread_count": summary.unread_count,
+            "is_muted": summary.partner_id in muted_sender_ids,
+            "last_activity": summary.last_message.created,
+            **display_identity_for(profile, summary.partner),
+        }
+        for summary in summaries
+    ]
 
 
 def all_conversations_for(profile: Profile) -> list[dict[str, Any]]:
@@ -24,11 +24,14 @@ The design has three moving parts:
    windows are spread evenly so the whole 30-day budget can't be burned in a
    day (e.g. a 300-calls/30-days limit with 6 calls already made today
    yields ``270 // 30 - 6 = 3``).
-3. :func:`run_enrichment_cycle` - one pass: per source, compute the budget,
-   pick the highest-impact candidate Locations, enrich them sequentially with
-   a per-item stagger derived from the service's per-minute limit (so even
-   very generous limits are never hammered in a burst), then re-resolve
-   official names/aliases once per touched location.
+3. :func:`run_enrichment_cycle` - one pass: per source, compute the budget
+   and pick the highest-impact candidate Locations, then run every source in
+   its own concurrent lane. Each item waits for a turn from
+   :class:`ServicePacer`, a per-service token bucket refilled at the
+   service's per-minute limit, so independent services (Overpass, Nominatim,
+   ...) work side by side while no single service is ever hammered in a
+   burst - even by two sources that share it. Official names/aliases are
+   re-resolved once per touched location at the end.
 
 Everything is admin-tunable via ``SiteSettings`` (enable toggle, UTC run
 window, buffer percent, per-service per-run cap) on the site-admin page.
@@ -38,8 +41,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import math
+import threading
 import time
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -47,6 +52,7 @@ from celery.exceptions import SoftTimeLimitExceeded
 from django.db.models import Q
 
 from urbanlens.dashboard.services.rate_limiter import RequestCancelledError, get_limit_config, service_is_enabled
+from urbanlens.dashboard.services.timeout_utils import fan_out
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
@@ -70,6 +76,11 @@ MAX_STAGGER_SECONDS = 60.0
 #: Default pause when none of a source's services declare a per-minute limit.
 DEFAULT_STAGGER_SECONDS = 2.0
 
+#: Wall-clock budget for one source's lane. Comfortably inside
+#: ``run_scheduled_enrichment``'s 3000s soft limit, so a lane stuck on a slow
+#: upstream is given up on before the task itself has to wind down.
+LANE_TIMEOUT_SECONDS = 2700
+
 #: How many extra candidates beyond the budget are shortlisted so the
 #: nearby-pin-density signal can reorder them before the final cut.
 _DENSITY_SHORTLIST_FACTOR = 3
@@ -343,7 +354,7 @@ def compute_service_budget(service: str, site_settings: SiteSettings | None = No
     buffer_fraction = min(max(site_settings.enrichment_buffer_percent, 0), 90) / 100.0
 
     def used_within(delta: timedelta) -> int:
-        return ApiCallLog.objects.for_service(service).since(delta).exclude(was_geo_filtered=True).count()
+        return ApiCallLog.objects.for_service(service).since(delta).exclude(was_geo_filtered=True).exclude(was_cached=True).count()
 
     budgets: list[int] = []
     used_day: int | None = None
@@ -366,13 +377,33 @@ def compute_service_budget(service: str, site_settings: SiteSettings | None = No
     return max(0, min(budgets))
 
 
+def _service_spacing(service: str) -> float | None:
+    """Seconds per call that ``service``'s per-minute limit allows, or None when it has none."""
+    try:
+        limit = get_limit_config(service).calls_per_minute
+    except Exception:
+        # TODO: Catch specific exceptions
+        logger.exception("Enrichment pacing: failed to read rate limit config for %s", service)
+        return None
+    return 60.0 / limit if limit else None
+
+
+def _clamped_pause(spacing: float | None, calls_per_item: int) -> float:
+    """One item's pause for a given per-call spacing, clamped to the stagger bounds."""
+    if spacing is None:
+        return DEFAULT_STAGGER_SECONDS
+    return min(max(spacing * max(calls_per_item, 1), MIN_STAGGER_SECONDS), MAX_STAGGER_SECONDS)
+
+
 def stagger_seconds(source: EnrichmentSource) -> float:
     """Pause between one source's consecutive enrichments, from its per-minute limits.
 
     Even a service with an enormous daily limit shouldn't see a burst of
     back-to-back requests from the background job, so the pause is derived
     from the tightest per-minute limit among the source's services and
-    clamped to [MIN_STAGGER_SECONDS, MAX_STAGGER_SECONDS].
+    clamped to [MIN_STAGGER_SECONDS, MAX_STAGGER_SECONDS]. This is the pace a
+    source runs at on its own; :class:`ServicePacer` applies the same figure
+    per service so sources sharing a service also share its pace.
 
     Args:
         source: The enrichment source about to run a batch.
@@ -380,21 +411,53 @@ def stagger_seconds(source: EnrichmentSource) -> float:
     Returns:
         Seconds to sleep between items.
     """
-    per_minute_limits: list[int] = []
-    for service in source.service_keys:
-        try:
-            limit = get_limit_config(service).calls_per_minute
-        except Exception:
-            # TODO: Catch specific exceptions
-            logger.exception("stagger_seconds: failed to read rate limit config for %s", service)
-            continue
-        if limit:
-            per_minute_limits.append(limit)
+    spacings = [spacing for service in source.service_keys if (spacing := _service_spacing(service)) is not None]
+    return _clamped_pause(max(spacings) if spacings else None, source.calls_per_item)
 
-    if not per_minute_limits:
-        return DEFAULT_STAGGER_SECONDS
-    pause = (60.0 / min(per_minute_limits)) * max(source.calls_per_item, 1)
-    return min(max(pause, MIN_STAGGER_SECONDS), MAX_STAGGER_SECONDS)
+
+class ServicePacer:
+    """Per-service token buckets shared by every lane of one enrichment cycle.
+
+    Each service's bucket holds one item's worth of calls and refills at the
+    service's per-minute limit (see :func:`stagger_seconds` for the clamping),
+    so a service's first item goes out at once and later ones - from any
+    lane - queue behind it. A source consuming several services waits until
+    all of their buckets allow it. Turns are booked under a lock and slept
+    out afterwards, so a waiting lane never blocks another service's lane.
+
+    Args:
+        sleep: Pause function (injected by tests).
+        clock: Monotonic clock (injected by tests).
+    """
+
+    def __init__(self, *, sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic) -> None:
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._spacings: dict[str, float | None] = {}
+        self._next_free: dict[str, float] = {}
+
+    def add(self, source: EnrichmentSource) -> None:
+        """Read the per-minute limits of ``source``'s services.
+
+        Call from the scheduling thread before the lanes start, so lanes never
+        have to touch the rate-limit table themselves.
+        """
+        for service in source.service_keys:
+            if service not in self._spacings:
+                self._spacings[service] = _service_spacing(service)
+
+    def wait_turn(self, source: EnrichmentSource) -> None:
+        """Block until every service ``source`` uses has room for one more item."""
+        # A source with no declared services still gets the default pace, on a bucket of its own.
+        pauses = {service: _clamped_pause(self._spacings.get(service), source.calls_per_item) for service in source.service_keys} or {f"source:{source.key}": DEFAULT_STAGGER_SECONDS}
+        with self._lock:
+            now = self._clock()
+            turn = max([now, *(self._next_free.get(bucket, now) for bucket in pauses)])
+            for bucket, pause in pauses.items():
+                self._next_free[bucket] = turn + pause
+        if turn > now:
+            self._sleep(turn - now)
 
 
 def enrichment_window_open(site_settings: SiteSettings, *, now: datetime | None = None) -> bool:
@@ -478,38 +541,24 @@ def prioritized_location_candidates(missing: Q, *, limit: int, geo_boundary: Geo
 
     shortlist = list(queryset[: limit * _DENSITY_SHORTLIST_FACTOR])
     if len(shortlist) > limit:
-        scored = [(candidate.priority_score + _nearby_density_score(candidate), candidate) for candidate in shortlist]
+        density = Location.objects.neighbor_counts([candidate.pk for candidate in shortlist], radius_meters=_DENSITY_RADIUS_KM * 1000, cap=_DENSITY_SCORE_CAP)
+        scored = [(candidate.priority_score + density.get(candidate.pk, 0), candidate) for candidate in shortlist]
         scored.sort(key=lambda pair: pair[0], reverse=True)
         return [candidate for _score, candidate in scored[:limit]]
     return shortlist
 
 
-def _nearby_density_score(location: Location) -> int:
-    """Capped count of other Locations within ~2 km, as a high-traffic-area proxy.
-
-    Args:
-        location: The candidate location.
-
-    Returns:
-        The neighbor count, capped at ``_DENSITY_SCORE_CAP``.
-    """
-    from django.contrib.gis.measure import D
-
-    from urbanlens.dashboard.models.location.model import Location
-
-    if location.point is None:
-        return 0
-    count = Location.objects.filter(point__distance_lte=(location.point, D(km=_DENSITY_RADIUS_KM))).exclude(pk=location.pk).count()
-    return min(count, _DENSITY_SCORE_CAP)
-
-
 def run_enrichment_cycle(*, force: bool = False, sleep: Callable[[float], None] = time.sleep) -> dict[str, Any]:
     """Run one background-enrichment pass across every source.
 
-    For each source: verify availability, compute the per-run item budget
-    (minimum service budget divided by calls-per-item, capped by the admin's
-    per-service-per-run limit), pick the highest-impact candidate locations,
-    and enrich them sequentially with a stagger pause between items. Official
+    Scheduling happens up front, in this thread: for each source, verify
+    availability, compute the per-run item budget (minimum service budget
+    divided by calls-per-item, capped by the admin's per-service-per-run
+    limit) and pick the highest-impact candidate locations. Calls a source is
+    handed are deducted from its services' budgets before the next source is
+    planned, so sources sharing a service can never jointly exceed
+    :func:`compute_service_budget`. The sources then run as concurrent lanes
+    (see :func:`fan_out`), each item paced by :class:`ServicePacer`. Official
     names and aliases are re-resolved once per touched location at the end,
     reading only the freshly cached data (no extra API calls).
 
@@ -550,54 +599,18 @@ def run_enrichment_cycle(*, force: bool = False, sleep: Callable[[float], None]
             return summary
 
     per_run_cap = max(1, site_settings.enrichment_max_per_service_per_run)
-    name_refresh_ids: set[int] = set()
+    remaining_budgets: dict[str, int | None] = {}
+    pacer = ServicePacer(sleep=sleep)
+    lanes: list[tuple[EnrichmentSource, list[Location], dict[str, Any]]] = []
 
     for source in enrichment_sources():
         entry: dict[str, Any] = {"enriched": 0, "failed": 0, "budget": 0}
         summary["sources"][source.key] = entry
         try:
-            self_reported = self_reported_skip(source)
-            if self_reported:
-                entry["skipped"] = self_reported
-                continue
-
-            budgets = [compute_service_budget(service, site_settings) for service in source.service_keys]
-            bounded = [budget for budget in budgets if budget is not None]
-            call_budget = min(bounded) if bounded else None
-            items = per_run_cap if call_budget is None else min(per_run_cap, call_budget // max(source.calls_per_item, 1))
-            entry["budget"] = max(0, items)
-            if items <= 0:
-                entry["skipped"] = "no_budget"
-                continue
-
-            candidates = prioritized_location_candidates(source.missing_filter(), limit=items, geo_boundary=source.geo_boundary)
-            if not candidates:
-                entry["skipped"] = "nothing_missing"
-                continue
-
-            pause = stagger_seconds(source)
-            for index, location in enumerate(candidates):
-                if index:
-                    sleep(pause)
-                try:
-                    changed = source.enrich(location)
-                except SoftTimeLimitExceeded:
-                    raise
-                except RequestCancelledError as exc:
-                    # The service hit its live rate limit or was disabled
-                    # mid-run - stop this source, let the others continue.
-                    logger.info("Enrichment source %s stopped early: %s", source.key, exc)
-                    entry["skipped"] = "rate_limited"
-                    break
-                except Exception:
-                    # TODO: Catch specific exceptions
-                    logger.exception("Enrichment source %s failed for location %s", source.key, location.pk)
-                    entry["failed"] += 1
-                    continue
-                if changed:
-                    entry["enriched"] += 1
-                    if source.refreshes_names:
-                        name_refresh_ids.add(location.pk)
+            candidates = _plan_lane(source, entry, site_settings, per_run_cap, remaining_budgets)
+            if candidates:
+                pacer.add(source)
+                lanes.append((source, candidates, entry))
         except SoftTimeLimitExceeded:
             raise
         except Exception:
@@ -606,6 +619,7 @@ def run_enrichment_cycle(*, force: bool = False, sleep: Callable[[float], None]
             logger.exception("Enrichment source %s crashed", source.key)
             entry["skipped"] = "error"
 
+    name_refresh_ids = _run_lanes(lanes, pacer)
     if name_refresh_ids:
         summary["names_refreshed"] = refresh_official_names(name_refresh_ids)
 
@@ -622,6 +636,120 @@ def run_enrichment_cycle(*, force: bool = False, sleep: Callable[[float], None]
     return summary
 
 
+def _plan_lane(source: EnrichmentSource, entry: dict[str, Any], site_settings: SiteSettings, per_run_cap: int, remaining_budgets: dict[str, int | None]) -> list[Location]:
+    """Pick one source's candidates for this cycle and reserve their calls.
+
+    Args:
+        source: The source to plan.
+        entry: The source's summary entry; budget and skip reason are recorded on it.
+        site_settings: Current settings.
+        per_run_cap: The admin's per-service-per-run item cap.
+        remaining_budgets: Per-service calls still unallocated this cycle,
+            filled from ``compute_service_budget`` on first use and reduced
+            by each planned lane.
+
+    Returns:
+        The locations to enrich, best first; empty when the source is skipped.
+    """
+    self_reported = self_reported_skip(source)
+    if self_reported:
+        entry["skipped"] = self_reported
+        return []
+
+    for service in source.service_keys:
+        if service not in remaining_budgets:
+            remaining_budgets[service] = compute_service_budget(service, site_settings)
+    bounded = [budget for service in source.service_keys if (budget := remaining_budgets[service]) is not None]
+    call_budget = min(bounded) if bounded else None
+    calls_per_item = max(source.calls_per_item, 1)
+    items = per_run_cap if call_budget is None else min(per_run_cap, call_budget // calls_per_item)
+    entry["budget"] = max(0, items)
+    if items <= 0:
+        entry["skipped"] = "no_budget"
+        return []
+
+    candidates = prioritized_location_candidates(source.missing_filter(), limit=items, geo_boundary=source.geo_boundary)
+    if not candidates:
+        entry["skipped"] = "nothing_missing"
+        return []
+
+    for service in source.service_keys:
+        if (budget := remaining_budgets[service]) is not None:
+            remaining_budgets[service] = budget - len(candidates) * calls_per_item
+    return candidates
+
+
+def _run_lanes(lanes: list[tuple[EnrichmentSource, list[Location], dict[str, Any]]], pacer: ServicePacer) -> set[int]:
+    """Run every planned source concurrently and collect locations needing a name refresh.
+
+    Args:
+        lanes: ``(source, candidates, summary entry)`` per source with work to do.
+        pacer: The cycle's shared per-service pacer.
+
+    Returns:
+        PKs of locations successfully enriched by name-refreshing sources.
+    """
+    stop = threading.Event()
+    try:
+        outcomes = fan_out(
+            [(source.key, partial(_run_lane, source, candidates, entry, pacer, stop)) for source, candidates, entry in lanes],
+            timeout=LANE_TIMEOUT_SECONDS,
+        )
+    finally:
+        # Interrupted (the task's soft time limit) or done: either way, lanes
+        # still running in the background stop at their next item.
+        stop.set()
+
+    name_refresh_ids: set[int] = set()
+    for outcome, (source, _candidates, entry) in zip(outcomes, lanes, strict=True):
+        if outcome.ok:
+            name_refresh_ids |= outcome.value
+        elif outcome.timed_out:
+            entry["skipped"] = "timed_out"
+        else:
+            logger.error("Enrichment source %s crashed", source.key, exc_info=outcome.error)
+            entry["skipped"] = "error"
+    return name_refresh_ids
+
+
+def _run_lane(source: EnrichmentSource, candidates: list[Location], entry: dict[str, Any], pacer: ServicePacer, stop: threading.Event) -> set[int]:
+    """Enrich one source's candidates in order, pacing each item through ``pacer``.
+
+    Args:
+        source: The source to run.
+        candidates: Its planned locations, best first.
+        entry: Its summary entry, updated with enriched/failed counts.
+        pacer: The cycle's shared per-service pacer.
+        stop: Set when the cycle is being abandoned.
+
+    Returns:
+        PKs of locations enriched here that need their names re-resolved.
+    """
+    name_refresh_ids: set[int] = set()
+    for location in candidates:
+        pacer.wait_turn(source)
+        if stop.is_set():
+            break
+        try:
+            changed = source.enrich(location)
+        except RequestCancelledError as exc:
+            # The service hit its live rate limit or was disabled
+            # mid-run - stop this source, let the others continue.
+            logger.info("Enrichment source %s stopped early: %s", source.key, exc)
+            entry["skipped"] = "rate_limited"
+            break
+        except Exception:
+            # TODO: Catch specific exceptions
+            logger.exception("Enrichment source %s failed for location %s", source.key, location.pk)
+            entry["failed"] += 1
+            continue
+        if changed:
+            entry["enriched"] += 1
+            if source.refreshes_names:
+                name_refresh_ids.add(location.pk)
+    return name_refresh_ids
+
+
 def self_reported_skip(source: EnrichmentSource) -> str | None:
     """Why a source can't run at all this cycle, or None when it can.
 
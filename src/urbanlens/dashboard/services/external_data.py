@@ -64,6 +64,7 @@ from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
 from datetime import timedelta
 from enum import StrEnum
+from functools import partial
 import logging
 import time
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -74,9 +75,10 @@ from django.utils import timezone
 
 from urbanlens.dashboard.services.apis.assets.base import MediaItem
 from urbanlens.dashboard.services.rate_limiter import RateLimitExceededError, RequestCancelledError, ServiceDisabledError
+from urbanlens.dashboard.services.timeout_utils import fan_out
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
     from django.contrib.auth.base_user import AbstractBaseUser
     from django.contrib.auth.models import AnonymousUser
@@ -109,6 +111,11 @@ DISABLED_SKIP_TTL_SECONDS = 1800
 #: than the 24h per-provider slide caches it summarises, so the marker always
 #: expires (and re-warms via a task) before the underlying entries do.
 SLIDES_READY_TTL_SECONDS = 12 * 3600
+#: Per-provider deadline inside a satellite/street collector run. The chain
+#: runs concurrently, so this bounds the whole run too, and it sits well inside
+#: ``fetch_panel_source``'s 110s soft limit. A provider that misses it is
+#: reported as failed; its own cache still fills if the call later completes.
+SLIDE_PROVIDER_DEADLINE_SECONDS = 60
 
 
 @dataclass(frozen=True, slots=True)
@@ -810,13 +817,42 @@ def _street_view_gateways() -> list[StreetViewProvider]:
     return plugin_registry.street_view_providers()
 
 
+def _collect_slides[SlideT](label: str, providers: Sequence[Any], fetch: Callable[[Any], tuple[list[SlideT], bool]]) -> tuple[list[SlideT], list[ProviderFetchResult]]:
+    """Run one carousel's provider chain concurrently and merge the results in chain order.
+
+    Args:
+        label: Human-readable chain name for log messages ("Satellite view").
+        providers: The provider chain, in display order.
+        fetch: Calls one provider's ``get_*_slides`` for the coordinates.
+
+    Returns:
+        Tuple of (all slides in provider order, per-provider outcomes).
+    """
+    calls = [(provider.service_key or type(provider).__name__, partial(fetch, provider)) for provider in providers]
+    slides: list[SlideT] = []
+    results: list[ProviderFetchResult] = []
+    for outcome in fan_out(calls, timeout=SLIDE_PROVIDER_DEADLINE_SECONDS):
+        if outcome.ok:
+            provider_slides, from_cache = outcome.value
+            slides.extend(provider_slides)
+            results.append(ProviderFetchResult(outcome.name, from_cache=from_cache, count=len(provider_slides)))
+        elif isinstance(outcome.error, RequestCancelledError):
+            logger.debug("%s provider %s request cancelled -> %s", label, outcome.name, outcome.error)
+        else:
+            if outcome.error is not None:
+                logger.warning("%s provider %s failed", label, outcome.name, exc_info=outcome.error)
+            results.append(ProviderFetchResult(outcome.name, from_cache=False, count=0, ok=False))
+    return slides, results
+
+
 def collect_satellite_slides(lat: float, lng: float) -> tuple[list[SatelliteSlide], list[ProviderFetchResult]]:
     """Gather satellite slides from every provider, tolerating per-provider failure.
 
     Each provider caches its own slides (24h, keyed by coordinates), so
     running this twice is one round of upstream fetches followed by pure cache
     hits -- the Celery warm-up task and the request-path render share this
-    exact function.
+    exact function. Providers are queried concurrently (see ``fan_out``), so
+    a cold run takes as long as the slowest provider rather than all of them.
 
     Args:
         lat: WGS-84 latitude.
@@ -826,21 +862,7 @@ def collect_satellite_slides(lat: float, lng: float) -> tuple[list[SatelliteSlid
         Tuple of (all slides in provider order, per-provider outcomes for the
         admin debug overlay).
     """
-    slides: list[SatelliteSlide] = []
-    results: list[ProviderFetchResult] = []
-    for gateway in _satellite_gateways():
-        service = gateway.service_key or type(gateway).__name__
-        try:
-            gateway_slides, from_cache = gateway.get_satellite_slides(lat, lng)
-            slides.extend(gateway_slides)
-            results.append(ProviderFetchResult(service, from_cache=from_cache, count=len(gateway_slides)))
-        except RequestCancelledError as rce:
-            logger.debug("Satellite view provider %s request cancelled -> %s", service, rce)
-        except Exception as e:
-            # TODO: Catch specific exceptions
-            logger.warning("Satellite view provider %s failed -> %s", service, e)
-            results.append(ProviderFetchResult(service, from_cache=False, count=0, ok=False))
-    return slides, results
+    return _collect_slides("Satellite view", _satellite_gateways(), lambda gateway: gateway.get_satellite_slides(lat, lng))
 
 
 def collect_street_view_slides(lat: float, lng: float) -> tuple[list[StreetViewSlide], list[ProviderFetchResult]]:
@@ -854,21 +876,7 @@ def collect_street_view_slides(lat: float, lng: float) -> tuple[list[StreetViewS
         Tuple of (all slides in provider order, per-provider outcomes for the
         admin debug overlay).
     """
-    slides: list[StreetViewSlide] = []
-    results: list[ProviderFetchResult] = []
-    for provider in _street_view_gateways():
-        service = provider.service_key or type(provider).__name__
-        try:
-            provider_slides, from_cache = provider.get_street_view_slides(lat, lng)
-            slides.extend(provider_slides)
-            results.append(ProviderFetchResult(service, from_cache=from_cache, count=len(provider_slides)))
-        except RequestCancelledError as rce:
-            logger.debug("Street view provider %s request cancelled -> %s", service, rce)
-        except Exception:
-            # TODO: Catch specific exceptions
-            logger.warning("Street view provider %s failed", service, exc_info=True)
-            results.append(ProviderFetchResult(service, from_cache=False, count=0, ok=False))
-    return slides, results
+    return _collect_slides("Street view", _street_view_gateways(), lambda provider: provider.get_street_view_slides(lat, lng))
 
 
 class SlidesPanelSource(PanelSource, ABC):
@@ -0,0 +1,238 @@
+"""Proximity clustering of weighted lat/lng points, with a spatial index.
+
+Shared by ``services.pin_suggestions`` (grouping unmatched library-sweep hits
+into new-pin suggestions) and ``services.device_scan.clustering`` (grouping a
+device's scan entries into markers). Both group points around a
+weight-weighted running centroid in plain lat/lng degrees; they differ only
+in visiting order and in when the centroid moves, which is why there are two
+entry points rather than one with a mode flag.
+
+The index maps each point to a unit vector on the sphere and buckets it in
+a 3D grid whose cell edge is twice the chord of the merge radius. Two points
+within ``radius_m`` of each other (great-circle) are within one chord on every
+axis, so a neighbour can only sit in the 8 cells nearest a query point - at the
+poles and across the antimeridian too, unlike a lat/lng grid. Candidates
+from those cells are then checked with the same haversine distance the
+callers used before, so the grouping is unchanged, just no longer compared
+against every cluster (or every point) in the set.
+
+NumPy comes with pandas/shapely, both hard dependencies.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+EARTH_RADIUS_METERS = 6_371_000.0
+
+_Cell = tuple[int, int, int]
+
+
+def _cell_edge(radius_m: float) -> float:
+    """Grid cell edge on the unit sphere for a merge radius in metres.
+
+    Twice the chord of the radius, so a point's neighbours all fall in the
+    2x2x2 block of cells on its side of its own cell's midpoints. Padded
+    slightly so a pair sitting exactly at ``radius_m`` can't escape that
+    block through rounding in the unit-vector conversion.
+    """
+    chord = 2 * math.sin(min(max(radius_m, 0.0) / EARTH_RADIUS_METERS, math.pi) / 2)
+    return max(2 * chord * (1 + 1e-9), 1e-12)
+
+
+def _unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """``(n, 3)`` unit vectors for arrays of WGS-84 degrees."""
+    lat = np.radians(latitudes)
+    lng = np.radians(longitudes)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def _block(cell: Sequence[int], step: Sequence[int]) -> list[_Cell]:
+    """The 8 cells that can hold a neighbour of a point in ``cell``."""
+    x, y, z = cell
+    sx, sy, sz = step
+    return [(cx, cy, cz) for cx in (x, x + sx) for cy in (y, y + sy) for cz in (z, z + sz)]
+
+
+def _locate(latitudes: np.ndarray, longitudes: np.ndarray, edge: float) -> tuple[list[_Cell], list[list[_Cell]]]:
+    """Each point's own cell and its neighbour block, computed in one vectorized pass."""
+    scaled = _unit_vectors(latitudes, longitudes) / edge
+    cells = np.floor(scaled)
+    steps = np.where(scaled - cells < 0.5, -1, 1).tolist()
+    own = [tuple(cell) for cell in cells.astype(np.int64).tolist()]
+    return own, [_block(cell, step) for cell, step in zip(own, steps, strict=True)]
+
+
+def _locate_one(latitude: float, longitude: float, edge: float) -> tuple[_Cell, list[_Cell]]:
+    """``_locate`` for a single point (a centroid that just moved)."""
+    lat, lng = math.radians(latitude), math.radians(longitude)
+    cos_lat = math.cos(lat)
+    scaled = (cos_lat * math.cos(lng) / edge, cos_lat * math.sin(lng) / edge, math.sin(lat) / edge)
+    cell = (math.floor(scaled[0]), math.floor(scaled[1]), math.floor(scaled[2]))
+    return cell, _block(cell, [-1 if value - floor < 0.5 else 1 for value, floor in zip(scaled, cell, strict=True)])
+
+
+def _distance_meters(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in metres between two points, for one-off checks."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    h = math.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin((math.radians(lng2) - math.radians(lng1)) / 2) ** 2
+    return EARTH_RADIUS_METERS * 2 * math.asin(math.sqrt(min(h, 1.0)))
+
+
+def haversine_meters(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Great-circle distance in metres from one point to each of many.
+
+    Args:
+        latitude: Origin latitude, degrees.
+        longitude: Origin longitude, degrees.
+        latitudes: Target latitudes, degrees.
+        longitudes: Target longitudes, degrees.
+
+    Returns:
+        Distances in metres, one per target.
+    """
+    lat1, lng1 = math.radians(latitude), math.radians(longitude)
+    lat2, lng2 = np.radians(latitudes), np.radians(longitudes)
+    h = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return EARTH_RADIUS_METERS * 2 * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
+def running_centroid_clusters(latitudes: Sequence[float], longitudes: Sequence[float], weights: Sequence[float], radius_m: float) -> list[list[int]]:
+    """Group points in input order, each joining the first cluster in range.
+
+    A point joins the earliest-created cluster whose running centroid is
+    within ``radius_m``, pulling that centroid toward itself by its share of
+    the cluster's total weight; a point with no cluster in range starts a new
+    one. This is ``pin_suggestions._cluster_hits``'s greedy grouping.
+
+    Args:
+        latitudes: Point latitudes, degrees.
+        longitudes: Point longitudes, degrees.
+        weights: Positive point weights.
+        radius_m: Merge distance in metres.
+
+    Returns:
+        Clusters as lists of input indices, in creation order, each in input
+        order.
+    """
+    count = len(latitudes)
+    if not count:
+        return []
+    lat = np.asarray(latitudes, dtype=float)
+    lng = np.asarray(longitudes, dtype=float)
+    edge = _cell_edge(radius_m)
+
+    members: list[list[int]] = []
+    centroid_lat: list[float] = []
+    centroid_lng: list[float] = []
+    cluster_weight: list[float] = []
+    cluster_cell: list[_Cell] = []
+    grid: defaultdict[_Cell, list[int]] = defaultdict(list)
+
+    cells, blocks = _locate(lat, lng, edge)
+    for index, (cell, block) in enumerate(zip(cells, blocks, strict=True)):
+        point_lat, point_lng, weight = float(lat[index]), float(lng[index]), weights[index]
+        candidates = sorted(cluster for neighbour in block for cluster in grid.get(neighbour, ()))
+        # Only a handful of clusters share a point's neighbourhood, too few
+        # for a vectorized distance call to pay for its overhead.
+        cluster = next((cluster for cluster in candidates if _distance_meters(centroid_lat[cluster], centroid_lng[cluster], point_lat, point_lng) <= radius_m), None)
+        if cluster is not None:
+            members[cluster].append(index)
+            clat, clng = centroid_lat[cluster], centroid_lng[cluster]
+            total_weight = cluster_weight[cluster] + weight
+            clat = clat + (point_lat - clat) * weight / total_weight
+            clng = clng + (point_lng - clng) * weight / total_weight
+            centroid_lat[cluster], centroid_lng[cluster] = clat, clng
+            cluster_weight[cluster] = total_weight
+            moved_to = _locate_one(clat, clng, edge)[0]
+            if moved_to != cluster_cell[cluster]:
+                grid[cluster_cell[cluster]].remove(cluster)
+                grid[moved_to].append(cluster)
+                cluster_cell[cluster] = moved_to
+            continue
+
+        cluster = len(members)
+        members.append([index])
+        centroid_lat.append(point_lat)
+        centroid_lng.append(point_lng)
+        cluster_weight.append(weight)
+        cluster_cell.append(cell)
+        grid[cell].append(cluster)
+    return members
+
+
+def seeded_clusters(latitudes: Sequence[float], longitudes: Sequence[float], weights: Sequence[float], radius_m: float) -> list[list[int]]:
+    """Grow clusters outward from the heaviest unclaimed point.
+
+    The heaviest remaining point seeds a cluster, which absorbs every
+    remaining point within ``radius_m`` of its centroid, recomputes the
+    weighted centroid, and repeats until a pass absorbs nothing. Ties in
+    weight keep input order. This is ``device_scan.clustering``'s grouping.
+
+    Args:
+        latitudes: Point latitudes, degrees.
+        longitudes: Point longitudes, degrees.
+        weights: Positive point weights.
+        radius_m: Merge distance in metres.
+
+    Returns:
+        Clusters as lists of input indices, in seeding order; each starts
+        with its seed, followed by the points absorbed in each pass.
+    """
+    count = len(latitudes)
+    if not count:
+        return []
+    lat = np.asarray(latitudes, dtype=float)
+    lng = np.asarray(longitudes, dtype=float)
+    edge = _cell_edge(radius_m)
+
+    order = sorted(range(count), key=lambda index: weights[index], reverse=True)
+    rank = np.empty(count, dtype=np.int64)
+    rank[order] = np.arange(count)
+    grid: defaultdict[_Cell, list[int]] = defaultdict(list)
+    for index, cell in enumerate(_locate(lat, lng, edge)[0]):
+        grid[cell].append(index)
+    claimed = [False] * count
+
+    clusters: list[list[int]] = []
+    for seed in order:
+        if claimed[seed]:
+            continue
+        claimed[seed] = True
+        cluster = [seed]
+        centroid = (float(lat[seed]), float(lng[seed]))
+        # Running sums in membership order give the same floats as
+        # recomputing the weighted mean over the whole cluster each pass.
+        weighted_lat = centroid[0] * weights[seed]
+        weighted_lng = centroid[1] * weights[seed]
+        total_weight = weights[seed]
+        while True:
+            nearby: list[int] = []
+            for neighbour in _locate_one(*centroid, edge)[1]:
+                bucket = grid.get(neighbour)
+                if bucket:
+                    bucket[:] = [index for index in bucket if not claimed[index]]
+                    nearby.extend(bucket)
+            if not nearby:
+                break
+            ids = np.fromiter(nearby, dtype=np.int64, count=len(nearby))
+            absorbed = ids[haversine_meters(*centroid, lat[ids], lng[ids]) <= radius_m]
+            if not absorbed.size:
+                break
+            for index in absorbed[np.argsort(rank[absorbed], kind="stable")].tolist():
+                claimed[index] = True
+                cluster.append(index)
+                weighted_lat += float(lat[index]) * weights[index]
+                weighted_lng += float(lng[index]) * weights[index]
+                total_weight += weights[index]
+            centroid = (weighted_lat / total_weight, weighted_lng / total_weight)
+        clusters.append(cluster)
+    return clusters
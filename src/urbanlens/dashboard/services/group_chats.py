@@ -882,16 +882,15 @@ def group_conversations_for(profile: Profile) -> list[dict[str, Any]]:
         ``is_muted`` (bool), and ``last_activity`` (datetime used for
         cross-kind sorting).
 
-    Runs a fixed number of queries regardless of how many groups the profile
-    is in, rather than three queries per group (last message, unread count,
-    member count) - this backs the messages sidebar, which refreshes after
-    nearly every send/receive, so a per-group query loop here compounds fast.
-    Each membership's own visibility window (its own ``created``/
-    ``last_read_at`` cutoffs) can't be expressed as one shared filter, but
-    the per-group breakdowns can still come from two grouped queries instead
-    of one query each.
+    Runs two queries regardless of how many groups the profile is in: last
+    message and unread count come from each membership's own inbox summary
+    (see ``GroupChatMembershipManager.record_message``) rather than from the
+    group's message history - this backs the messages sidebar, which
+    refreshes after nearly every send/receive.
     """
-    memberships = list(GroupChatMembership.objects.active().filter(profile=profile).select_related("group"))
+    memberships = list(
+        GroupChatMembership.objects.active().filter(profile=profile).select_related("group", "last_message__sender__user"),
+    )
     if not memberships:
         return []
     group_ids = [membership.group_id for membership in memberships]
@@ -900,40 +899,26 @@ def group_conversations_for(profile: Profile) -> list[dict[str, Any]]:
         GroupChatMembership.objects.active().filter(group_id__in=group_ids).values_list("group_id").annotate(count=Count("id")).order_by(),
     )
 
-    visible = Q(pk__in=[])
-    unread = Q(pk__in=[])
-    for membership in memberships:
-        visible |= Q(group_id=membership.group_id, created__gte=membership.created)
-        unread_clause = Q(group_id=membership.group_id, created__gte=membership.created) & ~Q(sender_id=membership.profile_id)
-        if membership.last_read_at is not None:
-            unread_clause &= Q(created__gt=membership.last_read_at)
-        unread |= unread_clause
-
-    last_message_by_group: dict[int, GroupMessage] = {}
-    for message in GroupMessage.objects.filter(visible).select_related("sender", "sender__user").order_by("group_id", "-id"):
-        last_message_by_group.setdefault(message.group_id, message)
-    unread_counts = dict(GroupMessage.objects.filter(unread).values_list("group_id").annotate(count=Count("id")).order_by())
-
     # The sidebar preview shows the last sender's name - resolve it through the
     # same viewer-scoped identity masking the thread render uses, so a sender
     # whose profile_visibility hides them from this viewer isn't revealed by
     # the preview line before the (masked) thread is even opened.
     sender_display_names: dict[int, str] = {}
-    for message in last_message_by_group.values():
-        if message.sender_id not in sender_display_names:
+    for membership in memberships:
+        message = membership.last_message
+        if message is not None and message.sender_id not in sender_display_names:
             sender_display_names[message.sender_id] = resolve_visible_identity(profile, message.sender)["display_name"]
 
     conversations: list[dict[str, Any]] = []
     for membership in memberships:
-        group = membership.group
-        last_message = last_message_by_group.get(membership.group_id)
+        last_message = membership.last_message
         conversations.append(
             {
                 "kind": "group",
-                "group": group,
+                "group": membership.group,
                 "last_message": last_message,
                 "last_sender_display_name": sender_display_names.get(last_message.sender_id, "") if last_message is not None else "",
-                "unread_count": unread_counts.get(membership.group_id, 0),
+                "unread_count": membership.unread_count,
                 "member_count": member_counts.get(membership.group_id, 0),
                 "is_muted": membership.muted,
                 "last_activity": last_message.created if last_message is not None else membership.created,
@@ -953,27 +938,12 @@ def unread_group_conversation_count(profile: Profile) -> int:
         The number of groups needing attention (feeds the navbar label,
         alongside the 1:1 ``unread_conversation_count``).
 
-    Runs exactly two queries regardless of how many groups the profile is
-    in - this backs a site-wide 60-second poll (every open page, every
-    logged-in user), so a per-membership query loop here is not just slow
-    for one request but a real aggregate load multiplier across the whole
-    site. Each membership's own visibility window (its own ``created``/
-    ``last_read_at`` cutoffs - see ``GroupMessageQuerySet.unread_for``)
-    can't be expressed as one shared filter, but can still be OR'd together
-    into a single query, matching the same technique
-    ``GroupMessageQuerySet.search_visible_to`` already uses for the analogous
-    "any of my memberships" problem.
+    One query regardless of how many groups the profile is in - this backs
+    a site-wide 60-second poll (every open page, every logged-in user), so
+    it reads the memberships' maintained ``unread_count`` instead of
+    matching each membership's visibility window against the messages.
     """
-    memberships = list(GroupChatMembership.objects.active().filter(profile=profile))
-    if not memberships:
-        return 0
-    visibility = Q(pk__in=[])
-    for membership in memberships:
-        clause = Q(group_id=membership.group_id, created__gte=membership.created) & ~Q(sender_id=membership.profile_id)
-        if membership.last_read_at is not None:
-            clause &= Q(created__gt=membership.last_read_at)
-        visibility |= clause
-    return GroupMessage.objects.filter(visibility).values("group_id").distinct().count()
+    return GroupChatMembership.objects.active().filter(profile=profile, unread_count__gt=0).count()
 
 
 def group_e2ee_ready(group: GroupChat) -> bool:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 import hashlib
@@ -11,6 +12,7 @@ import logging
 import math
 import posixpath
 import re
+import tempfile
 from typing import IO, TYPE_CHECKING, Any
 
 from django.utils import timezone
@@ -18,7 +20,10 @@ from PIL import Image as PILImage
 from PIL.ExifTags import GPSTAGS, TAGS
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from django.core.files.uploadedfile import UploadedFile
+    from django.db.models.fields.files import FieldFile
     from django.http import HttpRequest
 
     from urbanlens.dashboard.models.images.model import Image, MediaKind
@@ -38,6 +43,10 @@ _FORMAT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp", "TIFF": ".
 # JSON snapshot; larger values are summarized instead of embedded.
 _EXIF_BYTES_HEX_LIMIT = 4096
 
+# Stored files up to this size are spooled in memory by spooled_stored_file;
+# larger ones spill to a temp file.
+_SPOOL_MEMORY_LIMIT = 32 * 1024 * 1024
+
 
 def coerce_coordinates(data: Any) -> tuple[Decimal, Decimal]:
     """Validate and convert a mapping's ``latitude``/``longitude`` entries into Decimals.
@@ -136,7 +145,11 @@ def extract_gps_coords(image_file: IO[bytes]) -> tuple[float, float] | None:
     finally:
         with contextlib.suppress(Exception):
             image_file.seek(0)
+    return _gps_coords_from_ifd(gps_ifd)
 
+
+def _gps_coords_from_ifd(gps_ifd: dict[int, Any] | None) -> tuple[float, float] | None:
+    """(latitude, longitude) from an already-read GPS IFD (see ``extract_gps_coords``)."""
     if not gps_ifd:
         return None
     gps_data = {GPSTAGS.get(k, k): v for k, v in gps_ifd.items()}
@@ -178,7 +191,11 @@ def extract_gps_direction(image_file: IO[bytes]) -> float | None:
     finally:
         with contextlib.suppress(Exception):
             image_file.seek(0)
+    return _gps_direction_from_ifd(gps_ifd)
+
 
+def _gps_direction_from_ifd(gps_ifd: dict[int, Any] | None) -> float | None:
+    """Camera bearing from an already-read GPS IFD (see ``extract_gps_direction``)."""
     if not gps_ifd:
         return None
     gps_data = {GPSTAGS.get(k, k): v for k, v in gps_ifd.items()}
@@ -209,7 +226,11 @@ def extract_taken_at(image_file: IO[bytes]) -> datetime | None:
     finally:
         with contextlib.suppress(Exception):
             image_file.seek(0)
+    return _taken_at_from_ifd(exif_ifd)
 
+
+def _taken_at_from_ifd(exif_ifd: dict[int, Any] | None) -> datetime | None:
+    """Capture time from an already-read Exif SubIFD (see ``extract_taken_at``)."""
     if not exif_ifd:
         return None
     raw_value = exif_ifd.get(0x9003)  # 36867 - DateTimeOriginal
@@ -272,6 +293,11 @@ def extract_author(image_file: IO[bytes]) -> str | None:
     finally:
         with contextlib.suppress(Exception):
             image_file.seek(0)
+    return _author_from_ifd0(exif)
+
+
+def _author_from_ifd0(exif: Any | None) -> str | None:
+    """Author from already-read IFD0 tags (see ``extract_author``)."""
     if not exif:
         return None
     artist = exif.get(0x013B)  # Artist
@@ -290,6 +316,11 @@ def extract_copyright_notice(image_file: IO[bytes]) -> str | None:
     finally:
         with contextlib.suppress(Exception):
             image_file.seek(0)
+    return _copyright_from_ifd0(exif)
+
+
+def _copyright_from_ifd0(exif: Any | None) -> str | None:
+    """Copyright notice from already-read IFD0 tags (see ``extract_copyright_notice``)."""
     if not exif:
         return None
     notice = exif.get(0x8298)  # Copyright
@@ -308,6 +339,11 @@ def extract_caption_from_metadata(image_file: IO[bytes]) -> str | None:
     finally:
         with contextlib.suppress(Exception):
             image_file.seek(0)
+    return _caption_from_ifd0(exif)
+
+
+def _caption_from_ifd0(exif: Any | None) -> str | None:
+    """Caption from already-read IFD0 tags (see ``extract_caption_from_metadata``)."""
     if not exif:
         return None
     description = exif.get(0x010E)  # ImageDescription
@@ -336,15 +372,20 @@ def extract_source_url(image_file: IO[bytes]) -> str | None:
     try:
         image_file.seek(0)
         img = PILImage.open(image_file)
-        for key, value in (img.info or {}).items():
-            if isinstance(key, str) and isinstance(value, str) and key.lower() in {"url", "source", "source_url"} and value.strip().lower().startswith(("http://", "https://")):
-                return value.strip()
+        return _source_url_from_info(img.info)
     except Exception as exc:
         logger.debug("Source URL extraction failed: %s", exc)
         return None
     finally:
         with contextlib.suppress(Exception):
             image_file.seek(0)
+
+
+def _source_url_from_info(info: dict[str, Any] | None) -> str | None:
+    """Source URL from an opened image's text metadata (see ``extract_source_url``)."""
+    for key, value in (info or {}).items():
+        if isinstance(key, str) and isinstance(value, str) and key.lower() in {"url", "source", "source_url"} and value.strip().lower().startswith(("http://", "https://")):
+            return value.strip()
     return None
 
 
@@ -413,16 +454,7 @@ def extract_exif_data(image_file: IO[bytes]) -> dict[str, Any] | None:
         exif = img.getexif()
         if not exif:
             return None
-        data: dict[str, Any] = {}
-        for tag_id, value in exif.items():
-            data[str(TAGS.get(tag_id, tag_id))] = _json_safe(value)
-        exif_ifd = exif.get_ifd(0x8769)  # 34665 - Exif SubIFD
-        for tag_id, value in exif_ifd.items():
-            data[str(TAGS.get(tag_id, tag_id))] = _json_safe(value)
-        gps_ifd = exif.get_ifd(0x8825)  # 34853 - GPSInfo IFD
-        if gps_ifd:
-            data["GPSInfo"] = {str(GPSTAGS.get(tag_id, tag_id)): _json_safe(value) for tag_id, value in gps_ifd.items()}
-        return data or None
+        return _exif_snapshot(exif, exif.get_ifd(0x8769), exif.get_ifd(0x8825))  # Exif SubIFD, GPSInfo IFD
     except Exception as exc:
         logger.debug("EXIF snapshot failed: %s", exc)
         return None
@@ -431,7 +463,113 @@ def extract_exif_data(image_file: IO[bytes]) -> dict[str, Any] | None:
             image_file.seek(0)
 
 
-def downscale_stored_image(image: Image, max_dimension: int | None, convert_webp: bool, strip_gps: bool = False) -> int | None:
+def _exif_snapshot(exif: Any, exif_ifd: dict[int, Any] | None, gps_ifd: dict[int, Any] | None) -> dict[str, Any] | None:
+    """JSON-safe snapshot of already-read EXIF tags (see ``extract_exif_data``)."""
+    data: dict[str, Any] = {}
+    for tag_id, value in exif.items():
+        data[str(TAGS.get(tag_id, tag_id))] = _json_safe(value)
+    for tag_id, value in (exif_ifd or {}).items():
+        data[str(TAGS.get(tag_id, tag_id))] = _json_safe(value)
+    if gps_ifd:
+        data["GPSInfo"] = {str(GPSTAGS.get(tag_id, tag_id)): _json_safe(value) for tag_id, value in gps_ifd.items()}
+    return data or None
+
+
+@dataclass(frozen=True, slots=True)
+class ImageMetadata:
+    """Everything the upload pipeline reads from a photo's headers.
+
+    Built by :func:`read_image_metadata`, which opens the file and parses its
+    EXIF IFDs once instead of once per field. Each attribute means exactly
+    what the matching ``extract_*`` function returns.
+    """
+
+    gps_coords: tuple[float, float] | None = None
+    gps_direction: float | None = None
+    taken_at: datetime | None = None
+    exif_data: dict[str, Any] | None = None
+    author: str | None = None
+    copyright_notice: str | None = None
+    caption: str | None = None
+    source_url: str | None = None
+
+
+def _safely[T](label: str, derive: Callable[[], T | None]) -> T | None:
+    """Run one field's derivation, so a malformed tag only loses that field."""
+    try:
+        return derive()
+    except Exception as exc:
+        logger.debug("EXIF %s extraction failed: %s", label, exc)
+        return None
+
+
+def read_image_metadata(image_file: IO[bytes]) -> ImageMetadata:
+    """Read every upload-relevant metadata field from an image in one pass.
+
+    Equivalent to calling each ``extract_*`` function in turn, but the file
+    is opened and its IFD0, Exif SubIFD and GPS IFD are decoded only once.
+
+    Args:
+        image_file: The uploaded file or opened FieldFile to read.
+
+    Returns:
+        The parsed metadata; every field is None when the file isn't an
+        image Pillow can open.
+    """
+    try:
+        image_file.seek(0)
+        img = PILImage.open(image_file)
+        exif = img.getexif()
+        info = dict(img.info or {})
+    except Exception as exc:
+        logger.debug("Image metadata read failed: %s", exc)
+        return ImageMetadata()
+    finally:
+        with contextlib.suppress(Exception):
+            image_file.seek(0)
+
+    exif_ifd = _safely("SubIFD", lambda: exif.get_ifd(0x8769) or None) if exif else None  # 34665 - Exif SubIFD
+    gps_ifd = _safely("GPS", lambda: exif.get_ifd(0x8825) or None) if exif else None  # 34853 - GPSInfo IFD
+    return ImageMetadata(
+        gps_coords=_safely("GPS", lambda: _gps_coords_from_ifd(gps_ifd)),
+        gps_direction=_safely("GPS direction", lambda: _gps_direction_from_ifd(gps_ifd)),
+        taken_at=_safely("DateTimeOriginal", lambda: _taken_at_from_ifd(exif_ifd)),
+        exif_data=_safely("snapshot", lambda: _exif_snapshot(exif, exif_ifd, gps_ifd)) if exif else None,
+        author=_safely("author", lambda: _author_from_ifd0(exif or None)),
+        copyright_notice=_safely("copyright", lambda: _copyright_from_ifd0(exif or None)),
+        caption=_safely("caption", lambda: _caption_from_ifd0(exif or None)),
+        source_url=_source_url_from_info(info),
+    )
+
+
+@contextlib.contextmanager
+def spooled_stored_file(field_file: FieldFile) -> Iterator[tuple[IO[bytes], str]]:
+    """Read a stored file once into a local spool, hashing it on the way through.
+
+    Everything downstream - metadata, checksum, downscaling - then works off
+    the spool instead of reopening (for remote storage: re-downloading) the
+    file. Small files stay in memory; large ones spill to a temp file.
+
+    Args:
+        field_file: The stored file to read.
+
+    Yields:
+        ``(spool positioned at 0, SHA-256 hex digest of the contents)``.
+
+    Raises:
+        OSError: When the file cannot be read from storage.
+    """
+    digest = hashlib.sha256()
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MEMORY_LIMIT) as spool:
+        with field_file.open("rb") as stored_file:
+            for chunk in iter(lambda: stored_file.read(1024 * 1024), b""):
+                digest.update(chunk)
+                spool.write(chunk)
+        spool.seek(0)
+        yield spool, digest.hexdigest()
+
+
+def downscale_stored_image(image: Image, max_dimension: int | None, convert_webp: bool, strip_gps: bool = False, *, source: IO[bytes] | None = None) -> int | None:
     """Downscale and/or re-encode an Image's stored file in place.
 
     The stored file is replaced only when processing actually shrinks it (or a
@@ -449,6 +587,8 @@ def downscale_stored_image(image: Image, max_dimension: int | None, convert_webp
             stored file's own metadata (independent of the derived
             ``Image.latitude``/``longitude`` fields, which the caller controls
             separately).
+        source: The stored file's contents when the caller already has them
+            (see ``spooled_stored_file``), so storage isn't read again.
 
     Returns:
         The new stored size in bytes when the file was replaced, else None.
@@ -459,8 +599,14 @@ def downscale_stored_image(image: Image, max_dimension: int | None, convert_webp
     old_name = image.image.name
     if not old_name:
         return None
-    old_size = image.image.size
-    with image.image.open("rb") as stored_file:
+    if source is None:
+        old_size = image.image.size
+        opened = image.image.open("rb")
+    else:
+        old_size = source.seek(0, io.SEEK_END)
+        source.seek(0)
+        opened = contextlib.nullcontext(source)
+    with opened as stored_file:
         img: PILImage.Image = PILImage.open(stored_file)
         source_format = (img.format or "").upper()
         if source_format not in _PROCESSABLE_FORMATS:
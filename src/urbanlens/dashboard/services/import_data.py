@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass, field
+import itertools
 import json
 import logging
 import os
@@ -13,6 +14,8 @@ import zipfile
 
 from django.core.cache import cache
 
+from urbanlens.dashboard.services.json_rows import JsonRows
+
 logger = logging.getLogger(__name__)
 
 ProgressReporter = Callable[[int, int], None]
@@ -426,7 +429,7 @@ def _scan_extracted_files(extract_root: str) -> None:
 
     for dirpath, _dirnames, filenames in os.walk(extract_root):
         for filename in filenames:
-            if filename.lower().endswith(".json"):
+            if filename.lower().endswith((".json", ".ndjson")):
                 continue
             path = os.path.join(dirpath, filename)
             with open(path, "rb") as file_obj:
@@ -453,7 +456,11 @@ def _find_data_dir(root: str) -> str | None:
 
 
 def _read_json(data_dir: str, filename: str) -> Any:
-    """Read and parse a JSON file from the data directory; return None if missing."""
+    """Read and parse a JSON file from the data directory; return None if missing.
+
+    Only for the small single-object files (manifest, settings). Row files go
+    through ``JsonRows.open`` so they are never held in memory whole.
+    """
     path = os.path.join(data_dir, filename)
     if not os.path.exists(path):
         return None
@@ -480,7 +487,7 @@ def _import_labels(
 
     # Fall back to the pre-rename filename so backup archives exported before the
     # Badge -> Label rename still import cleanly.
-    rows = _read_json(data_dir, "labels.json") or _read_json(data_dir, "badges.json")
+    rows = JsonRows.open(data_dir, "labels.json") or JsonRows.open(data_dir, "badges.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -582,17 +589,22 @@ def _import_pins(
     Pins are imported as bare coordinates, exactly as if the user had dropped
     a new pin manually or imported a Google Takeout file. Location resolution
     (matching an existing shared Location nearby, or creating a new one)
-    happens inside ``Pin.objects.get_nearby_or_create``. No community wiki,
+    follows ``Pin.objects.get_nearby_or_create``. No community wiki,
     boundary, or external-API work happens at import time: wikis are created
     explicitly by the user from the pin detail page, and default boundaries
     are generated lazily when a pin detail page is first viewed.
 
-    Pins are deduped per-profile by proximity via ``Pin.objects.get_nearby_or_create``
-    (the same helper the Google Takeout importer uses) rather than inserted
-    directly. Multiple exported pins commonly resolve to the same effective
-    coordinate (e.g. several pins that all rely on one shared Location for
-    placement), which would otherwise collide with the one-root-pin-per-point
-    per-profile database constraint.
+    Pins are deduped per-profile by proximity rather than inserted directly.
+    Multiple exported pins commonly resolve to the same effective coordinate
+    (e.g. several pins that all rely on one shared Location for placement),
+    which would otherwise collide with the one-root-pin-per-point per-profile
+    database constraint.
+
+    Rows are imported ``bulk_pin_import.CHUNK_SIZE`` at a time by
+    ``BulkPinImporter``, which resolves a chunk in a handful of set-based
+    queries. A chunk that hits an IntegrityError (a concurrent write claiming
+    the same Location or uuid) is rolled back and re-run one row at a time
+    through :func:`_import_pin_row`, which tolerates those races.
 
     A pin's review rating and private article are only ever created here (never
     on a re-import that skips an already-existing pin), matching the same
@@ -600,102 +612,137 @@ def _import_pins(
     """
     from django.db import IntegrityError
 
-    from urbanlens.dashboard.models.abstract.choices import SecurityLevel
-    from urbanlens.dashboard.models.abstract.security import SECURITY_FIELDS
-    from urbanlens.dashboard.models.pin.model import Pin
+    from urbanlens.dashboard.services.bulk_pin_import import CHUNK_SIZE, BulkPinImporter
 
-    rows = _read_json(data_dir, "pins.json")
+    rows = JsonRows.open(data_dir, "pins.json")
     if not rows:
         return
     total_rows = len(rows)
-    security_level_values = set(SecurityLevel.values)
+    importer = BulkPinImporter(profile, result, pin_uuid_map=pin_uuid_map, label_uuid_map=label_uuid_map)
 
-    for idx, row in enumerate(rows, start=1):
+    done = 0
+    for chunk in itertools.batched(rows, CHUNK_SIZE):
+        try:
+            importer.import_chunk(list(chunk))
+        except IntegrityError:
+            logger.warning("Bulk pin import chunk at row %d conflicted; importing it row by row", done, exc_info=True)
+            for row in chunk:
+                if (pin := _import_pin_row(profile, row, result, pin_uuid_map=pin_uuid_map, label_uuid_map=label_uuid_map)) is not None:
+                    importer.claim_pin(pin)
+        done += len(chunk)
         if report_progress:
-            report_progress(idx, total_rows)
-        uuid_str = row.get("uuid", "")
+            report_progress(done, total_rows)
+    importer.finish()
 
-        # Idempotency: skip pins that already exist FOR THIS USER. The
-        # profile scope is load-bearing: the archive is user-supplied, so a
-        # uuid belonging to another user's pin must not enter pin_uuid_map -
-        # later steps (visit history) create rows against the mapped pks.
-        existing = Pin.objects.filter(uuid=uuid_str, profile=profile).first() if uuid_str else None
-        if existing:
-            pin_uuid_map[uuid_str] = existing.pk
-            result.inc_skipped("pins")
-            continue
 
-        lat = row.get("latitude")
-        lng = row.get("longitude")
-        if lat is None or lng is None:
-            result.warnings.append(f"Could not import pin '{row.get('name', uuid_str)}': missing coordinates.")
-            result.inc_skipped("pins")
-            continue
+def _import_pin_row(profile: Any, row: dict[str, Any], result: ImportResult, *, pin_uuid_map: dict[str, int], label_uuid_map: dict[str, int]) -> Any:
+    """Import one ``pins.json`` row through ``Pin.objects.get_nearby_or_create``.
 
-        defaults: dict[str, Any] = {
-            "name": row.get("name") or None,
-            "description": row.get("description") or "",
-            "icon": row.get("icon") or None,
-            "color": row.get("color") or None,
-            "priority": int(row.get("priority", 0)),
-            "vulnerability": int(row.get("vulnerability", 0)),
-            "danger": int(row.get("danger", 0)),
-            "pin_type": row.get("pin_type", "location"),
-            "detail_bg_color": row.get("detail_bg_color") or None,
-            "detail_bg_opacity": int(row.get("detail_bg_opacity", 80)),
-            "detail_border_color": row.get("detail_border_color") or None,
-            "detail_border_opacity": int(row.get("detail_border_opacity", 100)),
-        }
-        security = row.get("security") or {}
-        for field_name, _label in SECURITY_FIELDS:
-            value = security.get(field_name)
-            if value in security_level_values:
-                defaults[field_name] = value
-        # Only carry the archive's uuid onto the new pin when it isn't
-        # already taken by another user's pin (uuid is globally unique);
-        # otherwise import as a fresh pin. pin_uuid_map still keys on the
-        # archive's uuid either way - it exists to resolve the archive's own
-        # internal cross-references.
-        if uuid_str and not Pin.objects.filter(uuid=uuid_str).exists():
-            defaults["uuid"] = uuid_str
+    The row-at-a-time counterpart of ``BulkPinImporter``, used when a bulk
+    chunk conflicts with a concurrent write.
 
-        try:
-            pin, created = Pin.objects.get_nearby_or_create(lat, lng, profile, defaults=defaults)
-        except (IntegrityError, ValueError, TypeError):
-            logger.warning("Failed to import pin %s", uuid_str, exc_info=True)
-            result.warnings.append(f"Could not import pin '{row.get('name', uuid_str)}'.")
-            continue
+    Returns:
+        The pin the row resolved to through ``get_nearby_or_create`` (new or
+        existing), or None when it was skipped before that or failed.
+    """
+    from django.db import IntegrityError
 
-        if pin is None:
-            result.inc_skipped("pins")
-            continue
+    from urbanlens.dashboard.models.pin.model import Pin
 
-        if uuid_str:
-            pin_uuid_map[uuid_str] = pin.pk
+    uuid_str = row.get("uuid", "")
 
-        if not created:
-            result.inc_skipped("pins")
-            continue
+    # Idempotency: skip pins that already exist FOR THIS USER. The
+    # profile scope is load-bearing: the archive is user-supplied, so a
+    # uuid belonging to another user's pin must not enter pin_uuid_map -
+    # later steps (visit history) create rows against the mapped pks.
+    existing = Pin.objects.filter(uuid=uuid_str, profile=profile).first() if uuid_str else None
+    if existing:
+        pin_uuid_map[uuid_str] = existing.pk
+        result.inc_skipped("pins")
+        return None
+
+    lat = row.get("latitude")
+    lng = row.get("longitude")
+    if lat is None or lng is None:
+        result.warnings.append(f"Could not import pin '{row.get('name', uuid_str)}': missing coordinates.")
+        result.inc_skipped("pins")
+        return None
 
-        result.inc_created("pins")
+    defaults = _pin_defaults(row)
+    # Only carry the archive's uuid onto the new pin when it isn't
+    # already taken by another user's pin (uuid is globally unique);
+    # otherwise import as a fresh pin. pin_uuid_map still keys on the
+    # archive's uuid either way - it exists to resolve the archive's own
+    # internal cross-references.
+    if uuid_str and not Pin.objects.filter(uuid=uuid_str).exists():
+        defaults["uuid"] = uuid_str
 
-        # Assign labels. "badge_uuids" is the pre-rename key, kept for old backup archives.
-        for label_uuid in row.get("label_uuids") or row.get("badge_uuids", []):
-            if label_uuid in label_uuid_map:
-                pin.labels.add(label_uuid_map[label_uuid])
+    try:
+        pin, created = Pin.objects.get_nearby_or_create(lat, lng, profile, defaults=defaults)
+    except (IntegrityError, ValueError, TypeError):
+        logger.warning("Failed to import pin %s", uuid_str, exc_info=True)
+        result.warnings.append(f"Could not import pin '{row.get('name', uuid_str)}'.")
+        return None
 
-        rating = row.get("rating")
-        if isinstance(rating, int) and 0 <= rating <= 5:
-            from urbanlens.dashboard.models.reviews.model import Review
+    if pin is None:
+        result.inc_skipped("pins")
+        return None
 
-            Review.objects.create(profile=profile, pin=pin, rating=rating)
+    if uuid_str:
+        pin_uuid_map[uuid_str] = pin.pk
 
-        article_data = row.get("article") or {}
-        content = article_data.get("content")
-        if content:
-            from urbanlens.dashboard.services.articles import save_article
+    if not created:
+        result.inc_skipped("pins")
+        return pin
 
-            save_article(editor=profile, content=content, edit_summary="Imported", pin=pin)
+    result.inc_created("pins")
+
+    # Assign labels. "badge_uuids" is the pre-rename key, kept for old backup archives.
+    for label_uuid in row.get("label_uuids") or row.get("badge_uuids", []):
+        if label_uuid in label_uuid_map:
+            pin.labels.add(label_uuid_map[label_uuid])
+
+    rating = row.get("rating")
+    if isinstance(rating, int) and 0 <= rating <= 5:
+        from urbanlens.dashboard.models.reviews.model import Review
+
+        Review.objects.create(profile=profile, pin=pin, rating=rating)
+
+    article_data = row.get("article") or {}
+    content = article_data.get("content")
+    if content:
+        from urbanlens.dashboard.services.articles import save_article
+
+        save_article(editor=profile, content=content, edit_summary="Imported", pin=pin)
+    return pin
+
+
+def _pin_defaults(row: dict[str, Any]) -> dict[str, Any]:
+    """Pin field values for a new pin created from one ``pins.json`` row."""
+    from urbanlens.dashboard.models.abstract.choices import SecurityLevel
+    from urbanlens.dashboard.models.abstract.security import SECURITY_FIELDS
+
+    defaults: dict[str, Any] = {
+        "name": row.get("name") or None,
+        "description": row.get("description") or "",
+        "icon": row.get("icon") or None,
+        "color": row.get("color") or None,
+        "priority": int(row.get("priority", 0)),
+        "vulnerability": int(row.get("vulnerability", 0)),
+        "danger": int(row.get("danger", 0)),
+        "pin_type": row.get("pin_type", "location"),
+        "detail_bg_color": row.get("detail_bg_color") or None,
+        "detail_bg_opacity": int(row.get("detail_bg_opacity", 80)),
+        "detail_border_color": row.get("detail_border_color") or None,
+        "detail_border_opacity": int(row.get("detail_border_opacity", 100)),
+    }
+    security = row.get("security") or {}
+    security_level_values = set(SecurityLevel.values)
+    for field_name, _label in SECURITY_FIELDS:
+        value = security.get(field_name)
+        if value in security_level_values:
+            defaults[field_name] = value
+    return defaults
 
 
 def _import_visit_history(
@@ -714,7 +761,7 @@ def _import_visit_history(
     from urbanlens.dashboard.models.visits.model import PinVisit
     from urbanlens.dashboard.services.visits import visit_logging_allowed
 
-    rows = _read_json(data_dir, "visit_history.json")
+    rows = JsonRows.open(data_dir, "visit_history.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -786,7 +833,7 @@ def _import_connections(
     from urbanlens.dashboard.models.friendship.model import Friendship
     from urbanlens.dashboard.models.profile.model import Profile
 
-    rows = _read_json(data_dir, "connections.json")
+    rows = JsonRows.open(data_dir, "connections.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -1041,7 +1088,7 @@ def _import_pin_lists(
 
     from urbanlens.dashboard.models.pin_list.model import PinList, PinListItem
 
-    rows = _read_json(data_dir, "pin_lists.json")
+    rows = JsonRows.open(data_dir, "pin_lists.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -1119,7 +1166,7 @@ def _import_custom_fields(
     """
     from urbanlens.dashboard.models.custom_fields.model import CustomField, CustomFieldEntity, CustomFieldType, CustomFieldValue
 
-    rows = _read_json(data_dir, "custom_fields.json")
+    rows = JsonRows.open(data_dir, "custom_fields.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -1317,7 +1364,7 @@ def _import_comments(
     from urbanlens.dashboard.models.comments.model import Comment
     from urbanlens.dashboard.services.text_limits import MAX_COMMENT_TEXT_LENGTH
 
-    rows = _read_json(data_dir, "comments.json")
+    rows = JsonRows.open(data_dir, "comments.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -1393,7 +1440,7 @@ def _import_photos(
     from urbanlens.dashboard.models.images.model import Image, MediaKind
     from urbanlens.dashboard.services.storage import file_size_error_for_upload, quota_error_for_upload
 
-    rows = _read_json(data_dir, os.path.join("photos", "metadata.json"))
+    rows = JsonRows.open(data_dir, os.path.join("photos", "metadata.json"))
     if not rows:
         return
     photos_dir = os.path.join(data_dir, "photos")
@@ -1488,7 +1535,7 @@ def _import_trips(
     from urbanlens.dashboard.models.trips.model import Trip, TripMembership
     from urbanlens.dashboard.services.connections import get_connections
 
-    rows = _read_json(data_dir, "trips.json")
+    rows = JsonRows.open(data_dir, "trips.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -1600,7 +1647,7 @@ def _import_direct_messages(
     from urbanlens.dashboard.services.direct_messages import can_direct_message
     from urbanlens.dashboard.services.text_limits import MAX_DIRECT_MESSAGE_LENGTH
 
-    rows = _read_json(data_dir, "direct_messages.json")
+    rows = JsonRows.open(data_dir, "direct_messages.json")
     if not rows:
         return
     total_rows = len(rows)
@@ -0,0 +1,148 @@
+"""Bounded-memory readers for the row files in an import archive.
+
+``pins.json``, ``visit_history.json``, ``direct_messages.json`` and the other
+row files of a backup archive are JSON arrays of objects, and an active
+account's can run to hundreds of megabytes once decoded. Loading one with
+``json.load`` held every row in the Celery worker at once. :class:`JsonRows`
+decodes rows one at a time instead: the legacy array files through an
+incremental ``JSONDecoder.raw_decode`` loop, and NDJSON files (one object per
+line, ``<name>.ndjson``) line by line. An ``.ndjson`` file takes precedence
+over the ``.json`` file of the same name.
+
+``len()`` counts the rows with a separate streaming pass, so importers can
+keep reporting ``(done, total)`` progress without materializing the file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+#: Characters read per refill of the array decoder's buffer.
+READ_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonRows:
+    """The rows of one archive file, decoded lazily.
+
+    Args:
+        path: Path to a ``.json`` file holding an array, or an ``.ndjson`` file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.ndjson = path.endswith(".ndjson")
+        self._count: int | None = None
+
+    @classmethod
+    def open(cls, data_dir: str, filename: str) -> JsonRows | None:
+        """The rows stored under ``filename``, or None if the archive lacks it.
+
+        Args:
+            data_dir: The archive's data directory.
+            filename: The ``.json`` name, relative to ``data_dir``; an
+                ``.ndjson`` sibling is preferred when present.
+        """
+        path = os.path.join(data_dir, filename)
+        ndjson_path = os.path.splitext(path)[0] + ".ndjson"
+        if os.path.exists(ndjson_path):
+            return cls(ndjson_path)
+        if os.path.exists(path):
+            return cls(path)
+        return None
+
+    def __iter__(self) -> Iterator[Any]:
+        with open(self.path, encoding="utf-8") as fh:
+            if self.ndjson:
+                for line in fh:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                yield from iter_json_array(fh)
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = sum(1 for _row in self)
+        return self._count
+
+    def __bool__(self) -> bool:
+        # Only the first row is decoded; an empty file is as falsy as [] was.
+        return next(iter(self), None) is not None if self._count is None else self._count > 0
+
+
+def iter_json_array(fh: Any, read_size: int = READ_SIZE) -> Iterator[Any]:
+    """Yield the elements of the JSON array in a text file one at a time.
+
+    Args:
+        fh: A text-mode file positioned at the start of the document.
+        read_size: Characters read per buffer refill.
+
+    Raises:
+        ValueError: The document isn't a JSON array (``json.JSONDecodeError``
+            is a ValueError).
+    """
+    decoder = json.JSONDecoder()
+    buffer = fh.read(read_size)
+    eof = not buffer
+    pos = _skip_whitespace(buffer, 0)
+    if pos >= len(buffer) or buffer[pos] != "[":
+        msg = "Expected a JSON array"
+        raise json.JSONDecodeError(msg, buffer, pos)
+    pos += 1
+    expect_value, after_comma = True, False
+
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos >= len(buffer):
+            if eof:
+                msg = "Unterminated JSON array"
+                raise json.JSONDecodeError(msg, buffer, pos)
+            buffer, pos, eof = _refill(fh, buffer, pos, read_size)
+            continue
+
+        char = buffer[pos]
+        if char == "]" and not (expect_value and after_comma):
+            return
+        if not expect_value:
+            if char != ",":
+                msg = "Expected ',' or ']'"
+                raise json.JSONDecodeError(msg, buffer, pos)
+            pos += 1
+            expect_value = after_comma = True
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            buffer, pos, eof = _refill(fh, buffer, pos, read_size)
+            continue
+        after = _skip_whitespace(buffer, end)
+        if not eof and (after >= len(buffer) or buffer[after] not in ",]"):
+            # A scalar cut off by the buffer boundary ("12" of "123", "1" of
+            # "1.5") still decodes, so only trust a value once its separator
+            # has been read too.
+            buffer, pos, eof = _refill(fh, buffer, pos, read_size)
+            continue
+        yield value
+        pos = end
+        expect_value = False
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _refill(fh: Any, buffer: str, pos: int, read_size: int) -> tuple[str, int, bool]:
+    """Drop the consumed part of ``buffer`` and append the next read."""
+    chunk = fh.read(read_size)
+    return buffer[pos:] + chunk, 0, not chunk
@@ -320,6 +320,7 @@ def generate_location_boundaries(location: Location, *, name: str | None = None)
         The ResolvedBoundaries from the provider chain.
     """
     from urbanlens.dashboard.models.boundary.model import Boundary, BoundaryType
+    from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
 
     latitude = float(location.latitude)
     longitude = float(location.longitude)
@@ -332,6 +333,8 @@ def generate_location_boundaries(location: Location, *, name: str | None = None)
         if polygon is not None:
             updates["generated_polygon"] = polygon
         Boundary.objects.filter(pk=row.pk).update(**updates)
+    # update() skips post_save, so re-resolve the location's pins here.
+    PinFootprint.objects.refresh_location_on_commit(location.pk)
 
     # Persist one candidate row per property-capable provider that answered,
     # so users can vote on which official boundary is most accurate. Unlike
@@ -304,19 +304,11 @@ def _candidate_pins(sender: Profile, bounds: MapBounds):
 def _boundaries_for_pins(pins: list[Pin], boundary_type: str) -> dict[int, GEOSGeometry]:
     """Batch-resolve each pin's effective boundary polygon, keyed by pin id.
 
-    A batched counterpart to ``Boundary.objects.effective_polygon_for_pin``
-    for callers that need it for many pins at once - calling that per pin
-    (as ``detect_shared_pins`` used to) is an N+1: each call issues its own
-    "own row" / "wiki row" / "location-default row" queries. This instead
-    fetches each of those in one bulk query for the whole batch and resolves
-    every pin's polygon from the resulting dicts.
-
-    This mirrors ``BoundaryManager.resolve_for_pin``'s property-boundary
-    order (own row -> wiki row -> location-default row -> circle fallback)
-    but *without* the parent-pin inheritance branch, which is safe here only
-    because every candidate pin is guaranteed to be a root pin
-    (``_candidate_pins`` filters ``parent_pin__isnull=True``) - a detail pin
-    would need that branch and should not use this helper.
+    Calling ``Boundary.objects.effective_polygon_for_pin`` per pin (as
+    ``detect_shared_pins`` used to) is an N+1: each call issues its own
+    "own row" / "wiki row" / "location-default row" queries.
+    ``BoundaryManager.effective_polygons_by_pin_id`` fetches each of those in
+    one bulk query for the whole batch instead.
 
     Args:
         pins: Candidate pins to resolve (already ``select_related`` for
@@ -329,55 +321,8 @@ def _boundaries_for_pins(pins: list[Pin], boundary_type: str) -> dict[int, GEOSG
         applicable boundary (including no fallback circle) are omitted.
     """
     from urbanlens.dashboard.models.boundary.model import Boundary
-    from urbanlens.dashboard.models.boundary.queryset import circle_for_coordinates
-    from urbanlens.dashboard.models.wiki.model import Wiki
 
-    if not pins:
-        return {}
-
-    own_by_pin_id = Boundary.objects.rows_by_pin_id((pin.pk for pin in pins), boundary_type)
-
-    wiki_by_pin_id: dict[int, Wiki] = {}
-    for pin in pins:
-        if pin.pk in own_by_pin_id and (own_by_pin_id[pin.pk].polygon or own_by_pin_id[pin.pk].generated_polygon):
-            continue
-        wiki = pin.wiki if pin.wiki_id else (Wiki.objects.get_for_location(pin.location) if pin.location_id else None)
-        if wiki is not None:
-            wiki_by_pin_id[pin.pk] = wiki
-
-    wiki_boundary_by_wiki_id = Boundary.objects.rows_by_wiki_id((wiki.pk for wiki in wiki_by_pin_id.values()), boundary_type)
-    location_boundary_by_location_id = Boundary.objects.rows_by_location_id(
-        (pin.location_id for pin in pins if pin.location_id),
-        boundary_type,
-    )
-
-    result: dict[int, GEOSGeometry] = {}
-    for pin in pins:
-        own_row = own_by_pin_id.get(pin.pk)
-        if own_row is not None:
-            if own_row.polygon:
-                result[pin.pk] = own_row.polygon
-                continue
-            if own_row.generated_polygon:
-                result[pin.pk] = own_row.generated_polygon
-                continue
-
-        wiki = wiki_by_pin_id.get(pin.pk)
-        wiki_row = wiki_boundary_by_wiki_id.get(wiki.pk) if wiki is not None else None
-        if wiki_row is not None and wiki_row.drawn_or_generated_polygon:
-            result[pin.pk] = wiki_row.drawn_or_generated_polygon
-            continue
-
-        if pin.location_id:
-            location_row = location_boundary_by_location_id.get(pin.location_id)
-            if location_row is not None and location_row.generated_polygon:
-                result[pin.pk] = location_row.generated_polygon
-                continue
-            if boundary_type == _DETECTION_BOUNDARY_TYPE:
-                circle = circle_for_coordinates(pin.location.latitude, pin.location.longitude)
-                if circle is not None:
-                    result[pin.pk] = circle
-    return result
+    return Boundary.objects.effective_polygons_by_pin_id(pins, boundary_type)
 
 
 def detect_shared_pins(markup_map: MarkupMap, sender: Profile) -> list[Pin]:
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import contextlib
 from dataclasses import dataclass
+import hashlib
 import json
 import logging
+import math
 import os
 import time
 from typing import TYPE_CHECKING, Any, Protocol, Self
@@ -14,23 +16,62 @@ import redis
 from redis.exceptions import RedisError
 
 from urbanlens.dashboard.models.pin import Pin
+from urbanlens.dashboard.services.map_pins.clusters import (
+    APPLY_MEMBER_SCRIPT,
+    WEB_MERCATOR_MAX_LATITUDE,
+    MapPinClusterGrid,
+    cell_fields_for_bbox,
+    cluster_payload,
+    member_record,
+)
 from urbanlens.dashboard.services.map_pins.payload import MapPinPage, MapPinPayloadService
+from urbanlens.dashboard.services.map_pins.tiles import tile_contains
+from urbanlens.UrbanLens.settings.app import settings
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.db.models import QuerySet
 
     from urbanlens.dashboard.models.profile.model import Profile
 
 logger = logging.getLogger(__name__)
 
+#: Valkey's GEO index only accepts Web Mercator latitudes - the same limit the
+#: map itself renders to - so pins poleward of it are indexed at the limit.
+_GEO_MAX_LATITUDE = WEB_MERCATOR_MAX_LATITUDE
+
+#: Earth radius Valkey uses for GEOSEARCH distances, in kilometres.
+_GEO_EARTH_RADIUS_KM = 6372.7975608
+
+#: Widest longitude span one GEOSEARCH box may cover. Valkey measures the box
+#: as great-circle distances from its centre, which stop growing past 180
+#: degrees, so wider viewports are split into several boxes.
+_GEO_MAX_BOX_SPAN = 90.0
+
+#: Slack added to each search box so Valkey's spherical box always covers the
+#: requested bbox; the exact bbox test runs on the returned coordinates.
+_GEO_BOX_PADDING = 1.02
+
+#: Degrees added around a tile before searching the GEO index. Valkey stores
+#: coordinates as 52-bit geohashes, a few millionths of a degree off, so a pin
+#: on a tile edge may come back on either side of it; the half-open tile test
+#: then runs on the exact coordinates in the pin payload instead.
+_GEO_COORDINATE_SLACK = 1e-4
+
 
 class _SyncPipeline(Protocol):
     """Protocol for the subset of Pipeline methods used by MapPinCache."""
 
     def hset(self, name: str, key: str | None = ..., value: str | None = ..., mapping: dict[str, Any] | None = ...) -> int: ...
     def hdel(self, name: str, *keys: str) -> int: ...
+    def hincrby(self, name: str, key: str, amount: int = ...) -> int: ...
     def zadd(self, name: str, mapping: dict[str, Any]) -> int: ...
     def zrem(self, name: str, *values: str) -> int: ...
+    def geoadd(self, name: str, values: tuple[float, float, str]) -> int: ...
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> Any: ...
+    def geosearch(self, name: str, *, longitude: float, latitude: float, width: float, height: float, unit: str, withcoord: bool) -> list[Any]: ...
+    def zrangebylex(self, name: str, min: str, max: str) -> list[str]: ...  # noqa: A002
     def delete(self, *names: str) -> int: ...
     def expire(self, name: str, time: int) -> bool: ...
     def execute(self) -> list[Any]: ...
@@ -51,40 +92,74 @@ class _SyncRedis(Protocol):
     def exists(self, *names: str) -> int: ...
     def zrangebyscore(self, name: str, min_score: str | int, max_score: str | int, start: int = ..., num: int = ...) -> list[str]: ...
     def hmget(self, name: str, keys: list[str]) -> list[str | None]: ...
+    def hget(self, name: str, key: str) -> str | None: ...
     def zcard(self, name: str) -> int: ...
+    def geosearch(self, name: str, *, longitude: float, latitude: float, width: float, height: float, unit: str, withcoord: bool) -> list[Any]: ...
     def set(self, name: str, value: str, *, nx: bool = ..., ex: int = ...) -> bool | None: ...
     def pipeline(self, transaction: bool = ...) -> _SyncPipeline: ...
     def hset(self, name: str, key: str | None = ..., value: str | None = ..., mapping: dict[str, Any] | None = ...) -> int: ...
     def zadd(self, name: str, mapping: dict[str, Any]) -> int: ...
     def rename(self, src: str, dst: str) -> bool: ...
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> Any: ...
     def delete(self, *names: str) -> int: ...
     def hdel(self, name: str, *keys: str) -> int: ...
     def zrem(self, name: str, *values: str) -> int: ...
     def expire(self, name: str, time: int) -> bool: ...
 
 
+class _SyncBinaryRedis(Protocol):
+    """Protocol for the undecoded client that stores pre-compressed pages."""
+
+    def get(self, name: str) -> bytes | None: ...
+    def set(self, name: str, value: bytes, *, ex: int = ...) -> bool | None: ...
+
+
 @dataclass(frozen=True)
 class CachedMapPinPage:
     page: MapPinPage
     hit: bool
 
 
+@dataclass(frozen=True)
+class CachedMapPinClusters:
+    clusters: list[dict[str, Any]]
+    hit: bool
+
+
 class MapPinCache:
     """Per-profile map pin cache stored in Valkey/Redis.
 
     Only profiles that open the authenticated map are cached.  Pins are stored in
     a hash keyed by pin PK and ordered by a sorted set scored by that same PK,
     which allows fast keyset pages and targeted updates when one pin changes.
+    A GEO set of the same PKs indexes each pin's coordinates so viewport
+    (bbox) pages are answered from the cache too, with the same pk cursor.
+    Entries are stored exactly as the web map receives them (including
+    ``viewLocationUrl``), so pages can be served without decoding them, and
+    whole gzip-compressed response bodies can be kept per page.
+
+    Below ``settings.map_cluster_max_zoom`` the map asks for grid clusters
+    instead of pins (see ``services.map_pins.clusters``); their aggregates
+    live in a hash next to the pins and are updated pin by pin.
+
+    Each entry bakes in the icon, colour and name of the labels its pin
+    carries, so the cache also indexes pins by label: a sorted set of
+    ``"{label_pk}:{pin_pk}"`` members (all scored 0, read by lexicographic
+    range) answers "which cached pins carry this label", and a hash of pin PK
+    to label PKs lets each re-render drop the pin's stale index entries. A
+    label edit then re-renders just those pins (``refresh_labels``).
     """
 
-    VERSION = "v2"
+    VERSION = "v5"
     TTL_SECONDS = 2 * 60 * 60
     LOCK_SECONDS = 30
+    COMPRESSED_PAGE_TTL_SECONDS = 10 * 60
 
-    def __init__(self, profile: Profile, client: _SyncRedis | None = None):
+    def __init__(self, profile: Profile, client: _SyncRedis | None = None, binary_client: _SyncBinaryRedis | None = None):
         self.profile = profile
         self.profile_id = profile.pk
         self.client: _SyncRedis | None = client if client is not None else self._make_client()
+        self._binary_client = binary_client
         self.payload = MapPinPayloadService(profile)
 
     @classmethod
@@ -101,6 +176,15 @@ class MapPinCache:
         # at runtime.  This is the single boundary where we assert that fact.
         return redis.Redis.from_url(url, decode_responses=True, socket_connect_timeout=1, socket_timeout=2)  # type: ignore[return-value]
 
+    @property
+    def binary_client(self) -> _SyncBinaryRedis | None:
+        """Undecoded client for compressed pages, connected on first use."""
+        if self._binary_client is None and self.client is not None:
+            url = os.getenv("UL_VALKEY_URL") or os.getenv("UL_REDIS_URL")
+            if url:
+                self._binary_client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=2)  # type: ignore[assignment]
+        return self._binary_client
+
     @property
     def _prefix(self) -> str:
         return f"ul:map-pins:{self.VERSION}:profile:{self.profile_id}"
@@ -117,6 +201,44 @@ class MapPinCache:
     def order_key(self) -> str:
         return f"{self._prefix}:order"
 
+    @property
+    def geo_key(self) -> str:
+        return f"{self._prefix}:geo"
+
+    @property
+    def clusters_key(self) -> str:
+        return f"{self._prefix}:clusters"
+
+    @property
+    def cluster_members_key(self) -> str:
+        return f"{self._prefix}:cluster-members"
+
+    @property
+    def label_pins_key(self) -> str:
+        return f"{self._prefix}:label-pins"
+
+    @property
+    def pin_labels_key(self) -> str:
+        return f"{self._prefix}:pin-labels"
+
+    @property
+    def cluster_zooms(self) -> range:
+        """The zoom levels cluster aggregates are kept for."""
+        return range(max(settings.map_cluster_max_zoom, 0))
+
+    @property
+    def _data_keys(self) -> tuple[str, ...]:
+        return (
+            self.meta_key,
+            self.pins_key,
+            self.order_key,
+            self.geo_key,
+            self.clusters_key,
+            self.cluster_members_key,
+            self.label_pins_key,
+            self.pin_labels_key,
+        )
+
     @property
     def lock_key(self) -> str:
         return f"{self._prefix}:lock"
@@ -125,12 +247,38 @@ class MapPinCache:
     def rebuild_queued_key(self) -> str:
         return f"{self._prefix}:rebuild-queued"
 
-    def get_or_build_page(self, query: QuerySet[Pin], *, cursor: int | None, limit: int | None, include_total: bool) -> CachedMapPinPage:
+    def get_or_build_page(
+        self,
+        query: QuerySet[Pin],
+        *,
+        cursor: int | None,
+        limit: int | None,
+        include_total: bool,
+        bbox: tuple[float, float, float, float] | None = None,
+        raw: bool = False,
+    ) -> CachedMapPinPage:
+        """Serve one page of map pins, from the cache when it is warm.
+
+        Args:
+            query: The pins to serve on a cache miss, already narrowed to
+                ``bbox`` when one is given.
+            cursor: Return only pins with a PK above this one.
+            limit: Page size, clamped to the payload service's bounds.
+            include_total: Whether to count every matching pin.
+            bbox: Optional ``(south, west, north, east)`` viewport that cache
+                hits are filtered to, matching ``PinQuerySet.within_bounds``.
+            raw: Return cache hits as ``MapPinPage.raw_pins`` JSON fragments
+                instead of decoded ``pins``.
+
+        Returns:
+            The page, and whether it came from the cache. Misses always carry
+            decoded ``pins``, without ``viewLocationUrl``.
+        """
         if not self.client:
             return CachedMapPinPage(self.payload.page(query, cursor=cursor, limit=limit, include_total=include_total), hit=False)
         try:
             if self.client.exists(self.meta_key):
-                page = self.get_page(cursor=cursor, limit=limit, include_total=include_total)
+                page = self.get_page(cursor=cursor, limit=limit, include_total=include_total, bbox=bbox, raw=raw)
                 if page is not None:
                     return CachedMapPinPage(page, hit=True)
             self.enqueue_rebuild()
@@ -138,6 +286,100 @@ class MapPinCache:
             logger.warning("Map pin cache unavailable for profile %s", self.profile_id, exc_info=True)
         return CachedMapPinPage(self.payload.page(query, cursor=cursor, limit=limit, include_total=include_total), hit=False)
 
+    def get_or_build_within_bounds(self, query: QuerySet[Pin], *, bbox: tuple[float, float, float, float]) -> CachedMapPinPage:
+        """Serve every pin inside a box in one unpaged page, from the cache when it is warm.
+
+        Used for map tiles, whose area - not a page size - bounds the payload.
+        The box is half-open, as ``tiles.tile_contains`` describes, so a pin on
+        an edge shared by two tiles is served by only one of them.
+
+        Args:
+            query: The pins to serve on a cache miss, already narrowed to
+                ``bbox`` with ``PinQuerySet.within_tile``.
+            bbox: ``(south, west, north, east)`` tile box.
+
+        Returns:
+            The pins in pk order, and whether they came from the cache.
+        """
+        if self.client:
+            try:
+                if self.client.exists(self.meta_key):
+                    south, west, north, east = bbox
+                    candidates = self._geo_search(south - _GEO_COORDINATE_SLACK, west - _GEO_COORDINATE_SLACK, north + _GEO_COORDINATE_SLACK, east + _GEO_COORDINATE_SLACK)
+                    ids = [str(pin_id) for pin_id in sorted({int(member) for member, _ in candidates})]
+                    raw = self.client.hmget(self.pins_key, ids) if ids else []
+                    self._touch()
+                    pins = [pin for pin in (json.loads(item) for item in raw if item) if tile_contains(bbox, pin["latitude"], pin["longitude"])]
+                    return CachedMapPinPage(MapPinPage(pins=pins, next_cursor=None, total=len(pins)), hit=True)
+                self.enqueue_rebuild()
+            except RedisError:
+                logger.warning("Map pin cache unavailable for profile %s", self.profile_id, exc_info=True)
+        pins = self.payload.all(query)
+        return CachedMapPinPage(MapPinPage(pins=pins, next_cursor=None, total=len(pins)), hit=False)
+
+    def cached_fingerprint(self) -> str | None:
+        """Token that changes whenever the warm cache changes; None when it is cold.
+
+        Built from the cache's build time and its mutation counter, which
+        every ``upsert_pin``/``delete_pin`` bumps - including changes (ratings,
+        label icons) that never touch ``Pin.updated``.
+        """
+        if not self.client:
+            return None
+        try:
+            built_at, version = self.client.hmget(self.meta_key, ["built_at", "version"])
+        except RedisError:
+            logger.warning("Map pin cache unavailable for profile %s", self.profile_id, exc_info=True)
+            return None
+        return f"cache:{built_at}:{version or 0}" if built_at is not None else None
+
+    def get_or_build_clusters(self, query: QuerySet[Pin], *, zoom: int, bbox: tuple[float, float, float, float]) -> CachedMapPinClusters:
+        """Serve the grid clusters covering a viewport, from the cache when it is warm.
+
+        Args:
+            query: The pins to cluster on a cache miss, already narrowed to ``bbox``.
+            zoom: Map zoom level; must be one of ``cluster_zooms``.
+            bbox: ``(south, west, north, east)`` viewport.
+
+        Returns:
+            The clusters, and whether they came from the cache.
+        """
+        # A viewport too large to read cell by cell is clustered from the
+        # database, warm cache or not, so both paths give the same answer.
+        if self.client and cell_fields_for_bbox(*bbox, zoom) is not None:
+            try:
+                if self.client.exists(self.meta_key):
+                    clusters = self.get_clusters(zoom=zoom, bbox=bbox)
+                    if clusters is not None:
+                        return CachedMapPinClusters(clusters, hit=True)
+                self.enqueue_rebuild()
+            except RedisError:
+                logger.warning("Map pin cache unavailable for profile %s", self.profile_id, exc_info=True)
+        grid = MapPinClusterGrid()
+        for pin in self.payload.all(query):
+            grid.add(member_record(pin, (zoom,)))
+        return CachedMapPinClusters(grid.clusters(), hit=False)
+
+    def get_clusters(self, *, zoom: int, bbox: tuple[float, float, float, float]) -> list[dict[str, Any]] | None:
+        """Read the cached cluster cells a viewport touches.
+
+        Returns:
+            One ``cluster_payload`` per non-empty cell, or None when the cache
+            is cold, was built for different cluster zoom levels, or the
+            viewport spans more than ``MAX_CLUSTER_CELLS`` cells.
+        """
+        if not self.client:
+            return None
+        fields = cell_fields_for_bbox(*bbox, zoom)
+        if fields is None:
+            return None
+        cached_max_zoom = self.client.hget(self.meta_key, "cluster_max_zoom")
+        if cached_max_zoom is None or int(cached_max_zoom) != len(self.cluster_zooms):
+            return None
+        raw = self.client.hmget(self.clusters_key, fields) if fields else []
+        self._touch()
+        return [cluster_payload(json.loads(item)) for item in raw if item]
+
     def enqueue_rebuild(self) -> None:
         """Queue a full cache rebuild once when the cached page is missing."""
         from urbanlens.dashboard.services.celery import safely_enqueue_task
@@ -157,20 +399,109 @@ class MapPinCache:
             with contextlib.suppress(RedisError):
                 self.client.delete(self.rebuild_queued_key)
 
-    def get_page(self, *, cursor: int | None, limit: int | None, include_total: bool) -> MapPinPage | None:
+    def get_page(
+        self,
+        *,
+        cursor: int | None,
+        limit: int | None,
+        include_total: bool,
+        bbox: tuple[float, float, float, float] | None = None,
+        raw: bool = False,
+    ) -> MapPinPage | None:
         if not self.client or not self.client.exists(self.meta_key):
             return None
         limit = min(max(int(limit or self.payload.DEFAULT_LIMIT), 1), self.payload.MAX_LIMIT)
-        min_score: str | int = f"({cursor}" if cursor else "-inf"
-        ids = self.client.zrangebyscore(self.order_key, min_score, "+inf", start=0, num=limit + 1)
+        if bbox is None:
+            min_score: str | int = f"({cursor}" if cursor else "-inf"
+            ids = self.client.zrangebyscore(self.order_key, min_score, "+inf", start=0, num=limit + 1)
+            total = self.client.zcard(self.order_key) if include_total else None
+        else:
+            matching = self.ids_within_bounds(*bbox)
+            ids = [str(pin_id) for pin_id in matching if not cursor or pin_id > cursor][: limit + 1]
+            total = len(matching) if include_total else None
         has_more = len(ids) > limit
         ids = ids[:limit]
-        raw = self.client.hmget(self.pins_key, ids) if ids else []
-        pins = [json.loads(item) for item in raw if item]
+        fragments = [item for item in self.client.hmget(self.pins_key, ids) if item] if ids else []
         next_cursor = int(ids[-1]) if has_more and ids else None
-        total = self.client.zcard(self.order_key) if include_total else None
         self._touch()
-        return MapPinPage(pins=pins, next_cursor=next_cursor, total=total)
+        if raw:
+            return MapPinPage(pins=[], next_cursor=next_cursor, total=total, raw_pins=fragments)
+        return MapPinPage(pins=[json.loads(item) for item in fragments], next_cursor=next_cursor, total=total)
+
+    def _compressed_page_key(self, fingerprint: str, page_token: str) -> str:
+        digest = hashlib.sha256(f"{fingerprint}|{page_token}".encode()).hexdigest()[:32]
+        return f"{self._prefix}:gz:{digest}"
+
+    def get_compressed_page(self, fingerprint: str | None, page_token: str) -> bytes | None:
+        """A gzip-compressed response body stored by :meth:`store_compressed_page`.
+
+        Args:
+            fingerprint: ``cached_fingerprint()``, read before the page was built.
+            page_token: Everything else that shapes the response (cursor,
+                limit, bbox...), as one string.
+
+        Returns:
+            The stored body, or None when absent or the cache is cold.
+        """
+        if not fingerprint or not self.binary_client:
+            return None
+        try:
+            return self.binary_client.get(self._compressed_page_key(fingerprint, page_token))
+        except RedisError:
+            logger.warning("Map pin cache unavailable for profile %s", self.profile_id, exc_info=True)
+            return None
+
+    def store_compressed_page(self, fingerprint: str | None, page_token: str, body: bytes) -> None:
+        """Keep a gzip-compressed response body for repeat requests.
+
+        Keyed on the fingerprint, so any pin change makes stored pages
+        unreachable; they then lapse after ``COMPRESSED_PAGE_TTL_SECONDS``.
+        Only pages built while the cache was warm are stored.
+        """
+        if not fingerprint or not self.binary_client:
+            return
+        try:
+            self.binary_client.set(self._compressed_page_key(fingerprint, page_token), body, ex=self.COMPRESSED_PAGE_TTL_SECONDS)
+        except RedisError:
+            logger.warning("Unable to store compressed map pin page for profile %s", self.profile_id, exc_info=True)
+
+    def ids_within_bounds(self, south: float, west: float, north: float, east: float) -> list[int]:
+        """PKs of the cached pins strictly inside a lat/lng box, ascending.
+
+        Candidates come from ``GEOSEARCH`` boxes that cover the bbox (see
+        ``_geo_search_boxes``); the exact bbox test then runs on the returned
+        coordinates, mirroring ``PinQuerySet.within_bounds``.
+
+        Args:
+            south: Southern (minimum) latitude.
+            west: Western (minimum) longitude.
+            north: Northern (maximum) latitude.
+            east: Eastern (maximum) longitude.
+
+        Returns:
+            Matching pin PKs in cursor order.
+        """
+        if not self.client:
+            return []
+        south, north = sorted((south, north))
+        west, east = sorted((west, east))
+        candidates = self._geo_search(south, west, north, east)
+        south, north = max(south, -_GEO_MAX_LATITUDE), min(north, _GEO_MAX_LATITUDE)
+        return sorted({int(member) for member, (longitude, latitude) in candidates if west < longitude < east and south < latitude < north})
+
+    def _geo_search(self, south: float, west: float, north: float, east: float) -> list[tuple[Any, tuple[float, float]]]:
+        """``(member, (longitude, latitude))`` for every GEO index entry the bbox's search boxes cover.
+
+        A superset of the pins inside the bbox; callers apply the exact test.
+        """
+        boxes = _geo_search_boxes(south, west, north, east)
+        if not boxes:
+            return []
+        with self.client.pipeline(transaction=False) as pipe:
+            for longitude, latitude, width, height in boxes:
+                pipe.geosearch(self.geo_key, longitude=longitude, latitude=latitude, width=width, height=height, unit="km", withcoord=True)
+            results = pipe.execute()
+        return [entry for result in results for entry in result]
 
     def rebuild(self, query: QuerySet[Pin]) -> None:
         if not self.client:
@@ -181,85 +512,251 @@ class MapPinCache:
             return
         tmp_pins = f"{self.pins_key}:tmp:{lock_token}"
         tmp_order = f"{self.order_key}:tmp:{lock_token}"
+        tmp_geo = f"{self.geo_key}:tmp:{lock_token}"
+        tmp_clusters = f"{self.clusters_key}:tmp:{lock_token}"
+        tmp_members = f"{self.cluster_members_key}:tmp:{lock_token}"
+        tmp_label_pins = f"{self.label_pins_key}:tmp:{lock_token}"
+        tmp_pin_labels = f"{self.pin_labels_key}:tmp:{lock_token}"
         try:
             pipe = self.client.pipeline(transaction=False)
+            grid = MapPinClusterGrid()
             count = 0
-            for pin in self.payload.all(query):
+            labelled = 0
+            for pin, label_ids in self.payload.all_with_label_ids(query):
                 pin_id = int(pin["id"])
-                pipe.hset(tmp_pins, str(pin_id), json.dumps(pin, separators=(",", ":")))
+                member = member_record(pin, self.cluster_zooms)
+                grid.add(member)
+                pipe.hset(tmp_pins, str(pin_id), self._encode_entry(pin))
                 pipe.zadd(tmp_order, {str(pin_id): pin_id})
+                pipe.geoadd(tmp_geo, _geo_member(pin))
+                pipe.hset(tmp_members, str(pin_id), json.dumps(member, separators=(",", ":")))
+                if label_ids:
+                    pipe.zadd(tmp_label_pins, {_label_member(label_id, pin_id): 0 for label_id in label_ids})
+                    pipe.hset(tmp_pin_labels, str(pin_id), _join_label_ids(label_ids))
+                    labelled += 1
                 count += 1
                 if count % 500 == 0:
                     pipe.execute()
+            for index, (field, cell) in enumerate(grid.encoded().items(), start=1):
+                pipe.hset(tmp_clusters, field, cell)
+                if index % 500 == 0:
+                    pipe.execute()
             pipe.execute()
             if count:
                 self.client.rename(tmp_pins, self.pins_key)
                 self.client.rename(tmp_order, self.order_key)
+                self.client.rename(tmp_geo, self.geo_key)
+                self.client.rename(tmp_members, self.cluster_members_key)
             else:
-                self.client.delete(self.pins_key, self.order_key)
+                self.client.delete(self.pins_key, self.order_key, self.geo_key, self.cluster_members_key)
                 self.client.hset(tmp_pins, "__empty__", "1")
                 self.client.zadd(tmp_order, {"__empty__": 0})
                 self.client.delete(tmp_pins, tmp_order)
-            self.client.hset(self.meta_key, mapping={"cached_at": int(time.time()), "total": count})
+            if grid.cells:
+                self.client.rename(tmp_clusters, self.clusters_key)
+            else:
+                self.client.delete(self.clusters_key)
+            if labelled:
+                self.client.rename(tmp_label_pins, self.label_pins_key)
+                self.client.rename(tmp_pin_labels, self.pin_labels_key)
+            else:
+                self.client.delete(self.label_pins_key, self.pin_labels_key)
+            self.client.hset(
+                self.meta_key,
+                mapping={"cached_at": int(time.time()), "built_at": lock_token, "version": 0, "total": count, "cluster_max_zoom": len(self.cluster_zooms)},
+            )
             self._touch()
         finally:
             with self.client.pipeline(transaction=False) as pipe:
                 pipe.delete(tmp_pins)
                 pipe.delete(tmp_order)
+                pipe.delete(tmp_geo)
+                pipe.delete(tmp_clusters)
+                pipe.delete(tmp_members)
+                pipe.delete(tmp_label_pins)
+                pipe.delete(tmp_pin_labels)
                 pipe.delete(self.lock_key)
                 pipe.delete(self.rebuild_queued_key)
                 pipe.execute()
 
     def upsert_pin(self, pin: Pin) -> None:
-        if not self.client or not pin.profile_id or pin.profile_id != self.profile_id or not self.client.exists(self.meta_key):
+        if not pin.profile_id or pin.profile_id != self.profile_id:
             return
-        if pin.parent_pin_id:
-            self.delete_pin(pin.pk)
+        self.refresh_pins([pin.pk])
+
+    def refresh_pins(self, pin_ids: Iterable[int]) -> None:
+        """Re-render a batch of cached pins from the database.
+
+        The pins are serialized in one ``prepare_queryset`` pass and written
+        through a single pipeline, flushed every 500 pins; the mutation counter
+        is bumped once for the whole batch. Pins that were deleted, moved to
+        another profile or became detail pins are dropped from the cache.
+
+        Args:
+            pin_ids: PKs of the pins to re-render. A cold cache ignores them.
+        """
+        if not self.client or not self.client.exists(self.meta_key):
             return
-        query = Pin.objects.filter(pk=pin.pk).select_related("location__wiki")
-        pins = self.payload.all(query)
-        if not pins:
-            self.delete_pin(pin.pk)
+        remaining = {str(pin_id) for pin_id in pin_ids}
+        if not remaining:
             return
-        payload = json.dumps(pins[0], separators=(",", ":"))
-        pin_id_str = str(pin.pk)
+        ids = sorted(remaining, key=int)
+        indexed_labels = dict(zip(ids, self.client.hmget(self.pin_labels_key, ids), strict=True))
+        query = Pin.objects.filter(pk__in=ids, profile_id=self.profile_id).root_pins().select_related("location__wiki")
         with self.client.pipeline(transaction=False) as pipe:
-            pipe.hset(self.pins_key, pin_id_str, payload)
-            pipe.zadd(self.order_key, {pin_id_str: int(pin.pk)})
+            for count, (pin, label_ids) in enumerate(self.payload.all_with_label_ids(query), start=1):
+                pin_id = str(pin["id"])
+                remaining.discard(pin_id)
+                member = json.dumps(member_record(pin, self.cluster_zooms), separators=(",", ":"))
+                pipe.hset(self.pins_key, pin_id, self._encode_entry(pin))
+                pipe.zadd(self.order_key, {pin_id: int(pin_id)})
+                pipe.geoadd(self.geo_key, _geo_member(pin))
+                pipe.eval(APPLY_MEMBER_SCRIPT, 2, self.clusters_key, self.cluster_members_key, pin_id, member)
+                self._queue_label_index(pipe, pin_id, indexed_labels.get(pin_id), label_ids)
+                if count % 500 == 0:
+                    pipe.execute()
+            for pin_id in remaining:
+                self._queue_removal(pipe, pin_id, indexed_labels.get(pin_id))
             pipe.execute()
-        total = self.client.zcard(self.order_key)
+        self._record_mutation()
+
+    def refresh_labels(self, label_ids: Iterable[int]) -> None:
+        """Re-render every cached pin carrying any of these labels.
+
+        The pins come from the cache's own label index rather than the
+        database, so this also reaches pins whose label was just deleted or
+        merged away.
+
+        Args:
+            label_ids: PKs of the edited labels.
+        """
+        self.refresh_pins(self.pin_ids_for_labels(label_ids))
+
+    def pin_ids_for_labels(self, label_ids: Iterable[int]) -> set[int]:
+        """PKs of the cached pins carrying any of these labels."""
+        label_ids = list(label_ids)
+        if not self.client or not label_ids:
+            return set()
         with self.client.pipeline(transaction=False) as pipe:
-            pipe.hset(self.meta_key, mapping={"cached_at": int(time.time()), "total": total})
-            pipe.expire(self.meta_key, self.TTL_SECONDS)
-            pipe.expire(self.pins_key, self.TTL_SECONDS)
-            pipe.expire(self.order_key, self.TTL_SECONDS)
-            pipe.execute()
+            for label_id in label_ids:
+                # Every member for one label sorts between "<label>:" and
+                # "<label>;", the character after the colon.
+                pipe.zrangebylex(self.label_pins_key, f"[{label_id}:", f"({label_id};")
+            results = pipe.execute()
+        return {int(member.partition(":")[2]) for result in results for member in result}
 
     def delete_pin(self, pin_id: int) -> None:
         if not self.client or not self.client.exists(self.meta_key):
             return
         pin_id_str = str(pin_id)
+        indexed_labels = self.client.hget(self.pin_labels_key, pin_id_str)
         with self.client.pipeline(transaction=False) as pipe:
-            pipe.hdel(self.pins_key, pin_id_str)
-            pipe.zrem(self.order_key, pin_id_str)
+            self._queue_removal(pipe, pin_id_str, indexed_labels)
             pipe.execute()
+        self._record_mutation()
+
+    def _queue_removal(self, pipe: _SyncPipeline, pin_id: str, indexed_labels: str | None) -> None:
+        pipe.hdel(self.pins_key, pin_id)
+        pipe.zrem(self.order_key, pin_id)
+        pipe.zrem(self.geo_key, pin_id)
+        pipe.eval(APPLY_MEMBER_SCRIPT, 2, self.clusters_key, self.cluster_members_key, pin_id, "")
+        self._queue_label_index(pipe, pin_id, indexed_labels, [])
+
+    def _queue_label_index(self, pipe: _SyncPipeline, pin_id: str, indexed_labels: str | None, label_ids: list[int]) -> None:
+        """Queue the label index writes moving a pin from its indexed labels to ``label_ids``."""
+        old = set(indexed_labels.split(",")) if indexed_labels else set()
+        new = {str(label_id) for label_id in label_ids}
+        if old == new:
+            return
+        if stale := old - new:
+            pipe.zrem(self.label_pins_key, *(_label_member(label_id, pin_id) for label_id in stale))
+        if added := new - old:
+            pipe.zadd(self.label_pins_key, {_label_member(label_id, pin_id): 0 for label_id in added})
+        if new:
+            pipe.hset(self.pin_labels_key, pin_id, _join_label_ids(new))
+        else:
+            pipe.hdel(self.pin_labels_key, pin_id)
+
+    def _record_mutation(self) -> None:
+        """Bump the mutation counter and refresh totals and TTLs after an update."""
+        if not self.client:
+            return
         total = self.client.zcard(self.order_key)
         with self.client.pipeline(transaction=False) as pipe:
             pipe.hset(self.meta_key, mapping={"cached_at": int(time.time()), "total": total})
-            pipe.expire(self.meta_key, self.TTL_SECONDS)
-            pipe.expire(self.pins_key, self.TTL_SECONDS)
-            pipe.expire(self.order_key, self.TTL_SECONDS)
+            pipe.hincrby(self.meta_key, "version", 1)
+            for key in self._data_keys:
+                pipe.expire(key, self.TTL_SECONDS)
             pipe.execute()
 
+    def _encode_entry(self, pin: dict[str, Any]) -> str:
+        """One pin's stored JSON: its map payload plus ``viewLocationUrl``."""
+        return json.dumps({**pin, "viewLocationUrl": self.payload.view_location_url(pin)}, separators=(",", ":"))
+
     def clear(self) -> None:
         if self.client:
-            self.client.delete(self.meta_key, self.pins_key, self.order_key, self.lock_key, self.rebuild_queued_key)
+            self.client.delete(*self._data_keys, self.lock_key, self.rebuild_queued_key)
 
     def _touch(self) -> None:
         if not self.client:
             return
         with self.client.pipeline(transaction=False) as pipe:
-            pipe.expire(self.meta_key, self.TTL_SECONDS)
-            pipe.expire(self.pins_key, self.TTL_SECONDS)
-            pipe.expire(self.order_key, self.TTL_SECONDS)
+            for key in self._data_keys:
+                pipe.expire(key, self.TTL_SECONDS)
             pipe.execute()
+
+
+def _geo_member(pin: dict[str, Any]) -> tuple[float, float, str]:
+    """The ``GEOADD`` (longitude, latitude, member) triple for one pin payload."""
+    latitude = min(max(float(pin["latitude"]), -_GEO_MAX_LATITUDE), _GEO_MAX_LATITUDE)
+    return float(pin["longitude"]), latitude, str(pin["id"])
+
+
+def _label_member(label_id: int | str, pin_id: int | str) -> str:
+    """The label index member recording that a pin carries a label."""
+    return f"{label_id}:{pin_id}"
+
+
+def _join_label_ids(label_ids: Iterable[int | str]) -> str:
+    """A pin's label PKs as stored in the pin-to-labels hash."""
+    return ",".join(sorted({str(label_id) for label_id in label_ids}, key=int))
+
+
+def _haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance on Valkey's sphere, in kilometres."""
+    dlat = math.radians(lat2 - lat1)
+    dlng = math.radians(lng2 - lng1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlng / 2) ** 2
+    return 2 * _GEO_EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _geo_search_boxes(south: float, west: float, north: float, east: float) -> list[tuple[float, float, float, float]]:
+    """``GEOSEARCH BYBOX`` arguments whose union covers a lat/lng bbox.
+
+    Valkey tests a member's longitude offset along the member's own parallel,
+    so each box is as wide as its longitude span measured on the parallel
+    nearest the equator - the widest point of the bbox. Spans wider than
+    ``_GEO_MAX_BOX_SPAN`` are split into several boxes.
+
+    Args:
+        south: Southern latitude; must not exceed ``north``.
+        west: Western longitude; must not exceed ``east``.
+        north: Northern latitude.
+        east: Eastern longitude.
+
+    Returns:
+        ``(longitude, latitude, width_km, height_km)`` per box; empty when the
+        bbox lies entirely outside the indexable range.
+    """
+    west, east = max(west, -180.0), min(east, 180.0)
+    south, north = max(south, -_GEO_MAX_LATITUDE), min(north, _GEO_MAX_LATITUDE)
+    if west >= east or south >= north:
+        return []
+    center_lat = (south + north) / 2
+    widest_lat = 0.0 if south <= 0 <= north else min(abs(south), abs(north))
+    height = 2 * max(_haversine_km(center_lat, 0, south, 0), _haversine_km(center_lat, 0, north, 0)) * _GEO_BOX_PADDING
+    span = east - west
+    box_count = math.ceil(span / _GEO_MAX_BOX_SPAN)
+    box_span = span / box_count
+    width = 2 * _haversine_km(widest_lat, 0, widest_lat, box_span / 2) * _GEO_BOX_PADDING
+    return [(west + box_span * (index + 0.5), center_lat, width, height) for index in range(box_count)]
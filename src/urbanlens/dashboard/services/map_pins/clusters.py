@@ -0,0 +1,238 @@
+"""Grid clustering of map pins for low zoom levels.
+
+At country or state zoom the map only needs one marker per screen region, not
+every pin. Pins are bucketed into Web Mercator grid cells - each cell is a
+``1 / 2**CLUSTER_GRID_SHIFT`` slice of a 256px map tile on a side - and each
+cell keeps a running aggregate: pin count, coordinate sums (for the centroid),
+the members' bounding box and per-status/per-colour counts.
+
+``MapPinCache`` stores those aggregates in Valkey and keeps them current one
+pin at a time with ``APPLY_MEMBER_SCRIPT``; ``MapPinClusterGrid`` builds the
+same aggregates in Python for full rebuilds and uncached requests.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+#: Web Mercator's latitude limit - the furthest north or south the map renders.
+WEB_MERCATOR_MAX_LATITUDE = 85.05112878
+
+#: Each cluster cell is a 256px tile subdivided this many times per side (64px cells).
+CLUSTER_GRID_SHIFT = 2
+
+#: Upper bound on the cells a single cluster request reads. A real viewport
+#: covers a few hundred; anything larger is a malformed bbox/zoom pair.
+MAX_CLUSTER_CELLS = 4096
+
+#: Atomically replace one pin's contribution to the cluster cells.
+#:
+#: KEYS[1] is the cell aggregate hash, KEYS[2] the per-pin member hash.
+#: ARGV[1] is the pin id, ARGV[2] the pin's new member record (JSON, see
+#: ``member_record``), or an empty string when the pin was removed.
+#:
+#: Removing a pin cannot shrink a cell's bounding box without re-reading every
+#: member, so after removals the box may be looser than the members until the
+#: next full rebuild - it never excludes a member.
+APPLY_MEMBER_SCRIPT = """
+local function bump(counts, key, sign)
+    if key == nil or key == '' or key == cjson.null then
+        return
+    end
+    local value = (counts[key] or 0) + sign
+    if value <= 0 then
+        counts[key] = nil
+    else
+        counts[key] = value
+    end
+end
+
+local function apply(cells_key, member, sign)
+    for _, field in ipairs(member.cells) do
+        local raw = redis.call('HGET', cells_key, field)
+        local cell
+        if raw then
+            cell = cjson.decode(raw)
+        else
+            cell = {count = 0, lat = 0, lng = 0, s = member.lat, w = member.lng, n = member.lat, e = member.lng, status = {}, color = {}}
+        end
+        cell.count = cell.count + sign
+        if cell.count <= 0 then
+            redis.call('HDEL', cells_key, field)
+        else
+            cell.lat = cell.lat + sign * member.lat
+            cell.lng = cell.lng + sign * member.lng
+            if sign > 0 then
+                cell.s = math.min(cell.s, member.lat)
+                cell.w = math.min(cell.w, member.lng)
+                cell.n = math.max(cell.n, member.lat)
+                cell.e = math.max(cell.e, member.lng)
+            end
+            bump(cell.status, member.status, sign)
+            bump(cell.color, member.color, sign)
+            redis.call('HSET', cells_key, field, cjson.encode(cell))
+        end
+    end
+end
+
+local old = redis.call('HGET', KEYS[2], ARGV[1])
+if old then
+    apply(KEYS[1], cjson.decode(old), -1)
+end
+if ARGV[2] ~= '' then
+    redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+    apply(KEYS[1], cjson.decode(ARGV[2]), 1)
+else
+    redis.call('HDEL', KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+
+def cell_xy(latitude: float, longitude: float, zoom: int) -> tuple[int, int]:
+    """Grid cell column/row holding a coordinate at a map zoom level.
+
+    Args:
+        latitude: Latitude in degrees; clamped to Web Mercator's range.
+        longitude: Longitude in degrees.
+        zoom: Map zoom level.
+
+    Returns:
+        ``(x, y)`` cell indices, counted from the north-west corner.
+    """
+    cells_per_side = 2 ** (zoom + CLUSTER_GRID_SHIFT)
+    latitude = min(max(latitude, -WEB_MERCATOR_MAX_LATITUDE), WEB_MERCATOR_MAX_LATITUDE)
+    x = math.floor((longitude + 180.0) / 360.0 * cells_per_side)
+    y = math.floor((1.0 - math.asinh(math.tan(math.radians(latitude))) / math.pi) / 2.0 * cells_per_side)
+    return min(max(x, 0), cells_per_side - 1), min(max(y, 0), cells_per_side - 1)
+
+
+def cell_field(zoom: int, x: int, y: int) -> str:
+    """Hash field naming one grid cell at one zoom level."""
+    return f"{zoom}:{x}:{y}"
+
+
+def cell_fields_for_bbox(south: float, west: float, north: float, east: float, zoom: int) -> list[str] | None:
+    """Every grid cell a lat/lng box touches at one zoom level.
+
+    Args:
+        south: Southern latitude.
+        west: Western longitude.
+        north: Northern latitude.
+        east: Eastern longitude.
+        zoom: Map zoom level.
+
+    Returns:
+        The cells' hash fields, or None when the box spans more than
+        ``MAX_CLUSTER_CELLS`` cells.
+    """
+    south, north = sorted((south, north))
+    west, east = sorted((west, east))
+    west, east = max(west, -180.0), min(east, 180.0)
+    if west > east:
+        return []
+    min_x, min_y = cell_xy(north, west, zoom)
+    max_x, max_y = cell_xy(south, east, zoom)
+    if (max_x - min_x + 1) * (max_y - min_y + 1) > MAX_CLUSTER_CELLS:
+        return None
+    return [cell_field(zoom, x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+
+
+def member_record(pin: dict[str, Any], zooms: Iterable[int]) -> dict[str, Any]:
+    """One pin's contribution to the cluster cells.
+
+    Args:
+        pin: A ``MapPinPayloadService.serialize`` payload.
+        zooms: The zoom levels to place the pin at.
+
+    Returns:
+        The pin's cells, coordinates, status and colour.
+    """
+    latitude = float(pin["latitude"])
+    longitude = float(pin["longitude"])
+    return {
+        "cells": [cell_field(zoom, *cell_xy(latitude, longitude, zoom)) for zoom in zooms],
+        "lat": latitude,
+        "lng": longitude,
+        "status": pin.get("status") or "",
+        "color": pin.get("color") or "",
+    }
+
+
+def cluster_payload(cell: dict[str, Any]) -> dict[str, Any]:
+    """The JSON a cluster request returns for one cell aggregate.
+
+    Args:
+        cell: A decoded cell aggregate, as kept by ``MapPinClusterGrid`` or
+            ``APPLY_MEMBER_SCRIPT``.
+
+    Returns:
+        The cluster's count, centroid, bounding box and dominant status/colour.
+    """
+    count = int(cell["count"])
+    return {
+        "count": count,
+        "latitude": cell["lat"] / count,
+        "longitude": cell["lng"] / count,
+        "bbox": [cell["s"], cell["w"], cell["n"], cell["e"]],
+        "status": _dominant(cell.get("status")),
+        "color": _dominant(cell.get("color")) or None,
+    }
+
+
+def _dominant(counts: dict[str, int] | list | None) -> str:
+    """The most common key, ties broken alphabetically; "" when empty.
+
+    Lua's cjson encodes an empty table as ``{}`` but cannot tell it from an
+    empty array, so an empty ``[]`` is tolerated too.
+    """
+    if not counts:
+        return ""
+    return min(counts.items(), key=lambda item: (-item[1], item[0]))[0]
+
+
+class MapPinClusterGrid:
+    """Cluster cell aggregates built in Python, in ``APPLY_MEMBER_SCRIPT``'s shape."""
+
+    def __init__(self) -> None:
+        self.cells: dict[str, dict[str, Any]] = {}
+
+    def add(self, member: dict[str, Any]) -> None:
+        """Add one ``member_record`` to every cell it belongs to."""
+        for field in member["cells"]:
+            cell = self.cells.get(field)
+            if cell is None:
+                cell = self.cells[field] = {
+                    "count": 0,
+                    "lat": 0.0,
+                    "lng": 0.0,
+                    "s": member["lat"],
+                    "w": member["lng"],
+                    "n": member["lat"],
+                    "e": member["lng"],
+                    "status": {},
+                    "color": {},
+                }
+            cell["count"] += 1
+            cell["lat"] += member["lat"]
+            cell["lng"] += member["lng"]
+            cell["s"] = min(cell["s"], member["lat"])
+            cell["w"] = min(cell["w"], member["lng"])
+            cell["n"] = max(cell["n"], member["lat"])
+            cell["e"] = max(cell["e"], member["lng"])
+            for key in ("status", "color"):
+                if value := member[key]:
+                    cell[key][value] = cell[key].get(value, 0) + 1
+
+    def encoded(self) -> dict[str, str]:
+        """Every cell aggregate as compact JSON, keyed by hash field."""
+        return {field: json.dumps(cell, separators=(",", ":")) for field, cell in self.cells.items()}
+
+    def clusters(self) -> list[dict[str, Any]]:
+        """Every cell as a ``cluster_payload``."""
+        return [cluster_payload(cell) for cell in self.cells.values()]
@@ -11,6 +11,8 @@ from urbanlens.dashboard.models.labels.model import Label
 from urbanlens.dashboard.models.reviews.model import Review
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from urbanlens.dashboard.models.pin import Pin
     from urbanlens.dashboard.models.profile.model import Profile
 
@@ -24,6 +26,10 @@ class MapPinPage:
     pins: list[dict[str, Any]]
     next_cursor: int | None
     total: int | None = None
+    #: The page's pins as the JSON objects ``MapPinCache`` stored, set
+    #: instead of ``pins`` by raw cache reads so they can be spliced straight
+    #: into a response without a decode/encode round trip.
+    raw_pins: list[str] | None = None
 
 
 class MapPinPayloadService:
@@ -64,6 +70,32 @@ class MapPinPayloadService:
     def all(self, query: QuerySet[Pin]) -> list[dict[str, Any]]:
         return [self.serialize(pin) for pin in self.prepare_queryset(query).iterator(chunk_size=1000)]
 
+    def all_with_label_ids(self, query: QuerySet[Pin]) -> Iterator[tuple[dict[str, Any], list[int]]]:
+        """Serialize pins alongside the PKs of every label each one carries.
+
+        ``MapPinCache`` indexes its entries by label with these, so a label
+        edit re-renders only the pins it appears on. Reads the same prefetch
+        as :meth:`serialize`, so the label PKs cost no extra query.
+
+        Args:
+            query: The pins to serialize.
+
+        Yields:
+            ``(payload, label_pks)`` per pin, in pk order.
+        """
+        for pin in self.prepare_queryset(query).iterator(chunk_size=1000):
+            yield self.serialize(pin), [label.pk for label in pin.labels.all()]
+
+    @staticmethod
+    def view_location_url(payload: dict[str, Any]) -> str:
+        """The web map's pin-detail URL for one serialized pin.
+
+        Added to the web map's payloads (and baked into ``MapPinCache``
+        entries) rather than to :meth:`serialize`, whose shape the sync API
+        shares.
+        """
+        return f"/dashboard/map/pin/{payload['slug']}/"
+
     def display_labels(self, pin: Pin) -> list[Label]:
         """The pin's labels that display as chips, in prefetch order.
 
@@ -0,0 +1,75 @@
+"""Keep warm ``MapPinCache`` entries current after database writes.
+
+The pin, label and review receivers in ``models/pin/signals.py`` call these.
+Each defers its work until the surrounding transaction commits, so the cache
+re-renders from committed rows, and a Valkey outage is logged rather than
+failing the write that triggered it. Profiles whose cache is cold cost one
+``EXISTS`` and nothing more.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from redis.exceptions import RedisError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+_CACHE_ERRORS = (ConnectionError, OSError, RuntimeError, RedisError)
+
+
+def refresh_pins_on_commit(profile_id: int, pin_ids: Iterable[int]) -> None:
+    """Re-render a batch of one profile's cached pins once the transaction commits.
+
+    Args:
+        profile_id: The profile whose cache holds the pins.
+        pin_ids: PKs of the pins to re-render; deleted pins are dropped.
+    """
+    pin_ids = set(pin_ids)
+    if not profile_id or not pin_ids:
+        return
+
+    def _run() -> None:
+        from urbanlens.dashboard.models.profile.model import Profile
+        from urbanlens.dashboard.services.map_pins import MapPinCache
+
+        try:
+            MapPinCache(Profile(pk=profile_id)).refresh_pins(pin_ids)
+        except _CACHE_ERRORS:
+            logger.warning("Unable to refresh cached map pins %s for profile %s", sorted(pin_ids), profile_id, exc_info=True)
+
+    transaction.on_commit(_run)
+
+
+def refresh_labels_on_commit(profile_ids: Iterable[int], label_ids: Iterable[int]) -> None:
+    """Re-render every cached pin carrying these labels once the transaction commits.
+
+    The pins are looked up in each profile's cache (see
+    ``MapPinCache.refresh_labels``), so this works for labels that are being
+    deleted too.
+
+    Args:
+        profile_ids: The profiles whose caches may hold pins with the labels.
+        label_ids: PKs of the edited labels.
+    """
+    profile_ids = {profile_id for profile_id in profile_ids if profile_id}
+    label_ids = set(label_ids)
+    if not profile_ids or not label_ids:
+        return
+
+    def _run() -> None:
+        from urbanlens.dashboard.models.profile.model import Profile
+        from urbanlens.dashboard.services.map_pins import MapPinCache
+
+        for profile_id in profile_ids:
+            try:
+                MapPinCache(Profile(pk=profile_id)).refresh_labels(label_ids)
+            except _CACHE_ERRORS:
+                logger.warning("Unable to refresh cached map pins for labels %s, profile %s", sorted(label_ids), profile_id, exc_info=True)
+
+    transaction.on_commit(_run)
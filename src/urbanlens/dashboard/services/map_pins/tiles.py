@@ -0,0 +1,171 @@
+"""Compact columnar map-pin tiles.
+
+``map_pins_json`` sends one JSON object per pin, repeating every key and
+every label/icon string on every pin. A tile carries the same
+``MapPinPayloadService.serialize`` fields for the pins inside one slippy-map
+tile, laid out column by column:
+
+* ``strings`` - every icon, colour, status, category and label name in the
+  tile, each stored once. The ``INTERNED_COLUMNS`` hold indexes into it
+  (``-1`` for a missing or empty value).
+* ``tags`` - every distinct display-label chip as
+  ``[id, name, color, icon]`` string indexes; each pin's ``tags`` column
+  entry lists indexes into this table.
+* ``columns`` - one array per payload field, all the same length, one entry
+  per pin in pk order.
+
+Tiles are addressed by ``z/x/y``; the view hashes the encoded tile into an
+ETag so clients can revalidate them. Tile boxes are half-open (see
+:func:`tile_contains`), so tiles partition the map and a pin on a shared edge
+is served by exactly one of them.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+#: Columns whose values are interned into the tile's string table.
+INTERNED_COLUMNS = ("icon", "color", "status", "own_icon", "own_color")
+
+#: Columns copied through as-is.
+PLAIN_COLUMNS = (
+    "id",
+    "uuid",
+    "slug",
+    "name",
+    "description",
+    "priority",
+    "last_visited",
+    "latitude",
+    "longitude",
+    "rating",
+    "address",
+    "own_custom_icon_url",
+    "child_count",
+)
+
+#: Deepest zoom a tile may be requested at; pins are never denser than this.
+MAX_TILE_ZOOM = 22
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> tuple[float, float, float, float] | None:
+    """The lat/lng box a slippy-map tile covers.
+
+    Args:
+        zoom: Tile zoom level.
+        x: Tile column, counted from the antimeridian eastward.
+        y: Tile row, counted from the north.
+
+    Returns:
+        ``(south, west, north, east)``, or None for an out-of-range tile.
+    """
+    tiles_per_side = 2**zoom
+    if not 0 <= zoom <= MAX_TILE_ZOOM or not 0 <= x < tiles_per_side or not 0 <= y < tiles_per_side:
+        return None
+
+    def latitude(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / tiles_per_side))))
+
+    west = x / tiles_per_side * 360.0 - 180.0
+    east = (x + 1) / tiles_per_side * 360.0 - 180.0
+    # The outermost rows stretch to the poles so pins beyond Web Mercator's
+    # limit still land in a tile.
+    north = 90.0 if y == 0 else latitude(y)
+    south = -90.0 if y == tiles_per_side - 1 else latitude(y + 1)
+    return south, west, north, east
+
+
+def tile_contains(bounds: tuple[float, float, float, float], latitude: float, longitude: float) -> bool:
+    """Whether a point falls inside a tile box from :func:`tile_bounds`.
+
+    The box is half-open - ``south <= latitude < north`` and
+    ``west <= longitude < east`` - so a point on an edge shared by two tiles
+    belongs to exactly one. The world's own north and east edges, which no
+    further tile lies beyond, are closed. ``PinQuerySet.within_tile`` applies
+    the same rule in SQL.
+
+    Args:
+        bounds: ``(south, west, north, east)`` box.
+        latitude: Point latitude.
+        longitude: Point longitude.
+
+    Returns:
+        True when the point lies in the tile.
+    """
+    south, west, north, east = bounds
+    below_north = latitude <= north if north >= 90.0 else latitude < north
+    before_east = longitude <= east if east >= 180.0 else longitude < east
+    return south <= latitude and below_north and west <= longitude and before_east
+
+
+class _StringTable:
+    """Interns strings into a list, handing back stable indexes."""
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def intern(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def encode_columnar_tile(pins: list[dict[str, Any]]) -> dict[str, Any]:
+    """Lay out map pin payloads as one columnar tile.
+
+    Args:
+        pins: ``MapPinPayloadService.serialize`` payloads, in pk order.
+
+    Returns:
+        ``{"strings", "tags", "columns"}`` as described in the module docstring.
+    """
+    strings = _StringTable()
+    tags: list[list[int]] = []
+    tag_index: dict[tuple[Any, ...], int] = {}
+    columns: dict[str, list[Any]] = {name: [] for name in (*PLAIN_COLUMNS, *INTERNED_COLUMNS, "categories", "tags")}
+    for pin in pins:
+        for name in PLAIN_COLUMNS:
+            columns[name].append(pin.get(name))
+        for name in INTERNED_COLUMNS:
+            columns[name].append(strings.intern(pin.get(name) or None))
+        columns["categories"].append([strings.intern(category) for category in pin.get("categories", [])])
+        pin_tags = []
+        for tag in pin.get("tags", []):
+            key = (tag["id"], tag["name"], tag["color"], tag["icon"])
+            index = tag_index.get(key)
+            if index is None:
+                index = tag_index[key] = len(tags)
+                tags.append([tag["id"], strings.intern(tag["name"]), strings.intern(tag["color"]), strings.intern(tag["icon"])])
+            pin_tags.append(index)
+        columns["tags"].append(pin_tags)
+    return {"strings": strings.values, "tags": tags, "columns": columns}
+
+
+def decode_columnar_tile(tile: dict[str, Any]) -> list[dict[str, Any]]:
+    """Expand a columnar tile back into per-pin payloads.
+
+    The inverse of :func:`encode_columnar_tile`, for tests and Python
+    clients; ``profile`` is not carried in tiles since every pin in one
+    belongs to the requesting profile.
+    """
+    strings: list[str] = tile["strings"]
+    columns: dict[str, list[Any]] = tile["columns"]
+
+    def text(index: int) -> str | None:
+        return strings[index] if index >= 0 else None
+
+    pins = []
+    for row in range(len(columns["id"])):
+        pin = {name: columns[name][row] for name in PLAIN_COLUMNS}
+        pin.update({name: text(columns[name][row]) for name in INTERNED_COLUMNS})
+        pin["status"] = pin["status"] or ""
+        pin["categories"] = [strings[index] for index in columns["categories"][row]]
+        pin["tags"] = [{"id": tag_id, "name": text(name), "color": text(color), "icon": text(icon)} for tag_id, name, color, icon in (tile["tags"][index] for index in columns["tags"][row])]
+        pins.append(pin)
+    return pins
@@ -0,0 +1,261 @@
+"""Chunked download-and-store pipeline shared by the photo-library import tasks.
+
+``import_immich_photos``, ``import_flickr_photos``, ``import_flickr_album_photos``
+and ``import_google_photos`` differ only in where an asset's bytes come from
+and which provenance fields its ``Image`` row carries. Everything after the
+download - checksum dedupe, the storage-quota check, the row insert, the
+photo-sourced visit and the ``process_image_upload`` enqueue - lives here, run
+a chunk at a time:
+
+1. Assets whose ``source_url`` is already on the target are dropped before
+   anything is fetched. ``source_url`` is the per-provider de-dup key (see
+   ``ImmichAccount.asset_web_url``), so a task redelivered after a worker
+   restart (``CELERY_TASK_ACKS_LATE``) picks up where the last committed chunk
+   left off instead of downloading the whole selection again.
+2. The chunk's downloads run concurrently through ``fan_out`` on the
+   caller's gateway, so they share its pooled HTTP session. Each download is
+   hashed on the thread that fetched it.
+3. Survivors of the checksum check are written to storage concurrently,
+   outside the per-profile upload lock. The lock is then held only for the
+   quota check and one ``bulk_create`` per chunk, well inside its expiry;
+   files that fail the quota check, miss their write deadline or whose
+   insert fails are deleted again.
+4. EXIF/downscale post-processing is left to ``process_image_upload``, one
+   task per image, so it spreads across the Celery worker processes rather
+   than running in this one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import partial
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+
+from urbanlens.dashboard.models.images.model import Image
+from urbanlens.dashboard.services.timeout_utils import fan_out
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from urbanlens.dashboard.models.location.model import Location
+    from urbanlens.dashboard.models.pin.model import Pin
+    from urbanlens.dashboard.models.profile.model import Profile
+    from urbanlens.dashboard.models.wiki.model import Wiki
+    from urbanlens.dashboard.services.timeout_utils import FanOutResult
+
+logger = logging.getLogger(__name__)
+
+# Assets per chunk: the unit of progress reporting, of the batched insert,
+# and of what a restarted task can lose. Also bounds how many originals are
+# held in memory at once.
+IMPORT_CHUNK_SIZE = 16
+# Downloads and storage writes in flight at once for one import.
+IMPORT_MAX_PARALLEL = 8
+# Seconds one asset's download (or storage write) may take before it is
+# counted as failed. Generous: originals can be large videos.
+IMPORT_TRANSFER_DEADLINE_SECONDS = 600
+
+
+@dataclass(frozen=True, slots=True)
+class ImportAsset:
+    """One provider asset selected for import.
+
+    Attributes:
+        key: The provider's id for the asset, used in logs.
+        source_url: The asset's provider web URL, stored on the ``Image`` and
+            used as its "already imported" marker.
+        download: Fetches ``(file bytes, filename)``; raises
+            ``GatewayRequestError`` when the asset can't be downloaded.
+        fields: Extra ``Image`` field values for this asset (``source``,
+            ``caption``, ``visit``, ...).
+    """
+
+    key: str
+    source_url: str
+    download: Callable[[], tuple[bytes, str]]
+    fields: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class _Download:
+    content: bytes
+    filename: str
+    checksum: str
+
+
+def _fetch(asset: ImportAsset) -> _Download:
+    """Download one asset and hash it, on a fan-out worker thread."""
+    content, filename = asset.download()
+    return _Download(content=content, filename=filename, checksum=hashlib.sha256(content).hexdigest())
+
+
+def _store(image: Image, download: _Download, abandoned: threading.Event) -> None:
+    """Write one asset's bytes to storage ahead of the quota check and batched insert.
+
+    A write that finishes after its chunk has stopped waiting for it (see
+    ``abandoned``) deletes its own file, since no row will ever point at it.
+    """
+    image.image.save(download.filename, ContentFile(download.content), save=False)
+    if abandoned.is_set():
+        _discard(image)
+
+
+def _discard(image: Image) -> None:
+    """Best-effort delete of a stored file that will not get an ``Image`` row."""
+    if not image.image:
+        return
+    try:
+        image.image.delete(save=False)
+    except OSError:
+        logger.exception("Failed to delete stored import file %s for %s", image.image.name, image.source_url)
+
+
+def _retryable_error(outcomes: Sequence[FanOutResult[Any]]) -> OSError | None:
+    """The first network/storage ``OSError`` in a stage, which the task should retry on."""
+    return next((outcome.error for outcome in outcomes if isinstance(outcome.error, OSError)), None)
+
+
+def run_photo_import(
+    assets: Sequence[ImportAsset],
+    *,
+    profile: Profile,
+    location: Location,
+    pin: Pin | None = None,
+    wiki: Wiki | None = None,
+    log_visits: bool = False,
+    progress: Callable[..., None],
+    label: str,
+) -> dict[str, int]:
+    """Import provider assets onto a pin or wiki, a chunk at a time.
+
+    An asset already on the target (same ``source_url`` or checksum) is
+    skipped, and one that would exceed the profile's storage quota or can't
+    be downloaded is counted as failed, without failing the rest. A transient
+    network or storage ``OSError`` is re-raised once the chunk it hit has been
+    committed, so the task's ``autoretry_for=(OSError,)`` retries only what
+    is left.
+
+    Args:
+        assets: The selected assets, in import order.
+        profile: The importing profile; owns the created rows and the quota.
+        location: Location stored on every created row.
+        pin: Pin to import onto, if the target is a pin.
+        wiki: Wiki to import onto, if the target is a wiki.
+        log_visits: Log a photo-sourced ``PinVisit`` for each new image that
+            wasn't given a ``visit`` of its own (the user's own library
+            imports; not public albums).
+        progress: ``update_task_progress`` bound to the calling task.
+        label: Task name for log lines.
+
+    Returns:
+        Counts of imported/skipped/failed assets, surfaced to the polling UI.
+    """
+    from urbanlens.dashboard.services.celery import safely_enqueue_task
+    from urbanlens.dashboard.services.memories.photos import log_visit_on_pin
+    from urbanlens.dashboard.services.storage import per_profile_upload_lock, quota_error_for_upload
+    from urbanlens.dashboard.tasks import process_image_upload
+
+    counts = {"imported": 0, "skipped": 0, "failed": 0}
+    target_filter: dict[str, Any] = {"pin": pin} if pin is not None else {"wiki": wiki}
+    existing = Image.objects.filter(profile=profile, **target_filter).values_list("checksum", "source_url")
+    existing_checksums = {checksum for checksum, _url in existing if checksum}
+    imported_urls = {url for _checksum, url in existing if url}
+
+    pending = [asset for asset in assets if asset.source_url not in imported_urls]
+    counts["skipped"] = len(assets) - len(pending)
+    total = len(assets)
+    done = counts["skipped"]
+    for start in range(0, len(pending), IMPORT_CHUNK_SIZE):
+        chunk = pending[start : start + IMPORT_CHUNK_SIZE]
+        progress(current=done, total=total, message=f"Importing photos {done + 1}-{done + len(chunk)} of {total}...")
+        downloads = fan_out([(asset.key, partial(_fetch, asset)) for asset in chunk], timeout=IMPORT_TRANSFER_DEADLINE_SECONDS, max_parallel=IMPORT_MAX_PARALLEL)
+
+        candidates: list[tuple[Image, _Download]] = []
+        for asset, outcome in zip(chunk, downloads, strict=True):
+            if not outcome.ok or outcome.value is None:
+                logger.warning("%s: failed to download %s", label, asset.key, exc_info=outcome.error)
+                counts["failed"] += 1
+                continue
+            download = outcome.value
+            if download.checksum in existing_checksums:
+                counts["skipped"] += 1
+                continue
+            existing_checksums.add(download.checksum)
+            image = Image(
+                pin=pin,
+                wiki=wiki,
+                location=location,
+                profile=profile,
+                checksum=download.checksum,
+                file_size=len(download.content),
+                source_url=asset.source_url,
+                **asset.fields,
+            )
+            candidates.append((image, download))
+
+        # Storage writes can take up to the transfer deadline each, far past
+        # the upload lock's expiry, so they run before the lock is taken.
+        abandoned = threading.Event()
+        writes = fan_out([(image.source_url, partial(_store, image, download, abandoned)) for image, download in candidates], timeout=IMPORT_TRANSFER_DEADLINE_SECONDS, max_parallel=IMPORT_MAX_PARALLEL)
+        # Writes still running past their deadline clean up after themselves;
+        # any that finished since fan_out gave up on them are deleted here.
+        abandoned.set()
+        stored: list[Image] = []
+        for (image, download), outcome in zip(candidates, writes, strict=True):
+            if outcome.ok:
+                stored.append(image)
+                continue
+            logger.warning("%s: failed to store %s", label, image.source_url, exc_info=outcome.error)
+            _discard(image)
+            existing_checksums.discard(download.checksum)
+            counts["failed"] += 1
+
+        # The quota reads and the insert are one critical section, as in
+        # services.photo_upload; bytes admitted earlier in the chunk count
+        # against the quota before their rows exist.
+        with per_profile_upload_lock(profile):
+            admitted: list[Image] = []
+            admitted_bytes = 0
+            for image in stored:
+                if quota_error_for_upload(profile, admitted_bytes + image.file_size):
+                    _discard(image)
+                    existing_checksums.discard(image.checksum)
+                    counts["failed"] += 1
+                    continue
+                admitted_bytes += image.file_size
+                admitted.append(image)
+
+            try:
+                with transaction.atomic():
+                    created = Image.objects.bulk_create(admitted)
+                    if log_visits and pin is not None:
+                        for image in created:
+                            if image.visit_id is None:
+                                log_visit_on_pin(profile, image, pin)
+            except Exception:
+                for image in admitted:
+                    _discard(image)
+                raise
+
+        for image in created:
+            safely_enqueue_task(process_image_upload, image.pk)
+        counts["imported"] += len(created)
+        done += len(chunk)
+
+        retryable = _retryable_error(downloads) or _retryable_error(writes)
+        if retryable is not None:
+            raise retryable
+
+    summary = f"Imported {counts['imported']}"
+    if counts["skipped"]:
+        summary += f", skipped {counts['skipped']} duplicate(s)"
+    if counts["failed"]:
+        summary += f", {counts['failed']} failed"
+    progress(current=total, total=total, message=summary + ".")
+    return counts
@@ -35,6 +35,7 @@ from urbanlens.dashboard.models.pin.model import Pin
 from urbanlens.dashboard.models.pin_suggestions.model import MAX_STORED_VISIT_DATES, MAX_SUGGESTION_ALIASES, MAX_SUGGESTION_LINKS, MAX_SUGGESTION_PHOTOS, PinSuggestion, PinSuggestionOrigin, PinSuggestionStatus
 from urbanlens.dashboard.models.profile.model import _haversine_km
 from urbanlens.dashboard.models.visits.model import PinVisit, VisitSource
+from urbanlens.dashboard.services.geo_clustering import running_centroid_clusters
 from urbanlens.dashboard.services.images import compute_checksum
 from urbanlens.dashboard.services.media_materialize import fetch_with_revalidated_redirects
 from urbanlens.dashboard.services.storage import quota_error_for_upload
@@ -263,7 +264,13 @@ _BOUNDARY_PREFILTER_RADIUS_KM = 5
 def _match_hits_to_pins(profile: Profile, hits: list[LocationHit]) -> tuple[dict[Pin, list[LocationHit]], list[LocationHit]]:
     """Split hits into ones that fall inside an existing pin's boundary and ones that don't.
 
-    For each hit, prefilters candidate pins with an indexed PostGIS
+    The whole batch is matched against the profile's materialized pin
+    footprints in one ``ST_Contains`` join (see
+    ``PinFootprint.objects.pins_containing``). Hits that match nothing there
+    are re-checked against root pins with no footprint polygon to match (none
+    materialized yet, or a null one), if the profile has any.
+
+    For those, each hit prefilters candidate pins with an indexed PostGIS
     ``near_point`` distance query before resolving any boundary polygon -
     without this, a profile with many pins (e.g. after a bulk import) forces
     an unbounded, unbatched boundary-resolution chain over every single root
@@ -283,6 +290,25 @@ def _match_hits_to_pins(profile: Profile, hits: list[LocationHit]) -> tuple[dict
     from django.contrib.gis.geos import Point
 
     from urbanlens.dashboard.models.boundary.model import Boundary, BoundaryType
+    from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
+
+    matched: dict[Pin, list[LocationHit]] = {}
+    unmatched: list[LocationHit] = []
+    if not hits:
+        return matched, unmatched
+
+    footprint_matches = PinFootprint.objects.pins_containing(profile.pk, [(hit.latitude, hit.longitude) for hit in hits], BoundaryType.PROPERTY)
+    pins_by_id = Pin.objects.select_related("location").in_bulk({pin_id for pin_id in footprint_matches if pin_id is not None})
+    remaining: list[LocationHit] = []
+    for hit, pin_id in zip(hits, footprint_matches, strict=True):
+        if pin_id is not None and pin_id in pins_by_id:
+            matched.setdefault(pins_by_id[pin_id], []).append(hit)
+        else:
+            remaining.append(hit)
+    unmaterialized_pins = Pin.objects.filter(profile=profile).without_footprint_polygon()
+    if not remaining or not unmaterialized_pins.root_pins().exists():
+        unmatched.extend(remaining)
+        return matched, unmatched
 
     polygon_cache: dict[int, object] = {}
     nearby_cache: dict[tuple[float, float], list[Pin]] = {}
@@ -294,12 +320,10 @@ def _match_hits_to_pins(profile: Profile, hits: list[LocationHit]) -> tuple[dict
 
     def _nearby_pins(point: Point, key: tuple[float, float]) -> list[Pin]:
         if key not in nearby_cache:
-            nearby_cache[key] = list(Pin.objects.filter(profile=profile).near_point(point, radius_km=_BOUNDARY_PREFILTER_RADIUS_KM).select_related("location"))
+            nearby_cache[key] = list(unmaterialized_pins.near_point(point, radius_km=_BOUNDARY_PREFILTER_RADIUS_KM).select_related("location"))
         return nearby_cache[key]
 
-    matched: dict[Pin, list[LocationHit]] = {}
-    unmatched: list[LocationHit] = []
-    for hit in hits:
+    for hit in remaining:
         point = Point(hit.longitude, hit.latitude, srid=4326)
         matched_pin: Pin | None = None
         for pin in _nearby_pins(point, (hit.latitude, hit.longitude)):
@@ -336,6 +360,10 @@ def _cluster_hits(hits: list[LocationHit], radius_m: float) -> list[list[Locatio
     cluster's mass actually is, disagreeing with where ``_centroid()`` would
     ultimately place it.
 
+    Each hit is only compared against the clusters whose centroids are
+    near it (see ``services.geo_clustering``), not every cluster so far, so
+    a 100k-asset library sweep no longer spends minutes in this loop.
+
     Args:
         hits: Unmatched hits to cluster.
         radius_m: Merge distance in metres.
@@ -343,26 +371,8 @@ def _cluster_hits(hits: list[LocationHit], radius_m: float) -> list[list[Locatio
     Returns:
         List of hit groups, each destined to become one new-pin suggestion.
     """
-    clusters: list[list[LocationHit]] = []
-    centroids: list[tuple[float, float]] = []
-    weights: list[int] = []
-    for hit in hits:
-        for index, centroid in enumerate(centroids):
-            if _haversine_km(centroid, (hit.latitude, hit.longitude)) * 1000 <= radius_m:
-                clusters[index].append(hit)
-                clat, clon = centroid
-                total_weight = weights[index] + hit.weight
-                centroids[index] = (
-                    clat + (hit.latitude - clat) * hit.weight / total_weight,
-                    clon + (hit.longitude - clon) * hit.weight / total_weight,
-                )
-                weights[index] = total_weight
-                break
-        else:
-            clusters.append([hit])
-            centroids.append((hit.latitude, hit.longitude))
-            weights.append(hit.weight)
-    return clusters
+    groups = running_centroid_clusters([hit.latitude for hit in hits], [hit.longitude for hit in hits], [hit.weight for hit in hits], radius_m)
+    return [[hits[index] for index in group] for group in groups]
 
 
 def _find_nearby_pending_new_pin_suggestion(candidates: list[PinSuggestion], latitude: float, longitude: float) -> PinSuggestion | None:
@@ -12,20 +12,28 @@ any of them has logged a call, producing a real burst above the configured
 limit. ``_RateLimitedSession`` closes this by going through
 ``_reserve_call``/``_finalize_call`` instead of calling ``check_rate_limit``
 and ``log_api_call`` directly - see their docstrings.
+
+When Valkey is configured the reservation skips the database entirely: the
+windows are counted by ``services.valkey_rate_limiter`` in one atomic script,
+and call outcomes reach ``ApiCallLog`` through a batched audit list. The
+locked database path stays as the fallback when Valkey is absent or down.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
 import time
 from typing import Any
 
 from django.db import transaction
+from django.utils import timezone
+from redis.exceptions import RedisError
 
 from urbanlens.dashboard.exceptions import DashboardError
+from urbanlens.dashboard.services.valkey_rate_limiter import ValkeyRateLimiter, audit_record
 
 logger = logging.getLogger(__name__)
 
@@ -284,6 +292,44 @@ def get_limit_config(service: str) -> Any:
     return row
 
 
+#: How long a process reuses an ``ApiRateLimit`` row on the Valkey path. An
+#: admin edit reaches the saving process at once (see
+#: :func:`forget_limit_config`) and every other process within this window.
+LIMIT_CONFIG_TTL_SECONDS = 30
+
+_limit_configs: dict[str, tuple[float, Any]] = {}
+
+
+def cached_limit_config(service: str) -> Any:
+    """:func:`get_limit_config`, reused per process for ``LIMIT_CONFIG_TTL_SECONDS``.
+
+    Keeps the Valkey reservation path at one Valkey round trip per call
+    rather than adding a ``get_or_create`` query to each. The locked database
+    path reads the row afresh under its lock and doesn't use this.
+
+    Args:
+        service: The service key.
+
+    Returns:
+        An ``ApiRateLimit`` instance, possibly up to the TTL old.
+    """
+    now = time.monotonic()
+    cached = _limit_configs.get(service)
+    if cached is not None and now - cached[0] < LIMIT_CONFIG_TTL_SECONDS:
+        return cached[1]
+    config = get_limit_config(service)
+    _limit_configs[service] = (now, config)
+    return config
+
+
+def forget_limit_config(service: str | None = None) -> None:
+    """Drop this process's cached ``ApiRateLimit`` row for ``service``, or all of them."""
+    if service is None:
+        _limit_configs.clear()
+    else:
+        _limit_configs.pop(service, None)
+
+
 def service_is_permitted(service: str) -> bool:
     """
     Check if the service is enabled and not rate limited.
@@ -340,7 +386,7 @@ def check_rate_limit(service: str) -> bool:
 
     try:
         if config.calls_per_minute is not None:
-            recent_minute = ApiCallLog.objects.for_service(service).since(timedelta(minutes=1)).exclude(was_geo_filtered=True).count()
+            recent_minute = ApiCallLog.objects.for_service(service).since(timedelta(minutes=1)).exclude(was_geo_filtered=True).exclude(was_cached=True).count()
             if recent_minute >= config.calls_per_minute:
                 logger.warning(
                     "Rate limit hit for %s: %d/%d calls in last minute",
@@ -351,7 +397,7 @@ def check_rate_limit(service: str) -> bool:
                 return False
 
         if config.calls_per_day is not None:
-            today_count = ApiCallLog.objects.for_service(service).today().exclude(was_geo_filtered=True).count()
+            today_count = ApiCallLog.objects.for_service(service).today().exclude(was_geo_filtered=True).exclude(was_cached=True).count()
             if today_count >= config.calls_per_day:
                 logger.warning(
                     "Daily rate limit hit for %s: %d/%d calls today",
@@ -362,7 +408,7 @@ def check_rate_limit(service: str) -> bool:
                 return False
 
         if config.calls_per_30_days is not None:
-            recent_30_days = ApiCallLog.objects.for_service(service).since(timedelta(days=30)).exclude(was_geo_filtered=True).count()
+            recent_30_days = ApiCallLog.objects.for_service(service).since(timedelta(days=30)).exclude(was_geo_filtered=True).exclude(was_cached=True).count()
             if recent_30_days >= config.calls_per_30_days:
                 logger.warning(
                     "30-day rate limit hit for %s: %d/%d calls in the last 30 days",
@@ -389,6 +435,7 @@ def log_api_call(
     was_geo_filtered: bool = False,
     was_service_disabled: bool = False,
     cost_estimate: Decimal | None = None,
+    was_cached: bool = False,
 ) -> None:
     """Record one API call in the ``ApiCallLog`` table.
 
@@ -403,6 +450,9 @@ def log_api_call(
         was_geo_filtered: True if the call was skipped due to geo filtering.
         cost_estimate: Estimated USD cost of this call, if known - see
             ``ServiceDefaults.cost_per_call``.
+        was_cached: True if the call was answered from a local response cache
+            (e.g. ``LLMGateway.served_from_cache``) and never reached the
+            provider. Such rows don't count toward the service's limits.
     """
     from urbanlens.dashboard.models.api_call_log import ApiCallLog
 
@@ -416,12 +466,29 @@ def log_api_call(
             was_geo_filtered=was_geo_filtered,
             was_service_disabled=was_service_disabled,
             cost_estimate=cost_estimate,
+            was_cached=was_cached,
         )
     except Exception:
         logger.exception("Failed to log API call for service %s", service)
 
 
-def _reserve_call(service: str, *, endpoint: str = "") -> int:
+# Valkey failures that send a reservation back to the database path.
+_VALKEY_ERRORS = (ConnectionError, OSError, RuntimeError, RedisError)
+
+
+@dataclass(slots=True)
+class _Reservation:
+    """A reserved call slot, completed by ``_finalize_call``."""
+
+    service: str
+    endpoint: str
+    created: datetime
+    #: pk of the ``ApiCallLog`` reservation row on the database path; None
+    #: when the outcome goes to the Valkey audit list instead.
+    entry_pk: int | None = None
+
+
+def _reserve_call(service: str, *, endpoint: str = "") -> _Reservation:
     """Atomically check ``service``'s rate limit and reserve a logged call slot.
 
     ``check_rate_limit`` (COUNT) and ``log_api_call`` (INSERT), called as two
@@ -429,7 +496,11 @@ def _reserve_call(service: str, *, endpoint: str = "") -> int:
     requests can all pass the COUNT check before any of them has inserted a
     log row, letting a burst of calls through above the configured limit -
     this matters most for a hard per-request-per-second ToS limit like
-    Nominatim's. This function closes that gap by locking the service's
+    Nominatim's.
+
+    With Valkey configured, the check and the increment are one Lua script
+    (see ``ValkeyRateLimiter.reserve``), which is atomic by construction.
+    Otherwise - or if Valkey fails - this locks the service's
     ``ApiRateLimit`` row (the natural one-row-per-service counter for this
     domain) for the duration of the count check and the reservation insert,
     via ``select_for_update()`` inside ``transaction.atomic()`` - so a second
@@ -443,12 +514,12 @@ def _reserve_call(service: str, *, endpoint: str = "") -> int:
 
     Args:
         service: The service key.
-        endpoint: URL or endpoint path being requested, recorded on the
-            reservation row (truncated to 500 chars).
+        endpoint: URL or endpoint path being requested, recorded with the
+            call (truncated to 500 chars).
 
     Returns:
-        The pk of the reserved ``ApiCallLog`` row. Callers must update it via
-        ``_finalize_call`` once the request completes.
+        The reservation. Callers must pass it to ``_finalize_call`` once the
+        request completes.
 
     Raises:
         RateLimitExceededError: If the call would exceed the configured rate
@@ -461,6 +532,26 @@ def _reserve_call(service: str, *, endpoint: str = "") -> int:
 
     truncated_endpoint = endpoint[:500] if endpoint else ""
 
+    if (limiter := ValkeyRateLimiter.from_env()) is not None:
+        config = cached_limit_config(service)
+        now = timezone.now()
+        try:
+            if not config.enabled:
+                limiter.record(audit_record(service, endpoint=truncated_endpoint, created=now, success=False, was_service_disabled=True))
+                blocked = None
+            else:
+                blocked = limiter.reserve(service, config, endpoint=truncated_endpoint)
+        except _VALKEY_ERRORS:
+            logger.warning("Valkey rate limiter unavailable for %s - using the database", service, exc_info=True)
+        else:
+            if not config.enabled:
+                raise ServiceDisabledError(service)
+            if blocked is not None:
+                window, count, limit = blocked
+                logger.warning("Rate limit hit for %s: %d/%d calls %s", service, count, limit, window)
+                raise RateLimitExceededError(service)
+            return _Reservation(service=service, endpoint=truncated_endpoint, created=now)
+
     # Ensure the row exists (auto-created from defaults) before locking it -
     # get_or_create is safe to call outside the lock since it already handles
     # its own creation race.
@@ -478,21 +569,23 @@ def _reserve_call(service: str, *, endpoint: str = "") -> int:
             raise ServiceDisabledError(service)
 
         entry = ApiCallLog.objects.create(service=service, endpoint=truncated_endpoint, success=True)
-        return entry.pk
+        return _Reservation(service=service, endpoint=truncated_endpoint, created=entry.created, entry_pk=entry.pk)
 
 
-def _finalize_call(entry_pk: int, *, success: bool, response_ms: int | None = None, cost_estimate: Decimal | None = None) -> None:
-    """Update a reservation row created by ``_reserve_call`` with the request's outcome.
+def _finalize_call(reservation: _Reservation, *, success: bool, response_ms: int | None = None, cost_estimate: Decimal | None = None) -> None:
+    """Record the outcome of a call reserved by ``_reserve_call``.
 
-    Updates the existing row in place rather than inserting a new one, so a
-    reserved-but-not-yet-finalized call still counts toward
-    ``check_rate_limit``'s window queries (which count rows regardless of
-    ``success``) without double-counting once finalized.
+    On the database path this updates the reservation row in place rather
+    than inserting a new one, so a reserved-but-not-yet-finalized call still
+    counts toward ``check_rate_limit``'s window queries (which count rows
+    regardless of ``success``) without double-counting once finalized. On the
+    Valkey path the call was already counted, and the outcome is appended to
+    the audit list for the next ``flush_api_call_audit_log`` run.
 
     Failures are swallowed so that logging problems never break callers.
 
     Args:
-        entry_pk: pk of the ``ApiCallLog`` row returned by ``_reserve_call``.
+        reservation: The reservation returned by ``_reserve_call``.
         success: Whether the call succeeded (HTTP 2xx, no exception).
         response_ms: Round-trip time in milliseconds.
         cost_estimate: Estimated USD cost of this call, if known - see
@@ -500,10 +593,42 @@ def _finalize_call(entry_pk: int, *, success: bool, response_ms: int | None = No
     """
     from urbanlens.dashboard.models.api_call_log import ApiCallLog
 
+    if reservation.entry_pk is None:
+        limiter = ValkeyRateLimiter.from_env()
+        record = audit_record(
+            reservation.service,
+            endpoint=reservation.endpoint,
+            created=reservation.created,
+            success=success,
+            response_ms=response_ms,
+            cost_estimate=cost_estimate,
+        )
+        if limiter is not None:
+            try:
+                limiter.record(record)
+            except _VALKEY_ERRORS:
+                logger.warning("Unable to queue API call audit record for %s - logging it directly", reservation.service, exc_info=True)
+            else:
+                return
+        log_api_call(reservation.service, success=success, response_ms=response_ms, endpoint=reservation.endpoint, cost_estimate=cost_estimate)
+        return
+
     try:
-        ApiCallLog.objects.filter(pk=entry_pk).update(success=success, response_ms=response_ms, cost_estimate=cost_estimate)
+        ApiCallLog.objects.filter(pk=reservation.entry_pk).update(success=success, response_ms=response_ms, cost_estimate=cost_estimate)
     except Exception:
-        logger.exception("Failed to finalize API call log entry %s", entry_pk)
+        logger.exception("Failed to finalize API call log entry %s", reservation.entry_pk)
+
+
+def flush_api_call_audit_log() -> int:
+    """Move buffered Valkey audit records into ``ApiCallLog``.
+
+    Returns:
+        Number of rows written; 0 when Valkey isn't configured.
+    """
+    limiter = ValkeyRateLimiter.from_env()
+    if limiter is None:
+        return 0
+    return limiter.flush_audit_log()
 
 
 # ---------------------------------------------------------------------------
@@ -556,11 +681,10 @@ class _RateLimitedSession:
         """Reserve a rate-limit slot, make the request, finalize the logged result.
 
         The reservation (see ``_reserve_call``) atomically checks the rate
-        limit and logs the attempt in one locked transaction, so this
-        no longer has a check-then-log gap for concurrent callers to race
-        through.
+        limit and records the attempt in one step, so this no longer has a
+        check-then-log gap for concurrent callers to race through.
         """
-        entry_pk = _reserve_call(self._service_key, endpoint=str(url))
+        reservation = _reserve_call(self._service_key, endpoint=str(url))
 
         # requests has no default timeout at all: a gateway call that forgets
         # timeout= would otherwise block its caller (and, when running under a
@@ -578,11 +702,11 @@ class _RateLimitedSession:
             # and a failed response wasn't necessarily charged either way, so
             # estimating a cost for it would overstate real spend.
             cost_estimate = all_service_defaults().get(self._service_key, ServiceDefaults(display_name="")).cost_per_call if resp.ok else None
-            _finalize_call(entry_pk, success=resp.ok, response_ms=elapsed_ms, cost_estimate=cost_estimate)
+            _finalize_call(reservation, success=resp.ok, response_ms=elapsed_ms, cost_estimate=cost_estimate)
             return resp
         except Exception:
             elapsed_ms = int((time.monotonic() - t0) * 1000)
-            _finalize_call(entry_pk, success=False, response_ms=elapsed_ms)
+            _finalize_call(reservation, success=False, response_ms=elapsed_ms)
             raise
 
 
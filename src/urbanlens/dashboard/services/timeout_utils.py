@@ -6,18 +6,26 @@ an upstream API can still keep a request handler blocked far longer than any
 single per-call timeout would suggest. ``call_with_deadline`` runs the call
 in a worker thread and gives up waiting after a fixed wall-clock budget, so
 a view can never be held hostage by one slow provider.
+
+``fan_out`` is the multi-provider counterpart: it runs a chain of provider
+calls concurrently on a bounded pool, gives each its own deadline, and hands
+the outcomes back in chain order, so a panel backed by several upstreams
+waits for its slowest provider instead of the sum of all of them.
 """
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from dataclasses import dataclass
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from django.db import close_old_connections
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +46,16 @@ EXTERNAL_CALL_DEADLINE: float = 20.0
 # call occupies its slot until the underlying network call completes or errors.
 _EXECUTOR = ThreadPoolExecutor(max_workers=64, thread_name_prefix="ext-api-deadline")
 
+#: Most calls one ``fan_out`` keeps in flight at once. Provider chains are a
+#: handful of entries today; the cap keeps a long plugin-contributed chain
+#: from claiming the whole pool for itself.
+FAN_OUT_MAX_PARALLEL = 8
+
+# Separate from _EXECUTOR on purpose: the request path runs whole collectors
+# under call_with_deadline, and a collector that fanned out onto the same pool
+# could wait on slots its own callers are holding.
+_FAN_OUT_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="ext-api-fan-out")
+
 
 def call_with_deadline[T](func: Callable[[], T], *, timeout: float, default: T, name: str | None = None) -> T:
     """Run ``func`` with a hard wall-clock deadline, returning ``default`` only on timeout.
@@ -89,3 +107,91 @@ def call_with_deadline[T](func: Callable[[], T], *, timeout: float, default: T,
         else:
             logger.warning("External call %r exceeded %.0fs deadline -- abandoning it in the background", label, timeout)
         return default
+
+
+@dataclass(frozen=True, slots=True)
+class FanOutResult[T]:
+    """Outcome of one call inside a ``fan_out`` run.
+
+    Attributes:
+        name: The label the call was submitted under (e.g. a service key).
+        value: What the call returned; None when it raised or timed out.
+        error: The exception the call raised, if any.
+        timed_out: True when the call missed its deadline (or never started
+            before the fan-out was abandoned).
+    """
+
+    name: str
+    value: T | None = None
+    error: BaseException | None = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True when the call returned normally."""
+        return self.error is None and not self.timed_out
+
+
+def _run_closing_connections[T](func: Callable[[], T]) -> T:
+    """Run ``func`` on a pool thread, releasing any DB connection it opened."""
+    try:
+        return func()
+    finally:
+        # Same reasoning as call_with_deadline: pool threads outlive the call.
+        close_old_connections()
+
+
+def fan_out[T](calls: Sequence[tuple[str, Callable[[], T]]], *, timeout: float, max_parallel: int = FAN_OUT_MAX_PARALLEL) -> list[FanOutResult[T]]:
+    """Run independent calls concurrently, each under its own deadline.
+
+    At most ``max_parallel`` calls are in flight at once; the rest start as
+    earlier ones finish. Each call's ``timeout`` is counted from when it was
+    handed to the pool. A call that misses it is cancelled if it is still
+    queued, or abandoned in the background if it is already running (Python
+    cannot interrupt a blocked thread), and reported as ``timed_out``. If the
+    caller itself is interrupted - a Celery soft time limit, say - calls that
+    have not started yet are never started.
+
+    Unlike ``call_with_deadline``, exceptions are captured rather than
+    propagated, since one provider failing must not discard the others'
+    results; inspect ``error`` on each outcome.
+
+    Args:
+        calls: ``(name, zero-argument callable)`` pairs, in the order the
+            results should come back.
+        timeout: Seconds each call may take.
+        max_parallel: Most calls from this fan-out running at once.
+
+    Returns:
+        One ``FanOutResult`` per call, in the order of ``calls``.
+    """
+    outcomes: dict[int, FanOutResult[T]] = {}
+    queued = deque(enumerate(calls))
+    running: dict[Future[T], tuple[int, str, float]] = {}
+    try:
+        while queued or running:
+            while queued and len(running) < max_parallel:
+                index, (name, func) = queued.popleft()
+                running[_FAN_OUT_EXECUTOR.submit(_run_closing_connections, func)] = (index, name, time.monotonic() + timeout)
+
+            next_deadline = min(deadline for _, _, deadline in running.values())
+            wait(running, timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+
+            now = time.monotonic()
+            for future, (index, name, deadline) in list(running.items()):
+                if future.done():
+                    del running[future]
+                    error = future.exception()
+                    outcomes[index] = FanOutResult(name, error=error) if error is not None else FanOutResult(name, value=future.result())
+                elif deadline <= now:
+                    del running[future]
+                    if future.cancel():
+                        logger.warning("Fan-out call %r timed out after %.0fs without ever starting -- fan-out executor saturated", name, timeout)
+                    else:
+                        logger.warning("Fan-out call %r exceeded %.0fs deadline -- abandoning it in the background", name, timeout)
+                    outcomes[index] = FanOutResult(name, timed_out=True)
+    finally:
+        for future in running:
+            future.cancel()
+
+    return [outcomes[index] for index in range(len(calls))]
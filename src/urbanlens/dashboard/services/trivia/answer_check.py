@@ -69,7 +69,7 @@ def is_answer_equivalent(raw_answer: str, accepted_answer: str, *, profile: Prof
         log_api_call("trivia_answer_check", success=False)
         return False
     elapsed_ms = int((time.monotonic() - started) * 1000)
-    log_api_call("trivia_answer_check", success=raw is not None, response_ms=elapsed_ms, endpoint=gateway.model, cost_estimate=gateway.cost)
+    log_api_call("trivia_answer_check", success=raw is not None, response_ms=elapsed_ms, endpoint=gateway.model, cost_estimate=gateway.cost, was_cached=gateway.served_from_cache)
 
     if raw is None:
         logger.info("Trivia answer-check got no response from the AI gateway; treating as no match")
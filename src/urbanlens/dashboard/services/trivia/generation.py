@@ -7,14 +7,16 @@ request, this background generator needs no additional profile-scoping
 before reading a wiki's article text.
 
 Generated questions are classified by the exact same
-``services.trivia.classifier`` used for user submissions before ever being
-persisted - a rejected candidate was never shown to anyone, so (unlike a
-user's own rejected submission) there is no "show it back to the author
-very rarely" leniency to apply here; it is simply discarded.
+``services.trivia.classifier`` rules used for user submissions before ever
+being persisted, all of one wiki's candidates in a single batched call. A
+rejected candidate was never shown to anyone, so (unlike a user's own
+rejected submission) there is no "show it back to the author very rarely"
+leniency to apply here; it is simply discarded.
 """
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import TYPE_CHECKING
 
@@ -23,7 +25,8 @@ from django.db.models.functions import Length
 from urbanlens.dashboard.models.trivia.model import TriviaQuestion, TriviaQuestionSource, TriviaQuestionStatus
 from urbanlens.dashboard.services.ai.factory import get_gateway
 from urbanlens.dashboard.services.ai.scanner import wrap_user_data
-from urbanlens.dashboard.services.trivia.classifier import classify_trivia_question
+from urbanlens.dashboard.services.timeout_utils import fan_out
+from urbanlens.dashboard.services.trivia.classifier import classify_trivia_questions
 
 if TYPE_CHECKING:
     from urbanlens.dashboard.models.wiki.model import Wiki
@@ -41,6 +44,15 @@ MAX_QUESTIONS_PER_WIKI = 3
 #: single scheduled run can't spend unbounded AI tokens.
 DEFAULT_SWEEP_BATCH_SIZE = 25
 
+#: Wikis one sweep drafts at once, keyed by ``SiteSettings.ai_provider`` -
+#: each generated wiki costs two model calls (generation, then one batched
+#: classification), so this bounds a sweep's in-flight requests per provider.
+PROVIDER_CONCURRENCY: dict[str, int] = {"openai": 6, "anthropic": 4, "cloudflare": 3}
+DEFAULT_PROVIDER_CONCURRENCY = 2
+
+#: Longest one wiki's generation + classification may take in a sweep.
+WIKI_DRAFT_DEADLINE_SECONDS = 180
+
 #: Separator between a generated question and its answer within one ANSWER
 #: tag - deliberately unlikely to appear in ordinary prose.
 _PAIR_SEPARATOR = "|||"
@@ -77,7 +89,21 @@ def generate_questions_for_wiki(wiki: Wiki) -> list[TriviaQuestion]:
         return []
     if not wiki.description or len(wiki.description) < MIN_DESCRIPTION_LENGTH:
         return []
+    return _persist_questions(wiki, _draft_questions(wiki))
+
+
+def _draft_questions(wiki: Wiki) -> list[tuple[str, str]]:
+    """Generate one wiki's candidate pairs and keep those the classifier approves.
+
+    Only model calls happen here - no database writes beyond the API call
+    log - so the sweep can run it for several wikis at once.
 
+    Args:
+        wiki: The wiki to mine, already checked for eligibility.
+
+    Returns:
+        Approved ``(question, answer)`` pairs, in the order generated.
+    """
     gateway = get_gateway("trivia_generation", instructions=_INSTRUCTIONS)
     if gateway is None:
         return []
@@ -92,37 +118,55 @@ def generate_questions_for_wiki(wiki: Wiki) -> list[TriviaQuestion]:
         logger.exception("Trivia generation call failed unexpectedly for wiki %s; skipping", wiki.pk)
         return []
 
-    created: list[TriviaQuestion] = []
+    pairs: list[tuple[str, str]] = []
     for raw_pair in raw_pairs:
         if _PAIR_SEPARATOR not in raw_pair:
             logger.warning("Trivia generation returned a pair with no separator; discarding: %r", raw_pair)
             continue
         question_text, _, answer_text = raw_pair.partition(_PAIR_SEPARATOR)
         question_text, answer_text = question_text.strip(), answer_text.strip()
-        if not question_text or not answer_text:
-            continue
-
-        verdict = classify_trivia_question(question_text, answer_text, wiki.location)
-        if not verdict.approved:
+        if question_text and answer_text:
+            pairs.append((question_text, answer_text))
+
+    approved: list[tuple[str, str]] = []
+    for (question_text, answer_text), verdict in zip(pairs, classify_trivia_questions(pairs, wiki.location), strict=True):
+        if verdict.approved:
+            approved.append((question_text, answer_text))
+        else:
             logger.info("AI-generated trivia question rejected (%s): %r", verdict.reason, question_text)
-            continue
-
-        created.append(
-            TriviaQuestion.objects.create(
-                location=wiki.location,
-                prompt=question_text[:500],
-                answer=answer_text[:255],
-                source=TriviaQuestionSource.AI_GENERATED,
-                status=TriviaQuestionStatus.APPROVED,
-            ),
+    return approved
+
+
+def _persist_questions(wiki: Wiki, pairs: list[tuple[str, str]]) -> list[TriviaQuestion]:
+    """Save approved pairs as APPROVED, AI_GENERATED questions for the wiki's location."""
+    return [
+        TriviaQuestion.objects.create(
+            location=wiki.location,
+            prompt=question_text[:500],
+            answer=answer_text[:255],
+            source=TriviaQuestionSource.AI_GENERATED,
+            status=TriviaQuestionStatus.APPROVED,
         )
-    return created
+        for question_text, answer_text in pairs
+    ]
+
+
+def generation_concurrency() -> int:
+    """How many wikis a sweep drafts at once, for the site's configured AI provider."""
+    from urbanlens.dashboard.models.site_settings import SiteSettings
+
+    return PROVIDER_CONCURRENCY.get(SiteSettings.get_current().ai_provider, DEFAULT_PROVIDER_CONCURRENCY)
 
 
 def sweep_wikis_for_generation(*, batch_size: int = DEFAULT_SWEEP_BATCH_SIZE) -> dict[str, int]:
     """Generate AI trivia questions for a bounded batch of not-yet-processed wikis.
 
     Called from a scheduled Celery task (``tasks.run_scheduled_trivia_generation``).
+    Wikis are drafted concurrently, at most ``generation_concurrency()`` at
+    a time; their approved questions are saved on the calling thread once
+    every draft is back. A wiki whose drafting crashes or
+    overruns ``WIKI_DRAFT_DEADLINE_SECONDS`` is skipped; the next sweep
+    picks it up again.
 
     Args:
         batch_size: Maximum number of wikis to consider in this run.
@@ -133,18 +177,28 @@ def sweep_wikis_for_generation(*, batch_size: int = DEFAULT_SWEEP_BATCH_SIZE) ->
     from urbanlens.dashboard.models.wiki.model import Wiki
 
     already_generated_location_ids = TriviaQuestion.objects.filter(source=TriviaQuestionSource.AI_GENERATED).values_list("location_id", flat=True)
-    candidates = (
+    candidates = list(
         Wiki.objects.exclude(location_id__in=already_generated_location_ids)
         .exclude(description__isnull=True)
         .annotate(description_length=Length("description"))
         .filter(description_length__gte=MIN_DESCRIPTION_LENGTH)
         .select_related("location")
-        .order_by("pk")[:batch_size]
+        .order_by("pk")[:batch_size],
     )
+    if not candidates:
+        return {"wikis_considered": 0, "questions_created": 0}
 
-    wikis_considered = 0
+    outcomes = fan_out(
+        [(str(wiki.pk), partial(_draft_questions, wiki)) for wiki in candidates],
+        timeout=WIKI_DRAFT_DEADLINE_SECONDS,
+        max_parallel=generation_concurrency(),
+    )
     questions_created = 0
-    for wiki in candidates:
-        wikis_considered += 1
-        questions_created += len(generate_questions_for_wiki(wiki))
-    return {"wikis_considered": wikis_considered, "questions_created": questions_created}
+    for wiki, outcome in zip(candidates, outcomes, strict=True):
+        if outcome.ok:
+            questions_created += len(_persist_questions(wiki, outcome.value))
+        elif outcome.timed_out:
+            logger.warning("Trivia generation for wiki %s overran %ss; skipping until the next sweep", wiki.pk, WIKI_DRAFT_DEADLINE_SECONDS)
+        else:
+            logger.error("Trivia generation for wiki %s crashed; skipping", wiki.pk, exc_info=outcome.error)
+    return {"wikis_considered": len(candidates), "questions_created": questions_created}
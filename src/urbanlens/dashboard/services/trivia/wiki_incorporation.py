@@ -112,6 +112,7 @@ def _draft_paragraph(*, place_name: str, prompt: str, answer: str, existing_arti
         response_ms=elapsed_ms,
         endpoint=gateway.model,
         cost_estimate=gateway.cost,
+        was_cached=gateway.served_from_cache,
     )
     return answer_text
 
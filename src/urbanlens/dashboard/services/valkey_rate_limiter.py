@@ -0,0 +1,319 @@
+"""Valkey-backed rate limit counters for external API calls.
+
+The database limiter in ``services.rate_limiter`` locks the service's
+``ApiRateLimit`` row and runs up to three ``COUNT(*)`` queries over
+``ApiCallLog`` before every outbound request. When Valkey is configured,
+``_reserve_call`` uses :class:`ValkeyRateLimiter` instead: one Lua script
+checks and increments every window atomically, so a reservation costs a
+single round trip and concurrent callers never race.
+
+Each window is a hash of per-bucket call counts - one-second buckets for the
+per-minute limit, the UTC calendar day for the daily limit, and one-hour
+buckets for the 30-day limit. Buckets are always rounded outwards, so the
+Valkey windows are never shorter than the database ones they replace. A
+window hash that doesn't exist yet (first use, or expired after a long idle
+spell) is seeded from ``ApiCallLog`` before the script runs again, so
+switching backends never resets a monthly quota.
+
+``ApiCallLog`` rows are no longer written inline on this path. Each finished
+or blocked call is pushed onto an audit list, and the
+``flush_api_call_audit_log`` beat task drains it into the table in batches.
+Cost reports and the database fallback lag by at most one flush interval.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import json
+import os
+from typing import TYPE_CHECKING, Any
+import uuid
+
+from django.db import transaction
+import redis
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+AUDIT_LOG_KEY = "ul:rate-limit:audit"
+FLUSH_LOCK_KEY = "ul:rate-limit:audit:flush-lock"
+# Refreshed after every batch, so it only has to outlast one insert.
+_FLUSH_LOCK_SECONDS = 120
+
+# Compare-and-delete / compare-and-expire on the flush lock, so a flush whose
+# lock already expired can't release or extend the next holder's.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+_EXTEND_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1..3]: window hashes (minute, day, 30 days); KEYS[4]: the audit list.
+# ARGV: limit, current bucket, oldest counted bucket and TTL for each window
+# (limit -1 means "not configured"), then the audit record for a blocked call.
+# Returns {0, 0} when the call was reserved, {-1, window} when a configured
+# window still has to be seeded, or {window, count} when a limit was hit.
+_RESERVE_SCRIPT = """
+for i = 1, 3 do
+    if tonumber(ARGV[(i - 1) * 4 + 1]) >= 0 and redis.call('EXISTS', KEYS[i]) == 0 then
+        return {-1, i}
+    end
+end
+for i = 1, 3 do
+    local base = (i - 1) * 4
+    local limit = tonumber(ARGV[base + 1])
+    if limit >= 0 then
+        local oldest = tonumber(ARGV[base + 3])
+        local fields = redis.call('HGETALL', KEYS[i])
+        local total = 0
+        for j = 1, #fields, 2 do
+            local bucket = tonumber(fields[j])
+            if bucket then
+                if bucket < oldest then
+                    redis.call('HDEL', KEYS[i], fields[j])
+                else
+                    total = total + tonumber(fields[j + 1])
+                end
+            end
+        end
+        if total >= limit then
+            redis.call('RPUSH', KEYS[4], ARGV[13])
+            return {i, total}
+        end
+    end
+end
+for i = 1, 3 do
+    local base = (i - 1) * 4
+    if tonumber(ARGV[base + 1]) >= 0 then
+        redis.call('HINCRBY', KEYS[i], ARGV[base + 2], 1)
+        redis.call('EXPIRE', KEYS[i], ARGV[base + 4])
+    end
+end
+return {0, 0}
+"""
+
+# Marker field that keeps a seeded-but-empty window hash in existence. It
+# isn't numeric, so the script skips it when summing buckets.
+_SEEDED_FIELD = "seeded"
+
+
+@dataclass(frozen=True, slots=True)
+class _Window:
+    """One rate-limit window's bucketing."""
+
+    name: str
+    #: Human label used in the rate-limit warning.
+    label: str
+    ttl_seconds: int
+
+
+_WINDOWS = (
+    _Window("minute", "in last minute", 2 * 60),
+    _Window("day", "today", 2 * 24 * 60 * 60),
+    _Window("30d", "in the last 30 days", 31 * 24 * 60 * 60),
+)
+
+
+def _buckets(now: datetime) -> tuple[tuple[int, int], ...]:
+    """The current and oldest counted bucket of each window at ``now``."""
+    second = int(now.timestamp())
+    hour = second // 3600
+    day = now.date().toordinal()
+    return ((second, second - 60), (day, day), (hour, hour - 720))
+
+
+def audit_record(
+    service: str,
+    *,
+    endpoint: str = "",
+    created: datetime | None = None,
+    success: bool = True,
+    response_ms: int | None = None,
+    was_rate_limited: bool = False,
+    was_service_disabled: bool = False,
+    cost_estimate: Decimal | None = None,
+) -> str:
+    """Serialize one call for the audit list.
+
+    Args:
+        service: The service key.
+        endpoint: URL or endpoint path called (already truncated).
+        created: When the call was made; defaults to now.
+        success: Whether the call succeeded.
+        response_ms: Round-trip time in milliseconds.
+        was_rate_limited: True if the call was blocked by rate limiting.
+        was_service_disabled: True if the service was disabled.
+        cost_estimate: Estimated USD cost of the call, if known.
+
+    Returns:
+        The JSON record ``flush_audit_log`` turns back into an ``ApiCallLog`` row.
+    """
+    return json.dumps(
+        {
+            "service": service,
+            "endpoint": endpoint,
+            "created": (created or datetime.now(UTC)).isoformat(),
+            "success": success,
+            "response_ms": response_ms,
+            "was_rate_limited": was_rate_limited,
+            "was_service_disabled": was_service_disabled,
+            "cost_estimate": str(cost_estimate) if cost_estimate is not None else None,
+        }
+    )
+
+
+class ValkeyRateLimiter:
+    """Atomic sliding-window counters and the buffered call audit list."""
+
+    def __init__(self, client: redis.Redis) -> None:
+        self.client = client
+        self._reserve = client.register_script(_RESERVE_SCRIPT)
+        self._release_lock = client.register_script(_RELEASE_LOCK_SCRIPT)
+        self._extend_lock = client.register_script(_EXTEND_LOCK_SCRIPT)
+
+    @classmethod
+    def from_env(cls) -> ValkeyRateLimiter | None:
+        """The shared limiter for this process, or None when Valkey isn't configured."""
+        global _shared  # noqa: PLW0603 - one connection pool per process
+        url = os.getenv("UL_VALKEY_URL") or os.getenv("UL_REDIS_URL")
+        if not url:
+            return None
+        if _shared is None:
+            _shared = cls(redis.Redis.from_url(url, decode_responses=True, socket_connect_timeout=1, socket_timeout=2))
+        return _shared
+
+    @staticmethod
+    def window_key(service: str, window: str) -> str:
+        return f"ul:rate-limit:{service}:{window}"
+
+    def reserve(self, service: str, config: Any, *, endpoint: str = "") -> tuple[str, int, int] | None:
+        """Count one call to ``service`` against every configured window.
+
+        Args:
+            service: The service key.
+            config: The service's ``ApiRateLimit`` row.
+            endpoint: URL or endpoint path, recorded if the call is blocked.
+
+        Returns:
+            None when the call was reserved, else ``(window label, count,
+            limit)`` for the window that blocked it. Blocked calls are already
+            on the audit list.
+        """
+        limits = (config.calls_per_minute, config.calls_per_day, config.calls_per_30_days)
+        now = datetime.now(UTC)
+        keys = [self.window_key(service, window.name) for window in _WINDOWS]
+        args: list[Any] = []
+        for limit, (bucket, oldest), window in zip(limits, _buckets(now), _WINDOWS, strict=True):
+            args.extend((-1 if limit is None else limit, bucket, oldest, window.ttl_seconds))
+        args.append(audit_record(service, endpoint=endpoint, created=now, success=False, was_rate_limited=True))
+
+        # One retry is enough: the seed creates every missing window.
+        for _ in range(2):
+            window_index, count = self._reserve(keys=[*keys, AUDIT_LOG_KEY], args=args)
+            if window_index == 0:
+                return None
+            if window_index > 0:
+                return _WINDOWS[window_index - 1].label, count, limits[window_index - 1]
+            self._seed(service, now)
+        msg = f"Rate limit windows for {service} could not be seeded"
+        raise RuntimeError(msg)
+
+    def record(self, *records: str) -> None:
+        """Append finished calls to the audit list."""
+        if records:
+            self.client.rpush(AUDIT_LOG_KEY, *records)
+
+    def flush_audit_log(self, batch_size: int = 1000) -> int:
+        """Move buffered audit records into ``ApiCallLog``.
+
+        One flush runs at a time, under ``FLUSH_LOCK_KEY``; a flush that
+        finds the lock held writes nothing. Each batch is inserted in its own
+        transaction and trimmed from the list only after that commits, so a
+        failed insert leaves the batch for the next flush and a concurrent
+        flush can never insert it twice. Only a crash between the commit and
+        the trim can repeat a batch. Run outside any enclosing transaction
+        (as the beat task does), or the trim would precede the real commit.
+
+        Args:
+            batch_size: Records inserted per ``bulk_create``.
+
+        Returns:
+            Number of rows written.
+        """
+        from urbanlens.dashboard.models.api_call_log import ApiCallLog
+
+        token = uuid.uuid4().hex
+        if not self.client.set(FLUSH_LOCK_KEY, token, nx=True, ex=_FLUSH_LOCK_SECONDS):
+            return 0
+        written = 0
+        try:
+            while records := self.client.lrange(AUDIT_LOG_KEY, 0, batch_size - 1):
+                fields = [json.loads(record) for record in records]
+                created = [datetime.fromisoformat(entry.pop("created")) for entry in fields]
+                with transaction.atomic():
+                    rows = ApiCallLog.objects.bulk_create([ApiCallLog(**entry) for entry in fields])
+                    # created is auto_now_add, which bulk_create overwrites with
+                    # the flush time; bulk_update writes the real call times back.
+                    for row, call_time in zip(rows, created, strict=True):
+                        row.created = call_time
+                    ApiCallLog.objects.bulk_update(rows, ["created"], batch_size=batch_size)
+                # Producers only RPUSH and no other flush holds the lock, so
+                # the head of the list is still exactly this batch.
+                self.client.ltrim(AUDIT_LOG_KEY, len(records), -1)
+                written += len(records)
+                if not self._extend_lock(keys=[FLUSH_LOCK_KEY], args=[token, _FLUSH_LOCK_SECONDS]):
+                    break
+        finally:
+            self._release_lock(keys=[FLUSH_LOCK_KEY], args=[token])
+        return written
+
+    def _seed(self, service: str, now: datetime) -> None:
+        """Create the missing window hashes from the calls already in ``ApiCallLog``.
+
+        Blocked and disabled attempts are left out, since this backend never
+        counts them either.
+        """
+        from django.db.models import Count
+        from django.db.models.functions import TruncHour
+
+        from urbanlens.dashboard.models.api_call_log import ApiCallLog
+
+        keys = [self.window_key(service, window.name) for window in _WINDOWS]
+        with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.exists(key)
+            missing = [bool(not exists) for exists in pipe.execute()]
+
+        calls = ApiCallLog.objects.for_service(service).filter(was_geo_filtered=False, was_rate_limited=False, was_service_disabled=False, was_cached=False)
+        counts: list[dict[str, int]] = [{}, {}, {}]
+        if missing[0]:
+            for created in calls.since(timedelta(seconds=61)).values_list("created", flat=True):
+                bucket = str(int(created.timestamp()))
+                counts[0][bucket] = counts[0].get(bucket, 0) + 1
+        if missing[1]:
+            counts[1] = {str(now.date().toordinal()): calls.today().count()}
+        if missing[2]:
+            hourly = calls.since(timedelta(days=30, hours=1)).annotate(hour=TruncHour("created")).values("hour").annotate(calls=Count("id"))
+            counts[2] = {str(int(row["hour"].timestamp()) // 3600): row["calls"] for row in hourly}
+
+        with self.client.pipeline() as pipe:
+            for window, key, is_missing, window_counts in zip(_WINDOWS, keys, missing, counts, strict=True):
+                if not is_missing:
+                    continue
+                # HSETNX leaves buckets alone if a concurrent caller seeded this window first.
+                pipe.hsetnx(key, _SEEDED_FIELD, 1)
+                for bucket, calls_in_bucket in window_counts.items():
+                    pipe.hsetnx(key, bucket, calls_in_bucket)
+                pipe.expire(key, window.ttl_seconds)
+            pipe.execute()
+
+
+_shared: ValkeyRateLimiter | None = None
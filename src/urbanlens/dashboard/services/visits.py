@@ -610,7 +610,8 @@ def _pin_contains_point(pin: Pin, point: GEOSPoint) -> bool:
 
     from urbanlens.dashboard.models.boundary.model import Boundary, BoundaryType
 
-    polygon = Boundary.objects.effective_polygon_for_pin(pin, BoundaryType.PROPERTY)
+    # Reads a root pin's materialized footprint when it has one.
+    polygon = Boundary.objects.effective_polygons_by_pin_id([pin], BoundaryType.PROPERTY).get(pin.pk)
     if polygon is not None:
         return bool(polygon.contains(point))
     return Pin.objects.filter(pk=pin.pk, location__point__distance_lte=(point, D(m=50))).exists()
@@ -634,8 +635,14 @@ def find_pin_containing_point(profile: Profile, point: GEOSPoint, *, pins: Itera
     Returns:
         The first matching Pin, or None.
     """
-    candidates = pins if pins is not None else Pin.objects.filter(profile=profile).root_pins().select_related("location")
-    for pin in candidates:
+    if pins is None:
+        root_pins = Pin.objects.filter(profile=profile).root_pins()
+        if (pin := root_pins.containing_point(point).select_related("location").first()) is not None:
+            return pin
+        # Pins with no footprint polygon (none materialized yet, or a null one)
+        # are resolved one by one, keeping the 50 m fallback.
+        pins = root_pins.without_footprint_polygon().select_related("location")
+    for pin in pins:
         if _pin_contains_point(pin, point):
             return pin
     return None
@@ -668,16 +675,20 @@ def record_geolocation_pin_visits(profile: Profile, *, latitude: float | Decimal
 
     timestamp = visited_at or timezone.now()
     point = Point(float(longitude), float(latitude), srid=4326)
-    # Pre-filter with an indexed PostGIS distance query before running the
-    # per-pin boundary-containment loop below - without this, a profile with
-    # many pins (e.g. after a bulk import) forces an unbounded, unbatched
-    # boundary-resolution chain over every single root pin on every geolocation
-    # ping, which was blowing well past nginx's 60s upstream timeout in
-    # production. 5km is a deliberately generous upper bound on any real
-    # property boundary's size, so this can only ever exclude pins that
-    # couldn't possibly contain the point anyway - it doesn't change which
-    # pins end up matching, just how many are checked.
-    pins = Pin.objects.filter(profile=profile).near_point(point, radius_km=5).select_related("location")
+    profile_pins = Pin.objects.filter(profile=profile)
+    # Materialized footprints answer containment in one indexed query.
+    pins = list(profile_pins.root_pins().containing_point(point).select_related("location"))
+    # Pins without a footprint polygon (none materialized yet, or a null one)
+    # still run the per-pin boundary chain and its 50 m fallback, so
+    # pre-filter them with an indexed PostGIS distance query first - without
+    # this, a profile with many pins (e.g. after a bulk import) forces an
+    # unbounded, unbatched boundary-resolution chain over every single root
+    # pin on every geolocation ping, which was blowing well past nginx's 60s
+    # upstream timeout in production. 5km is a deliberately generous upper
+    # bound on any real property boundary's size, so this can only ever
+    # exclude pins that couldn't possibly contain the point anyway.
+    unmaterialized = profile_pins.without_footprint_polygon().near_point(point, radius_km=5).select_related("location")
+    pins.extend(pin for pin in unmaterialized if _pin_contains_point(pin, point))
     created_visits: list[PinVisit] = []
 
     already_visited_today = set(
@@ -687,8 +698,6 @@ def record_geolocation_pin_visits(profile: Profile, *, latitude: float | Decimal
     for pin in pins:
         if pin.pk in already_visited_today:
             continue
-        if not _pin_contains_point(pin, point):
-            continue
 
         visit = PinVisit.objects.create(pin=pin, visited_at=timestamp, source=VisitSource.GEOLOCATION)
         sync_last_visited(pin)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import TYPE_CHECKING
 
@@ -534,90 +535,79 @@ class _UploadProcessResult:
 def _process_photo_upload(image: Image, image_id: int, strip_location: bool) -> _UploadProcessResult | None:
     """Photo-specific metadata extraction and downscaling.
 
+    The stored file is read from storage exactly once: the checksum is taken
+    while spooling it, every metadata field comes from one header parse
+    (``read_image_metadata``), and the downscale re-encodes from the same
+    spool.
+
     Returns None on unrecoverable read failure (the caller treats that as a
     failed task run).
     """
     from decimal import Decimal
 
-    from urbanlens.dashboard.services.images import (
-        compute_checksum,
-        downscale_stored_image,
-        extract_author,
-        extract_caption_from_metadata,
-        extract_copyright_notice,
-        extract_exif_data,
-        extract_gps_coords,
-        extract_gps_direction,
-        extract_source_url,
-        extract_taken_at,
-        is_camera_generated_filename,
-    )
+    from urbanlens.dashboard.services.images import downscale_stored_image, is_camera_generated_filename, read_image_metadata, spooled_stored_file
     from urbanlens.dashboard.services.storage import get_downscale_policy
 
-    try:
-        with image.image.open("rb") as image_file:
-            coords = None if strip_location else extract_gps_coords(image_file)
-            # Same GPS-IFD-derived, same privacy opt-out as coords above - the
-            # compass bearing is only ever meaningful alongside a location.
-            direction = None if strip_location else extract_gps_direction(image_file)
-            taken_at = extract_taken_at(image_file)
-            checksum = compute_checksum(image_file) if not image.checksum else None
-            exif_data = extract_exif_data(image_file) if image.exif_data is None else None
-            author = extract_author(image_file) if not image.author else None
-            copyright_notice = extract_copyright_notice(image_file) if not image.copyright else None
-            metadata_caption = extract_caption_from_metadata(image_file) if not image.caption else None
-            source_url = extract_source_url(image_file) if not image.source_url else None
-    except (OSError, ValueError) as exc:
-        logger.warning("Image metadata extraction failed for image %s: %s", image_id, exc, exc_info=True)
-        return None
-
-    if strip_location and exif_data:
-        exif_data.pop("GPSInfo", None)
-
-    update_fields: dict[str, object] = {}
-    if direction is not None:
-        image.direction = Decimal(str(round(direction, 2)))
-        update_fields["direction"] = image.direction
-    if taken_at:
-        image.taken_at = taken_at
-        update_fields["taken_at"] = taken_at
-    if checksum:
-        image.checksum = checksum
-        update_fields["checksum"] = checksum
-    if exif_data:
-        image.exif_data = exif_data
-        update_fields["exif_data"] = exif_data
-    if author:
-        image.author = author
-        update_fields["author"] = author
-    if copyright_notice:
-        image.copyright = copyright_notice
-        update_fields["copyright"] = copyright_notice
-    if metadata_caption:
-        image.caption = metadata_caption
-        update_fields["caption"] = metadata_caption
-    if source_url:
-        image.source_url = source_url
-        update_fields["source_url"] = source_url
-
-    if image.profile is not None and not (image.author or image.source_url or image.caption or image.copyright) and is_camera_generated_filename(image.image.name or ""):
-        uploader_name = image.profile.full_name or image.profile.username
-        if uploader_name:
-            image.author = uploader_name
-            update_fields["author"] = uploader_name
-
-    new_stored_size: int | None = None
-    if image.profile is not None:
-        max_dimension, convert_webp = get_downscale_policy(image.profile)
-        if max_dimension is not None or convert_webp or strip_location:
-            try:
-                new_size = downscale_stored_image(image, max_dimension, convert_webp, strip_gps=strip_location)
-            except (OSError, ValueError) as exc:
-                logger.warning("Downscaling failed for image %s: %s", image_id, exc, exc_info=True)
-            else:
-                if new_size is not None:
-                    update_fields["image"] = image.image.name
-                    new_stored_size = new_size
+    with contextlib.ExitStack() as stack:
+        try:
+            photo, checksum = stack.enter_context(spooled_stored_file(image.image))
+        except (OSError, ValueError) as exc:
+            logger.warning("Image metadata extraction failed for image %s: %s", image_id, exc, exc_info=True)
+            return None
+        metadata = read_image_metadata(photo)
+
+        # The compass bearing is GPS-IFD-derived too, so it shares the
+        # location privacy opt-out - it's only meaningful alongside a location.
+        coords = None if strip_location else metadata.gps_coords
+        direction = None if strip_location else metadata.gps_direction
+        exif_data = metadata.exif_data if image.exif_data is None else None
+        if strip_location and exif_data:
+            exif_data.pop("GPSInfo", None)
+
+        update_fields: dict[str, object] = {}
+        if direction is not None:
+            image.direction = Decimal(str(round(direction, 2)))
+            update_fields["direction"] = image.direction
+        if metadata.taken_at:
+            image.taken_at = metadata.taken_at
+            update_fields["taken_at"] = metadata.taken_at
+        if not image.checksum:
+            image.checksum = checksum
+            update_fields["checksum"] = checksum
+        if exif_data:
+            image.exif_data = exif_data
+            update_fields["exif_data"] = exif_data
+        if metadata.author and not image.author:
+            image.author = metadata.author
+            update_fields["author"] = metadata.author
+        if metadata.copyright_notice and not image.copyright:
+            image.copyright = metadata.copyright_notice
+            update_fields["copyright"] = metadata.copyright_notice
+        if metadata.caption and not image.caption:
+            image.caption = metadata.caption
+            update_fields["caption"] = metadata.caption
+        if metadata.source_url and not image.source_url:
+            image.source_url = metadata.source_url
+            update_fields["source_url"] = metadata.source_url
+
+        if image.profile is not None and not (image.author or image.source_url or image.caption or image.copyright) and is_camera_generated_filename(image.image.name or ""):
+            uploader_name = image.profile.full_name or image.profile.username
+            if uploader_name:
+                image.author = uploader_name
+                update_fields["author"] = uploader_name
+
+        new_stored_size: int | None = None
+        if image.profile is not None:
+            max_dimension, convert_webp = get_downscale_policy(image.profile)
+            if max_dimension is not None or convert_webp or strip_location:
+                try:
+                    new_size = downscale_stored_image(image, max_dimension, convert_webp, strip_gps=strip_location, source=photo)
+                except (OSError, ValueError) as exc:
+                    logger.warning("Downscaling failed for image %s: %s", image_id, exc, exc_info=True)
+                else:
+                    if new_size is not None:
+                        update_fields["image"] = image.image.name
+                        new_stored_size = new_size
 
     return _UploadProcessResult(update_fields, coords, new_stored_size)
 
@@ -936,7 +926,11 @@ def import_immich_photos(self, pin_id: int, profile_id: int, asset_ids: list[str
     image, and enqueues ``process_image_upload`` for each so EXIF/downscale
     post-processing matches every other upload path. An asset already
     imported to this pin, or one that would exceed the uploader's storage
-    quota, is skipped rather than failing the whole batch.
+    quota, is skipped rather than failing the whole batch. Assets are
+    downloaded concurrently and inserted a chunk at a time (see
+    ``services.photo_import_pipeline``), and a retried or redelivered run
+    skips the assets an earlier run already imported without re-downloading
+    them.
 
     Args:
         pin_id: PK of the pin to import onto.
@@ -954,76 +948,38 @@ def import_immich_photos(self, pin_id: int, profile_id: int, asset_ids: list[str
     Returns:
         Counts of imported/skipped/failed assets, surfaced to the polling UI.
     """
-    import io
-
-    from django.core.files.base import ContentFile
-
-    from urbanlens.dashboard.models.images.model import Image
     from urbanlens.dashboard.models.immich.model import ImmichAccount
     from urbanlens.dashboard.models.pin.model import Pin
     from urbanlens.dashboard.models.profile.model import Profile
     from urbanlens.dashboard.models.visits.model import PinVisit
     from urbanlens.dashboard.services.apis.immich import ImmichGateway
-    from urbanlens.dashboard.services.celery import safely_enqueue_task
-    from urbanlens.dashboard.services.gateway import GatewayRequestError
-    from urbanlens.dashboard.services.images import compute_checksum
-    from urbanlens.dashboard.services.memories.photos import log_visit_on_pin
-    from urbanlens.dashboard.services.storage import quota_error_for_upload
+    from urbanlens.dashboard.services.photo_import_pipeline import ImportAsset, run_photo_import
 
-    counts = {"imported": 0, "skipped": 0, "failed": 0}
     pin = Pin.objects.select_related("location", "profile").filter(pk=pin_id).first()
     profile = Profile.objects.filter(pk=profile_id).first()
     account = ImmichAccount.objects.get_for_profile(profile) if profile is not None else None
     if pin is None or profile is None or account is None:
         update_task_progress(self, current=0, total=1, message="Import failed: pin, profile, or Immich connection no longer exists.")
-        return counts
+        return {"imported": 0, "skipped": 0, "failed": 0}
 
     gateway = ImmichGateway(account=account)
-    existing_checksums = set(Image.objects.filter(pin=pin, profile=profile).values_list("checksum", flat=True))
-    total = len(asset_ids)
-    for index, asset_id in enumerate(asset_ids):
-        update_task_progress(self, current=index, total=total, message=f"Importing photo {index + 1} of {total}...")
-        try:
-            content, filename, _content_type = gateway.get_asset_original(asset_id)
-        except GatewayRequestError:
-            logger.warning("import_immich_photos: failed to download asset %s for pin %s", asset_id, pin_id, exc_info=True)
-            counts["failed"] += 1
-            continue
+    visit_id_by_asset = visit_id_by_asset or {}
+    target_visits = PinVisit.objects.filter(pin=pin).in_bulk(set(visit_id_by_asset.values()))
 
-        checksum = compute_checksum(io.BytesIO(content))
-        if checksum in existing_checksums:
-            counts["skipped"] += 1
-            continue
-        if quota_error_for_upload(profile, len(content)):
-            counts["failed"] += 1
-            continue
+    def download(asset_id: str) -> tuple[bytes, str]:
+        content, filename, _content_type = gateway.get_asset_original(asset_id)
+        return content, filename
 
-        target_visit_id = (visit_id_by_asset or {}).get(asset_id)
-        target_visit = PinVisit.objects.filter(pk=target_visit_id, pin=pin).first() if target_visit_id else None
-
-        image = Image.objects.create(
-            image=ContentFile(content, name=filename),
-            pin=pin,
-            location=pin.location,
-            profile=profile,
-            checksum=checksum,
-            file_size=len(content),
+    assets = [
+        ImportAsset(
+            key=asset_id,
             source_url=account.asset_web_url(asset_id),
-            visit=target_visit,
+            download=partial(download, asset_id),
+            fields={"visit": target_visits.get(visit_id_by_asset.get(asset_id))},
         )
-        if target_visit is None:
-            log_visit_on_pin(profile, image, pin)
-        safely_enqueue_task(process_image_upload, image.pk)
-        existing_checksums.add(checksum)
-        counts["imported"] += 1
-
-    summary = f"Imported {counts['imported']}"
-    if counts["skipped"]:
-        summary += f", skipped {counts['skipped']} duplicate(s)"
-    if counts["failed"]:
-        summary += f", {counts['failed']} failed"
-    update_task_progress(self, current=total, total=total, message=summary + ".")
-    return counts
+        for asset_id in asset_ids
+    ]
+    return run_photo_import(assets, profile=profile, location=pin.location, pin=pin, log_visits=True, progress=partial(update_task_progress, self), label="import_immich_photos")
 
 
 @shared_task(bind=True, autoretry_for=(OSError,), retry_backoff=True, retry_kwargs={"max_retries": 3})
@@ -1264,71 +1220,28 @@ def import_flickr_photos(self, pin_id: int, profile_id: int, photo_ids: list[str
     Returns:
         Counts of imported/skipped/failed photos, surfaced to the polling UI.
     """
-    import io
-
-    from django.core.files.base import ContentFile
-
     from urbanlens.dashboard.models.flickr.model import FlickrAccount
-    from urbanlens.dashboard.models.images.model import Image, ImageSource
+    from urbanlens.dashboard.models.images.model import ImageSource
     from urbanlens.dashboard.models.pin.model import Pin
     from urbanlens.dashboard.models.profile.model import Profile
     from urbanlens.dashboard.services.apis.flickr.gateway import FlickrGateway
-    from urbanlens.dashboard.services.celery import safely_enqueue_task
-    from urbanlens.dashboard.services.gateway import GatewayRequestError
-    from urbanlens.dashboard.services.images import compute_checksum
-    from urbanlens.dashboard.services.memories.photos import log_visit_on_pin
-    from urbanlens.dashboard.services.storage import quota_error_for_upload
+    from urbanlens.dashboard.services.photo_import_pipeline import ImportAsset, run_photo_import
 
-    counts = {"imported": 0, "skipped": 0, "failed": 0}
     pin = Pin.objects.select_related("location", "profile").filter(pk=pin_id).first()
     profile = Profile.objects.filter(pk=profile_id).first()
     account = FlickrAccount.objects.get_for_profile(profile) if profile is not None else None
     if pin is None or profile is None or account is None:
         update_task_progress(self, current=0, total=1, message="Import failed: pin, profile, or Flickr connection no longer exists.")
-        return counts
+        return {"imported": 0, "skipped": 0, "failed": 0}
 
     gateway = FlickrGateway(account=account)
-    existing_checksums = set(Image.objects.filter(pin=pin, profile=profile).values_list("checksum", flat=True))
-    total = len(photo_ids)
-    for index, photo_id in enumerate(photo_ids):
-        update_task_progress(self, current=index, total=total, message=f"Importing photo {index + 1} of {total}...")
-        try:
-            content, filename, _content_type = gateway.get_original(photo_id)
-        except GatewayRequestError:
-            logger.warning("import_flickr_photos: failed to download photo %s for pin %s", photo_id, pin_id, exc_info=True)
-            counts["failed"] += 1
-            continue
 
-        checksum = compute_checksum(io.BytesIO(content))
-        if checksum in existing_checksums:
-            counts["skipped"] += 1
-            continue
-        if quota_error_for_upload(profile, len(content)):
-            counts["failed"] += 1
-            continue
-
-        image = Image.objects.create(
-            image=ContentFile(content, name=filename),
-            pin=pin,
-            location=pin.location,
-            profile=profile,
-            source=ImageSource.FLICKR,
-            checksum=checksum,
-            file_size=len(content),
-            source_url=account.photo_web_url(photo_id),
-        )
-        log_visit_on_pin(profile, image, pin)
-        safely_enqueue_task(process_image_upload, image.pk)
-        existing_checksums.add(checksum)
-        counts["imported"] += 1
+    def download(photo_id: str) -> tuple[bytes, str]:
+        content, filename, _content_type = gateway.get_original(photo_id)
+        return content, filename
 
-    summary = f"Imported {counts['imported']}"
-    if counts["skipped"]:
-        summary += f", skipped {counts['skipped']} duplicate(s)"
-    if counts["failed"]:
-        summary += f", {counts['failed']} failed"
-    update_task_progress(self, current=total, total=total, message=summary + ".")
-    return counts
+    assets = [ImportAsset(key=photo_id, source_url=account.photo_web_url(photo_id), download=partial(download, photo_id), fields={"source": ImageSource.FLICKR}) for photo_id in photo_ids]
+    return run_photo_import(assets, profile=profile, location=pin.location, pin=pin, log_visits=True, progress=partial(update_task_progress, self), label="import_flickr_photos")
 
 
 @shared_task(bind=True, autoretry_for=(OSError,), retry_backoff=True, retry_kwargs={"max_retries": 3})
@@ -1355,81 +1268,47 @@ def import_flickr_album_photos(self, target_kind: str, target_id: int, profile_i
     Returns:
         Counts of imported/skipped/failed photos, surfaced to the polling UI.
     """
-    import io
-
-    from django.core.files.base import ContentFile
-
-    from urbanlens.dashboard.models.images.model import Image, ImageSource
+    from urbanlens.dashboard.models.images.model import ImageSource
     from urbanlens.dashboard.models.pin.model import Pin
     from urbanlens.dashboard.models.profile.model import Profile
     from urbanlens.dashboard.models.wiki.model import Wiki
-    from urbanlens.dashboard.services.apis.flickr.public import FlickrPublicGateway, photo_web_url
-    from urbanlens.dashboard.services.celery import safely_enqueue_task
+    from urbanlens.dashboard.services.apis.flickr.public import FlickrAlbumPhoto, FlickrPublicGateway, photo_web_url
     from urbanlens.dashboard.services.gateway import GatewayRequestError
-    from urbanlens.dashboard.services.images import compute_checksum
-    from urbanlens.dashboard.services.storage import quota_error_for_upload
+    from urbanlens.dashboard.services.photo_import_pipeline import ImportAsset, run_photo_import
 
-    counts = {"imported": 0, "skipped": 0, "failed": 0}
+    empty = {"imported": 0, "skipped": 0, "failed": 0}
     profile = Profile.objects.filter(pk=profile_id).first()
     pin = Pin.objects.select_related("location").filter(pk=target_id).first() if target_kind == "pin" else None
     wiki = Wiki.objects.select_related("location").filter(pk=target_id).first() if target_kind == "wiki" else None
     location = pin.location if pin is not None else (wiki.location if wiki is not None else None)
     if profile is None or location is None or (pin is None and wiki is None):
         update_task_progress(self, current=0, total=1, message="Import failed: the pin, wiki, or your profile no longer exists.")
-        return counts
+        return empty
 
+    # One gateway for the lookup and every download, so they share its
+    # pooled connections to Flickr.
+    gateway = FlickrPublicGateway()
     try:
-        album = FlickrPublicGateway().get_album(album_url)
+        album = gateway.get_album(album_url)
     except (ValueError, GatewayRequestError) as exc:
         update_task_progress(self, current=0, total=1, message=f"Import failed: {exc}")
-        return counts
-
-    photos_by_id = {photo.id: photo for photo in album.photos}
-    selected = [photos_by_id[photo_id] for photo_id in photo_ids if photo_id in photos_by_id]
-    dedupe_filter = {"pin": pin} if pin is not None else {"wiki": wiki}
-    existing_checksums = set(Image.objects.filter(profile=profile, **dedupe_filter).values_list("checksum", flat=True))
-    total = len(selected)
-    for index, photo in enumerate(selected):
-        update_task_progress(self, current=index, total=total, message=f"Importing photo {index + 1} of {total}...")
-        try:
-            content, filename, _content_type = FlickrPublicGateway().download_photo(photo)
-        except GatewayRequestError:
-            logger.warning("import_flickr_album_photos: failed to download photo %s from album %s", photo.id, album_url, exc_info=True)
-            counts["failed"] += 1
-            continue
+        return empty
 
-        checksum = compute_checksum(io.BytesIO(content))
-        if checksum in existing_checksums:
-            counts["skipped"] += 1
-            continue
-        if quota_error_for_upload(profile, len(content)):
-            counts["failed"] += 1
-            continue
+    def download(photo: FlickrAlbumPhoto) -> tuple[bytes, str]:
+        content, filename, _content_type = gateway.download_photo(photo)
+        return content, filename
 
-        image = Image.objects.create(
-            image=ContentFile(content, name=filename),
-            pin=pin,
-            wiki=wiki,
-            location=location,
-            profile=profile,
-            source=ImageSource.FLICKR,
-            caption=photo.title or "",
-            author=photo.author,
+    photos_by_id = {photo.id: photo for photo in album.photos}
+    assets = [
+        ImportAsset(
+            key=photo.id,
             source_url=photo_web_url(album.owner_nsid, photo.id),
-            checksum=checksum,
-            file_size=len(content),
+            download=partial(download, photo),
+            fields={"source": ImageSource.FLICKR, "caption": photo.title or "", "author": photo.author},
         )
-        safely_enqueue_task(process_image_upload, image.pk)
-        existing_checksums.add(checksum)
-        counts["imported"] += 1
-
-    summary = f"Imported {counts['imported']}"
-    if counts["skipped"]:
-        summary += f", skipped {counts['skipped']} duplicate(s)"
-    if counts["failed"]:
-        summary += f", {counts['failed']} failed"
-    update_task_progress(self, current=total, total=total, message=summary + ".")
-    return counts
+        for photo in (photos_by_id[photo_id] for photo_id in photo_ids if photo_id in photos_by_id)
+    ]
+    return run_photo_import(assets, profile=profile, location=location, pin=pin, wiki=wiki, progress=partial(update_task_progress, self), label="import_flickr_album_photos")
 
 
 @shared_task(bind=True, autoretry_for=(OSError,), retry_backoff=True, retry_kwargs={"max_retries": 3})
@@ -1452,29 +1331,21 @@ def import_google_photos(self, pin_id: int, profile_id: int, session_id: str, me
     Returns:
         Counts of imported/skipped/failed items, surfaced to the polling UI.
     """
-    import io
-
     from django.core.cache import cache
-    from django.core.files.base import ContentFile
 
     from urbanlens.dashboard.models.google_photos.model import GooglePhotosAccount
-    from urbanlens.dashboard.models.images.model import Image
     from urbanlens.dashboard.models.pin.model import Pin
     from urbanlens.dashboard.models.profile.model import Profile
     from urbanlens.dashboard.services.apis.photos.google import GooglePhotosGateway, media_item_web_url, session_items_cache_key
-    from urbanlens.dashboard.services.celery import safely_enqueue_task
     from urbanlens.dashboard.services.gateway import GatewayRequestError
-    from urbanlens.dashboard.services.images import compute_checksum
-    from urbanlens.dashboard.services.memories.photos import log_visit_on_pin
-    from urbanlens.dashboard.services.storage import quota_error_for_upload
+    from urbanlens.dashboard.services.photo_import_pipeline import ImportAsset, run_photo_import
 
-    counts = {"imported": 0, "skipped": 0, "failed": 0}
     pin = Pin.objects.select_related("location", "profile").filter(pk=pin_id).first()
     profile = Profile.objects.filter(pk=profile_id).first()
     account = GooglePhotosAccount.objects.get_for_profile(profile) if profile is not None else None
     if pin is None or profile is None or account is None:
         update_task_progress(self, current=0, total=1, message="Import failed: pin, profile, or Google Photos connection no longer exists.")
-        return counts
+        return {"imported": 0, "skipped": 0, "failed": 0}
 
     gateway = GooglePhotosGateway(account=account)
     items = cache.get(session_items_cache_key(session_id)) or {}
@@ -1486,50 +1357,14 @@ def import_google_photos(self, pin_id: int, profile_id: int, session_id: str, me
         except GatewayRequestError:
             logger.warning("import_google_photos: could not re-list session %s to resolve %d missing item(s)", session_id, len(missing_ids), exc_info=True)
 
-    existing_checksums = set(Image.objects.filter(pin=pin, profile=profile).values_list("checksum", flat=True))
-    total = len(media_item_ids)
-    for index, item_id in enumerate(media_item_ids):
-        update_task_progress(self, current=index, total=total, message=f"Importing photo {index + 1} of {total}...")
+    def download(item_id: str) -> tuple[bytes, str]:
         cached_item = items.get(item_id)
         if cached_item is None:
-            counts["failed"] += 1
-            continue
-        try:
-            content = gateway.download_media_item(cached_item["base_url"], original=True)
-        except GatewayRequestError:
-            logger.warning("import_google_photos: failed to download item %s for pin %s", item_id, pin_id, exc_info=True)
-            counts["failed"] += 1
-            continue
-
-        checksum = compute_checksum(io.BytesIO(content))
-        if checksum in existing_checksums:
-            counts["skipped"] += 1
-            continue
-        if quota_error_for_upload(profile, len(content)):
-            counts["failed"] += 1
-            continue
-
-        image = Image.objects.create(
-            image=ContentFile(content, name=cached_item.get("filename") or f"{item_id}.jpg"),
-            pin=pin,
-            location=pin.location,
-            profile=profile,
-            checksum=checksum,
-            file_size=len(content),
-            source_url=media_item_web_url(item_id),
-        )
-        log_visit_on_pin(profile, image, pin)
-        safely_enqueue_task(process_image_upload, image.pk)
-        existing_checksums.add(checksum)
-        counts["imported"] += 1
+            raise GatewayRequestError(f"Google Photos item {item_id} is not in picker session {session_id}.")
+        return gateway.download_media_item(cached_item["base_url"], original=True), cached_item.get("filename") or f"{item_id}.jpg"
 
-    summary = f"Imported {counts['imported']}"
-    if counts["skipped"]:
-        summary += f", skipped {counts['skipped']} duplicate(s)"
-    if counts["failed"]:
-        summary += f", {counts['failed']} failed"
-    update_task_progress(self, current=total, total=total, message=summary + ".")
-    return counts
+    assets = [ImportAsset(key=item_id, source_url=media_item_web_url(item_id), download=partial(download, item_id)) for item_id in media_item_ids]
+    return run_photo_import(assets, profile=profile, location=pin.location, pin=pin, log_visits=True, progress=partial(update_task_progress, self), label="import_google_photos")
 
 
 def _run_database_backup(task=None) -> bool:
@@ -1837,7 +1672,11 @@ def hard_delete_expired_direct_messages() -> int:
     so attached images are explicitly deleted here too - otherwise they'd
     survive as orphaned, still-unencrypted files after the message is gone.
     """
+    from django.db import transaction
+
+    from urbanlens.dashboard.models.direct_messages.conversation import DirectMessageConversation
     from urbanlens.dashboard.models.direct_messages.model import DirectMessage
+    from urbanlens.dashboard.models.direct_messages.signals import deferred_conversation_refresh
     from urbanlens.dashboard.models.images.model import Image
 
     due_ids = list(DirectMessage.objects.due_for_hard_delete().values_list("id", flat=True))
@@ -1853,7 +1692,13 @@ def hard_delete_expired_direct_messages() -> int:
     Image.objects.filter(direct_message_id__in=due_ids).delete()
 
     count = len(due_ids)
-    DirectMessage.objects.filter(id__in=due_ids).delete()
+    due = DirectMessage.objects.filter(id__in=due_ids)
+    # One inbox refresh per conversation, not one per deleted message.
+    pairs = due.conversation_pairs()
+    with transaction.atomic():
+        with deferred_conversation_refresh():
+            due.delete()
+        DirectMessageConversation.objects.refresh_pairs(pairs)
     logger.info("Hard-deleted %s expired direct message(s)", count)
     return count
 
@@ -1969,6 +1814,25 @@ def send_direct_message_text_alerts_if_unread(message_id: int) -> None:
     send_message_text_alerts_now(message)
 
 
+@shared_task
+def flush_api_call_audit_log() -> int:
+    """Write buffered external API call records to ``ApiCallLog``.
+
+    Scheduled every minute (see ``CELERY_BEAT_SCHEDULE``). Only the Valkey
+    rate limiter buffers records (see ``services.valkey_rate_limiter``); this
+    is a no-op without Valkey, where calls are logged inline.
+
+    Returns:
+        Number of rows written.
+    """
+    from urbanlens.dashboard.services.rate_limiter import flush_api_call_audit_log as flush
+
+    written = flush()
+    if written:
+        logger.debug("Flushed %d API call audit record(s)", written)
+    return written
+
+
 @shared_task
 def prune_pin_tombstones() -> int:
     """Remove pin-deletion tombstones older than the sync retention window.
@@ -3,7 +3,8 @@
 Covers the full plumbing added for this ticket: ServiceDefaults.cost_per_call,
 ApiCallLog.cost_estimate, _RateLimitedSession._do_request() populating it on
 success only, ApiCallLogQuerySet.summary_by_service()'s total_cost
-aggregation, the site-admin API usage report now covering plugin-declared
+aggregation (and its count of cache-answered calls, which don't count toward
+limits), the site-admin API usage report now covering plugin-declared
 services (not just SERVICE_REGISTRY) plus its new cost column, and the
 public costs page.
 """
@@ -55,6 +56,18 @@ class SummaryByServiceTotalCostTests(TestCase):
 
         self.assertIsNone(summary["free_svc"]["total_cost"])
 
+    def test_cached_answers_are_counted_apart_and_spare_the_limits(self) -> None:
+        from urbanlens.dashboard.models.api_rate_limit import ApiRateLimit
+        from urbanlens.dashboard.services.rate_limiter import check_rate_limit, log_api_call
+
+        ApiRateLimit.objects.create(service="llm_svc", display_name="LLM", calls_per_minute=1, calls_per_day=None, calls_per_30_days=None)
+        log_api_call("llm_svc", cost_estimate=Decimal(0), was_cached=True)
+
+        summary = {row["service"]: row for row in ApiCallLog.objects.summary_by_service()}
+
+        self.assertEqual((summary["llm_svc"]["total"], summary["llm_svc"]["cached"]), (1, 1))
+        self.assertTrue(check_rate_limit("llm_svc"))
+
 
 class DoRequestCostEstimateTests(TestCase):
     """_RateLimitedSession._do_request() populates cost_estimate on success only."""
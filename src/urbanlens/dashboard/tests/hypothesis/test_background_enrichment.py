@@ -30,6 +30,7 @@ from urbanlens.dashboard.models.site_settings.model import SiteSettings
 from urbanlens.dashboard.models.wiki.model import Wiki
 from urbanlens.dashboard.services.enrichment import (
     EnrichmentSource,
+    ServicePacer,
     compute_service_budget,
     enrichment_sources,
     enrichment_window_open,
@@ -160,6 +161,59 @@ class StaggerSecondsTests(TestCase):
         self.assertEqual(stagger_seconds(self._Source()), 2.0)
 
 
+class ServicePacerTests(TestCase):
+    """ServicePacer - per-service token buckets shared across lanes."""
+
+    class _Source(EnrichmentSource):
+        key = "pacer_test"
+        service_keys = ("svc_pace",)
+
+        def missing_filter(self) -> Q:
+            return Q()
+
+        def enrich(self, location) -> bool:
+            return True
+
+    class _OtherService(_Source):
+        key = "pacer_other"
+        service_keys = ("svc_other",)
+
+    def setUp(self) -> None:
+        super().setUp()
+        ApiRateLimit.objects.create(service="svc_pace", display_name="x", calls_per_minute=20, calls_per_day=None, calls_per_30_days=None)
+        ApiRateLimit.objects.create(service="svc_other", display_name="y", calls_per_minute=20, calls_per_day=None, calls_per_30_days=None)
+        self.sleeps: list[float] = []
+        self.pacer = ServicePacer(sleep=self.sleeps.append, clock=lambda: 100.0)
+
+    def test_first_item_goes_at_once_and_later_ones_queue(self) -> None:
+        source = self._Source()
+        self.pacer.add(source)
+
+        for _ in range(3):
+            self.pacer.wait_turn(source)
+
+        self.assertEqual(self.sleeps, [3.0, 6.0])
+
+    def test_sources_sharing_a_service_share_its_pace(self) -> None:
+        class Sibling(self._Source):
+            key = "pacer_sibling"
+
+        self.pacer.add(self._Source())
+        self.pacer.wait_turn(self._Source())
+        self.pacer.wait_turn(Sibling())
+
+        self.assertEqual(self.sleeps, [3.0])
+
+    def test_independent_services_do_not_wait_for_each_other(self) -> None:
+        self.pacer.add(self._Source())
+        self.pacer.add(self._OtherService())
+
+        self.pacer.wait_turn(self._Source())
+        self.pacer.wait_turn(self._OtherService())
+
+        self.assertEqual(self.sleeps, [])
+
+
 class PrioritizedCandidatesTests(TestCase):
     """prioritized_location_candidates - impact-ordered selection."""
 
@@ -198,6 +252,30 @@ class PrioritizedCandidatesTests(TestCase):
         pks = [location.pk for location in candidates]
         self.assertLess(pks.index(listed.pk), pks.index(unlisted.pk))
 
+    def test_nearby_density_reorders_the_shortlist_in_one_query(self) -> None:
+        dense = _make_location(lat="40.000000")
+        baker.make(Pin, profile=_make_profile(), location=dense)
+        for index in range(1, 4):
+            _make_location(lat=f"40.00{index}000")
+        sparse = _make_location(lat="45.000000")
+        baker.make(Pin, profile=_make_profile(), location=sparse)
+
+        # Shortlist query plus one neighbor-count query, however long the shortlist.
+        with self.assertNumQueries(2):
+            candidates = prioritized_location_candidates(Q(), limit=1)
+
+        self.assertEqual(candidates, [dense])
+
+    def test_neighbor_counts_are_capped(self) -> None:
+        center = _make_location(lat="40.000000")
+        for index in range(1, 6):
+            _make_location(lat=f"40.00{index}000")
+        lonely = _make_location(lat="45.000000")
+
+        counts = Location.objects.neighbor_counts([center.pk, lonely.pk], radius_meters=2000, cap=3)
+
+        self.assertEqual(counts, {center.pk: 3, lonely.pk: 0})
+
     def test_limit_is_respected(self) -> None:
         for index in range(5):
             baker.make(Pin, profile=_make_profile(), location=_make_location(lat=f"40.{index:06d}"))
@@ -372,6 +450,47 @@ class RunEnrichmentCycleTests(TestCase):
         self.assertEqual(summary["names_refreshed"], 1)
 
 
+    def test_sources_sharing_a_service_split_its_budget(self) -> None:
+        for index in range(4):
+            baker.make(Pin, profile=_make_profile(), location=_make_location(lat=f"40.{index:06d}"))
+        for _ in range(87):
+            ApiCallLog.objects.create(service="svc_cycle", success=True)
+
+        class Sibling(_RecordingSource):
+            key = "sibling"
+
+        first, second = _RecordingSource(), Sibling()
+        with (
+            patch("urbanlens.dashboard.services.enrichment.enrichment_sources", return_value=[first, second]),
+            patch.object(SiteSettings, "get_effective_environment_type", return_value=EnvironmentTypes.PRODUCTION),
+        ):
+            summary = run_enrichment_cycle(sleep=lambda _seconds: None)
+
+        # 90 buffered calls - 87 used leaves 3, shared between both lanes.
+        self.assertEqual(len(first.enriched_pks) + len(second.enriched_pks), 3)
+        self.assertEqual(summary["sources"]["recording"]["budget"], 3)
+        self.assertEqual(summary["sources"]["sibling"]["budget"], 0)
+
+    def test_a_crashing_lane_does_not_stop_the_others(self) -> None:
+        baker.make(Pin, profile=_make_profile(), location=_make_location())
+
+        class Crashing(_RecordingSource):
+            key = "crashing"
+
+            def enrich(self, location) -> bool:
+                raise ValueError("boom")
+
+        healthy = _RecordingSource()
+        with (
+            patch("urbanlens.dashboard.services.enrichment.enrichment_sources", return_value=[Crashing(), healthy]),
+            patch.object(SiteSettings, "get_effective_environment_type", return_value=EnvironmentTypes.PRODUCTION),
+        ):
+            summary = run_enrichment_cycle(sleep=lambda _seconds: None)
+
+        self.assertEqual(summary["sources"]["crashing"]["failed"], 1)
+        self.assertEqual(summary["sources"]["recording"]["enriched"], 1)
+
+
 class EnrichmentCycleProductionGateTests(TestCase):
     """run_enrichment_cycle must never spend real API quota outside production."""
 
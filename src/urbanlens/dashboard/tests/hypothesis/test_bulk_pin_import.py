@@ -0,0 +1,114 @@
+"""Tests for the set-based pin import in ``_import_pins``.
+
+A backup's ``pins.json`` used to go through ``get_nearby_or_create`` one row
+at a time - several queries and a save per pin. ``BulkPinImporter`` resolves
+a whole chunk with a handful of queries instead. Key invariants:
+
+1. Rows that land on the same spot still collapse into one root pin.
+2. Re-importing the same archive creates nothing and maps every uuid.
+3. Labels and ratings are attached to newly created pins only.
+4. A chunk that hits an IntegrityError is re-imported row by row, and the
+   slugs those rows take are reserved against later chunks.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.labels.model import KIND_TAG, Label
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.models.reviews.model import Review
+from urbanlens.dashboard.services import import_data
+from urbanlens.dashboard.services.bulk_pin_import import BulkPinImporter
+from urbanlens.dashboard.services.import_data import ImportResult, _import_pins
+
+
+class BulkPinImportTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.profile = baker.make(User, username="bulk-importer").profile
+
+    def _import(self, rows: list[dict], label_uuid_map: dict[str, int] | None = None) -> tuple[ImportResult, dict[str, int]]:
+        result = ImportResult()
+        pin_uuid_map: dict[str, int] = {}
+        with tempfile.TemporaryDirectory() as data_dir:
+            with open(os.path.join(data_dir, "pins.json"), "w", encoding="utf-8") as fh:
+                json.dump(rows, fh)
+            with self.captureOnCommitCallbacks(execute=False):
+                _import_pins(self.profile, data_dir, result, pin_uuid_map=pin_uuid_map, label_uuid_map=label_uuid_map or {})
+        return result, pin_uuid_map
+
+    def _rows(self) -> list[dict]:
+        return [
+            {"uuid": "11111111-1111-1111-1111-111111111111", "name": "Mill", "latitude": 42.65, "longitude": -73.75},
+            {"uuid": "22222222-2222-2222-2222-222222222222", "name": "Mill again", "latitude": 42.65001, "longitude": -73.75001},
+            {"uuid": "33333333-3333-3333-3333-333333333333", "name": "Depot", "latitude": 43.1, "longitude": -74.2},
+        ]
+
+    def test_rows_on_the_same_spot_share_one_pin(self) -> None:
+        result, pin_uuid_map = self._import(self._rows())
+
+        self.assertEqual(Pin.objects.filter(profile=self.profile).count(), 2)
+        self.assertEqual(result.created.get("pins"), 2)
+        self.assertEqual(pin_uuid_map["11111111-1111-1111-1111-111111111111"], pin_uuid_map["22222222-2222-2222-2222-222222222222"])
+        self.assertNotEqual(pin_uuid_map["11111111-1111-1111-1111-111111111111"], pin_uuid_map["33333333-3333-3333-3333-333333333333"])
+
+    def test_reimport_creates_nothing(self) -> None:
+        _, first_map = self._import(self._rows())
+
+        result, second_map = self._import(self._rows())
+
+        self.assertEqual(Pin.objects.filter(profile=self.profile).count(), 2)
+        self.assertFalse(result.created.get("pins"))
+        self.assertEqual(second_map, first_map)
+
+    def test_labels_and_rating_attach_to_created_pins(self) -> None:
+        label = baker.make(Label, name="mills", kind=KIND_TAG, profile=None)
+        rows = [{"uuid": "44444444-4444-4444-4444-444444444444", "latitude": 42.0, "longitude": -73.0, "label_uuids": ["archive-label"], "rating": 4}]
+
+        _, pin_uuid_map = self._import(rows, label_uuid_map={"archive-label": label.pk})
+
+        pin = Pin.objects.get(pk=pin_uuid_map["44444444-4444-4444-4444-444444444444"])
+        self.assertEqual(list(pin.labels.values_list("pk", flat=True)), [label.pk])
+        self.assertEqual(Review.objects.get(pin=pin).rating, 4)
+
+    def test_conflicting_chunk_falls_back_to_row_imports(self) -> None:
+        with mock.patch.object(BulkPinImporter, "_import_chunk", side_effect=IntegrityError("race")):
+            result, pin_uuid_map = self._import(self._rows())
+
+        self.assertEqual(result.created.get("pins"), 2)
+        self.assertEqual(len(pin_uuid_map), 3)
+
+    def test_fallback_pins_keep_their_slugs_from_later_chunks(self) -> None:
+        rows = [
+            {"uuid": "44444444-4444-4444-4444-444444444444", "name": "Mill", "latitude": 42.65, "longitude": -73.75},
+            {"uuid": "55555555-5555-5555-5555-555555555555", "name": "Mill", "latitude": 43.1, "longitude": -74.2},
+        ]
+        import_chunk = BulkPinImporter._import_chunk
+        chunks: list[object] = []
+
+        def fail_first_chunk(importer: BulkPinImporter, chunk: object) -> object:
+            chunks.append(chunk)
+            if len(chunks) == 1:
+                raise IntegrityError("race")
+            return import_chunk(importer, chunk)
+
+        with (
+            mock.patch("urbanlens.dashboard.services.bulk_pin_import.CHUNK_SIZE", 1),
+            mock.patch.object(BulkPinImporter, "_import_chunk", fail_first_chunk),
+            mock.patch("urbanlens.dashboard.services.import_data._import_pin_row", wraps=import_data._import_pin_row) as row_import,
+        ):
+            result, _ = self._import(rows)
+
+        self.assertEqual(result.created.get("pins"), 2)
+        # Only the first chunk fell back; the second minted a slug of its own.
+        self.assertEqual(row_import.call_count, 1)
+        self.assertEqual(len(set(Pin.objects.filter(profile=self.profile).values_list("slug", flat=True))), 2)
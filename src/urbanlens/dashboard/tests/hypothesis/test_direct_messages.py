@@ -5,7 +5,7 @@ Covers:
 - Profile.accepts_direct_messages_from / services.can_direct_message for each
   VisibilityChoice, including the reply exception and community gating
 - create_direct_message validation, permission enforcement, and notifications
-- DirectMessageQuerySet conversation helpers (between/unread_for/conversation_rows)
+- DirectMessageQuerySet conversation helpers (between/unread_for/mark_read)
 - conversations_for / has_used_direct_messages service helpers
 - The HTTP endpoints (page, conversation, send, dropdown, unread count)
 """
@@ -240,7 +240,7 @@ class CreateDirectMessageTests(TestCase):
 
 
 class DirectMessageQuerySetTests(TestCase):
-    """between/unread_for/mark_read/conversation_rows behave as documented."""
+    """between/unread_for/mark_read behave as documented."""
 
     def setUp(self) -> None:
         super().setUp()
@@ -268,21 +268,6 @@ class DirectMessageQuerySetTests(TestCase):
         self.assertEqual(DirectMessage.objects.unread_for(self.bob).count(), 0)
         self.assertEqual(DirectMessage.objects.unread_for(self.alice).count(), 1)
 
-    def test_conversation_rows_groups_by_partner(self) -> None:
-        self._msg(self.alice, self.bob, "to bob")
-        last_bob = self._msg(self.bob, self.alice, "from bob")
-        last_carol = self._msg(self.carol, self.alice, "from carol")
-
-        rows = list(DirectMessage.objects.conversation_rows(self.alice))
-        self.assertEqual(len(rows), 2)
-        # Most recently active first.
-        self.assertEqual(rows[0]["partner_id"], self.carol.pk)
-        self.assertEqual(rows[0]["last_message_id"], last_carol.pk)
-        self.assertEqual(rows[0]["unread_count"], 1)
-        self.assertEqual(rows[1]["partner_id"], self.bob.pk)
-        self.assertEqual(rows[1]["last_message_id"], last_bob.pk)
-        self.assertEqual(rows[1]["unread_count"], 1)
-
     def test_conversations_for_returns_partner_objects(self) -> None:
         self._msg(self.alice, self.bob, "to bob")
         conversations = conversations_for(self.alice)
@@ -855,7 +840,7 @@ class MessageTextAlertTests(TestCase):
 class SelfDeletedMessageVisibilityTests(TestCase):
     """Messages deleted-for-self stay out of the sidebar preview and unread badge.
 
-    Regression: conversation_rows/unread_conversation_count ran on the raw
+    Regression: the inbox rows/unread_conversation_count ran on the raw
     involving() set, so a message the recipient had removed from their own
     view could still light the navbar badge and surface as the sidebar's
     last-message preview.
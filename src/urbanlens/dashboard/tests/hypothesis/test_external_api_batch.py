@@ -0,0 +1,144 @@
+"""Tests for the external API's ``POST batch/`` endpoint.
+
+Key invariants:
+
+1. A sub-request answers what the same call made on its own would: same
+   status, same rows, same payload shape.
+2. Scopes and throttles are enforced per sub-request against the envelope's
+   credential - a batch reaches nothing the credential couldn't reach alone -
+   and the envelope itself still takes a slot of the burst cap.
+3. The credential is looked up once per batch, but every dispatched
+   sub-request is written to the key's usage log under its own path.
+4. Sub-requests fail independently: a 404, a 403 or an exception in one slot
+   leaves the others intact, and only ``external_api`` routes (never another
+   batch) are reachable.
+"""
+
+from __future__ import annotations
+
+import base64
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.external_api import authentication
+from urbanlens.dashboard.external_api.errors import NOT_FOUND_BODY
+from urbanlens.dashboard.external_api.serializers_batch import MAX_BATCH_REQUESTS
+from urbanlens.dashboard.external_api.throttling import ExternalApiBurstThrottle, ExternalApiReadThrottle
+from urbanlens.dashboard.external_api.views import PhotosView
+from urbanlens.dashboard.models.account.model import ApiKey, ApiKeyScope, ApiKeyUsageLog
+from urbanlens.dashboard.models.images.model import Image
+from urbanlens.dashboard.models.profile.model import Profile
+from urbanlens.dashboard.services.api_keys import generate_api_key
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_PNG_BYTES = base64.b64decode("iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg==")
+
+
+def _bearer(raw_key: str) -> dict:
+    return {"HTTP_AUTHORIZATION": f"Bearer {raw_key}"}
+
+
+def _key_with_scopes(user: User, scopes: Iterable[ApiKeyScope]) -> str:
+    api_key, raw_key = generate_api_key(user, "Test Key")
+    api_key.scopes = [scope.value for scope in scopes]
+    api_key.save(update_fields=["scopes"])
+    return raw_key
+
+
+def _make_image(profile: Profile) -> Image:
+    return Image.objects.create(image=SimpleUploadedFile("photo.png", _PNG_BYTES, content_type="image/png"), profile=profile)
+
+
+class BatchEndpointTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user = baker.make(User)
+        self.profile = Profile.objects.get(user=self.user)
+        self.other_profile = Profile.objects.get(user=baker.make(User))
+        self.raw_key = _key_with_scopes(self.user, [ApiKeyScope.PHOTOS_READ])
+        self.image = _make_image(self.profile)
+        self.other_image = _make_image(self.other_profile)
+
+    def _batch(self, *requests: dict) -> list[dict]:
+        response = self.client.post(reverse("external_api:batch"), {"requests": list(requests)}, content_type="application/json", **_bearer(self.raw_key))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return response.json()["responses"]
+
+    def test_sub_requests_answer_like_direct_calls(self) -> None:
+        detail_path = f"photos/{self.image.uuid}/"
+        responses = self._batch({"id": "list", "path": "photos/?page_size=1"}, {"id": "detail", "method": "GET", "path": detail_path})
+
+        direct_list = self.client.get(reverse("external_api:photos"), {"page_size": 1}, **_bearer(self.raw_key)).json()
+        direct_detail = self.client.get(reverse("external_api:photos.detail", kwargs={"image_uuid": self.image.uuid}), **_bearer(self.raw_key)).json()
+        self.assertEqual([(r["id"], r["status"]) for r in responses], [("list", 200), ("detail", 200)])
+        # Compared by identity and shape rather than byte-for-byte: media URLs
+        # may be signed with an expiry that moves between the two calls.
+        self.assertEqual([row["uuid"] for row in responses[0]["body"]["results"]], [row["uuid"] for row in direct_list["results"]])
+        self.assertEqual(responses[0]["body"]["count"], direct_list["count"])
+        self.assertEqual((responses[1]["body"]["uuid"], responses[1]["body"].keys()), (direct_detail["uuid"], direct_detail.keys()))
+
+    def test_scopes_are_checked_per_sub_request(self) -> None:
+        responses = self._batch({"path": "photos/"}, {"path": "pins/"})
+
+        self.assertEqual([r["status"] for r in responses], [HTTPStatus.OK, HTTPStatus.FORBIDDEN])
+
+    def test_throttles_are_charged_per_sub_request(self) -> None:
+        with mock.patch.object(ExternalApiReadThrottle, "allow_request", return_value=False) as allow, mock.patch.object(ExternalApiReadThrottle, "wait", return_value=None):
+            responses = self._batch({"path": "photos/"}, {"path": f"photos/{self.image.uuid}/"})
+
+        self.assertEqual([r["status"] for r in responses], [HTTPStatus.TOO_MANY_REQUESTS] * 2)
+        self.assertEqual(allow.call_count, 2)
+
+    def test_the_envelope_is_burst_throttled(self) -> None:
+        with mock.patch.object(ExternalApiBurstThrottle, "allow_request", return_value=False), mock.patch.object(ExternalApiBurstThrottle, "wait", return_value=None):
+            response = self.client.post(reverse("external_api:batch"), {"requests": [{"path": "photos/"}]}, content_type="application/json", **_bearer(self.raw_key))
+
+        self.assertEqual(response.status_code, HTTPStatus.TOO_MANY_REQUESTS)
+
+    def test_the_credential_is_looked_up_once_and_each_call_is_logged(self) -> None:
+        detail_path = f"photos/{self.image.uuid}/"
+        with mock.patch.object(authentication, "authenticate_api_key", wraps=authentication.authenticate_api_key) as lookup:
+            self._batch({"path": "photos/"}, {"path": detail_path}, {"path": "no/such/endpoint/"})
+
+        lookup.assert_called_once()
+        api_key = ApiKey.objects.get(user=self.user)
+        logged = set(ApiKeyUsageLog.objects.for_api_key(api_key).values_list("endpoint", flat=True))
+        self.assertEqual(logged, {reverse("external_api:batch"), reverse("external_api:photos"), reverse("external_api:photos.detail", kwargs={"image_uuid": self.image.uuid})})
+
+    def test_failures_stay_in_their_own_slot(self) -> None:
+        responses = self._batch(
+            {"path": f"photos/{self.other_image.uuid}/"},
+            {"path": "no/such/endpoint/"},
+            {"path": "batch/", "method": "POST", "body": {"requests": [{"path": "photos/"}]}},
+            {"path": "photos/"},
+        )
+
+        self.assertEqual([r["status"] for r in responses], [404, 404, 400, 200])
+        self.assertEqual(responses[0]["body"], NOT_FOUND_BODY)
+        self.assertEqual(responses[1]["body"], NOT_FOUND_BODY)
+
+    def test_an_exception_in_one_sub_request_is_contained(self) -> None:
+        with mock.patch.object(PhotosView, "get", side_effect=RuntimeError("boom")):
+            responses = self._batch({"path": "photos/"}, {"path": f"photos/{self.image.uuid}/"})
+
+        self.assertEqual([r["status"] for r in responses], [500, 200])
+
+    def test_oversized_and_empty_batches_are_refused(self) -> None:
+        for requests in ([], [{"path": "photos/"}] * (MAX_BATCH_REQUESTS + 1)):
+            with self.subTest(size=len(requests)):
+                response = self.client.post(reverse("external_api:batch"), {"requests": requests}, content_type="application/json", **_bearer(self.raw_key))
+                self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_anonymous_batches_are_refused(self) -> None:
+        response = self.client.post(reverse("external_api:batch"), {"requests": [{"path": "photos/"}]}, content_type="application/json")
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
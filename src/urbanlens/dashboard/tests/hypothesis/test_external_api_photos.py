@@ -18,6 +18,9 @@ The invariants here are the ones that fail silently and expensively:
 4. **The journal contract can't silently lose a field.** ``JournalEntry`` is a
    dataclass and ``JournalEntrySerializer`` mirrors it by hand, so a new
    dataclass field would otherwise just stop reaching clients.
+5. **Cursor mode returns the same rows as page numbers.** Walking
+   ``?cursor=`` visits every photo exactly once in page-number order, even
+   when a bulk import stamps many rows with the same ``created``.
 """
 
 from __future__ import annotations
@@ -31,9 +34,11 @@ from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from model_bakery import baker
 
 from urbanlens.dashboard.external_api.serializers import JournalEntrySerializer
@@ -180,6 +185,59 @@ class ForeignPhotoTests(_PhotoApiTestCase):
         self.assertNotIn(str(self.other_image.uuid), returned)
 
 
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class PhotoCursorPaginationTests(_PhotoApiTestCase):
+    """``?cursor=`` is an opt-in keyset walk over the same ordering as ``?page=``."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        # Six photos, four sharing one instant the way a bulk import writes them.
+        self.images = [self.image, *(_make_image(self.profile) for _ in range(5))]
+        stamp = timezone.now()
+        Image.objects.filter(pk__in=[image.pk for image in self.images[2:]]).update(created=stamp)
+
+    def _walk(self, params: dict) -> list[str]:
+        url = reverse("external_api:photos")
+        seen: list[str] = []
+        while url:
+            body = self.client.get(url, params, **_bearer(self.raw_key)).json()
+            seen.extend(row["uuid"] for row in body["results"])
+            url, params = body["next"], {}
+        return seen
+
+    def test_cursor_walk_matches_the_page_number_walk(self) -> None:
+        """Every photo once, in the same order, with no overlap at the shared timestamp."""
+        by_cursor = self._walk({"cursor": "", "page_size": 2})
+        by_page = self._walk({"page_size": 2})
+
+        self.assertEqual(by_cursor, by_page)
+        self.assertEqual(sorted(by_cursor), sorted(str(image.uuid) for image in self.images))
+
+    def test_count_is_only_computed_on_request(self) -> None:
+        """Cursor pages skip COUNT(*) unless ?count=true asks for it."""
+        url = reverse("external_api:photos")
+        plain = self.client.get(url, {"cursor": "", "page_size": 2}, **_bearer(self.raw_key)).json()
+        counted = self.client.get(url, {"cursor": plain["next_cursor"], "page_size": 2, "count": "true"}, **_bearer(self.raw_key)).json()
+
+        self.assertIsNone(plain["count"])
+        self.assertIsNone(plain["previous"])
+        self.assertEqual(counted["count"], len(self.images))
+
+    def test_last_page_has_no_next_cursor(self) -> None:
+        """A page that reaches the end hands back no cursor to follow."""
+        body = self.client.get(reverse("external_api:photos"), {"cursor": "", "page_size": 100}, **_bearer(self.raw_key)).json()
+        self.assertEqual(len(body["results"]), len(self.images))
+        self.assertIsNone(body["next"])
+        self.assertIsNone(body["next_cursor"])
+
+    def test_invalid_cursor_is_a_400(self) -> None:
+        """A tampered cursor is refused rather than silently restarting the walk."""
+        response = self.client.get(reverse("external_api:photos"), {"cursor": "not-a-cursor"}, **_bearer(self.raw_key))
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn("error", response.json())
+
+
 class PhotoDeleteTests(_PhotoApiTestCase):
     """The caller's own photo deletes cleanly."""
 
@@ -0,0 +1,83 @@
+"""Tests for the per-request feature entitlement snapshot.
+
+Key invariants:
+
+1. However many features are checked, a user's subscriptions are queried at
+   most once per user instance.
+2. Granting or revoking a subscription through the user instance that holds
+   the snapshot is visible to the next check.
+3. Site-wide default features are never frozen into the snapshot.
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.test import RequestFactory
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.context_processors import add_feature_access
+from urbanlens.dashboard.models.site_settings import SiteSettings
+from urbanlens.dashboard.models.subscriptions import SiteFeature, SubscriptionRole, UserSubscription, entitlements_for, grant_subscription, user_has_feature
+
+
+class FeatureEntitlementsTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        baker.make(User)  # first user is auto-promoted to site admin; keep it off the subject
+        self.user: User = baker.make(User)
+        self.granter: User = baker.make(User)
+        self.role = baker.make(SubscriptionRole, slug="explorer", features=f"{SiteFeature.AI},{SiteFeature.SEARCH}")
+
+    def test_feature_checks_share_one_subscriptions_query(self) -> None:
+        grant_subscription(self.user, self.role, self.granter, months=None)
+        SiteSettings.get_current()
+        self.user.has_perm("dashboard.view_site_admin")
+
+        with SiteSettings.objects.request_scope():
+            SiteSettings.get_current()
+            with self.assertNumQueries(1):
+                self.assertTrue(user_has_feature(self.user, SiteFeature.AI))
+                self.assertTrue(user_has_feature(self.user, SiteFeature.SEARCH))
+                self.assertFalse(user_has_feature(self.user, SiteFeature.PLACES))
+
+    def test_context_processor_uses_the_request_users_snapshot(self) -> None:
+        grant_subscription(self.user, self.role, self.granter, months=None)
+        request = RequestFactory().get("/")
+        request.user = self.user
+
+        context = add_feature_access(request)
+
+        self.assertTrue(context["can_use_ai_features"])
+        self.assertFalse(context["show_places_layer"])
+        self.assertIs(entitlements_for(self.user), entitlements_for(request.user))
+
+    def test_grant_and_revoke_are_seen_by_the_next_check(self) -> None:
+        self.assertFalse(user_has_feature(self.user, SiteFeature.AI))
+
+        subscription = grant_subscription(self.user, self.role, self.granter, months=None)
+        self.assertTrue(user_has_feature(self.user, SiteFeature.AI))
+
+        subscription.revoke()
+        self.assertFalse(user_has_feature(self.user, SiteFeature.AI))
+
+    def test_deleting_a_subscription_is_seen_by_the_next_check(self) -> None:
+        subscription = baker.make(UserSubscription, user=self.user, role=self.role, granted_by=self.granter)
+        self.assertTrue(user_has_feature(self.user, SiteFeature.AI))
+
+        subscription.delete()
+
+        self.assertFalse(user_has_feature(self.user, SiteFeature.AI))
+
+    def test_site_defaults_are_read_live(self) -> None:
+        self.assertFalse(user_has_feature(self.user, SiteFeature.PLACES))
+
+        SiteSettings.objects.filter(pk=1).update(default_features=SiteFeature.PLACES)
+
+        self.assertTrue(user_has_feature(self.user, SiteFeature.PLACES))
+
+    def test_anonymous_users_have_nothing(self) -> None:
+        SiteSettings.objects.filter(pk=SiteSettings.get_current().pk).update(default_features=SiteFeature.AI)
+
+        self.assertFalse(user_has_feature(AnonymousUser(), SiteFeature.AI))
+        self.assertEqual(entitlements_for(AnonymousUser()).roles, [])
@@ -0,0 +1,86 @@
+"""Tests for the indexed proximity clustering engine.
+
+Key invariants:
+
+1. ``running_centroid_clusters`` groups points exactly as the greedy
+   first-fit loop it replaced in ``pin_suggestions._cluster_hits``.
+2. ``seeded_clusters`` groups points exactly as the heaviest-seed loop it
+   replaced in ``device_scan.clustering._cluster_entries``.
+3. The grid index never hides a neighbour - across the antimeridian and at
+   the poles included.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from django.contrib.gis.geos import Point
+from hypothesis import given, settings, strategies as st
+
+from urbanlens.core.tests.testcase import SimpleTestCase
+from urbanlens.dashboard.management.commands.benchmark_geo_clustering import legacy_running_centroid_clusters, legacy_seeded_clusters, synthetic_points
+from urbanlens.dashboard.services.device_scan.clustering import _cluster_entries, _WeightedEntry
+from urbanlens.dashboard.services.geo_clustering import running_centroid_clusters, seeded_clusters
+from urbanlens.dashboard.services.pin_suggestions import LocationHit, _cluster_hits
+
+# Points within a few hundred metres of each other, so clusters actually form.
+_nearby_point = st.tuples(st.floats(min_value=40.0, max_value=40.004), st.floats(min_value=-74.004, max_value=-74.0))
+_weighted_points = st.lists(st.tuples(_nearby_point, st.integers(min_value=1, max_value=50)), max_size=60)
+
+
+def _split(weighted_points: list[tuple[tuple[float, float], int]]) -> tuple[list[tuple[float, float]], list[float]]:
+    return [point for point, _weight in weighted_points], [float(weight) for _point, weight in weighted_points]
+
+
+class RunningCentroidClustersTests(SimpleTestCase):
+    @settings(max_examples=200)
+    @given(_weighted_points, st.sampled_from([10.0, 50.0, 150.0]))
+    def test_matches_the_legacy_loop(self, weighted_points, radius_m) -> None:
+        points, weights = _split(weighted_points)
+
+        groups = running_centroid_clusters([lat for lat, _ in points], [lng for _, lng in points], weights, radius_m)
+
+        self.assertEqual(groups, legacy_running_centroid_clusters(points, weights, radius_m))
+
+    def test_matches_the_legacy_loop_on_a_synthetic_library(self) -> None:
+        points, weights = synthetic_points(2_000, 150, 60.0, seed=7)
+
+        groups = running_centroid_clusters([lat for lat, _ in points], [lng for _, lng in points], weights, 150.0)
+
+        self.assertEqual(groups, legacy_running_centroid_clusters(points, weights, 150.0))
+
+    def test_neighbours_across_the_antimeridian_and_pole_are_found(self) -> None:
+        self.assertEqual(running_centroid_clusters([10.0, 10.0], [179.9999, -179.9999], [1, 1], 50.0), [[0, 1]])
+        self.assertEqual(running_centroid_clusters([89.99995, 89.99995], [0.0, 180.0], [1, 1], 50.0), [[0, 1]])
+
+    def test_pin_suggestion_hits_keep_their_grouping(self) -> None:
+        taken_at = datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC)
+        hits = [LocationHit(latitude=40.0, longitude=-74.0, taken_at=taken_at), LocationHit(latitude=41.0, longitude=-74.0, taken_at=taken_at), LocationHit(latitude=40.0001, longitude=-74.0, taken_at=taken_at)]
+
+        self.assertEqual(_cluster_hits(hits, 100.0), [[hits[0], hits[2]], [hits[1]]])
+
+
+class SeededClustersTests(SimpleTestCase):
+    @settings(max_examples=200)
+    @given(_weighted_points, st.sampled_from([10.0, 30.0, 150.0]))
+    def test_matches_the_legacy_loop(self, weighted_points, radius_m) -> None:
+        points, weights = _split(weighted_points)
+
+        groups = seeded_clusters([lat for lat, _ in points], [lng for _, lng in points], weights, radius_m)
+
+        self.assertEqual(groups, legacy_seeded_clusters(points, weights, radius_m))
+
+    def test_matches_the_legacy_loop_on_a_synthetic_library(self) -> None:
+        points, weights = synthetic_points(2_000, 150, 20.0, seed=7)
+
+        groups = seeded_clusters([lat for lat, _ in points], [lng for _, lng in points], weights, 30.0)
+
+        self.assertEqual(groups, legacy_seeded_clusters(points, weights, 30.0))
+
+    def test_device_entries_are_seeded_by_weight(self) -> None:
+        observed_at = datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC)
+        light = _WeightedEntry(point=Point(-74.0, 40.0, srid=4326), weight=0.2, observed_at=observed_at, avg_signal_strength=None)
+        heavy = _WeightedEntry(point=Point(-74.0001, 40.0, srid=4326), weight=0.9, observed_at=observed_at, avg_signal_strength=None)
+        far = _WeightedEntry(point=Point(-73.0, 40.0, srid=4326), weight=0.5, observed_at=observed_at, avg_signal_strength=None)
+
+        self.assertEqual(_cluster_entries([light, heavy, far]), [[heavy, light], [far]])
@@ -381,14 +381,14 @@ class ConversationMergeTests(TestCase):
         """The N+1 regression this batch fixed: query count must not grow
         with the number of groups the profile belongs to."""
         create_group_chat(self.me, "One", [self.friend])
-        with self.assertNumQueries(4):
+        with self.assertNumQueries(2):
             group_conversations_for(self.friend)
 
         for i in range(4):
             other = _profile()
             _befriend(self.me, other)
             create_group_chat(self.me, f"Extra {i}", [self.friend, other])
-        with self.assertNumQueries(4):
+        with self.assertNumQueries(2):
             group_conversations_for(self.friend)
 
     def test_unread_group_conversation_count_across_multiple_groups(self) -> None:
@@ -0,0 +1,122 @@
+"""Tests for the single-pass photo metadata read used by process_image_upload.
+
+Key invariants:
+
+1. read_image_metadata() returns exactly what the individual extract_*
+   functions return for the same file.
+2. spooled_stored_file() hashes the stored bytes to the same digest as
+   compute_checksum().
+3. Photo upload processing reads the stored file from storage once, even
+   when it also downscales it.
+"""
+
+from __future__ import annotations
+
+import io
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models.fields.files import FieldFile
+from django.test import override_settings
+from PIL import Image as PILImage
+from PIL.TiffImagePlugin import IFDRational
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.images.model import Image
+from urbanlens.dashboard.services.images import (
+    ImageMetadata,
+    compute_checksum,
+    extract_author,
+    extract_caption_from_metadata,
+    extract_copyright_notice,
+    extract_exif_data,
+    extract_gps_coords,
+    extract_gps_direction,
+    extract_source_url,
+    extract_taken_at,
+    read_image_metadata,
+    spooled_stored_file,
+)
+from urbanlens.dashboard.tasks import _process_photo_upload
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix="urbanlens-test-media-")
+
+
+def _tagged_jpeg(width: int = 400, height: int = 300) -> bytes:
+    """A JPEG carrying IFD0 attribution, a capture time and a GPS position and bearing."""
+    img = PILImage.new("RGB", (width, height), color=(40, 80, 120))
+    exif = PILImage.Exif()
+    exif[0x013B] = "Jane Doe"  # Artist
+    exif[0x8298] = "(c) 2026 Jane Doe"  # Copyright
+    exif[0x010E] = "Old mill"  # ImageDescription
+    exif.get_ifd(0x8769)[0x9003] = "2026:05:01 12:30:00"  # DateTimeOriginal
+    gps_ifd = exif.get_ifd(0x8825)
+    gps_ifd[1] = "N"
+    gps_ifd[2] = (IFDRational(40, 1), IFDRational(30, 1), IFDRational(0, 1))
+    gps_ifd[3] = "W"
+    gps_ifd[4] = (IFDRational(74, 1), IFDRational(0, 1), IFDRational(0, 1))
+    gps_ifd[17] = IFDRational(90, 1)  # GPSImgDirection
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", exif=exif.tobytes())
+    return buf.getvalue()
+
+
+class ReadImageMetadataTests(TestCase):
+    def test_matches_the_individual_extractors(self) -> None:
+        content = _tagged_jpeg()
+
+        metadata = read_image_metadata(io.BytesIO(content))
+
+        self.assertEqual(
+            metadata,
+            ImageMetadata(
+                gps_coords=extract_gps_coords(io.BytesIO(content)),
+                gps_direction=extract_gps_direction(io.BytesIO(content)),
+                taken_at=extract_taken_at(io.BytesIO(content)),
+                exif_data=extract_exif_data(io.BytesIO(content)),
+                author=extract_author(io.BytesIO(content)),
+                copyright_notice=extract_copyright_notice(io.BytesIO(content)),
+                caption=extract_caption_from_metadata(io.BytesIO(content)),
+                source_url=extract_source_url(io.BytesIO(content)),
+            ),
+        )
+        self.assertEqual(metadata.gps_coords, (40.5, -74.0))
+        self.assertEqual(metadata.author, "Jane Doe")
+
+    def test_unreadable_file_yields_empty_metadata(self) -> None:
+        self.assertEqual(read_image_metadata(io.BytesIO(b"not an image")), ImageMetadata())
+
+
+@override_settings(MEDIA_ROOT=_MEDIA_ROOT)
+class SinglePassUploadTests(TestCase):
+    def _image(self, content: bytes) -> Image:
+        profile = User.objects.create(username=f"u{Image.objects.count()}").profile
+        return Image.objects.create(image=SimpleUploadedFile("mill.jpg", content, content_type="image/jpeg"), profile=profile)
+
+    def test_spool_checksum_matches_compute_checksum(self) -> None:
+        content = _tagged_jpeg()
+        image = self._image(content)
+
+        with spooled_stored_file(image.image) as (spool, checksum):
+            self.assertEqual(spool.read(), content)
+
+        self.assertEqual(checksum, compute_checksum(io.BytesIO(content)))
+
+    def test_photo_processing_reads_storage_once(self) -> None:
+        image = self._image(_tagged_jpeg(1600, 1200))
+        Image.objects.filter(pk=image.pk).update(checksum="")
+        image.refresh_from_db()
+
+        with (
+            mock.patch("urbanlens.dashboard.services.storage.get_downscale_policy", return_value=(800, False)),
+            mock.patch.object(FieldFile, "open", autospec=True, side_effect=FieldFile.open) as opened,
+        ):
+            result = _process_photo_upload(image, image.pk, strip_location=False)
+
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(result.coords, (40.5, -74.0))
+        self.assertEqual(result.update_fields["author"], "Jane Doe")
+        self.assertIn("checksum", result.update_fields)
+        self.assertIsNotNone(result.new_stored_size)
@@ -0,0 +1,188 @@
+"""Tests for the denormalized messages inbox summaries.
+
+``DirectMessageConversation`` rows and the summary columns on
+``GroupChatMembership`` replace the per-render aggregation over every
+message a profile ever sent or received. Key invariants:
+
+1. Each write path (send, read receipt, delete-for-self, hard delete) leaves
+   the rows equal to an aggregate recomputed from the visible messages; the
+   expiry sweep refreshes each conversation once, not once per message.
+2. ``rebuild`` reproduces the incrementally maintained rows exactly.
+3. Inbox reads cost a fixed number of queries, however long the history.
+4. The inbox is ordered by the indexed ``last_message`` column, so a
+   conversation moves to the top as soon as it gets a new message.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.direct_messages.conversation import DirectMessageConversation
+from urbanlens.dashboard.models.direct_messages.meta import MessageRetentionChoice
+from urbanlens.dashboard.models.direct_messages.model import DirectMessage
+from urbanlens.dashboard.models.group_chats.model import GroupChatMembership, GroupMessage
+from urbanlens.dashboard.services.direct_messages import conversations_for, delete_message_for_self
+from urbanlens.dashboard.tasks import hard_delete_expired_direct_messages
+
+if TYPE_CHECKING:
+    from urbanlens.dashboard.models.profile.model import Profile
+
+
+def _profile() -> Profile:
+    return baker.make("auth.User").profile
+
+
+class DirectMessageConversationTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.alice = _profile()
+        self.bob = _profile()
+        self.carol = _profile()
+
+    def _msg(self, sender: Profile, recipient: Profile, body: str = "hi") -> DirectMessage:
+        return DirectMessage.objects.create(sender=sender, recipient=recipient, body=body)
+
+    def _summary(self, profile: Profile) -> list[tuple[int, int, int]]:
+        return [(row.partner_id, row.last_message_id, row.unread_count) for row in DirectMessageConversation.objects.inbox(profile)]
+
+    def _aggregated(self, profile: Profile) -> list[tuple[int, int, int]]:
+        """The summary recomputed from the messages the profile can still see."""
+        rows: dict[int, tuple[int, int]] = {}
+        for message in DirectMessage.objects.involving(profile).visible_to(profile):
+            partner_id = message.recipient_id if message.sender_id == profile.pk else message.sender_id
+            last_id, unread = rows.get(partner_id, (0, 0))
+            unread += message.recipient_id == profile.pk and message.read_at is None
+            rows[partner_id] = (max(last_id, message.pk), unread)
+        return sorted(((partner_id, last_id, unread) for partner_id, (last_id, unread) in rows.items()), key=lambda row: -row[1])
+
+    def test_sending_updates_both_participants(self) -> None:
+        self._msg(self.alice, self.bob)
+        last = self._msg(self.alice, self.bob)
+
+        self.assertEqual(self._summary(self.alice), [(self.bob.pk, last.pk, 0)])
+        self.assertEqual(self._summary(self.bob), [(self.alice.pk, last.pk, 2)])
+
+    def test_read_receipts_clear_the_unread_count(self) -> None:
+        self._msg(self.alice, self.bob)
+        self._msg(self.carol, self.bob)
+
+        DirectMessage.objects.between(self.bob, self.alice).filter(recipient=self.bob).mark_read()
+
+        self.assertEqual(self._summary(self.bob), self._aggregated(self.bob))
+        self.assertEqual({partner: unread for partner, _, unread in self._summary(self.bob)}, {self.alice.pk: 0, self.carol.pk: 1})
+
+    def test_delete_for_self_moves_the_last_message_back(self) -> None:
+        first = self._msg(self.alice, self.bob, "keep")
+        second = self._msg(self.alice, self.bob, "hide")
+
+        delete_message_for_self(second, self.bob)
+
+        self.assertEqual(self._summary(self.bob), [(self.alice.pk, first.pk, 1)])
+        self.assertEqual(self._summary(self.alice), [(self.bob.pk, second.pk, 0)])
+
+    def test_hard_delete_removes_an_emptied_conversation(self) -> None:
+        only = self._msg(self.alice, self.bob)
+
+        only.delete()
+
+        self.assertEqual(self._summary(self.alice), [])
+        self.assertEqual(self._summary(self.bob), [])
+
+    def test_the_expiry_sweep_refreshes_each_conversation_once(self) -> None:
+        kept = self._msg(self.alice, self.bob, "keep")
+        for _ in range(3):
+            self._msg(self.alice, self.bob)
+        self._msg(self.carol, self.bob)
+        DirectMessage.objects.exclude(pk=kept.pk).update(sender_delete_after=MessageRetentionChoice.WHEN_READ, read_at=timezone.now())
+
+        with mock.patch.object(DirectMessageConversation.objects, "refresh_pairs", wraps=DirectMessageConversation.objects.refresh_pairs) as refresh:
+            self.assertEqual(hard_delete_expired_direct_messages(), 4)
+
+        refresh.assert_called_once()
+        self.assertEqual(self._summary(self.bob), self._aggregated(self.bob))
+        self.assertEqual(self._summary(self.bob), [(self.alice.pk, kept.pk, 1)])
+        self.assertEqual(self._summary(self.carol), [])
+
+    def test_rebuild_matches_the_incremental_rows(self) -> None:
+        self._msg(self.alice, self.bob)
+        self._msg(self.bob, self.alice)
+        self._msg(self.carol, self.alice)
+        delete_message_for_self(self._msg(self.carol, self.alice), self.alice)
+        before = self._summary(self.alice)
+
+        DirectMessageConversation.objects.rebuild([self.alice.pk])
+
+        self.assertEqual(self._summary(self.alice), before)
+        self.assertEqual(before, self._aggregated(self.alice))
+
+    def test_a_new_message_moves_its_conversation_to_the_top(self) -> None:
+        self._msg(self.bob, self.alice)
+        from_carol = self._msg(self.carol, self.alice)
+        latest = self._msg(self.bob, self.alice)
+
+        self.assertEqual([row[:2] for row in self._summary(self.alice)], [(self.bob.pk, latest.pk), (self.carol.pk, from_carol.pk)])
+        self.assertEqual(DirectMessageConversation.objects.inbox(self.alice).query.order_by, ("-last_message_id",))
+
+    def test_inbox_query_count_is_independent_of_history_length(self) -> None:
+        self._msg(self.bob, self.alice)
+        self._msg(self.alice, self.carol)
+        with CaptureQueriesContext(connection) as short_history:
+            conversations_for(self.alice)
+
+        for _ in range(5):
+            self._msg(self.bob, self.alice)
+            self._msg(self.alice, self.carol)
+        with CaptureQueriesContext(connection) as long_history:
+            conversations = conversations_for(self.alice)
+
+        self.assertEqual(len(long_history), len(short_history))
+        self.assertEqual([conversation["partner"] for conversation in conversations], [self.carol, self.bob])
+        self.assertEqual(conversations[1]["unread_count"], 6)
+
+
+class GroupMembershipSummaryTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.alice = _profile()
+        self.bob = _profile()
+        self.group = baker.make("dashboard.GroupChat")
+        self.alice_membership = GroupChatMembership.objects.create(group=self.group, profile=self.alice)
+        self.bob_membership = GroupChatMembership.objects.create(group=self.group, profile=self.bob)
+
+    def _send(self, sender: Profile, body: str = "hi") -> GroupMessage:
+        return GroupMessage.objects.create(group=self.group, sender=sender, body=body)
+
+    def test_messages_count_as_unread_for_everyone_but_the_sender(self) -> None:
+        self._send(self.alice)
+        last = self._send(self.alice)
+
+        self.alice_membership.refresh_from_db()
+        self.bob_membership.refresh_from_db()
+        self.assertEqual((self.alice_membership.last_message_id, self.alice_membership.unread_count), (last.pk, 0))
+        self.assertEqual((self.bob_membership.last_message_id, self.bob_membership.unread_count), (last.pk, 2))
+
+    def test_mark_read_clears_the_unread_count(self) -> None:
+        self._send(self.alice)
+
+        GroupMessage.objects.mark_read(self.bob_membership)
+
+        self.bob_membership.refresh_from_db()
+        self.assertEqual(self.bob_membership.unread_count, 0)
+
+    def test_rebuild_matches_the_incremental_summary(self) -> None:
+        self._send(self.alice)
+        self._send(self.bob)
+        self._send(self.alice)
+        expected = list(GroupChatMembership.objects.order_by("pk").values_list("last_message_id", "unread_count"))
+
+        GroupChatMembership.objects.update(last_message=None, unread_count=0)
+        GroupChatMembership.objects.active().rebuild_summaries()
+
+        self.assertEqual(list(GroupChatMembership.objects.order_by("pk").values_list("last_message_id", "unread_count")), expected)
@@ -0,0 +1,90 @@
+"""Tests for the streaming row reader used by the backup importer.
+
+``JsonRows`` replaces ``json.load`` for an archive's row files so a large
+export never sits in a worker's memory whole. Key invariants:
+
+1. Legacy array files decode to exactly what ``json.load`` returned, however
+   the read buffer happens to split them.
+2. An ``.ndjson`` sibling is preferred, and blank lines in it are ignored.
+3. ``len()`` and truthiness match the list the importers used to get.
+4. A file that isn't an array is rejected with a ValueError, which
+   ``run_import`` already reports as a failed import.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import tempfile
+
+import pytest
+
+from urbanlens.core.tests.testcase import SimpleTestCase
+from urbanlens.dashboard.services.json_rows import JsonRows, iter_json_array
+
+_ROWS = [
+    {"uuid": "a", "name": "Old Mill", "latitude": 42.65, "longitude": -73.75},
+    {"uuid": "b", "name": 'Depot ] [ , "quoted"', "tags": [1, 2, {"nested": True}]},
+    {"uuid": "c", "name": "Ünïcode ☃", "rating": 123456},
+]
+
+
+class IterJsonArrayTests(SimpleTestCase):
+    def test_matches_json_load_for_every_buffer_size(self) -> None:
+        document = json.dumps(_ROWS, indent=2, ensure_ascii=False)
+        for read_size in (1, 2, 7, 64, len(document)):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(list(iter_json_array(io.StringIO(document), read_size=read_size)), _ROWS)
+
+    def test_empty_array_yields_nothing(self) -> None:
+        self.assertEqual(list(iter_json_array(io.StringIO(" [ ] "))), [])
+
+    def test_non_array_document_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="JSON array"):
+            list(iter_json_array(io.StringIO('{"uuid": "a"}')))
+
+    def test_truncated_document_is_rejected(self) -> None:
+        # Cut inside a string literal, so the decoder's complaint is about the
+        # truncation itself rather than whatever token happens to follow.
+        document = json.dumps(_ROWS)
+        document = document[: document.index("Old Mill") + len("Old")]
+        with pytest.raises(ValueError, match="Unterminated"):
+            list(iter_json_array(io.StringIO(document), read_size=8))
+
+
+class JsonRowsTests(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.data_dir = self._tmp.name
+
+    def _write(self, filename: str, text: str) -> None:
+        with open(os.path.join(self.data_dir, filename), "w", encoding="utf-8") as fh:
+            fh.write(text)
+
+    def test_missing_file_is_none(self) -> None:
+        self.assertIsNone(JsonRows.open(self.data_dir, "pins.json"))
+
+    def test_array_file_streams_its_rows(self) -> None:
+        self._write("pins.json", json.dumps(_ROWS))
+
+        rows = JsonRows.open(self.data_dir, "pins.json")
+
+        self.assertTrue(rows)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(list(rows), _ROWS)
+
+    def test_ndjson_sibling_takes_precedence(self) -> None:
+        self._write("pins.json", json.dumps(_ROWS[:1]))
+        self._write("pins.ndjson", "\n".join(json.dumps(row) for row in _ROWS) + "\n\n")
+
+        rows = JsonRows.open(self.data_dir, "pins.json")
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(list(rows), _ROWS)
+
+    def test_empty_array_is_falsy(self) -> None:
+        self._write("pins.json", "[]")
+        self.assertFalse(JsonRows.open(self.data_dir, "pins.json"))
@@ -0,0 +1,116 @@
+"""Tests for expanding label hierarchies in a single query.
+
+Filtering pins by a label also matches every label below it. That expansion
+used to walk ``Label.parents`` one query per node, so a search formula with a
+handful of deep labels cost dozens of round trips. ``descendant_map`` now does
+it in one recursive CTE for any number of labels, and the cycle guard reuses
+it. Key invariants:
+
+1. Every requested id maps to itself plus all of its descendants.
+2. Labels that share descendants each get the full set.
+3. The walk terminates against a hierarchy that already contains a cycle.
+4. ``apply_label_groups`` expands all of its groups with one query.
+5. Ids stored as strings by saved filters or API criteria (``"5"``) expand
+   like their int form, alone or mixed with ints.
+6. ``would_create_cycle`` still rejects self-parenting and descendant parents.
+"""
+
+from __future__ import annotations
+
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.labels.model import KIND_TAG, Label
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.services.labels.hierarchy import descendant_map, safe_parent_ids, would_create_cycle
+
+
+def _make_tag(name: str = "tag", *parents: Label) -> Label:
+    label = baker.make(Label, name=name, kind=KIND_TAG, profile=None)
+    if parents:
+        label.parents.add(*parents)
+    return label
+
+
+class DescendantMapTests(TestCase):
+    def test_empty_input_runs_no_query(self) -> None:
+        with self.assertNumQueries(0):
+            self.assertEqual(descendant_map([]), {})
+
+    def test_expands_several_labels_in_one_query(self) -> None:
+        root = _make_tag("root")
+        child = _make_tag("child", root)
+        grandchild = _make_tag("grandchild", child)
+        other = _make_tag("other")
+        shared = _make_tag("shared", root, other)
+
+        with self.assertNumQueries(1):
+            result = descendant_map([root.pk, other.pk, grandchild.pk])
+
+        self.assertEqual(result[root.pk], {root.pk, child.pk, grandchild.pk, shared.pk})
+        self.assertEqual(result[other.pk], {other.pk, shared.pk})
+        self.assertEqual(result[grandchild.pk], {grandchild.pk})
+
+    def test_terminates_on_an_existing_cycle(self) -> None:
+        a = _make_tag("a")
+        b = _make_tag("b", a)
+        c = _make_tag("c", b)
+        # parents.add() skips the write-time guard, as pre-guard writes did.
+        a.parents.add(c)
+
+        self.assertEqual(descendant_map([a.pk])[a.pk], {a.pk, b.pk, c.pk})
+        self.assertEqual(Label.get_label_and_descendants(b.pk), {a.pk, b.pk, c.pk})
+
+
+class ApplyLabelGroupsExpansionTests(TestCase):
+    def test_all_groups_expand_with_one_hierarchy_query(self) -> None:
+        parent = _make_tag("parent")
+        child = _make_tag("child", parent)
+        excluded = _make_tag("excluded")
+        profile = baker.make("auth.User").profile
+        tagged = baker.make(Pin, profile=profile)
+        tagged.labels.add(child)
+        hidden = baker.make(Pin, profile=profile)
+        hidden.labels.add(child, excluded)
+
+        groups = [{"op": "and", "ids": [parent.pk]}, {"op": "not", "ids": [excluded.pk]}]
+        with self.assertNumQueries(2):
+            # One hierarchy query, then the pin query itself.
+            result = list(Pin.objects.filter(profile=profile).apply_label_groups(groups).distinct())
+
+        self.assertEqual(result, [tagged])
+
+    def test_string_ids_from_saved_criteria_are_accepted(self) -> None:
+        parent = _make_tag("parent")
+        child = _make_tag("child", parent)
+        other = _make_tag("other")
+        profile = baker.make("auth.User").profile
+        tagged = baker.make(Pin, profile=profile)
+        tagged.labels.add(child)
+        baker.make(Pin, profile=profile).labels.add(other)
+
+        groups = [{"op": "or", "ids": [str(parent.pk)]}, {"op": "not", "ids": [str(other.pk), other.pk]}]
+        result = list(Pin.objects.filter(profile=profile).apply_label_groups(groups).distinct())
+
+        self.assertEqual(result, [tagged])
+        self.assertEqual(descendant_map([str(parent.pk), parent.pk]), {parent.pk: {parent.pk, child.pk}})
+
+
+class LabelCycleGuardTests(TestCase):
+    def test_label_cannot_be_its_own_parent(self) -> None:
+        label = _make_tag()
+        self.assertTrue(would_create_cycle(label, [label.pk]))
+
+    def test_descendant_cannot_become_parent(self) -> None:
+        root = _make_tag("root")
+        child = _make_tag("child", root)
+        grandchild = _make_tag("grandchild", child)
+        unrelated = _make_tag("unrelated")
+
+        self.assertTrue(would_create_cycle(root, [grandchild.pk]))
+        self.assertFalse(would_create_cycle(grandchild, [root.pk]))
+        self.assertEqual(safe_parent_ids(root, [unrelated.pk, grandchild.pk, child.pk]), [unrelated.pk])
+
+    def test_unsaved_label_never_closes_a_loop(self) -> None:
+        parent = _make_tag("parent")
+        self.assertFalse(would_create_cycle(Label(name="new"), [parent.pk]))
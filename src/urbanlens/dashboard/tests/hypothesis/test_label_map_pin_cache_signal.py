@@ -10,7 +10,11 @@ Redis-backed, only live when a Valkey/Redis URL is configured) to rebuild
 the cached JSON for pins carrying that label - they kept serving the old
 baked-in icon/color until something else happened to touch that specific
 pin, or the 2-hour TTL lapsed. Label/LabelCustomization now have their own
-post_save receivers in models/pin/signals.py that refresh every affected pin.
+receivers in models/pin/signals.py that refresh every affected pin.
+
+Those pins are found through MapPinCache's own label index (a lexicographic
+sorted set of "label:pin" members) and re-rendered in one batch per profile,
+which also reaches pins whose label was deleted or merged away.
 """
 
 from __future__ import annotations
@@ -21,10 +25,13 @@ from unittest import mock
 from django.contrib.auth.models import User
 from model_bakery import baker
 
-from urbanlens.core.tests.testcase import TestCase
+from urbanlens.core.tests.testcase import SimpleTestCase, TestCase
 from urbanlens.dashboard.models.labels.customization.model import LabelCustomization
 from urbanlens.dashboard.models.labels.model import Label
 from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.models.reviews.model import Review
+from urbanlens.dashboard.services.labels.merge import merge_labels
+from urbanlens.dashboard.services.map_pins.cache import MapPinCache
 
 # Location carries a unique (latitude, longitude) constraint, so every test pin
 # needs its own coordinates.
@@ -47,29 +54,55 @@ class LabelSaveRefreshesMapPinCacheTests(TestCase):
 
     def test_editing_label_icon_refreshes_every_pin_carrying_it(self) -> None:
         label = baker.make(Label, profile=self.profile, kind="tag", name="Urbex", icon="place")
-        pin = _make_pin_with_label(self.profile, label)
-        other_pin = _make_pin_with_label(self.profile, label)
-        offset = next(_COORDS)
-        unrelated_pin = baker.make(
-            Pin,
-            profile=self.profile,
-            location=baker.make("dashboard.Location", latitude=f"{40 + offset * 0.01:.6f}", longitude=f"{-74 + offset * 0.01:.6f}"),
-        )
+        _make_pin_with_label(self.profile, label)
+        _make_pin_with_label(self.profile, label)
 
         with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
             label.icon = "explore"
             label.save(update_fields=["icon"])
 
-        refreshed_pin_ids = {call.args[0].pk for call in mock_cache_cls.return_value.upsert_pin.call_args_list}
-        self.assertEqual(refreshed_pin_ids, {pin.pk, other_pin.pk})
-        self.assertNotIn(unrelated_pin.pk, refreshed_pin_ids)
+        # One batched refresh for the owning profile, resolved through the
+        # cache's label index rather than one upsert per pin.
+        self.assertEqual([call.args[0].pk for call in mock_cache_cls.call_args_list], [self.profile.pk])
+        mock_cache_cls.return_value.refresh_labels.assert_called_once_with({label.pk})
+        mock_cache_cls.return_value.upsert_pin.assert_not_called()
 
     def test_creating_a_label_does_not_touch_the_cache(self) -> None:
         """A brand-new label isn't attached to any pin yet - nothing to refresh."""
         with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
             baker.make(Label, profile=self.profile, kind="tag", name="New Label")
 
-        mock_cache_cls.return_value.upsert_pin.assert_not_called()
+        mock_cache_cls.return_value.refresh_labels.assert_not_called()
+
+    def test_deleting_a_label_refreshes_pins_that_carried_it(self) -> None:
+        label = baker.make(Label, profile=self.profile, kind="tag", name="Gone")
+        _make_pin_with_label(self.profile, label)
+        label_pk = label.pk
+
+        with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
+            label.delete()
+
+        mock_cache_cls.return_value.refresh_labels.assert_called_once_with({label_pk})
+
+    def test_adding_pins_from_the_label_side_refreshes_them_in_one_batch(self) -> None:
+        label = baker.make(Label, profile=self.profile, kind="tag", name="Urbex")
+        pins = [_make_pin_with_label(self.profile, baker.make(Label, profile=self.profile, kind="tag")) for _ in range(3)]
+
+        with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
+            label.pins.add(*pins)
+
+        mock_cache_cls.return_value.refresh_pins.assert_called_once_with({pin.pk for pin in pins})
+
+    def test_merging_labels_refreshes_the_merged_labels_pins(self) -> None:
+        target = baker.make(Label, profile=self.profile, kind="tag", name="Target")
+        source = baker.make(Label, profile=self.profile, kind="tag", name="Source")
+        _make_pin_with_label(self.profile, source)
+        source_pk = source.pk
+
+        with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
+            merge_labels(target=target, sources=[source], profile=self.profile)
+
+        self.assertIn(mock.call({source_pk}), mock_cache_cls.return_value.refresh_labels.call_args_list)
 
 
 class LabelCustomizationSaveRefreshesMapPinCacheTests(TestCase):
@@ -88,6 +121,69 @@ class LabelCustomizationSaveRefreshesMapPinCacheTests(TestCase):
         with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
             LabelCustomization.objects.create(profile=self.profile, label=global_label, icon="star")
 
-        refreshed_pin_ids = {call.args[0].pk for call in mock_cache_cls.return_value.upsert_pin.call_args_list}
-        self.assertEqual(refreshed_pin_ids, {own_pin.pk})
-        self.assertNotIn(other_profiles_pin.pk, refreshed_pin_ids)
+        refreshed_profile_ids = {call.args[0].pk for call in mock_cache_cls.call_args_list}
+        self.assertEqual(refreshed_profile_ids, {own_pin.profile_id})
+        self.assertNotIn(other_profiles_pin.profile_id, refreshed_profile_ids)
+        mock_cache_cls.return_value.refresh_labels.assert_called_once_with({global_label.pk})
+
+
+class ReviewRefreshesMapPinCacheTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user: User = baker.make(User)
+        self.profile = self.user.profile
+        self.pin = _make_pin_with_label(self.profile, baker.make(Label, profile=self.profile, kind="tag"))
+
+    def test_new_review_refreshes_its_pin(self) -> None:
+        with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
+            baker.make(Review, pin=self.pin, rating=4)
+
+        mock_cache_cls.return_value.refresh_pins.assert_called_once_with({self.pin.pk})
+
+    def test_editing_an_older_review_leaves_the_cache_alone(self) -> None:
+        older = baker.make(Review, pin=self.pin, rating=2)
+        baker.make(Review, pin=self.pin, rating=5)
+
+        with mock.patch("urbanlens.dashboard.services.map_pins.MapPinCache") as mock_cache_cls, self.captureOnCommitCallbacks(execute=True):
+            older.rating = 3
+            older.save()
+
+        mock_cache_cls.return_value.refresh_pins.assert_not_called()
+
+
+class _Profile:
+    pk = 42
+
+
+class MapPinCacheLabelIndexTests(SimpleTestCase):
+    def _cache(self) -> tuple[MapPinCache, mock.MagicMock]:
+        client = mock.MagicMock()
+        return MapPinCache(_Profile(), client=client), client.pipeline.return_value.__enter__.return_value
+
+    def test_label_lookup_reads_one_lexicographic_range_per_label(self) -> None:
+        cache, pipe = self._cache()
+        pipe.execute.return_value = [["1:10", "1:11"], ["12:11"]]
+
+        self.assertEqual(cache.pin_ids_for_labels([1, 12]), {10, 11})
+        self.assertEqual(
+            pipe.zrangebylex.call_args_list,
+            [mock.call(cache.label_pins_key, "[1:", "(1;"), mock.call(cache.label_pins_key, "[12:", "(12;")],
+        )
+
+    def test_reindexing_a_pin_writes_only_the_label_changes(self) -> None:
+        cache, pipe = self._cache()
+
+        cache._queue_label_index(pipe, "10", "1,3", [3, 4])
+
+        pipe.zrem.assert_called_once_with(cache.label_pins_key, "1:10")
+        pipe.zadd.assert_called_once_with(cache.label_pins_key, {"4:10": 0})
+        pipe.hset.assert_called_once_with(cache.pin_labels_key, "10", "3,4")
+
+    def test_unchanged_labels_write_nothing(self) -> None:
+        cache, pipe = self._cache()
+
+        cache._queue_label_index(pipe, "10", "3,4", [4, 3])
+
+        pipe.zrem.assert_not_called()
+        pipe.zadd.assert_not_called()
+        pipe.hset.assert_not_called()
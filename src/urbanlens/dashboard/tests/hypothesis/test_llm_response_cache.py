@@ -0,0 +1,101 @@
+"""Tests for the opt-in LLM response cache.
+
+Key invariants:
+
+1. A gateway with a ``cache_policy`` answers a repeated conversation from the
+   cache: the provider is called once, and the hit adds no tokens and is
+   reported as ``served_from_cache``.
+2. Any change to the model, the system prompt or the request parameters is a
+   different cache entry.
+3. Replies without an ANSWER tag, and replies over the policy's size cap,
+   are never stored.
+4. A gateway without a policy - any feature missing from ``CACHE_POLICIES``
+   - always calls the provider.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from urbanlens.core.tests.testcase import SimpleTestCase
+from urbanlens.dashboard.services.ai.gateway import LLMGateway
+from urbanlens.dashboard.services.ai.message import MessageQueue
+from urbanlens.dashboard.services.ai.response_cache import LLMCachePolicy, cache_key, policy_for
+
+_LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+_POLICY = LLMCachePolicy(ttl_seconds=60, max_response_chars=100)
+
+
+class _StubGateway(LLMGateway[str]):
+    """Gateway whose provider call is a mock returning ``reply``."""
+
+    def __init__(self, reply: str = "<ANSWER>Ruins</ANSWER>", **kwargs) -> None:
+        self.provider = mock.Mock(return_value=reply)
+        super().__init__(**kwargs)
+
+    def calculate_tokens(self, prompt: str) -> int:
+        return len(prompt.split())
+
+    def _get_response(self, message_queue: MessageQueue) -> str | None:
+        return self.provider(message_queue)
+
+    def _parse_response(self, response: str) -> str | None:
+        return response
+
+
+@override_settings(CACHES=_LOCMEM_CACHES)
+class LLMResponseCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+
+    def test_a_repeated_prompt_is_answered_from_the_cache(self) -> None:
+        first = _StubGateway(cache_policy=_POLICY)
+        self.assertEqual(first.send_prompt("Old mill by the river"), "Ruins")
+
+        second = _StubGateway(cache_policy=_POLICY)
+        self.assertEqual(second.send_prompt_list("Old mill by the river"), ["Ruins"])
+
+        second.provider.assert_not_called()
+        self.assertEqual((second.cache_hits, second.cache_misses, second.tokens), (1, 0, 0))
+        self.assertEqual((first.cache_hits, first.cache_misses), (0, 1))
+        self.assertGreater(first.tokens, 0)
+        self.assertEqual((first.served_from_cache, second.served_from_cache), (False, True))
+
+    def test_model_instructions_and_parameters_change_the_key(self) -> None:
+        _StubGateway(cache_policy=_POLICY).send_prompt("Old mill")
+
+        for gateway in (
+            _StubGateway(cache_policy=_POLICY, model="other-model"),
+            _StubGateway(cache_policy=_POLICY, instructions="Answer in French."),
+        ):
+            gateway.send_prompt("Old mill")
+            gateway.provider.assert_called_once()
+
+        queue = MessageQueue()
+        queue.add_message("Old mill")
+        self.assertNotEqual(cache_key("_StubGateway", "m", queue, {"max_tokens": 10}), cache_key("_StubGateway", "m", queue, {"max_tokens": 20}))
+
+    def test_unanswered_and_oversized_replies_are_not_stored(self) -> None:
+        for reply in ("I can't tell.", f"<ANSWER>{'x' * 200}</ANSWER>"):
+            cache.clear()
+            _StubGateway(reply, cache_policy=_POLICY).send_prompt("Old mill")
+
+            again = _StubGateway(reply, cache_policy=_POLICY)
+            again.send_prompt("Old mill")
+
+            again.provider.assert_called_once()
+
+    def test_gateways_without_a_policy_always_call_the_provider(self) -> None:
+        _StubGateway().send_prompt("Old mill")
+        gateway = _StubGateway()
+
+        gateway.send_prompt("Old mill")
+
+        gateway.provider.assert_called_once()
+        self.assertEqual((gateway.cache_hits, gateway.cache_misses), (0, 0))
+        self.assertIsNone(policy_for("trivia_moderation"))
+        self.assertIsNone(policy_for(None))
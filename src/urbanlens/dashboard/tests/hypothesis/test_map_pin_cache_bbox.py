@@ -0,0 +1,109 @@
+"""Tests for viewport (bbox) pages served from the map-pin cache's GEO index."""
+
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from urbanlens.core.tests.testcase import SimpleTestCase
+from urbanlens.dashboard.services.map_pins.cache import _GEO_MAX_LATITUDE, MapPinCache, _geo_search_boxes, _haversine_km
+
+
+class _Profile:
+    pk = 42
+
+
+def _in_valkey_box(latitude: float, longitude: float, box: tuple[float, float, float, float]) -> bool:
+    """Valkey's GEOSEARCH BYBOX membership test (geohashGetDistanceIfInRectangle)."""
+    center_lon, center_lat, width, height = box
+    return _haversine_km(latitude, longitude, center_lat, longitude) <= height / 2 and _haversine_km(latitude, longitude, latitude, center_lon) <= width / 2
+
+
+def _client_with_pins(pins: dict[int, tuple[float, float]]) -> mock.Mock:
+    """A mock client whose GEOSEARCH returns every pin, leaving the bbox test to the cache."""
+    client = mock.Mock()
+    client.exists.return_value = 1
+    geo_result = [[str(pin_id), (lon, lat)] for pin_id, (lat, lon) in pins.items()]
+    pipe = client.pipeline.return_value.__enter__.return_value
+    pipe.execute.side_effect = lambda: [geo_result for _ in pipe.geosearch.call_args_list]
+    client.hmget.side_effect = lambda _key, ids: [json.dumps({"id": int(pin_id)}) for pin_id in ids]
+    return client
+
+
+class GeoSearchBoxesTests(SimpleTestCase):
+    """The GEOSEARCH boxes always cover the requested bbox."""
+
+    @settings(max_examples=200, deadline=None)
+    @given(
+        lats=st.tuples(st.floats(-_GEO_MAX_LATITUDE, _GEO_MAX_LATITUDE), st.floats(-_GEO_MAX_LATITUDE, _GEO_MAX_LATITUDE)),
+        lons=st.tuples(st.floats(-180, 180), st.floats(-180, 180)),
+        fractions=st.tuples(st.floats(0, 1), st.floats(0, 1)),
+    )
+    def test_every_point_in_bbox_falls_in_some_box(self, lats, lons, fractions) -> None:
+        south, north = sorted(lats)
+        west, east = sorted(lons)
+        boxes = _geo_search_boxes(south, west, north, east)
+        if south == north or west == east:
+            self.assertEqual(boxes, [])
+            return
+        latitude = south + (north - south) * fractions[0]
+        longitude = west + (east - west) * fractions[1]
+        self.assertTrue(any(_in_valkey_box(latitude, longitude, box) for box in boxes))
+
+    def test_wide_viewports_are_split(self) -> None:
+        self.assertEqual(len(_geo_search_boxes(-60, -180, 60, 180)), 4)
+        self.assertEqual(len(_geo_search_boxes(40, -75, 41, -73)), 1)
+
+    def test_bbox_outside_the_world_has_no_boxes(self) -> None:
+        self.assertEqual(_geo_search_boxes(10, 190, 20, 200), [])
+
+
+class MapPinCacheBboxPageTests(SimpleTestCase):
+    """Bbox cache hits return only pins inside the viewport, in pk cursor order."""
+
+    PINS = {
+        5: (40.5, -74.0),
+        9: (40.7, -73.9),
+        12: (10.0, 10.0),
+        20: (40.6, -73.5),
+    }
+
+    def test_page_filters_to_bbox(self) -> None:
+        cache = MapPinCache(_Profile(), client=_client_with_pins(self.PINS))
+
+        page = cache.get_page(cursor=None, limit=10, include_total=True, bbox=(40, -75, 41, -73))
+
+        self.assertEqual([pin["id"] for pin in page.pins], [5, 9, 20])
+        self.assertEqual(page.total, 3)
+        self.assertIsNone(page.next_cursor)
+
+    def test_page_keeps_cursor_semantics(self) -> None:
+        cache = MapPinCache(_Profile(), client=_client_with_pins(self.PINS))
+
+        first = cache.get_page(cursor=None, limit=2, include_total=False, bbox=(40, -75, 41, -73))
+        second = cache.get_page(cursor=first.next_cursor, limit=2, include_total=False, bbox=(40, -75, 41, -73))
+
+        self.assertEqual([pin["id"] for pin in first.pins], [5, 9])
+        self.assertEqual(first.next_cursor, 9)
+        self.assertEqual([pin["id"] for pin in second.pins], [20])
+        self.assertIsNone(second.next_cursor)
+
+    def test_unordered_bbox_corners_are_normalized(self) -> None:
+        cache = MapPinCache(_Profile(), client=_client_with_pins(self.PINS))
+
+        self.assertEqual(cache.ids_within_bounds(41, -73, 40, -75), [5, 9, 20])
+
+    def test_page_without_bbox_uses_pk_order(self) -> None:
+        client = _client_with_pins(self.PINS)
+        client.zrangebyscore.return_value = ["5", "9"]
+        client.zcard.return_value = 4
+        cache = MapPinCache(_Profile(), client=client)
+
+        page = cache.get_page(cursor=None, limit=10, include_total=True)
+
+        self.assertEqual([pin["id"] for pin in page.pins], [5, 9])
+        self.assertEqual(page.total, 4)
+        client.pipeline.return_value.__enter__.return_value.geosearch.assert_not_called()
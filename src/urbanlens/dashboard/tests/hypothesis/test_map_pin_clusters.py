@@ -0,0 +1,156 @@
+"""Tests for server-side map pin clustering (GET map.pins.clusters).
+
+Below ``settings.map_cluster_max_zoom`` the map asks for grid-cell aggregates
+instead of every pin; at or above it the same endpoint pages individual pins
+exactly like map.pins. The aggregates themselves live in
+services/map_pins/clusters.py and are shared by the Valkey cache and the
+uncached fallback. A viewport spanning more than ``MAX_CLUSTER_CELLS`` cells
+is clustered from the database whether or not the cache is warm, so the
+answer never depends on cache state.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+from urllib.parse import urlencode
+
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import SimpleTestCase, TestCase
+from urbanlens.dashboard.models.location.model import Location
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.services.map_pins.cache import MapPinCache
+from urbanlens.dashboard.services.map_pins.clusters import (
+    MAX_CLUSTER_CELLS,
+    MapPinClusterGrid,
+    cell_fields_for_bbox,
+    cell_xy,
+    cluster_payload,
+    member_record,
+)
+
+
+def _pin(pin_id: int, latitude: float, longitude: float, status: str = "", color: str | None = None) -> dict:
+    return {"id": pin_id, "latitude": latitude, "longitude": longitude, "status": status, "color": color}
+
+
+class ClusterCellTests(SimpleTestCase):
+    def test_zoom_zero_has_four_cells_per_side(self) -> None:
+        self.assertEqual(cell_xy(84, -179.9, 0), (0, 0))
+        self.assertEqual(cell_xy(-84, 179.9, 0), (3, 3))
+
+    def test_out_of_range_coordinates_are_clamped(self) -> None:
+        self.assertEqual(cell_xy(90, 180, 0), (3, 0))
+        self.assertEqual(cell_xy(-90, -180, 0), (0, 3))
+
+    def test_bbox_cells_include_every_member_cell(self) -> None:
+        fields = cell_fields_for_bbox(40, -75, 41, -73, 8)
+        member = member_record(_pin(1, 40.5, -74.0), (8,))
+        self.assertIn(member["cells"][0], fields)
+
+    def test_oversized_bbox_is_rejected(self) -> None:
+        self.assertIsNone(cell_fields_for_bbox(-80, -180, 80, 180, 10))
+        self.assertLessEqual(len(cell_fields_for_bbox(-80, -180, 80, 180, 3)), MAX_CLUSTER_CELLS)
+
+    def test_bbox_outside_the_world_has_no_cells(self) -> None:
+        self.assertEqual(cell_fields_for_bbox(10, 190, 20, 200, 3), [])
+
+
+class MapPinClusterGridTests(SimpleTestCase):
+    def test_aggregates_count_centroid_bbox_and_dominant_values(self) -> None:
+        grid = MapPinClusterGrid()
+        for pin in (
+            _pin(1, 40.0, -74.0, "Visited", "#ff0000"),
+            _pin(2, 40.2, -74.2, "Visited", "#00ff00"),
+            _pin(3, 40.4, -74.4, "Want to visit", "#00ff00"),
+        ):
+            grid.add(member_record(pin, (3,)))
+
+        [cluster] = grid.clusters()
+
+        self.assertEqual(cluster["count"], 3)
+        self.assertAlmostEqual(cluster["latitude"], 40.2)
+        self.assertAlmostEqual(cluster["longitude"], -74.2)
+        self.assertEqual(cluster["bbox"], [40.0, -74.4, 40.4, -74.0])
+        self.assertEqual(cluster["status"], "Visited")
+        self.assertEqual(cluster["color"], "#00ff00")
+
+    def test_pins_without_status_or_color_leave_them_blank(self) -> None:
+        grid = MapPinClusterGrid()
+        grid.add(member_record(_pin(1, 10.0, 10.0), (3,)))
+
+        [cluster] = grid.clusters()
+
+        self.assertEqual(cluster["status"], "")
+        self.assertIsNone(cluster["color"])
+
+    def test_one_member_per_zoom_level(self) -> None:
+        member = member_record(_pin(1, 40.0, -74.0), range(4))
+        self.assertEqual([field.split(":")[0] for field in member["cells"]], ["0", "1", "2", "3"])
+
+    def test_lua_empty_tables_decode_as_no_dominant_value(self) -> None:
+        cluster = cluster_payload({"count": 1, "lat": 1.0, "lng": 2.0, "s": 1.0, "w": 2.0, "n": 1.0, "e": 2.0, "status": [], "color": []})
+        self.assertEqual(cluster["status"], "")
+        self.assertIsNone(cluster["color"])
+
+
+class _Profile:
+    pk = 42
+
+
+class CachedClustersTests(SimpleTestCase):
+    def test_oversized_viewport_is_clustered_uncached_on_a_warm_cache(self) -> None:
+        client = mock.Mock()
+        client.exists.return_value = 1
+        cache = MapPinCache(_Profile(), client=client)
+        client.hget.return_value = str(len(cache.cluster_zooms))
+        pins = [_pin(1, 40.0, -74.0), _pin(2, 10.0, 10.0)]
+
+        with mock.patch.object(cache.payload, "all", return_value=pins), mock.patch.object(cache, "enqueue_rebuild") as rebuild:
+            result = cache.get_or_build_clusters(Pin.objects.none(), zoom=10, bbox=(-80, -180, 80, 180))
+
+        self.assertFalse(result.hit)
+        self.assertEqual(sum(cluster["count"] for cluster in result.clusters), 2)
+        client.hmget.assert_not_called()
+        rebuild.assert_not_called()
+        self.assertIsNone(cache.get_clusters(zoom=10, bbox=(-80, -180, 80, 180)))
+
+
+class MapPinClustersViewTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user = baker.make(User)
+        self.profile = self.user.profile
+        self.client = Client()
+        self.client.force_login(self.user)
+        baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="40.0", longitude="-74.0"))
+        baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="40.1", longitude="-74.1"))
+        baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="10.0", longitude="10.0"))
+
+    def _get(self, **params):
+        return self.client.get(f"{reverse('map.pins.clusters')}?{urlencode(params)}")
+
+    def test_low_zoom_returns_clusters_within_bbox(self) -> None:
+        response = self._get(zoom=3, bbox="30,-80,50,-60")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["mode"], "clusters")
+        self.assertEqual(sum(cluster["count"] for cluster in data["clusters"]), 2)
+
+    def test_high_zoom_returns_individual_pins(self) -> None:
+        with mock.patch("urbanlens.dashboard.controllers.maps.settings.map_cluster_max_zoom", 10):
+            response = self._get(zoom=10, bbox="30,-80,50,-60")
+
+        data = response.json()
+        self.assertEqual(data["mode"], "pins")
+        self.assertEqual(len(data["pins"]), 2)
+        self.assertTrue(all("viewLocationUrl" in pin for pin in data["pins"]))
+
+    def test_missing_zoom_or_bbox_is_rejected(self) -> None:
+        self.assertEqual(self._get(bbox="30,-80,50,-60").status_code, 400)
+        self.assertEqual(self._get(zoom=3).status_code, 400)
+        self.assertEqual(self._get(zoom=-1, bbox="30,-80,50,-60").status_code, 400)
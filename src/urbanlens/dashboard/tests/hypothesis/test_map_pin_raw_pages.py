@@ -0,0 +1,116 @@
+"""Tests for serving cached map pin pages without decoding them.
+
+MapPinCache stores each pin exactly as the web map receives it (including
+viewLocationUrl), so cache hits are spliced into the response body as-is, and
+gzip-compressed bodies are kept per page under the cache fingerprint.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import SimpleTestCase, TestCase
+from urbanlens.dashboard.controllers.maps import _accepts_gzip
+from urbanlens.dashboard.models.location.model import Location
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.services.map_pins.cache import MapPinCache
+from urbanlens.dashboard.services.map_pins.payload import MapPinPage
+
+
+class _Profile:
+    pk = 42
+
+
+class MapPinCacheRawPageTests(SimpleTestCase):
+    def _cache(self) -> tuple[MapPinCache, mock.Mock, mock.Mock]:
+        client = mock.MagicMock()
+        client.exists.return_value = 1
+        client.zrangebyscore.return_value = ["1", "2"]
+        client.hmget.side_effect = lambda _key, ids: [f'{{"id":{pin_id}}}' for pin_id in ids]
+        binary_client = mock.Mock()
+        return MapPinCache(_Profile(), client=client, binary_client=binary_client), client, binary_client
+
+    def test_raw_page_returns_stored_fragments(self) -> None:
+        cache, _, _ = self._cache()
+
+        page = cache.get_page(cursor=None, limit=10, include_total=False, raw=True)
+
+        self.assertEqual(page.raw_pins, ['{"id":1}', '{"id":2}'])
+        self.assertEqual(page.pins, [])
+
+    def test_decoded_page_is_unchanged(self) -> None:
+        cache, _, _ = self._cache()
+
+        page = cache.get_page(cursor=None, limit=10, include_total=False)
+
+        self.assertEqual(page.pins, [{"id": 1}, {"id": 2}])
+        self.assertIsNone(page.raw_pins)
+
+    def test_stored_entries_carry_view_location_url(self) -> None:
+        cache, _, _ = self._cache()
+
+        entry = json.loads(cache._encode_entry({"id": 1, "slug": "old-mill"}))
+
+        self.assertEqual(entry["viewLocationUrl"], "/dashboard/map/pin/old-mill/")
+
+    def test_compressed_pages_are_keyed_on_the_fingerprint(self) -> None:
+        cache, _, binary_client = self._cache()
+
+        cache.store_compressed_page("cache:1:1", "page", b"body")
+        stored_key = binary_client.set.call_args.args[0]
+        cache.get_compressed_page("cache:1:2", "page")
+
+        self.assertNotEqual(binary_client.get.call_args.args[0], stored_key)
+
+    def test_cold_cache_never_stores_compressed_pages(self) -> None:
+        cache, _, binary_client = self._cache()
+
+        cache.store_compressed_page(None, "page", b"body")
+
+        self.assertIsNone(cache.get_compressed_page(None, "page"))
+        binary_client.set.assert_not_called()
+
+
+class AcceptsGzipTests(SimpleTestCase):
+    def test_gzip_needs_a_non_zero_quality(self) -> None:
+        for header in ("gzip", "deflate, gzip;q=0.5", "GZIP", "x-gzip", "br, *", "gzip ; q=1.0"):
+            self.assertTrue(_accepts_gzip(header), header)
+        for header in ("", "gzip;q=0", "identity", "br, deflate", "notgzip", "gzipped", "*;q=0", "gzip;q=0, *", "gzip;q=oops"):
+            self.assertFalse(_accepts_gzip(header), header)
+
+
+class MapPinsResponseTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user = baker.make(User)
+        self.client = Client()
+        self.client.force_login(self.user)
+        self.pin = baker.make(Pin, profile=self.user.profile, location=baker.make(Location, latitude="40.0", longitude="-74.0"))
+
+    def test_cache_miss_adds_view_location_url(self) -> None:
+        data = self.client.get(reverse("map.pins")).json()
+
+        self.assertEqual(data["cache"], "miss")
+        self.assertEqual(data["pins"][0]["viewLocationUrl"], f"/dashboard/map/pin/{self.pin.slug}/")
+
+    def test_cache_hit_splices_fragments_and_compresses(self) -> None:
+        page = MapPinPage(pins=[], next_cursor=None, total=1, raw_pins=['{"id":1,"viewLocationUrl":"/dashboard/map/pin/x/"}'])
+        with (
+            mock.patch.object(MapPinCache, "cached_fingerprint", return_value="cache:1:0"),
+            mock.patch.object(MapPinCache, "get_compressed_page", return_value=None),
+            mock.patch.object(MapPinCache, "store_compressed_page") as store,
+            mock.patch.object(MapPinCache, "get_or_build_page", return_value=mock.Mock(page=page, hit=True)),
+        ):
+            response = self.client.get(reverse("map.pins"), {"include_total": "1"}, headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(data, {"pins": [{"id": 1, "viewLocationUrl": "/dashboard/map/pin/x/"}], "next_cursor": None, "cache": "hit", "total": 1})
+        store.assert_called_once()
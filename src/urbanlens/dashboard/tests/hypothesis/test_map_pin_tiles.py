@@ -0,0 +1,172 @@
+"""Tests for columnar map-pin tiles (GET map.pins.tile).
+
+Tiles carry the same MapPinPayloadService fields as map.pins for the pins in
+one slippy-map tile, with label/icon strings interned once per tile, and an
+ETag hashed from the tile's content so unchanged tiles revalidate as 304s -
+including across the cache warming up. Tile boxes are half-open, so a pin on
+an edge two tiles share is served by exactly one of them, cached or not.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import SimpleTestCase, TestCase
+from urbanlens.dashboard.models.location.model import Location
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.services.map_pins.cache import MapPinCache
+from urbanlens.dashboard.services.map_pins.tiles import decode_columnar_tile, encode_columnar_tile, tile_bounds, tile_contains
+
+
+def _payload(pin_id: int, tags: list[dict]) -> dict:
+    return {
+        "id": pin_id,
+        "uuid": f"uuid-{pin_id}",
+        "slug": f"pin-{pin_id}",
+        "name": f"Pin {pin_id}",
+        "icon": "factory",
+        "description": "",
+        "priority": 3,
+        "last_visited": "never",
+        "latitude": 40.0 + pin_id / 100,
+        "longitude": -74.0,
+        "status": "Visited" if pin_id % 2 else "",
+        "categories": ["Industrial"],
+        "rating": 0,
+        "color": "#ff0000",
+        "tags": tags,
+        "address": None,
+        "own_icon": None,
+        "own_custom_icon_url": None,
+        "own_color": None,
+        "child_count": 0,
+    }
+
+
+class ColumnarTileTests(SimpleTestCase):
+    TAG = {"id": 1, "name": "Factory", "color": "#ff0000", "icon": "factory"}
+
+    def test_round_trip_preserves_payloads(self) -> None:
+        pins = [_payload(1, [self.TAG]), _payload(2, [])]
+
+        self.assertEqual(decode_columnar_tile(encode_columnar_tile(pins)), pins)
+
+    def test_repeated_strings_and_tags_are_interned_once(self) -> None:
+        tile = encode_columnar_tile([_payload(pin_id, [self.TAG]) for pin_id in range(1, 50)])
+
+        self.assertEqual(len(tile["tags"]), 1)
+        self.assertEqual(tile["strings"].count("factory"), 1)
+        self.assertEqual(tile["columns"]["tags"], [[0]] * 49)
+
+    def test_empty_tile_has_empty_columns(self) -> None:
+        tile = encode_columnar_tile([])
+
+        self.assertEqual(tile["columns"]["id"], [])
+        self.assertEqual(decode_columnar_tile(tile), [])
+
+
+class TileBoundsTests(SimpleTestCase):
+    def test_zoom_zero_covers_the_world(self) -> None:
+        self.assertEqual(tile_bounds(0, 0, 0), (-90.0, -180.0, 90.0, 180.0))
+
+    def test_zoom_one_north_east_quadrant(self) -> None:
+        self.assertEqual(tile_bounds(1, 1, 0), (0.0, 0.0, 90.0, 180.0))
+
+    def test_out_of_range_tiles_are_rejected(self) -> None:
+        self.assertIsNone(tile_bounds(2, 4, 0))
+        self.assertIsNone(tile_bounds(-1, 0, 0))
+        self.assertIsNone(tile_bounds(30, 0, 0))
+
+    def test_a_point_on_a_shared_edge_lies_in_exactly_one_tile(self) -> None:
+        tiles = [tile_bounds(1, x, y) for x in range(2) for y in range(2)]
+
+        self.assertEqual([tile_contains(bounds, 0.0, 0.0) for bounds in tiles], [False, False, True, False])
+
+    def test_the_worlds_north_and_east_edges_are_closed(self) -> None:
+        self.assertTrue(tile_contains(tile_bounds(1, 1, 0), 90.0, 180.0))
+        self.assertFalse(tile_contains(tile_bounds(1, 1, 1), 0.0, 180.0))
+
+
+class _Profile:
+    pk = 42
+
+
+class CachedTileTests(SimpleTestCase):
+    def test_edge_pin_is_placed_by_its_exact_coordinates(self) -> None:
+        client = mock.Mock()
+        client.exists.return_value = True
+        # The GEO index hands back a geohash-rounded longitude just west of 0.
+        client.pipeline.return_value.__enter__.return_value.execute.return_value = [[("7", (-0.000002, 10.0))]]
+        client.hmget.return_value = ['{"id": 7, "latitude": 10.0, "longitude": 0.0}']
+        cache = MapPinCache(_Profile(), client=client)
+
+        west = cache.get_or_build_within_bounds(mock.Mock(), bbox=tile_bounds(1, 0, 0))
+        east = cache.get_or_build_within_bounds(mock.Mock(), bbox=tile_bounds(1, 1, 0))
+
+        self.assertEqual(west.page.pins, [])
+        self.assertEqual([pin["id"] for pin in east.page.pins], [7])
+
+
+class MapPinTileViewTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user = baker.make(User)
+        self.profile = self.user.profile
+        self.client = Client()
+        self.client.force_login(self.user)
+        self.pin = baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="40.0", longitude="-74.0"))
+        baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="-33.0", longitude="151.0"))
+
+    def _url(self, zoom: int, x: int, y: int) -> str:
+        return reverse("map.pins.tile", kwargs={"zoom": zoom, "x": x, "y": y})
+
+    def test_tile_returns_only_pins_inside_it(self) -> None:
+        response = self.client.get(self._url(1, 0, 0))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["columns"]["id"], [self.pin.pk])
+        self.assertIn("ETag", response)
+
+    def test_matching_etag_returns_not_modified(self) -> None:
+        etag = self.client.get(self._url(1, 0, 0))["ETag"]
+
+        response = self.client.get(self._url(1, 0, 0), headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_pin_edit_changes_the_etag(self) -> None:
+        etag = self.client.get(self._url(1, 0, 0))["ETag"]
+        self.pin.name = "Renamed"
+        self.pin.save()
+
+        response = self.client.get(self._url(1, 0, 0), headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_survives_the_cache_warming_up(self) -> None:
+        etag = self.client.get(self._url(1, 0, 0))["ETag"]
+        build = MapPinCache.get_or_build_within_bounds
+
+        def warm(cache, *args, **kwargs):
+            return dataclasses.replace(build(cache, *args, **kwargs), hit=True)
+
+        with mock.patch.object(MapPinCache, "get_or_build_within_bounds", warm):
+            response = self.client.get(self._url(1, 0, 0), headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_pin_on_a_shared_edge_is_served_by_one_tile(self) -> None:
+        edge_pin = baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="0.0", longitude="0.0"))
+
+        tiles = [self.client.get(self._url(1, x, y)).json()["columns"]["id"] for x in range(2) for y in range(2)]
+
+        self.assertEqual([edge_pin.pk in ids for ids in tiles], [False, False, True, False])
+
+    def test_invalid_tile_is_rejected(self) -> None:
+        self.assertEqual(self.client.get(self._url(1, 2, 0)).status_code, 400)
@@ -55,6 +55,14 @@ class NavbarMessagesIconVisibilityTests(TestCase):
         friendship.decline()
         self.assertFalse(self._show())
 
+    def test_a_visible_icon_is_remembered_without_requerying(self) -> None:
+        Friendship.request(self.user.profile, self.other.profile).accept()
+        self.assertTrue(self._show())
+
+        # Only the e2ee key-bundle check remains (and only for passwordless users).
+        with self.assertNumQueries(0 if self.user.has_usable_password() else 1):
+            self.assertTrue(self._show())
+
 
 class FriendshipEverFriendsQuerySetTests(TestCase):
     def setUp(self) -> None:
@@ -7,6 +7,9 @@ returns every pin whose footprint intersects another pin's footprint (from the
 same queryset), which - since every pin resolves to *some* footprint - also
 catches pins accidentally left stacked on identical/near-identical
 coordinates (e.g. by the merge/child-pin coordinate bugs).
+
+The same overlaps are also reported as connected groups, keyset-paged by
+each group's lowest pin PK (``services.pin_overlaps`` / map.pins.overlaps).
 """
 
 from __future__ import annotations
@@ -21,6 +24,7 @@ from urbanlens.dashboard.forms.search import SearchForm
 from urbanlens.dashboard.models.boundary.model import Boundary, BoundaryType
 from urbanlens.dashboard.models.location.model import Location
 from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.services.pin_overlaps import overlap_group_page, overlap_groups
 
 
 def _pin_at(profile, name: str, latitude: float, longitude: float) -> Pin:
@@ -119,3 +123,48 @@ class OverlappingPinsSearchIntegrationTests(TestCase):
         self.assertIn(str(a.uuid), body)
         self.assertIn(str(b.uuid), body)
         self.assertNotIn(str(far.uuid), body)
+
+
+class OverlapGroupTests(TestCase):
+    def setUp(self) -> None:
+        self.user = baker.make(User)
+        self.profile = self.user.profile
+        self.client.force_login(self.user)
+
+    def test_chained_overlaps_form_one_group(self) -> None:
+        # A-B and B-C overlap (~70m apart, 100m combined radius); A-C do not.
+        a = _pin_at(self.profile, "A", 42.0000, -73.0000)
+        b = _pin_at(self.profile, "B", 42.0000, -72.9991)
+        c = _pin_at(self.profile, "C", 42.0000, -72.9982)
+        d = _pin_at(self.profile, "D", 10.0000, 10.0000)
+        e = _pin_at(self.profile, "E", 10.0001, 10.0001)
+        _pin_at(self.profile, "Alone", -30.0000, 20.0000)
+
+        groups = overlap_groups(Pin.objects.filter(profile=self.profile))
+
+        self.assertEqual(groups, [sorted([a.pk, b.pk, c.pk]), sorted([d.pk, e.pk])])
+
+    def test_groups_page_by_lowest_pin(self) -> None:
+        for offset in range(3):
+            _pin_at(self.profile, f"A{offset}", 10.0 + offset, 10.0)
+            _pin_at(self.profile, f"B{offset}", 10.0001 + offset, 10.0001)
+        pins = Pin.objects.filter(profile=self.profile)
+
+        first = overlap_group_page(pins, limit=2)
+        second = overlap_group_page(pins, cursor=first.next_cursor, limit=2)
+
+        self.assertEqual(first.total, 3)
+        self.assertEqual(len(first.groups), 2)
+        self.assertEqual(len(second.groups), 1)
+        self.assertIsNone(second.next_cursor)
+
+    def test_report_endpoint_returns_groups(self) -> None:
+        a = _pin_at(self.profile, "A", 42.00000, -73.00000)
+        b = _pin_at(self.profile, "B", 42.00010, -73.00010)
+        _pin_at(self.profile, "Far", 10.0000, 10.0000)
+
+        data = self.client.get(reverse("map.pins.overlaps")).json()
+
+        self.assertEqual(data["total"], 1)
+        self.assertIsNone(data["next_cursor"])
+        self.assertEqual([pin["id"] for pin in data["groups"][0]["pins"]], sorted([a.pk, b.pk]))
@@ -0,0 +1,135 @@
+"""Tests for the chunked photo-library import pipeline.
+
+Key invariants:
+
+1. An asset whose ``source_url`` is already on the target is skipped without
+   being downloaded, so a redelivered task resumes instead of starting over.
+2. Each chunk is committed before a transient ``OSError`` from it is
+   re-raised for the task's autoretry.
+3. Checksum dedupe and the quota check see assets admitted earlier in the
+   same chunk, not just rows already in the database.
+4. Progress is reported once per chunk, plus the final summary.
+5. Storage writes happen before the per-profile upload lock is taken, so the
+   lock only spans the quota check and the insert.
+6. A written file that never gets its row - rejected by the quota, or part
+   of a failed insert - is deleted again.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from model_bakery import baker
+import pytest
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.images.model import Image
+from urbanlens.dashboard.services import photo_import_pipeline
+from urbanlens.dashboard.services.gateway import GatewayRequestError
+from urbanlens.dashboard.services.photo_import_pipeline import ImportAsset, run_photo_import
+
+
+def _asset(key: str, content: bytes = b"", *, error: BaseException | None = None) -> ImportAsset:
+    download = mock.Mock(side_effect=error) if error is not None else mock.Mock(return_value=(content or key.encode(), f"{key}.jpg"))
+    return ImportAsset(key=key, source_url=f"https://photos.example.com/{key}", download=download)
+
+
+class RunPhotoImportTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.profile = baker.make(User).profile
+        self.location = baker.make("dashboard.Location")
+        self.pin = baker.make_recipe("dashboard.pin", profile=self.profile, location=self.location)
+        self.progress = mock.Mock()
+        enqueue = mock.patch("urbanlens.dashboard.services.celery.safely_enqueue_task")
+        self.enqueue = enqueue.start()
+        self.addCleanup(enqueue.stop)
+
+    def _run(self, assets: list[ImportAsset]) -> dict[str, int]:
+        return run_photo_import(assets, profile=self.profile, location=self.location, pin=self.pin, progress=self.progress, label="test")
+
+    def test_already_imported_source_urls_are_not_downloaded_again(self) -> None:
+        done, fresh = _asset("done"), _asset("fresh")
+        baker.make(Image, pin=self.pin, profile=self.profile, source_url=done.source_url)
+
+        counts = self._run([done, fresh])
+
+        self.assertEqual(counts, {"imported": 1, "skipped": 1, "failed": 0})
+        done.download.assert_not_called()
+        self.assertTrue(Image.objects.filter(pin=self.pin, source_url=fresh.source_url).exists())
+
+    def test_a_transient_error_is_raised_after_its_chunk_commits(self) -> None:
+        assets = [_asset("a"), _asset("b", error=ConnectionError("reset")), _asset("c")]
+
+        with pytest.raises(ConnectionError):
+            self._run(assets)
+
+        self.assertEqual(set(Image.objects.filter(pin=self.pin).values_list("source_url", flat=True)), {assets[0].source_url, assets[2].source_url})
+        counts = self._run([_asset("a"), _asset("b"), _asset("c")])
+        self.assertEqual(counts, {"imported": 1, "skipped": 2, "failed": 0})
+
+    def test_gateway_errors_count_as_failed_without_raising(self) -> None:
+        counts = self._run([_asset("a", error=GatewayRequestError("gone")), _asset("b")])
+
+        self.assertEqual(counts, {"imported": 1, "skipped": 0, "failed": 1})
+
+    def test_duplicates_within_a_chunk_are_imported_once(self) -> None:
+        counts = self._run([_asset("a", b"same"), _asset("b", b"same")])
+
+        self.assertEqual(counts, {"imported": 1, "skipped": 1, "failed": 0})
+        self.assertEqual(self.enqueue.call_count, 1)
+
+    def test_quota_counts_bytes_admitted_earlier_in_the_chunk(self) -> None:
+        with mock.patch("urbanlens.dashboard.services.storage.quota_error_for_upload", side_effect=lambda _profile, size: "Full." if size > 10 else None):
+            counts = self._run([_asset("a", b"123456"), _asset("b", b"abcdef")])
+
+        self.assertEqual(counts, {"imported": 1, "skipped": 0, "failed": 1})
+
+    def test_files_are_written_before_the_upload_lock_is_taken(self) -> None:
+        events: list[str] = []
+        store = photo_import_pipeline._store
+
+        @contextlib.contextmanager
+        def lock(_profile):
+            events.append("lock")
+            yield True
+
+        def record_store(*args):
+            events.append("store")
+            store(*args)
+
+        with mock.patch("urbanlens.dashboard.services.storage.per_profile_upload_lock", lock), mock.patch.object(photo_import_pipeline, "_store", record_store):
+            self._run([_asset("a"), _asset("b")])
+
+        self.assertEqual(events, ["store", "store", "lock"])
+
+    def test_files_rejected_by_the_quota_are_deleted(self) -> None:
+        with (
+            mock.patch("urbanlens.dashboard.services.storage.quota_error_for_upload", side_effect=lambda _profile, size: "Full." if size > 10 else None),
+            mock.patch.object(photo_import_pipeline, "_discard") as discard,
+        ):
+            self._run([_asset("a", b"123456"), _asset("b", b"abcdef")])
+
+        self.assertEqual([call.args[0].source_url for call in discard.call_args_list], ["https://photos.example.com/b"])
+
+    def test_a_failed_insert_deletes_the_written_files(self) -> None:
+        with (
+            mock.patch.object(Image.objects, "bulk_create", side_effect=IntegrityError("boom")),
+            mock.patch.object(photo_import_pipeline, "_discard") as discard,
+            pytest.raises(IntegrityError),
+        ):
+            self._run([_asset("a"), _asset("b")])
+
+        self.assertEqual(len(discard.call_args_list), 2)
+        self.assertFalse(Image.objects.filter(pin=self.pin).exists())
+
+    def test_progress_is_reported_per_chunk(self) -> None:
+        with mock.patch.object(photo_import_pipeline, "IMPORT_CHUNK_SIZE", 2):
+            counts = self._run([_asset(str(index)) for index in range(5)])
+
+        self.assertEqual(counts["imported"], 5)
+        self.assertEqual([call.kwargs["current"] for call in self.progress.call_args_list], [0, 2, 4, 5])
+        self.assertEqual(self.progress.call_args_list[-1].kwargs["message"], "Imported 5.")
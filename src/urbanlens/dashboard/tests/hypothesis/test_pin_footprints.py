@@ -0,0 +1,96 @@
+"""Tests for materialized pin footprints.
+
+``PinFootprint`` stores each root pin's effective boundary so point-in-pin
+checks are one ``ST_Contains`` query instead of a boundary-resolution chain
+per candidate pin. Key invariants:
+
+1. A refresh stores exactly what the resolution chain answers - the pin's own
+   drawing, else the circle fallback - and nothing for detail pins.
+2. Boundary edits, pin moves and vote results re-resolve the affected pins
+   once the transaction commits.
+3. ``find_pin_containing_point`` and ``pins_containing`` read footprints, and
+   still resolve pins that don't have one yet, or whose one is null.
+"""
+
+from __future__ import annotations
+
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from model_bakery import baker
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.boundary.model import Boundary, BoundaryType
+from urbanlens.dashboard.models.location.model import Location
+from urbanlens.dashboard.models.pin.model import Pin
+from urbanlens.dashboard.models.pin_footprint.model import PinFootprint
+from urbanlens.dashboard.services.visits import find_pin_containing_point, record_geolocation_pin_visits
+
+
+def _square_around(lng: float, lat: float, delta: float = 0.01) -> MultiPolygon:
+    ring = ((lng - delta, lat - delta), (lng + delta, lat - delta), (lng + delta, lat + delta), (lng - delta, lat + delta), (lng - delta, lat - delta))
+    return MultiPolygon(Polygon(ring, srid=4326), srid=4326)
+
+
+class PinFootprintTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.profile = baker.make("auth.User").profile
+        self.location = baker.make(Location, latitude="40.000000", longitude="-74.000000")
+        self.pin = baker.make(Pin, profile=self.profile, location=self.location)
+
+    def _footprint(self, pin: Pin) -> PinFootprint | None:
+        return PinFootprint.objects.of_type(BoundaryType.PROPERTY).filter(pin=pin).first()
+
+    def test_refresh_stores_the_circle_fallback_and_skips_detail_pins(self) -> None:
+        detail = baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="40.000100", longitude="-74.000100"), parent_pin=self.pin)
+
+        PinFootprint.objects.refresh(Pin.objects.filter(pk__in=[self.pin.pk, detail.pk]))
+
+        footprint = self._footprint(self.pin)
+        self.assertIsNotNone(footprint.polygon)
+        self.assertTrue(footprint.polygon.contains(Point(-74.0, 40.0, srid=4326)))
+        self.assertIsNone(PinFootprint.objects.of_type(BoundaryType.BUILDING).get(pin=self.pin).polygon)
+        self.assertFalse(PinFootprint.objects.filter(pin=detail).exists())
+
+    def test_drawn_boundary_is_materialized_on_commit(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            baker.make(Boundary, pin=self.pin, profile=self.profile, location=self.location, boundary_type=BoundaryType.PROPERTY, polygon=_square_around(-74.0, 40.0))
+
+        # Well outside the 50 m circle, inside the drawn square.
+        self.assertTrue(self._footprint(self.pin).polygon.contains(Point(-74.008, 40.008, srid=4326)))
+
+    def test_moving_a_pin_refreshes_its_footprint(self) -> None:
+        PinFootprint.objects.refresh(Pin.objects.filter(pk=self.pin.pk))
+        pin = Pin.objects.get(pk=self.pin.pk)
+        pin.location = baker.make(Location, latitude="41.000000", longitude="-75.000000")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pin.save()
+
+        self.assertTrue(self._footprint(pin).polygon.contains(Point(-75.0, 41.0, srid=4326)))
+
+    def test_find_pin_containing_point_reads_footprints_in_one_query(self) -> None:
+        PinFootprint.objects.refresh(Pin.objects.filter(pk=self.pin.pk))
+        point = Point(-74.0001, 40.0001, srid=4326)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(find_pin_containing_point(self.profile, point), self.pin)
+
+    def test_pins_without_a_footprint_are_still_matched(self) -> None:
+        self.assertFalse(PinFootprint.objects.exists())
+        self.assertEqual(find_pin_containing_point(self.profile, Point(-74.0001, 40.0001, srid=4326)), self.pin)
+
+    def test_a_null_footprint_keeps_the_proximity_fallback(self) -> None:
+        PinFootprint.objects.create(pin=self.pin, profile=self.profile, boundary_type=BoundaryType.PROPERTY, polygon=None)
+        point = Point(-74.0001, 40.0001, srid=4326)
+
+        self.assertEqual(find_pin_containing_point(self.profile, point), self.pin)
+        self.assertEqual([visit.pin for visit in record_geolocation_pin_visits(self.profile, latitude=40.0001, longitude=-74.0001)], [self.pin])
+
+    def test_pins_containing_matches_a_batch_nearest_pin_first(self) -> None:
+        near = baker.make(Pin, profile=self.profile, location=baker.make(Location, latitude="40.005000", longitude="-74.005000"))
+        baker.make(Boundary, pin=self.pin, profile=self.profile, location=self.location, boundary_type=BoundaryType.PROPERTY, polygon=_square_around(-74.0, 40.0))
+        PinFootprint.objects.refresh(Pin.objects.filter(profile=self.profile))
+
+        matches = PinFootprint.objects.pins_containing(self.profile.pk, [(40.005, -74.005), (40.008, -74.008), (10.0, 10.0)], BoundaryType.PROPERTY)
+
+        self.assertEqual(matches, [near.pk, self.pin.pk, None])
@@ -0,0 +1,116 @@
+"""Tests for the concurrent provider fan-out behind the satellite/street carousels.
+
+Key invariants:
+
+1. Outcomes come back in submission order, whatever order the calls finish in.
+2. One call raising or missing its deadline never discards the others' results.
+3. Calls run concurrently: a chain takes about as long as its slowest member.
+4. The slide collectors keep their per-provider ``ProviderFetchResult`` accounting.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest import mock
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.services import external_data
+from urbanlens.dashboard.services.external_data import ProviderFetchResult, collect_satellite_slides
+from urbanlens.dashboard.services.rate_limiter import RateLimitExceededError
+from urbanlens.dashboard.services.timeout_utils import fan_out
+
+
+def _sleep_then(seconds: float, value: str):
+    def call() -> str:
+        time.sleep(seconds)
+        return value
+
+    return call
+
+
+def _raise(exc: Exception):
+    def call(*_args: object):
+        raise exc
+
+    return call
+
+
+class FanOutTests(TestCase):
+    def test_results_keep_submission_order(self) -> None:
+        outcomes = fan_out([("slow", _sleep_then(0.2, "a")), ("fast", _sleep_then(0, "b"))], timeout=5)
+
+        self.assertEqual([(outcome.name, outcome.value) for outcome in outcomes], [("slow", "a"), ("fast", "b")])
+        self.assertTrue(all(outcome.ok for outcome in outcomes))
+
+    def test_calls_run_concurrently(self) -> None:
+        started = time.monotonic()
+
+        fan_out([(str(index), _sleep_then(0.3, "x")) for index in range(4)], timeout=5)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_a_failing_call_is_captured(self) -> None:
+        boom = ValueError("boom")
+
+        failed, fine = fan_out([("bad", _raise(boom)), ("good", _sleep_then(0, "ok"))], timeout=5)
+
+        self.assertIs(failed.error, boom)
+        self.assertFalse(failed.ok)
+        self.assertEqual(fine.value, "ok")
+
+    def test_a_slow_call_times_out_without_holding_up_the_rest(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        started = time.monotonic()
+
+        stuck, fine = fan_out([("stuck", release.wait), ("good", _sleep_then(0, "ok"))], timeout=0.2)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertTrue(stuck.timed_out)
+        self.assertEqual(fine.value, "ok")
+
+    def test_max_parallel_bounds_calls_in_flight(self) -> None:
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def call() -> None:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+
+        fan_out([(str(index), call) for index in range(6)], timeout=5, max_parallel=2)
+
+        self.assertLessEqual(peak, 2)
+
+
+class CollectSlidesTests(TestCase):
+    def _provider(self, service_key: str, behaviour) -> mock.Mock:
+        provider = mock.Mock(service_key=service_key)
+        provider.get_satellite_slides.side_effect = behaviour
+        return provider
+
+    def test_collector_merges_in_chain_order_with_accounting(self) -> None:
+        chain = [
+            self._provider("slow", lambda *_: (time.sleep(0.1), (["s1", "s2"], False))[1]),
+            self._provider("broken", _raise(ValueError("down"))),
+            self._provider("limited", _raise(RateLimitExceededError("limited"))),
+            self._provider("cached", lambda *_: (["c1"], True)),
+        ]
+
+        with mock.patch.object(external_data, "_satellite_gateways", return_value=chain):
+            slides, results = collect_satellite_slides(1.0, 2.0)
+
+        self.assertEqual(slides, ["s1", "s2", "c1"])
+        self.assertEqual(
+            results,
+            [
+                ProviderFetchResult("slow", from_cache=False, count=2),
+                ProviderFetchResult("broken", from_cache=False, count=0, ok=False),
+                ProviderFetchResult("cached", from_cache=True, count=1),
+            ],
+        )
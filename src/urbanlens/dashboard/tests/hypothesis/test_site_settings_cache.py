@@ -0,0 +1,86 @@
+"""Tests for the cached SiteSettings singleton.
+
+Key invariants:
+
+1. Inside a request scope the row is read at most once, and a write in that
+   request is visible to the reads after it.
+2. A process copy is served while the Valkey version matches it (or, without
+   Valkey, until it expires), and always as a copy of its own.
+3. Saves and queryset updates bump the shared version once they commit.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.site_settings import SiteSettings
+from urbanlens.dashboard.models.site_settings import queryset as site_settings_cache
+
+
+class SiteSettingsCacheTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        SiteSettings.get_current()
+        site_settings_cache._cached = None
+        self.addCleanup(setattr, site_settings_cache, "_cached", None)
+
+    def _cache(self, version: str | None, loaded_at: float = 0.0) -> SiteSettings:
+        cached = SiteSettings.objects.get(pk=1)
+        site_settings_cache._cached = site_settings_cache._Cached(settings=cached, version=version, loaded_at=loaded_at)
+        return cached
+
+    def test_request_scope_reads_the_row_once(self) -> None:
+        with SiteSettings.objects.request_scope(), self.assertNumQueries(1):
+            first = SiteSettings.get_current()
+            self.assertIs(SiteSettings.get_current(), first)
+
+    def test_update_inside_a_request_scope_is_visible_to_later_reads(self) -> None:
+        with SiteSettings.objects.request_scope():
+            SiteSettings.get_current()
+            SiteSettings.objects.filter(pk=1).update(app_title="Renamed")
+
+            self.assertEqual(SiteSettings.get_current().app_title, "Renamed")
+
+    def test_process_copy_is_served_while_the_version_matches(self) -> None:
+        cached = self._cache(version="3")
+
+        with mock.patch.object(site_settings_cache, "_current_version", return_value="3"), self.assertNumQueries(0):
+            served = SiteSettings.get_current()
+
+        self.assertEqual(served.pk, cached.pk)
+        self.assertIsNot(served, cached)
+
+    def test_a_moved_version_rereads_the_row(self) -> None:
+        SiteSettings.objects.filter(pk=1).update(app_title="Renamed")
+        self._cache(version="3").app_title = "Stale"
+
+        with mock.patch.object(site_settings_cache, "_current_version", return_value="4"):
+            self.assertEqual(SiteSettings.get_current().app_title, "Renamed")
+
+    def test_without_valkey_the_process_copy_expires(self) -> None:
+        self._cache(version=None, loaded_at=100.0).app_title = "Stale"
+
+        with mock.patch.object(site_settings_cache, "_current_version", return_value=None), mock.patch.object(site_settings_cache.time, "monotonic", return_value=102.0):
+            self.assertEqual(SiteSettings.get_current().app_title, "Stale")
+        with mock.patch.object(site_settings_cache, "_current_version", return_value=None), mock.patch.object(site_settings_cache.time, "monotonic", return_value=100.0 + site_settings_cache.LOCAL_TTL_SECONDS):
+            self.assertNotEqual(SiteSettings.get_current().app_title, "Stale")
+
+    def test_rows_read_inside_a_transaction_are_not_shared(self) -> None:
+        SiteSettings.get_current()
+
+        self.assertIsNone(site_settings_cache._cached)
+
+    def test_save_bumps_the_shared_version_on_commit(self) -> None:
+        client = mock.MagicMock()
+        self._cache(version="3")
+
+        with mock.patch.object(site_settings_cache, "_valkey", return_value=client):
+            with self.captureOnCommitCallbacks(execute=True):
+                site = SiteSettings.objects.get(pk=1)
+                site.app_title = "Renamed"
+                site.save()
+                client.incr.assert_not_called()
+
+        client.incr.assert_called_once_with(site_settings_cache.VERSION_KEY)
+        self.assertIsNone(site_settings_cache._cached)
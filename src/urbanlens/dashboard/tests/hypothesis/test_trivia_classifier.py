@@ -16,7 +16,7 @@ from model_bakery import baker
 
 from urbanlens.core.tests.testcase import TestCase
 from urbanlens.dashboard.models.location.model import Location
-from urbanlens.dashboard.services.trivia.classifier import classify_trivia_question
+from urbanlens.dashboard.services.trivia.classifier import ClassifierVerdict, classify_trivia_question, classify_trivia_questions
 
 
 class _FakeGateway:
@@ -107,3 +107,49 @@ class ClassifyTriviaQuestionTests(TestCase):
 
         self.assertIn("<USER_DATA>", captured["prompt"])
         self.assertIn("What year was it built?", captured["prompt"])
+
+
+class _FakeBatchGateway(_FakeGateway):
+    def __init__(self, answers: list[str]):
+        super().__init__(None)
+        self._answers = answers
+        self.prompts: list[str] = []
+
+    def send_prompt_list(self, prompt: str, **kwargs) -> list[str]:
+        self.prompts.append(prompt)
+        return self._answers
+
+
+class ClassifyTriviaQuestionsTests(TestCase):
+    _PAIRS = [("What year was it built?", "1937"), ("Who partied here?", "Our crew"), ("How many floors?", "5")]
+
+    def setUp(self) -> None:
+        self.location = _make_location()
+
+    def _classify(self, answers: list[str]) -> tuple[list[ClassifierVerdict], _FakeBatchGateway]:
+        gateway = _FakeBatchGateway(answers)
+        with patch("urbanlens.dashboard.services.trivia.classifier.get_gateway", return_value=gateway):
+            return classify_trivia_questions(self._PAIRS, self.location), gateway
+
+    def test_numbered_verdicts_map_back_to_their_pairs_in_one_call(self) -> None:
+        verdicts, gateway = self._classify(["2: REJECT_INGROUP", "1: APPROVE", "3: APPROVE"])
+
+        self.assertEqual(verdicts, [ClassifierVerdict(approved=True), ClassifierVerdict(approved=False, reason="ingroup"), ClassifierVerdict(approved=True)])
+        self.assertEqual(len(gateway.prompts), 1)
+        self.assertEqual(gateway.prompts[0].count("<USER_DATA>"), 6)
+
+    def test_missing_conflicting_and_unknown_verdicts_fail_closed(self) -> None:
+        verdicts, _gateway = self._classify(["1: APPROVE", "1: REJECT_PERSON", "2: MAYBE", "APPROVE"])
+
+        self.assertEqual([verdict.reason for verdict in verdicts], ["unparseable", "unparseable", "unparseable"])
+
+    def test_no_answers_fail_closed_as_unavailable(self) -> None:
+        verdicts, _gateway = self._classify([])
+
+        self.assertEqual([verdict.reason for verdict in verdicts], ["ai_unavailable"] * 3)
+
+    def test_a_single_pair_uses_the_single_question_classifier(self) -> None:
+        with patch("urbanlens.dashboard.services.trivia.classifier.get_gateway", return_value=_FakeGateway("APPROVE")):
+            verdicts = classify_trivia_questions(self._PAIRS[:1], self.location)
+
+        self.assertEqual(verdicts, [ClassifierVerdict(approved=True)])
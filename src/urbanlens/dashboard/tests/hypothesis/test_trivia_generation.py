@@ -8,10 +8,11 @@ from model_bakery import baker
 
 from urbanlens.core.tests.testcase import TestCase
 from urbanlens.dashboard.models.location.model import Location
+from urbanlens.dashboard.models.site_settings import SiteSettings
 from urbanlens.dashboard.models.trivia.model import TriviaQuestion, TriviaQuestionSource
 from urbanlens.dashboard.models.wiki.model import Wiki
 from urbanlens.dashboard.services.trivia.classifier import ClassifierVerdict
-from urbanlens.dashboard.services.trivia.generation import MIN_DESCRIPTION_LENGTH, generate_questions_for_wiki, sweep_wikis_for_generation
+from urbanlens.dashboard.services.trivia.generation import DEFAULT_PROVIDER_CONCURRENCY, MIN_DESCRIPTION_LENGTH, PROVIDER_CONCURRENCY, generate_questions_for_wiki, generation_concurrency, sweep_wikis_for_generation
 
 _LONG_DESCRIPTION = "This building has a long and storied history. " * 20
 assert len(_LONG_DESCRIPTION) >= MIN_DESCRIPTION_LENGTH
@@ -57,7 +58,7 @@ class GenerateQuestionsForWikiTests(TestCase):
         gateway = _FakeGateway(["What year was it built?|||1937"])
         with (
             patch("urbanlens.dashboard.services.trivia.generation.get_gateway", return_value=gateway),
-            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_question", return_value=ClassifierVerdict(approved=True)),
+            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_questions", return_value=[ClassifierVerdict(approved=True)]),
         ):
             created = generate_questions_for_wiki(wiki)
 
@@ -72,7 +73,7 @@ class GenerateQuestionsForWikiTests(TestCase):
         gateway = _FakeGateway(["What was X in the year somebody did Y?|||1937"])
         with (
             patch("urbanlens.dashboard.services.trivia.generation.get_gateway", return_value=gateway),
-            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_question", return_value=ClassifierVerdict(approved=False, reason="person")),
+            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_questions", return_value=[ClassifierVerdict(approved=False, reason="person")]),
         ):
             created = generate_questions_for_wiki(wiki)
 
@@ -92,11 +93,12 @@ class GenerateQuestionsForWikiTests(TestCase):
         verdicts = [ClassifierVerdict(approved=True), ClassifierVerdict(approved=False, reason="bullying")]
         with (
             patch("urbanlens.dashboard.services.trivia.generation.get_gateway", return_value=gateway),
-            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_question", side_effect=verdicts),
+            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_questions", return_value=verdicts) as classify,
         ):
             created = generate_questions_for_wiki(wiki)
         self.assertEqual(len(created), 1)
         self.assertEqual(created[0].prompt, "Good question")
+        classify.assert_called_once_with([("Good question", "42"), ("Bad question", "99")], wiki.location)
 
 
 class SweepWikisForGenerationTests(TestCase):
@@ -106,7 +108,7 @@ class SweepWikisForGenerationTests(TestCase):
         gateway = _FakeGateway(["What year was it built?|||1937"])
         with (
             patch("urbanlens.dashboard.services.trivia.generation.get_gateway", return_value=gateway),
-            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_question", return_value=ClassifierVerdict(approved=True)),
+            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_questions", return_value=[ClassifierVerdict(approved=True)]),
         ):
             summary = sweep_wikis_for_generation(batch_size=10)
 
@@ -127,3 +129,28 @@ class SweepWikisForGenerationTests(TestCase):
         with patch("urbanlens.dashboard.services.trivia.generation.get_gateway", return_value=None):
             summary = sweep_wikis_for_generation(batch_size=2)
         self.assertEqual(summary["wikis_considered"], 2)
+
+    def test_a_crashing_wiki_does_not_stop_the_others(self) -> None:
+        wikis = [_make_wiki() for _ in range(3)]
+        gateway = _FakeGateway(["What year was it built?|||1937"])
+
+        def classify(pairs, location):
+            if location == wikis[1].location:
+                raise RuntimeError("boom")
+            return [ClassifierVerdict(approved=True)] * len(pairs)
+
+        with (
+            patch("urbanlens.dashboard.services.trivia.generation.get_gateway", return_value=gateway),
+            patch("urbanlens.dashboard.services.trivia.generation.classify_trivia_questions", side_effect=classify),
+        ):
+            summary = sweep_wikis_for_generation(batch_size=10)
+
+        self.assertEqual(summary, {"wikis_considered": 3, "questions_created": 2})
+        self.assertFalse(TriviaQuestion.objects.filter(location=wikis[1].location).exists())
+
+    def test_concurrency_follows_the_configured_provider(self) -> None:
+        SiteSettings.objects.filter(pk=SiteSettings.get_current().pk).update(ai_provider="anthropic")
+        self.assertEqual(generation_concurrency(), PROVIDER_CONCURRENCY["anthropic"])
+
+        SiteSettings.objects.filter(pk=SiteSettings.get_current().pk).update(ai_provider="something-new")
+        self.assertEqual(generation_concurrency(), DEFAULT_PROVIDER_CONCURRENCY)
@@ -0,0 +1,122 @@
+"""Tests for the Valkey-backed rate limiter path in ``_reserve_call``.
+
+With Valkey configured, reserving a call runs one Lua script instead of the
+locked ``COUNT(*)`` queries over ``ApiCallLog``, and call outcomes are
+buffered on an audit list that ``flush_api_call_audit_log`` writes to the
+table in batches. The database path stays as the fallback whenever Valkey
+fails.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from urbanlens.core.tests.testcase import TestCase
+from urbanlens.dashboard.models.api_call_log.model import ApiCallLog
+from urbanlens.dashboard.models.api_rate_limit.model import ApiRateLimit
+from urbanlens.dashboard.services import rate_limiter
+from urbanlens.dashboard.services.rate_limiter import RateLimitExceededError, ServiceDisabledError, _finalize_call, _reserve_call, forget_limit_config
+from urbanlens.dashboard.services.valkey_rate_limiter import AUDIT_LOG_KEY, ValkeyRateLimiter, audit_record
+
+_FROM_ENV = "urbanlens.dashboard.services.valkey_rate_limiter.ValkeyRateLimiter.from_env"
+
+
+class ValkeyReserveCallTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        forget_limit_config()
+        self.service = "test_valkey_service"
+        ApiRateLimit.objects.create(service=self.service, display_name="Test Valkey Service", calls_per_minute=2, calls_per_day=None)
+        self.limiter = mock.Mock(spec=ValkeyRateLimiter)
+
+    def test_reserved_call_writes_no_log_row_until_flushed(self) -> None:
+        self.limiter.reserve.return_value = None
+
+        with mock.patch(_FROM_ENV, return_value=self.limiter):
+            reservation = _reserve_call(self.service, endpoint="https://example.com/api")
+            _finalize_call(reservation, success=True, response_ms=12, cost_estimate=Decimal("0.01"))
+
+        self.assertFalse(ApiCallLog.objects.filter(service=self.service).exists())
+        self.assertIsNone(reservation.entry_pk)
+        self.limiter.record.assert_called_once()
+
+    def test_blocked_call_raises(self) -> None:
+        self.limiter.reserve.return_value = ("in last minute", 2, 2)
+
+        with mock.patch(_FROM_ENV, return_value=self.limiter), pytest.raises(RateLimitExceededError):
+            _reserve_call(self.service)
+
+    def test_disabled_service_does_not_consume_a_slot(self) -> None:
+        ApiRateLimit.objects.filter(service=self.service).update(enabled=False)
+
+        with mock.patch(_FROM_ENV, return_value=self.limiter), pytest.raises(ServiceDisabledError):
+            _reserve_call(self.service)
+
+        self.limiter.reserve.assert_not_called()
+        self.limiter.record.assert_called_once()
+
+    def test_valkey_failure_falls_back_to_the_database(self) -> None:
+        self.limiter.reserve.side_effect = RedisConnectionError("down")
+
+        with mock.patch(_FROM_ENV, return_value=self.limiter):
+            reservation = _reserve_call(self.service)
+
+        self.assertTrue(ApiCallLog.objects.filter(pk=reservation.entry_pk).exists())
+
+    def test_limit_config_is_read_once_per_ttl(self) -> None:
+        self.limiter.reserve.return_value = None
+
+        with mock.patch(_FROM_ENV, return_value=self.limiter), mock.patch.object(rate_limiter, "get_limit_config", wraps=rate_limiter.get_limit_config) as get_config:
+            _reserve_call(self.service)
+            _reserve_call(self.service)
+
+        get_config.assert_called_once_with(self.service)
+
+        forget_limit_config(self.service)
+        ApiRateLimit.objects.filter(service=self.service).update(enabled=False)
+        with mock.patch(_FROM_ENV, return_value=self.limiter), pytest.raises(ServiceDisabledError):
+            _reserve_call(self.service)
+
+
+class FlushAuditLogTests(TestCase):
+    def test_flush_keeps_the_original_call_time(self) -> None:
+        called_at = datetime.now(UTC) - timedelta(minutes=5)
+        records = [audit_record("flush_svc", endpoint="/a", created=called_at, cost_estimate=Decimal("0.005"))]
+        client = mock.MagicMock()
+        client.lrange.side_effect = [records, []]
+
+        written = ValkeyRateLimiter(client).flush_audit_log()
+
+        self.assertEqual(written, 1)
+        entry = ApiCallLog.objects.get(service="flush_svc")
+        self.assertEqual(entry.created, called_at)
+        self.assertEqual(entry.cost_estimate, Decimal("0.005"))
+        client.ltrim.assert_called_once_with(AUDIT_LOG_KEY, 1, -1)
+
+    def test_a_held_lock_skips_the_flush(self) -> None:
+        client = mock.MagicMock()
+        client.set.return_value = None
+
+        written = ValkeyRateLimiter(client).flush_audit_log()
+
+        self.assertEqual(written, 0)
+        client.lrange.assert_not_called()
+        client.ltrim.assert_not_called()
+
+    def test_a_failed_insert_leaves_the_batch_on_the_list(self) -> None:
+        client = mock.MagicMock()
+        client.lrange.side_effect = [[audit_record("flush_svc", endpoint="/a")], []]
+        limiter = ValkeyRateLimiter(client)
+
+        with mock.patch.object(ApiCallLog.objects, "bulk_update", side_effect=RuntimeError("db down")), pytest.raises(RuntimeError):
+            limiter.flush_audit_log()
+
+        client.ltrim.assert_not_called()
+        self.assertFalse(ApiCallLog.objects.filter(service="flush_svc").exists())
+        self.assertEqual(client.set.call_args.kwargs["nx"], True)
+        limiter._release_lock.assert_called_once()
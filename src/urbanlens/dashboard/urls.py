@@ -263,6 +263,9 @@ urlpatterns = [
                 path("init/", maps.MapController.as_view({"get": "init_map"}), name="map.init"),
                 path("pins/", maps.MapController.as_view({"get": "map_pins_json"}), name="map.pins"),
                 path("pins/children/", maps.MapController.as_view({"get": "map_child_pins_json"}), name="map.pins.children"),
+                path("pins/clusters/", maps.MapController.as_view({"get": "map_pin_clusters_json"}), name="map.pins.clusters"),
+                path("pins/tiles/<int:zoom>/<int:x>/<int:y>.json", maps.MapController.as_view({"get": "map_pin_tile"}), name="map.pins.tile"),
+                path("pins/overlaps/", maps.MapController.as_view({"get": "map_pin_overlaps_json"}), name="map.pins.overlaps"),
                 path("pins/meta/", maps.MapController.as_view({"get": "map_pins_meta"}), name="map.pins.meta"),
                 path("geolocation/visits/", maps.MapController.as_view({"post": "record_geolocation_visit"}), name="map.geolocation.visits"),
                 path("pins/list/", maps.MapController.as_view({"get": "pin_list_panel"}), name="map.pins.list"),